@@ -7,6 +7,7 @@ from .export_command import ExportCommand
 from .gateway_command import GatewayCommand
 from .help_command import HelpCommand
 from .history_command import HistoryCommand
+from .host_command import HostCommand
 from .import_command import ImportCommand
 from .mqtt_command import MQTTCommand
 from .order_book_command import OrderBookCommand
@@ -28,6 +29,7 @@ __all__ = [
     GatewayCommand,
     HelpCommand,
     HistoryCommand,
+    HostCommand,
     ImportCommand,
     OrderBookCommand,
     PreviousCommand,
@@ -44,7 +44,8 @@ no_restart_pmm_keys = ["order_amount",
                        "price_band_refresh_time"
                        "order_optimization_enabled",
                        "bid_order_optimization_depth",
-                       "ask_order_optimization_depth"
+                       "ask_order_optimization_depth",
+                       "stage_timing_enabled"
                        ]
 client_configs_to_display = ["autofill_import",
                              "kill_switch_mode",
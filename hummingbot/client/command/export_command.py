@@ -2,6 +2,7 @@ import os
 from typing import TYPE_CHECKING, List, Optional
 
 import pandas as pd
+from sqlalchemy import or_
 from sqlalchemy.orm import Query, Session
 
 from hummingbot.client.config.security import Security
@@ -63,7 +64,7 @@ class ExportCommand:
 
     async def export_trades(self,  # type: HummingbotApplication
                             ):
-        with self.trade_fill_db.get_new_session() as session:
+        with self.trade_fill_db.get_read_only_session() as session:
             trades: List[TradeFill] = self._get_trades_from_session(
                 int(self.init_time * 1e3),
                 session=session)
@@ -93,11 +94,14 @@ class ExportCommand:
                                  start_timestamp: int,
                                  session: Session,
                                  number_of_rows: Optional[int] = None,
-                                 config_file_path: str = None) -> List[TradeFill]:
+                                 config_file_path: str = None,
+                                 config_file_paths: Optional[List[str]] = None) -> List[TradeFill]:
 
         filters = [TradeFill.timestamp >= start_timestamp]
         if config_file_path is not None:
             filters.append(TradeFill.config_file_path.like(f"%{config_file_path}%"))
+        if config_file_paths is not None:
+            filters.append(or_(*[TradeFill.config_file_path.like(f"%{path}%") for path in config_file_paths]))
         query: Query = (session
                         .query(TradeFill)
                         .filter(*filters)
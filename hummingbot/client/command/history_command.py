@@ -41,11 +41,11 @@ class HistoryCommand:
             self.notify("\n  Please first import a strategy config file of which to show historical performance.")
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
-        with self.trade_fill_db.get_new_session() as session:
+        with self.trade_fill_db.get_read_only_session() as session:
             trades: List[TradeFill] = self._get_trades_from_session(
                 int(start_time * 1e3),
                 session=session,
-                config_file_path=self.strategy_file_name)
+                config_file_paths=self.strategy_config_file_paths)
             if not trades:
                 self.notify("\n  No past trades to report.")
                 return
@@ -58,11 +58,11 @@ class HistoryCommand:
         if self.strategy_file_name is None:
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
-        with self.trade_fill_db.get_new_session() as session:
+        with self.trade_fill_db.get_read_only_session() as session:
             trades: List[TradeFill] = self._get_trades_from_session(
                 int(start_time * 1e3),
                 session=session,
-                config_file_path=self.strategy_file_name)
+                config_file_paths=self.strategy_config_file_paths)
             return list([TradeFill.to_bounty_api_json(t) for t in trades])
 
     async def history_report(self,  # type: HummingbotApplication
@@ -208,11 +208,11 @@ class HistoryCommand:
 
         start_time = self.init_time
 
-        with self.trade_fill_db.get_new_session() as session:
+        with self.trade_fill_db.get_read_only_session() as session:
             trades: List[TradeFill] = self._get_trades_from_session(
                 int(start_time * 1e3),
                 session=session,
-                config_file_path=self.strategy_file_name)
+                config_file_paths=self.strategy_config_file_paths)
             avg_return = await self.history_report(start_time, trades, display_report=False)
         return avg_return
 
@@ -224,12 +224,12 @@ class HistoryCommand:
 
         lines = []
 
-        with self.trade_fill_db.get_new_session() as session:
+        with self.trade_fill_db.get_read_only_session() as session:
             queried_trades: List[TradeFill] = self._get_trades_from_session(
                 int(start_time * 1e3),
                 session=session,
                 number_of_rows=MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT + 1,
-                config_file_path=self.strategy_file_name)
+                config_file_paths=self.strategy_config_file_paths)
             df: pd.DataFrame = TradeFill.to_pandas(queried_trades)
 
         if len(df) > 0:
@@ -0,0 +1,166 @@
+import threading
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+import hummingbot.client.settings as settings
+from hummingbot import init_logging
+from hummingbot.client.config.config_helpers import (
+    format_config_file_name,
+    load_strategy_config_map_from_file,
+    validate_strategy_file,
+)
+from hummingbot.core.rate_oracle.rate_oracle import RateOracle
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.strategy.order_attribution import OrderAttribution
+
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication  # noqa: F401
+
+
+class HostCommand:
+    """
+    Runs several strategy configurations in the same bot. The strategies are separate clock iterators that share one
+    connector (and so one order book tracker and one set of websocket connections) per exchange, created with the
+    trading pairs of all the strategies. The orders are attributed to the strategy that created them, the trades and
+    orders of each strategy are recorded under its own configuration file in the `<name>.sqlite` database.
+    """
+
+    def host(self,  # type: HummingbotApplication
+             config_files: List[str],
+             name: str = "host"):
+        if threading.current_thread() != threading.main_thread():
+            self.ev_loop.call_soon_threadsafe(self.host, config_files, name)
+            return
+        safe_ensure_future(self.host_check(config_files, name), loop=self.ev_loop)
+
+    async def host_check(self,  # type: HummingbotApplication
+                         config_files: List[str],
+                         name: str = "host"):
+        if self._in_start_check or (self.strategy_task is not None and not self.strategy_task.done()):
+            self.notify('The bot is already running - please run "stop" first')
+            return
+
+        self._in_start_check = True
+        try:
+            hosted_configs = await self._load_hosted_configs(config_files)
+            if hosted_configs is None or not await self._hosted_status_check(hosted_configs):
+                self.notify("Start aborted.")
+                return
+
+            self.strategy_file_name = f"{name}.yml"
+            self._hosted_config_file_paths = list(hosted_configs)
+            if self._last_started_strategy_file != self.strategy_file_name:
+                init_logging("hummingbot_logs.yml", self.client_config_map, strategy_file_path=self.strategy_file_name)
+                self._last_started_strategy_file = self.strategy_file_name
+            self._initialize_notifiers()
+
+            try:
+                await self._initialize_hosted_strategies(hosted_configs)
+            except Exception as e:
+                self.notify(f"{e} Start aborted.")
+                self._reset_hosted_strategies()
+                self.markets = {}
+                self.market_trading_pairs_map.clear()
+                return
+            finally:
+                self.strategy_name = name
+                self.strategy_config_map = None
+            self._initialize_markets_recorder()
+
+            self.notify(f"\nStatus check complete. Starting {len(self.hosted_strategies)} strategies "
+                        f"on shared connectors...")
+            await self.start_market_making()
+        finally:
+            self._in_start_check = False
+
+        # We always start the RateOracle. It is required for PNL calculation.
+        RateOracle.get_instance().start()
+        if self._mqtt:
+            self._mqtt.patch_loggers()
+
+    async def _load_hosted_configs(self,  # type: HummingbotApplication
+                                   config_files: List[str]) -> Optional[Dict[str, str]]:
+        """
+        Validates the configuration files and returns the strategy name of each one, by file name.
+        """
+        settings.required_exchanges.clear()
+        hosted_configs: Dict[str, str] = {}
+        for file_name in config_files:
+            file_name = format_config_file_name(file_name)
+            error = validate_strategy_file(settings.STRATEGIES_CONF_DIR_PATH / file_name)
+            if error is not None:
+                self.notify(f"{file_name}: {error}")
+                return None
+            config_map = await load_strategy_config_map_from_file(settings.STRATEGIES_CONF_DIR_PATH / file_name)
+            strategy_name = (
+                config_map.strategy
+                if not isinstance(config_map, dict)
+                else config_map.get("strategy").value  # legacy
+            )
+            if strategy_name not in settings.STRATEGIES:
+                self.notify(f"{file_name}: the {strategy_name} strategy can't be hosted.")
+                return None
+            hosted_configs[file_name] = strategy_name
+        return hosted_configs
+
+    async def _hosted_status_check(self,  # type: HummingbotApplication
+                                   hosted_configs: Dict[str, str]) -> bool:
+        all_valid = True
+        for file_name, strategy_name in hosted_configs.items():
+            self.strategy_name = strategy_name
+            self.strategy_config_map = await load_strategy_config_map_from_file(
+                settings.STRATEGIES_CONF_DIR_PATH / file_name)
+            missing_configs = self.missing_configurations_legacy()
+            validation_errors = self.validate_configs()
+            if missing_configs:
+                self.notify(f"  - {file_name}: Incomplete strategy configuration. The following values are missing.")
+                for config in missing_configs:
+                    self.notify(f"    {config.key}")
+            for error in validation_errors:
+                self.notify(f"  - {file_name}: {error}")
+            all_valid = all_valid and not missing_configs and len(validation_errors) == 0
+        self.strategy_config_map = None
+
+        invalid_conns = await self.validate_required_connections()
+        for ex, err_msg in invalid_conns.items():
+            self.notify(f"  - {ex}: {err_msg}")
+        return all_valid and not invalid_conns
+
+    async def _initialize_hosted_strategies(self,  # type: HummingbotApplication
+                                            hosted_configs: Dict[str, str]):
+        self._order_attribution = OrderAttribution()
+        for file_name, strategy_name in hosted_configs.items():
+            self._order_attribution.add_strategy(file_name, strategy_name)
+
+        for file_name, strategy_name in hosted_configs.items():
+            await self._initialize_hosted_strategy(file_name, strategy_name)
+
+        # A connector is created again when a strategy adds trading pairs to it, the strategies initialized before
+        # with the replaced connector are initialized again with the final one
+        markets = set(self.markets.values())
+        for file_name, strategy in list(self.hosted_strategies.items()):
+            if not markets.issuperset(strategy.active_markets):
+                strategy.remove_markets(strategy.active_markets)
+                await self._initialize_hosted_strategy(file_name, hosted_configs[file_name])
+
+    async def _initialize_hosted_strategy(self,  # type: HummingbotApplication
+                                          file_name: str,
+                                          strategy_name: str):
+        # The legacy strategies read their configuration from a module level config map, so each configuration is
+        # loaded right before its strategy is initialized
+        self.strategy_name = strategy_name
+        self.strategy_config_map = await load_strategy_config_map_from_file(
+            settings.STRATEGIES_CONF_DIR_PATH / file_name)
+        self.strategy = None
+        self._initialize_strategy(strategy_name)
+        strategy = self.strategy
+        self.strategy = None
+        if strategy is None:
+            raise ValueError(f"The strategy configured in {file_name} could not be initialized.")
+        strategy.set_order_attribution(self._order_attribution, file_name)
+        self.hosted_strategies[file_name] = strategy
+
+    def _reset_hosted_strategies(self,  # type: HummingbotApplication
+                                 ):
+        self.hosted_strategies = {}
+        self._order_attribution = None
+        self._hosted_trading_pairs.clear()
@@ -246,15 +246,19 @@ class StartCommand(GatewayChainApiManager):
             tick_size = self.client_config_map.tick_size
             self.logger().info(f"Creating the clock with tick size: {tick_size}")
             self.clock = Clock(ClockMode.REALTIME, tick_size=tick_size)
+            if self.client_config_map.tick_profiling.tick_profiling_enabled:
+                self.clock.enable_tick_profiling(self.client_config_map.tick_profiling.overrun_budget_pct)
             for market in self.markets.values():
                 if market is not None:
                     self.clock.add_iterator(market)
-                    self.markets_recorder.restore_market_states(self.strategy_file_name, market)
+                    self.markets_recorder.restore_latest_market_states(self.strategy_config_file_paths, market)
                     if len(market.limit_orders) > 0:
                         self.notify(f"Canceling dangling limit orders on {market.name}...")
                         await market.cancel_all(10.0)
             if self.strategy:
                 self.clock.add_iterator(self.strategy)
+            for strategy in self.hosted_strategies.values():
+                self.clock.add_iterator(strategy)
             self.strategy_task: asyncio.Task = safe_ensure_future(self._run_clock(), loop=self.ev_loop)
             self.notify(f"\n'{self.strategy_name}' strategy started.\n"
                         f"Run `status` command to query the progress.")
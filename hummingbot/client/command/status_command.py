@@ -72,13 +72,37 @@ class StatusCommand:
 
         paper_trade = "\n  Paper Trading Active: All orders are simulated, and no real orders are placed." if len(active_paper_exchanges) > 0 \
             else ""
-        if asyncio.iscoroutinefunction(self.strategy.format_status):
+        if self.hosted_strategies:
+            st_status = "\n".join(f"\n  Strategy {file_name}:\n{strategy.format_status()}"
+                                  for file_name, strategy in self.hosted_strategies.items())
+        elif asyncio.iscoroutinefunction(self.strategy.format_status):
             st_status = await self.strategy.format_status()
         else:
             st_status = self.strategy.format_status()
         status = paper_trade + "\n" + st_status
+        if self.clock is not None and self.clock.tick_profiler is not None:
+            status += "\n\n" + self.clock.tick_profiler.format_status()
+        connection_pools_status = self._format_connection_pools_status()
+        if connection_pools_status:
+            status += "\n\n" + connection_pools_status
         return status
 
+    def _format_connection_pools_status(self,  # type: HummingbotApplication
+                                        ) -> str:
+        # Only the connectors with connection pool settings are reported
+        lines = []
+        for connector_name in self.client_config_map.connection_pools:
+            connector = self.markets.get(connector_name)
+            stats = getattr(connector, "connection_pool_stats", None)
+            if stats and "in_use" in stats:
+                lines.append(f"    {connector_name}: {stats['in_use']} in use, {stats['idle']} idle, "
+                             f"limit {stats['limit']} ({stats['saturation']:.0%} saturation)")
+            elif stats:
+                lines.append(f"    {connector_name}: limit {stats['limit']}")
+        if len(lines) == 0:
+            return ""
+        return "\n".join(["  Connection pools:"] + lines)
+
     def application_warning(self):
         # Application warnings.
         self._expire_old_application_warnings()
@@ -134,11 +158,11 @@ class StatusCommand:
                                notify_success=True,
                                live=False) -> bool:
 
-        if self.strategy is not None:
+        if self.strategy is not None or self.hosted_strategies:
             if live:
                 await self.stop_live_update()
                 self.app.live_updates = True
-                while self.app.live_updates and self.strategy:
+                while self.app.live_updates and (self.strategy or self.hosted_strategies):
                     await self.cls_display_delay(
                         await self.strategy_status(live=True) + "\n\n Press escape key to stop update.", 0.1
                     )
@@ -37,7 +37,10 @@ class StopCommand:
             # prevent race condition where the strategy tries to create more
             # orders during cancellation.
             if self.clock:
-                self.clock.remove_iterator(self.strategy)
+                if self.strategy is not None:
+                    self.clock.remove_iterator(self.strategy)
+                for strategy in self.hosted_strategies.values():
+                    self.clock.remove_iterator(strategy)
             success = await self._cancel_outstanding_orders()
             # Give some time for cancellation events to trigger
             await asyncio.sleep(2)
@@ -59,6 +62,7 @@ class StopCommand:
 
         self.strategy_task = None
         self.strategy = None
+        self._reset_hosted_strategies()
         self.market_pair = None
         self.clock = None
         self.markets_recorder = None
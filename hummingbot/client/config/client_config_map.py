@@ -4,7 +4,7 @@ import re
 from abc import ABC, abstractmethod
 from decimal import Decimal
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field, SecretStr, root_validator, validator
 from tabulate import tabulate_formats
@@ -25,7 +25,10 @@ from hummingbot.connector.exchange.kraken.kraken_utils import KrakenConfigMap
 from hummingbot.connector.exchange.kucoin.kucoin_utils import KuCoinConfigMap
 from hummingbot.core.rate_oracle.rate_oracle import RATE_ORACLE_SOURCES, RateOracle
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
+from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.utils.kill_switch import ActiveKillSwitch, KillSwitch, PassThroughKillSwitch
+from hummingbot.core.web_assistant.connections.data_types import ConnectionPoolSettings
+from hummingbot.core.web_assistant.request_tracer import LatencySink, LoggerLatencySink, PrometheusLatencySink
 from hummingbot.notifier.telegram_notifier import TelegramNotifier
 
 if TYPE_CHECKING:
@@ -173,6 +176,111 @@ class MarketDataCollectionConfigMap(BaseClientModel):
         title = "market_data_collection"
 
 
+class TickProfilingConfigMap(BaseClientModel):
+    tick_profiling_enabled: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable the clock tick profiling"
+            ),
+        ),
+    )
+    overrun_budget_pct: float = Field(
+        default=80.0,
+        gt=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "What percentage of the tick size can a tick take (including its lateness) before it is reported"
+                " as an overrun? (Default=80)"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "tick_profiling"
+
+
+class ExchangeInfoCacheConfigMap(BaseClientModel):
+    exchange_info_cache_enabled: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable the local cache of the trading pairs and trading rules of the exchanges"
+            ),
+        ),
+    )
+    exchange_info_cache_ttl: float = Field(
+        default=24 * 60 * 60,
+        gt=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enter the maximum age in seconds of the cached exchange information used at startup"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "exchange_info_cache"
+
+
+class RequestTracingConfigMap(BaseClientModel):
+    request_tracing_enabled: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable the tracing of the duration of each stage of the exchange requests"
+            ),
+        ),
+    )
+    request_tracing_export_interval: float = Field(
+        default=60.0,
+        gt=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "How often (in seconds) should the request latencies be logged and exported?"
+            ),
+        ),
+    )
+    request_tracing_prometheus_port: int = Field(
+        default=0,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enter the local port serving the request latencies in the Prometheus format at /metrics"
+                " (Enter 0 to disable)"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "request_tracing"
+
+    def build_latency_sinks(self) -> List[LatencySink]:
+        sinks: List[LatencySink] = [LoggerLatencySink()]
+        if self.request_tracing_prometheus_port > 0:
+            prometheus_sink = PrometheusLatencySink()
+            safe_ensure_future(prometheus_sink.start_server(port=self.request_tracing_prometheus_port))
+            sinks.append(prometheus_sink)
+        return sinks
+
+
+class ConnectionPoolConfigMap(BaseClientModel):
+    limit: int = Field(default=ConnectionPoolSettings.limit, ge=0)
+    limit_per_host: int = Field(default=ConnectionPoolSettings.limit_per_host, ge=0)
+    use_dns_cache: bool = Field(default=ConnectionPoolSettings.use_dns_cache)
+    ttl_dns_cache: Optional[int] = Field(default=ConnectionPoolSettings.ttl_dns_cache, ge=0)
+    keepalive_timeout: float = Field(default=ConnectionPoolSettings.keepalive_timeout, ge=0)
+    force_close: bool = Field(default=ConnectionPoolSettings.force_close)
+    enable_cleanup_closed: bool = Field(default=ConnectionPoolSettings.enable_cleanup_closed)
+    pre_warm_connections: int = Field(default=ConnectionPoolSettings.pre_warm_connections, ge=0)
+
+    class Config:
+        title = "connection_pool"
+
+    def build_settings(self) -> ConnectionPoolSettings:
+        return ConnectionPoolSettings(**self.dict())
+
+
 class ColorConfigMap(BaseClientModel):
     top_pane: str = Field(
         default="#000000",
@@ -422,6 +530,13 @@ class DBMode(BaseClientModel, ABC):
     def get_url(self, db_path: str) -> str:
         ...
 
+    def get_sqlite_pragmas(self) -> Dict[str, Any]:
+        """
+        SQLite settings applied to every connection. When set, the database uses a dedicated writer connection and
+        read-only connections for the reporting queries.
+        """
+        return {}
+
 
 class DBSqliteMode(DBMode):
     db_engine: str = Field(
@@ -441,6 +556,37 @@ class DBSqliteMode(DBMode):
         return f"{self.db_engine}:///{db_path}"
 
 
+class DBSqlitePerformanceMode(DBSqliteMode):
+    cache_size_mb: int = Field(
+        default=64,
+        gt=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Enter the size of the SQLite page cache of each connection in MB",
+        ),
+    )
+    mmap_size_mb: int = Field(
+        default=256,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Enter the size of the SQLite memory mapped I/O in MB (0 to disable it)",
+        ),
+    )
+
+    class Config:
+        title = "sqlite_performance_db_engine"
+
+    def get_sqlite_pragmas(self) -> Dict[str, Any]:
+        # WAL lets the reporting queries read while the trades are recorded, and with synchronous NORMAL the commits
+        # only sync the write-ahead log at checkpoints (recent commits can be lost on power failure, not corrupted)
+        return {
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            "cache_size": -self.cache_size_mb * 1024,
+            "mmap_size": self.mmap_size_mb * 1024 * 1024,
+            "temp_store": "MEMORY",
+        }
+
+
 class DBOtherMode(DBMode):
     db_engine: str = Field(
         default=...,
@@ -495,6 +641,7 @@ class DBOtherMode(DBMode):
 
 DB_MODES = {
     DBSqliteMode.Config.title: DBSqliteMode,
+    DBSqlitePerformanceMode.Config.title: DBSqlitePerformanceMode,
     DBOtherMode.Config.title: DBOtherMode,
 }
 
@@ -959,6 +1106,8 @@ class ClientConfigMap(BaseClientModel):
         description=("Advanced database options, currently supports SQLAlchemy's included dialects"
                      "\nReference: https://docs.sqlalchemy.org/en/13/dialects/"
                      "\nTo use an instance of SQLite DB the required configuration is \n  db_engine: sqlite"
+                     "\nTo use SQLite with the performance profile (WAL journal, dedicated writer connection)"
+                     " the configuration is\n  db_engine: sqlite\n  cache_size_mb: 64\n  mmap_size_mb: 256"
                      "\nTo use a DBMS the required configuration is"
                      "\n  db_host: 127.0.0.1\n  db_port: 3306\n  db_username: username\n  db_password: password"
                      "\n  db_name: dbname"),
@@ -980,6 +1129,26 @@ class ClientConfigMap(BaseClientModel):
             ),
         ),
     )
+    order_book_max_depth: Dict[str, int] = Field(
+        default={},
+        description=("Number of best levels kept on each side of the order books of a connector"
+                     "\nDeeper levels are dropped, and a new snapshot is requested when too few levels are left"
+                     "\ne.g. Keeping the 500 best levels of the Kraken order books."
+                     "\norder_book_max_depth:"
+                     "\n  kraken: 500"),
+    )
+    connection_pools: Dict[str, ConnectionPoolConfigMap] = Field(
+        default={},
+        description=("HTTP connection pool settings of a connector"
+                     "\nSettings: limit, limit_per_host, use_dns_cache, ttl_dns_cache, keepalive_timeout, force_close,"
+                     "\nenable_cleanup_closed and pre_warm_connections"
+                     "\n(connections opened to the exchange API when the connector starts)"
+                     "\ne.g. Limiting Binance to 20 connections and opening 4 of them at startup."
+                     "\nconnection_pools:"
+                     "\n  binance:"
+                     "\n    limit: 20"
+                     "\n    pre_warm_connections: 4"),
+    )
     manual_gas_price: Decimal = Field(
         default=Decimal("50"),
         description="Fixed gas price (in Gwei) for Ethereum transactions",
@@ -1077,6 +1246,21 @@ class ClientConfigMap(BaseClientModel):
             ),
         ),
     )
+    tick_profiling: TickProfilingConfigMap = Field(
+        default=TickProfilingConfigMap(),
+        description="Records the duration of the clock ticks of the connectors and strategies, shown by the status"
+                    "\ncommand, and warns when the ticks overrun the tick size.",
+    )
+    exchange_info_cache: ExchangeInfoCacheConfigMap = Field(
+        default=ExchangeInfoCacheConfigMap(),
+        description="Keeps the trading pairs and trading rules of the exchanges in the data directory, to use them"
+                    "\nat startup instead of requesting them. They are refreshed in the background.",
+    )
+    request_tracing: RequestTracingConfigMap = Field(
+        default=RequestTracingConfigMap(),
+        description="Records the time spent in each stage of the exchange requests (throttler, authentication,"
+                    "\nnetwork, decoding) and logs their histograms periodically.",
+    )
     market_data_collection: MarketDataCollectionConfigMap = Field(default=MarketDataCollectionConfigMap())
 
     class Config:
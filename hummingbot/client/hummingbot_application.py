@@ -4,7 +4,7 @@ import asyncio
 import logging
 import time
 from collections import deque
-from typing import Deque, Dict, List, Optional, Tuple, Union
+from typing import Deque, Dict, List, Optional, Set, Tuple, Union
 
 from hummingbot.client.command import __all__ as commands
 from hummingbot.client.config.client_config_map import ClientConfigMap
@@ -34,6 +34,7 @@ from hummingbot.core.clock import Clock
 from hummingbot.core.gateway.gateway_status_monitor import GatewayStatusMonitor
 from hummingbot.core.utils.kill_switch import KillSwitch
 from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
+from hummingbot.core.web_assistant.request_tracer import get_request_tracer
 from hummingbot.data_feed.data_feed_base import DataFeedBase
 from hummingbot.exceptions import ArgumentParserError
 from hummingbot.logger import HummingbotLogger
@@ -43,6 +44,7 @@ from hummingbot.notifier.notifier_base import NotifierBase
 from hummingbot.remote_iface.mqtt import MQTTGateway
 from hummingbot.strategy.maker_taker_market_pair import MakerTakerMarketPair
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.order_attribution import OrderAttribution
 from hummingbot.strategy.strategy_base import StrategyBase
 
 s_logger = None
@@ -85,6 +87,11 @@ class HummingbotApplication(*commands):
         self._strategy_config_map: Optional[BaseStrategyConfigMap] = None
         self.strategy_task: Optional[asyncio.Task] = None
         self.strategy: Optional[StrategyBase] = None
+        # strategies run on shared connectors by the host command, by configuration file name
+        self.hosted_strategies: Dict[str, StrategyBase] = {}
+        self._order_attribution: Optional[OrderAttribution] = None
+        self._hosted_trading_pairs: Dict[str, Set[str]] = {}
+        self._hosted_config_file_paths: List[str] = []
         self.market_pair: Optional[MakerTakerMarketPair] = None
         self.market_trading_pair_tuples: List[MarketTradingPairTuple] = []
         self.clock: Optional[Clock] = None
@@ -123,6 +130,7 @@ class HummingbotApplication(*commands):
         )
 
         self._init_gateway_monitor()
+        self._init_request_tracer()
         # MQTT Bridge
         if self.client_config_map.mqtt_bridge.mqtt_autostart:
             self.mqtt_start()
@@ -146,6 +154,7 @@ class HummingbotApplication(*commands):
     @strategy_file_name.setter
     def strategy_file_name(self, value: Optional[str]):
         self._strategy_file_name = value
+        self._hosted_config_file_paths = []
         if value is not None:
             db_name = value.split(".")[0]
             self.trade_fill_db = SQLConnectionManager.get_trade_fills_instance(
@@ -154,6 +163,17 @@ class HummingbotApplication(*commands):
         else:
             self.trade_fill_db = None
 
+    @property
+    def strategy_config_file_paths(self) -> List[str]:
+        """
+        The configuration files the trades and orders of the strategy are recorded under. In host mode they are
+        recorded under the configuration file of each hosted strategy, and under the host file when the strategy that
+        created an order is unknown.
+        """
+        if self.strategy_file_name is None:
+            return []
+        return [self.strategy_file_name] + self._hosted_config_file_paths
+
     @property
     def strategy_config_map(self):
         if self._strategy_config_map is not None:
@@ -175,6 +195,12 @@ class HummingbotApplication(*commands):
         except RuntimeError:
             pass
 
+    def _init_request_tracer(self):
+        tracing_config = self.client_config_map.request_tracing
+        if tracing_config.request_tracing_enabled:
+            get_request_tracer().enable(sinks=tracing_config.build_latency_sinks(),
+                                        export_interval=tracing_config.request_tracing_export_interval)
+
     def notify(self, msg: str):
         self.app.log(msg)
         for notifier in self.notifiers:
@@ -296,9 +322,16 @@ class HummingbotApplication(*commands):
             if market_name not in self.market_trading_pairs_map:
                 self.market_trading_pairs_map[market_name] = []
             for hb_trading_pair in trading_pairs:
-                self.market_trading_pairs_map[market_name].append(hb_trading_pair)
+                if hb_trading_pair not in self.market_trading_pairs_map[market_name]:
+                    self.market_trading_pairs_map[market_name].append(hb_trading_pair)
 
         for connector_name, trading_pairs in self.market_trading_pairs_map.items():
+            if self._order_attribution is not None:
+                # In host mode a connector is only created again when a strategy requires new trading pairs
+                if (connector_name in self.markets
+                        and set(trading_pairs).issubset(self._hosted_trading_pairs.get(connector_name, set()))):
+                    continue
+                self._hosted_trading_pairs[connector_name] = set(trading_pairs)
             conn_setting = AllConnectorSettings.get_connector_settings()[connector_name]
 
             if connector_name.endswith("paper_trade") and conn_setting.type == ConnectorType.Exchange:
@@ -320,12 +353,18 @@ class HummingbotApplication(*commands):
                 connector = connector_class(**init_params)
             self.markets[connector_name] = connector
 
+        if self._order_attribution is None:
+            # In host mode the markets recorder is created once all the strategies are initialized
+            self._initialize_markets_recorder()
+
+    def _initialize_markets_recorder(self):
         self.markets_recorder = MarketsRecorder(
             self.trade_fill_db,
             list(self.markets.values()),
             self.strategy_file_name,
             self.strategy_name,
             self.client_config_map.market_data_collection,
+            order_attribution=self._order_attribution,
         )
         self.markets_recorder.start()
         if self._mqtt is not None:
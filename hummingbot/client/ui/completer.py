@@ -295,7 +295,7 @@ class HummingbotCompleter(Completer):
     def _complete_paths(self, document: Document) -> bool:
         text_before_cursor: str = document.text_before_cursor
         return (("path" in self.prompt_text and "file" in self.prompt_text) or
-                "import" in text_before_cursor)
+                "import" in text_before_cursor or text_before_cursor.startswith("host "))
 
     def _complete_gateway_chain(self, document: Document) -> bool:
         return "Which chain do you want" in self.prompt_text
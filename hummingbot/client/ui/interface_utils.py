@@ -66,11 +66,11 @@ async def start_trade_monitor(trade_monitor):
         try:
             if hb.strategy_task is not None and not hb.strategy_task.done():
                 if all(market.ready for market in hb.markets.values()):
-                    with hb.trade_fill_db.get_new_session() as session:
+                    with hb.trade_fill_db.get_read_only_session() as session:
                         trades: List[TradeFill] = hb._get_trades_from_session(
                             int(hb.init_time * 1e3),
                             session=session,
-                            config_file_path=hb.strategy_file_name)
+                            config_file_paths=hb.strategy_config_file_paths)
                         if len(trades) > 0:
                             market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
                             for market, symbol in market_info:
@@ -76,6 +76,12 @@ def load_parser(hummingbot: "HummingbotApplication", command_tabs) -> [ThrowingA
 
     start_parser.set_defaults(func=hummingbot.start)
 
+    host_parser = subparsers.add_parser("host", help="Run several strategy configurations on shared connectors")
+    host_parser.add_argument("config_files", nargs="+", help="Names of the strategy configuration files")
+    host_parser.add_argument("--name", type=str, default="host", dest="name",
+                             help="Name of the trades database and of the logs file")
+    host_parser.set_defaults(func=hummingbot.host)
+
     stop_parser = subparsers.add_parser('stop', help="Stop the current bot")
     stop_parser.set_defaults(func=hummingbot.stop)
 
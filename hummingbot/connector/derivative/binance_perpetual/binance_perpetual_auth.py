@@ -1,13 +1,11 @@
-import hashlib
-import hmac
-import json
 from collections import OrderedDict
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from urllib.parse import urlencode
 
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
-from hummingbot.core.web_assistant.auth import AuthBase
+from hummingbot.core.web_assistant.auth import AuthBase, HMACSigner
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, WSRequest
+from hummingbot.core.web_assistant.json_codec import get_json_codec
 
 
 class BinancePerpetualAuth(AuthBase):
@@ -19,15 +17,17 @@ class BinancePerpetualAuth(AuthBase):
         self._api_key: str = api_key
         self._api_secret: str = api_secret
         self._time_provider: TimeSynchronizer = time_provider
+        self._signer: Optional[HMACSigner] = None
 
     def generate_signature_from_payload(self, payload: str) -> str:
-        secret = bytes(self._api_secret.encode("utf-8"))
-        signature = hmac.new(secret, payload.encode("utf-8"), hashlib.sha256).hexdigest()
+        if self._signer is None:
+            self._signer = HMACSigner(self._api_secret)
+        signature = self._signer.hexdigest(payload)
         return signature
 
     async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
         if request.method == RESTMethod.POST:
-            request.data = self.add_auth_to_params(params=json.loads(request.data))
+            request.data = self.add_auth_to_params(params=get_json_codec().loads(request.data))
         else:
             request.params = self.add_auth_to_params(request.params)
 
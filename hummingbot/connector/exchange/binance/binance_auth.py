@@ -1,13 +1,11 @@
-import hashlib
-import hmac
-import json
 from collections import OrderedDict
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from urllib.parse import urlencode
 
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
-from hummingbot.core.web_assistant.auth import AuthBase
+from hummingbot.core.web_assistant.auth import AuthBase, HMACSigner
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, WSRequest
+from hummingbot.core.web_assistant.json_codec import get_json_codec
 
 
 class BinanceAuth(AuthBase):
@@ -16,6 +14,15 @@ class BinanceAuth(AuthBase):
         self.secret_key = secret_key
         self.time_provider = time_provider
 
+    @property
+    def secret_key(self) -> str:
+        return self._secret_key
+
+    @secret_key.setter
+    def secret_key(self, secret_key: str):
+        self._secret_key = secret_key
+        self._signer: Optional[HMACSigner] = None
+
     async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
         """
         Adds the server time and the signature to the request, required for authenticated interactions. It also adds
@@ -23,7 +30,7 @@ class BinanceAuth(AuthBase):
         :param request: the request to be configured for authenticated interaction
         """
         if request.method == RESTMethod.POST:
-            request.data = self.add_auth_to_params(params=json.loads(request.data))
+            request.data = self.add_auth_to_params(params=get_json_codec().loads(request.data))
         else:
             request.params = self.add_auth_to_params(params=request.params)
 
@@ -59,6 +66,8 @@ class BinanceAuth(AuthBase):
 
     def _generate_signature(self, params: Dict[str, Any]) -> str:
 
+        if self._signer is None:
+            self._signer = HMACSigner(self.secret_key)
         encoded_params_str = urlencode(params)
-        digest = hmac.new(self.secret_key.encode("utf8"), encoded_params_str.encode("utf8"), hashlib.sha256).hexdigest()
+        digest = self._signer.hexdigest(encoded_params_str)
         return digest
@@ -29,6 +29,8 @@ ORDER_PATH_URL = "/order"
 BINANCE_USER_STREAM_PATH_URL = "/userDataStream"
 
 WS_HEARTBEAT_TIME_INTERVAL = 30
+# Binance accepts up to 1024 streams per connection, and each trading pair uses two (trades and depth diffs)
+WS_MAX_TRADING_PAIRS_PER_CONNECTION = 200
 
 # Binance params
 
@@ -1,7 +1,12 @@
-from typing import List
+from typing import List, Optional
 
 from hummingbot.client.config.config_helpers import ClientConfigAdapter, get_connector_class
 from hummingbot.client.settings import AllConnectorSettings
+from hummingbot.connector.exchange.paper_trade.order_book_replay import (
+    ReplayOrderBookTracker,
+    ReplayOrderBookTrackerDataSource,
+    recording_files_for_pair,
+)
 from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 
@@ -22,3 +27,27 @@ def create_paper_trade_market(exchange_name: str, client_config_map: ClientConfi
                               tracker,
                               get_connector_class(exchange_name),
                               exchange_name=exchange_name)
+
+
+def create_replay_paper_trade_market(exchange_name: str,
+                                     client_config_map: ClientConfigAdapter,
+                                     trading_pairs: List[str],
+                                     recordings_path: str,
+                                     start_time: float,
+                                     end_time: Optional[float] = None) -> PaperTradeExchange:
+    """
+    Creates a paper trade exchange whose order books replay the recordings of `exchange_name` stored in
+    `recordings_path` (the layout written by OrderBookRecorder). Add an OrderBookReplayIterator for
+    `market.order_book_tracker` to the clock before the market to move the books forward.
+    """
+    recording_files = {
+        trading_pair: recording_files_for_pair(recordings_path, exchange_name, trading_pair, start_time, end_time)
+        for trading_pair in trading_pairs
+    }
+    data_source = ReplayOrderBookTrackerDataSource(trading_pairs=trading_pairs, recording_files=recording_files)
+    tracker = ReplayOrderBookTracker(
+        data_source=data_source, trading_pairs=trading_pairs, start_time=start_time, end_time=end_time)
+    return PaperTradeExchange(client_config_map,
+                              tracker,
+                              get_connector_class(exchange_name),
+                              exchange_name=exchange_name)
@@ -0,0 +1,178 @@
+import heapq
+import logging
+import os
+from typing import Dict, Iterator, List, Optional
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import FILE_EXTENSION, OrderBookRecordReader, recording_file_path
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.core.py_time_iterator import PyTimeIterator
+from hummingbot.logger import HummingbotLogger
+
+
+def recording_files_for_pair(base_path: str,
+                             connector_name: str,
+                             trading_pair: str,
+                             start_time: float,
+                             end_time: Optional[float] = None) -> List[str]:
+    """
+    Returns the daily recording files written by `OrderBookRecorder` that cover the [start_time, end_time] period,
+    sorted by day.
+    """
+    pair_dir = os.path.dirname(recording_file_path(base_path, connector_name, trading_pair, start_time))
+    if not os.path.isdir(pair_dir):
+        return []
+    first_file = os.path.basename(recording_file_path(base_path, connector_name, trading_pair, start_time))
+    last_file = (os.path.basename(recording_file_path(base_path, connector_name, trading_pair, end_time))
+                 if end_time is not None else None)
+    file_names = sorted(
+        name for name in os.listdir(pair_dir)
+        if name.endswith(f".{FILE_EXTENSION}")
+        and name >= first_file
+        and (last_file is None or name <= last_file)
+    )
+    return [os.path.join(pair_dir, name) for name in file_names]
+
+
+class ReplayOrderBookTrackerDataSource(OrderBookTrackerDataSource):
+    """
+    Data source that serves messages recorded by `OrderBookRecorder` instead of connecting to an exchange.
+    """
+
+    def __init__(self, trading_pairs: List[str], recording_files: Dict[str, List[str]]):
+        super().__init__(trading_pairs=trading_pairs)
+        self._recording_files = recording_files
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {}
+
+    def pair_messages(self,
+                      trading_pair: str,
+                      start_time: float,
+                      end_time: Optional[float] = None) -> Iterator[OrderBookMessage]:
+        """
+        Messages of one pair, starting at the last keyframe before `start_time`.
+        """
+        for index, file_path in enumerate(self._recording_files.get(trading_pair, [])):
+            reader = OrderBookRecordReader(file_path)
+            # Every recording file starts with a keyframe, so only the first file needs to seek
+            yield from reader.messages(start_time=start_time if index == 0 else None, end_time=end_time)
+
+    def messages(self, start_time: float, end_time: Optional[float] = None) -> Iterator[OrderBookMessage]:
+        """
+        Messages of all pairs merged in timestamp order.
+        """
+        return heapq.merge(
+            *[self.pair_messages(trading_pair, start_time, end_time) for trading_pair in self._trading_pairs],
+            key=lambda message: message.timestamp)
+
+
+class ReplayOrderBookTracker(OrderBookTracker):
+    """
+    Order book tracker that replays recorded diffs, snapshots and trades synchronously.
+
+    The books are not updated by background tasks. They are moved forward by `advance_to`, usually called by
+    `OrderBookReplayIterator` at every clock tick, so a strategy can be run with the clock in backtest mode as fast as
+    the messages can be applied. Trades are applied to the books, which triggers the paper trade exchange matching of
+    its limit orders.
+    """
+    _rt_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._rt_logger is None:
+            cls._rt_logger = logging.getLogger(__name__)
+        return cls._rt_logger
+
+    def __init__(self,
+                 data_source: ReplayOrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 start_time: float,
+                 end_time: Optional[float] = None):
+        super().__init__(data_source=data_source, trading_pairs=trading_pairs)
+        self._start_time = start_time
+        self._end_time = end_time
+        self._messages: Optional[Iterator[OrderBookMessage]] = None
+        self._next_message: Optional[OrderBookMessage] = None
+        self._replayed_messages_count = 0
+
+    @property
+    def data_source(self) -> ReplayOrderBookTrackerDataSource:
+        return self._data_source
+
+    @property
+    def replay_finished(self) -> bool:
+        return self._messages is not None and self._next_message is None
+
+    @property
+    def replayed_messages_count(self) -> int:
+        return self._replayed_messages_count
+
+    def start(self):
+        if self._messages is not None:
+            return
+        for trading_pair in self._trading_pairs:
+            self._order_books[trading_pair] = self._data_source.order_book_create_function()
+        self._messages = self._data_source.messages(start_time=self._start_time, end_time=self._end_time)
+        self._next_message = next(self._messages, None)
+        self.advance_to(self._start_time)
+        self._order_books_initialized.set()
+
+    def stop(self):
+        # Replayed books keep their state, there are no background tasks to stop
+        pass
+
+    def advance_to(self, timestamp: float):
+        """
+        Applies all recorded messages with a timestamp up to `timestamp`.
+        """
+        if self._messages is None:
+            self.start()
+        while self._next_message is not None and self._next_message.timestamp <= timestamp:
+            message = self._next_message
+            self._apply_message(message)
+            self._replayed_messages_count += 1
+            self._next_message = next(self._messages, None)
+
+    def _apply_message(self, message: OrderBookMessage):
+        order_book: OrderBook = self._order_books[message.trading_pair]
+        if message.type is OrderBookMessageType.DIFF:
+            order_book.apply_diffs(message.bids, message.asks, message.update_id)
+        elif message.type is OrderBookMessageType.SNAPSHOT:
+            order_book.apply_snapshot(message.bids, message.asks, message.update_id)
+        elif message.type is OrderBookMessageType.TRADE:
+            order_book.apply_trade(OrderBookTradeEvent(
+                trading_pair=message.trading_pair,
+                timestamp=message.timestamp,
+                price=float(message.content["price"]),
+                amount=float(message.content["amount"]),
+                trade_id=message.trade_id,
+                type=TradeType.SELL if
+                message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
+            ))
+
+
+class OrderBookReplayIterator(PyTimeIterator):
+    """
+    Moves a `ReplayOrderBookTracker` forward with the clock. It has to be added to the clock before the connectors and
+    strategies, so they see the books as of the current tick. When `stop_when_finished` is set a backtest clock stops
+    once all the recorded messages have been replayed.
+    """
+
+    def __init__(self, order_book_tracker: ReplayOrderBookTracker, stop_when_finished: bool = True):
+        super().__init__()
+        self._order_book_tracker = order_book_tracker
+        self._stop_when_finished = stop_when_finished
+
+    @property
+    def order_book_tracker(self) -> ReplayOrderBookTracker:
+        return self._order_book_tracker
+
+    def tick(self, timestamp: float):
+        self._order_book_tracker.advance_to(timestamp)
+        if self._stop_when_finished and self._order_book_tracker.replay_finished:
+            raise StopIteration
@@ -0,0 +1,112 @@
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional
+
+from hummingbot import data_path
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.logger import HummingbotLogger
+
+# Cached files written with a different version are ignored
+CACHE_VERSION = 1
+SYMBOL_MAP_SECTION = "symbol_map"
+TRADING_RULES_SECTION = "trading_rules"
+
+
+class ExchangeInfoCache:
+    """
+    Local cache of the trading pair symbol map and the trading rules of a connector, so that the connector does not
+    have to request the exchange information at startup.
+
+    The cache of each connector is a JSON file in the `exchange_info_cache` data directory. The symbol map and the
+    trading rules are stored in separate sections with the time they were fetched, and a section older than `ttl`
+    seconds is not used.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, connector_name: str, ttl: float, cache_dir: Optional[str] = None):
+        self._connector_name = connector_name
+        self._ttl = ttl
+        cache_dir = Path(cache_dir or os.path.join(data_path(), "exchange_info_cache"))
+        self._file_path = cache_dir / f"{connector_name}.json"
+
+    @property
+    def file_path(self) -> Path:
+        return self._file_path
+
+    def age(self, section: str) -> Optional[float]:
+        """
+        Returns the number of seconds since the section was cached, or None if it is not cached.
+        """
+        content = self._read().get(section)
+        return None if content is None else time.time() - content["timestamp"]
+
+    def symbol_map(self) -> Optional[Dict[str, str]]:
+        """
+        Returns the cached map of exchange symbols to trading pairs, or None if it is not cached or has expired.
+        """
+        return self._valid_data(SYMBOL_MAP_SECTION)
+
+    def trading_rules(self) -> Optional[List[TradingRule]]:
+        """
+        Returns the cached trading rules, or None if they are not cached or have expired.
+        """
+        data = self._valid_data(TRADING_RULES_SECTION)
+        return None if data is None else [TradingRule.from_json(rule) for rule in data]
+
+    def save_symbol_map(self, symbol_map: Mapping[str, str]):
+        self._save_section(SYMBOL_MAP_SECTION, dict(symbol_map))
+
+    def save_trading_rules(self, trading_rules: List[TradingRule]):
+        self._save_section(TRADING_RULES_SECTION, [trading_rule.to_json() for trading_rule in trading_rules])
+
+    def _valid_data(self, section: str) -> Optional[Any]:
+        content = self._read().get(section)
+        if content is None or time.time() - content["timestamp"] > self._ttl:
+            return None
+        return content["data"]
+
+    def _read(self) -> Dict[str, Any]:
+        try:
+            with open(self._file_path) as cache_file:
+                content = json.load(cache_file)
+        except FileNotFoundError:
+            return {}
+        except Exception:
+            self.logger().warning(f"Could not read the exchange info cache {self._file_path}.", exc_info=True)
+            return {}
+        if content.get("version") != CACHE_VERSION or content.get("connector") != self._connector_name:
+            return {}
+        return content
+
+    def _save_section(self, section: str, data: Any):
+        content = self._read()
+        content.update({
+            "version": CACHE_VERSION,
+            "connector": self._connector_name,
+            section: {"timestamp": time.time(), "data": data},
+        })
+        temp_file_path: Optional[str] = None
+        try:
+            self._file_path.parent.mkdir(parents=True, exist_ok=True)
+            # Written to a temporary file first, so that a reader never sees a partially written cache. Each writer
+            # gets its own temporary file, several bots can share the same cache
+            with tempfile.NamedTemporaryFile(
+                mode="w", dir=self._file_path.parent, prefix=f"{self._file_path.stem}.", suffix=".tmp", delete=False
+            ) as cache_file:
+                temp_file_path = cache_file.name
+                json.dump(content, cache_file)
+            os.replace(temp_file_path, self._file_path)
+        except Exception:
+            self.logger().warning(f"Could not write the exchange info cache {self._file_path}.", exc_info=True)
+            if temp_file_path is not None and os.path.exists(temp_file_path):
+                os.remove(temp_file_path)
@@ -7,10 +7,12 @@ from decimal import Decimal
 from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, Dict, List, Optional, Tuple
 
 from async_timeout import timeout
+from bidict import bidict
 
 from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.constants import MINUTE, TWELVE_HOURS, s_decimal_0, s_decimal_NaN
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.exchange_info_cache import TRADING_RULES_SECTION, ExchangeInfoCache
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
@@ -30,6 +32,7 @@ from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
+from hummingbot.core.web_assistant.request_tracer import RequestTrace, get_request_tracer
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.logger import HummingbotLogger
 
@@ -53,6 +56,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._last_timestamp = 0
         self._trading_rules = {}
         self._trading_fees = {}
+        self._exchange_info_cache: Optional[ExchangeInfoCache] = None
 
         self._status_polling_task: Optional[asyncio.Task] = None
         self._user_stream_tracker_task: Optional[asyncio.Task] = None
@@ -70,9 +74,15 @@ class ExchangePyBase(ExchangeBase, ABC):
         # init Auth and Api factory
         self._auth: AuthBase = self.authenticator
         self._web_assistants_factory: WebAssistantsFactory = self._create_web_assistants_factory()
+        connection_pool_config = client_config_map.connection_pools.get(self.name)
+        if connection_pool_config is not None:
+            self._web_assistants_factory.connection_pool_settings = connection_pool_config.build_settings()
 
         # init OrderBook Data Source and Tracker
         self._orderbook_ds: OrderBookTrackerDataSource = self._create_order_book_data_source()
+        order_book_max_depth = client_config_map.order_book_max_depth.get(self.name, 0)
+        if order_book_max_depth > 0:
+            self._orderbook_ds.order_book_create_function = lambda: OrderBook(max_depth=order_book_max_depth)
         self._set_order_book_tracker(OrderBookTracker(
             data_source=self._orderbook_ds,
             trading_pairs=self.trading_pairs,
@@ -94,6 +104,25 @@ class ExchangePyBase(ExchangeBase, ABC):
     def name(self) -> str:
         raise NotImplementedError
 
+    @property
+    def exchange_info_cache(self) -> Optional[ExchangeInfoCache]:
+        """
+        The local cache of the trading pair symbol map and the trading rules, None if it is disabled in the client
+        configuration
+        """
+        cache_config = self._client_config.exchange_info_cache
+        if self._exchange_info_cache is None and cache_config.exchange_info_cache_enabled:
+            self._exchange_info_cache = ExchangeInfoCache(
+                connector_name=self.name, ttl=cache_config.exchange_info_cache_ttl)
+        return self._exchange_info_cache
+
+    @property
+    def connection_pool_stats(self) -> Dict[str, Any]:
+        """
+        Usage of the HTTP connection pool of the connector (connections in use, idle and the pool saturation)
+        """
+        return self._web_assistants_factory.connection_pool_stats()
+
     @property
     @abstractmethod
     def authenticator(self) -> AuthBase:
@@ -407,6 +436,28 @@ class ExchangePyBase(ExchangeBase, ABC):
         :param order_type: the type of order to create (MARKET, LIMIT, LIMIT_MAKER)
         :param price: the order price
         """
+        tracer = get_request_tracer()
+        if not tracer.enabled:
+            await self._validate_and_place_order(
+                trade_type, order_id, trading_pair, amount, order_type, price, None, **kwargs)
+            return
+        with tracer.request_context(connector=self.name, order_id=order_id):
+            trace = tracer.start_trace("create_order")
+            try:
+                await self._validate_and_place_order(
+                    trade_type, order_id, trading_pair, amount, order_type, price, trace, **kwargs)
+            finally:
+                tracer.finish_trace(trace)
+
+    async def _validate_and_place_order(self,
+                                        trade_type: TradeType,
+                                        order_id: str,
+                                        trading_pair: str,
+                                        amount: Decimal,
+                                        order_type: OrderType,
+                                        price: Optional[Decimal],
+                                        trace: Optional[RequestTrace],
+                                        **kwargs):
         trading_rule = self._trading_rules[trading_pair]
 
         if order_type in [OrderType.LIMIT, OrderType.LIMIT_MAKER]:
@@ -448,8 +499,13 @@ class ExchangePyBase(ExchangeBase, ABC):
                                   f"created. Increase the amount or the price to be higher than the minimum notional.")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
             return
+
+        if trace is not None:
+            trace.mark("validation")
         try:
             await self._place_order_and_process_update(order=order, **kwargs,)
+            if trace is not None:
+                trace.mark("place_order")
 
         except asyncio.CancelledError:
             raise
@@ -666,6 +722,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         - The background task to process the events received through the user stream tracker (websocket connection)
         """
         self._stop_network()
+        if self._web_assistants_factory.connection_pool_settings.pre_warm_connections > 0:
+            safe_ensure_future(self._pre_warm_connections())
         self.order_book_tracker.start()
         if self.is_trading_required:
             self._trading_rules_polling_task = safe_ensure_future(self._trading_rules_polling_loop())
@@ -694,6 +752,19 @@ class ExchangePyBase(ExchangeBase, ABC):
             return NetworkStatus.NOT_CONNECTED
         return NetworkStatus.CONNECTED
 
+    async def _pre_warm_connections(self):
+        """
+        Opens the configured number of keep-alive connections to the exchange REST API host, so the first requests
+        reuse them instead of establishing new connections
+        """
+        try:
+            url = await self._api_request_url(path_url=self.check_network_request_path)
+            await self._web_assistants_factory.pre_warm_connections(url=url)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().debug("Error pre-warming the connections to the exchange API.", exc_info=True)
+
     def _stop_network(self):
         # Resets timestamps and events for status_polling_loop
         self._last_poll_timestamp = 0
@@ -727,9 +798,13 @@ class ExchangePyBase(ExchangeBase, ABC):
         Updates the trading rules by requesting the latest definitions from the exchange.
         Executes regularly every 30 minutes
         """
+        refresh_delay = self._load_exchange_info_from_cache()
+        if refresh_delay > 0:
+            await self._sleep(refresh_delay)
         while True:
             try:
                 await safe_gather(self._update_trading_rules())
+                await self._save_exchange_info_to_cache()
                 await self._sleep(self.TRADING_RULES_INTERVAL)
             except NotImplementedError:
                 raise
@@ -896,6 +971,26 @@ class ExchangePyBase(ExchangeBase, ABC):
             **kwargs,
     ) -> Dict[str, Any]:
 
+        tracer = get_request_tracer()
+        if tracer.enabled:
+            with tracer.request_context(connector=self.name):
+                return await self._execute_api_request(
+                    path_url, overwrite_url, method, params, data, is_auth_required, return_err, limit_id, headers)
+        return await self._execute_api_request(
+            path_url, overwrite_url, method, params, data, is_auth_required, return_err, limit_id, headers)
+
+    async def _execute_api_request(
+            self,
+            path_url,
+            overwrite_url: Optional[str],
+            method: RESTMethod,
+            params: Optional[Dict[str, Any]],
+            data: Optional[Dict[str, Any]],
+            is_auth_required: bool,
+            return_err: bool,
+            limit_id: Optional[str],
+            headers: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
         last_exception = None
         rest_assistant = await self._web_assistants_factory.get_rest_assistant()
 
@@ -1068,13 +1163,56 @@ class ExchangePyBase(ExchangeBase, ABC):
     def _create_order_tracker(self) -> ClientOrderTracker:
         return ClientOrderTracker(connector=self)
 
-    async def _initialize_trading_pair_symbol_map(self):
+    async def _initialize_trading_pair_symbol_map(self, cached_symbol_map: Optional[Dict[str, str]] = None):
+        """
+        Initializes the symbol map with the cached map if one is given or available in the exchange info cache, and
+        with the exchange information requested from the exchange otherwise.
+
+        :param cached_symbol_map: map of exchange symbols to trading pairs
+        """
+        if cached_symbol_map is None and self.exchange_info_cache is not None:
+            cached_symbol_map = self.exchange_info_cache.symbol_map()
+        if cached_symbol_map:
+            self._set_trading_pair_symbol_map(bidict(cached_symbol_map))
+            return
         try:
             exchange_info = await self._make_trading_pairs_request()
             self._initialize_trading_pair_symbols_from_exchange_info(exchange_info=exchange_info)
+            if self.exchange_info_cache is not None and self.trading_pair_symbol_map_ready():
+                self.exchange_info_cache.save_symbol_map(await self.trading_pair_symbol_map())
         except Exception:
             self.logger().exception("There was an error requesting exchange info.")
 
+    def _load_exchange_info_from_cache(self) -> float:
+        """
+        Sets the trading rules and the symbol map from the exchange info cache, when both are cached and have not
+        expired.
+
+        :return: the time to wait before requesting the trading rules, TRADING_RULES_INTERVAL after they were cached,
+        or 0 if nothing was loaded from the cache
+        """
+        cache = self.exchange_info_cache
+        if cache is None:
+            return 0
+        trading_rules = cache.trading_rules()
+        symbol_map = cache.symbol_map()
+        if trading_rules is None or symbol_map is None:
+            return 0
+        self._trading_rules.clear()
+        for trading_rule in trading_rules:
+            self._trading_rules[trading_rule.trading_pair] = trading_rule
+        if not self.trading_pair_symbol_map_ready():
+            self._set_trading_pair_symbol_map(bidict(symbol_map))
+        return max(self.TRADING_RULES_INTERVAL - cache.age(TRADING_RULES_SECTION), 0)
+
+    async def _save_exchange_info_to_cache(self):
+        cache = self.exchange_info_cache
+        if cache is None:
+            return
+        if self.trading_pair_symbol_map_ready():
+            cache.save_symbol_map(await self.trading_pair_symbol_map())
+        cache.save_trading_rules(list(self._trading_rules.values()))
+
     async def _make_network_check_request(self):
         await self._api_get(path_url=self.check_network_request_path)
 
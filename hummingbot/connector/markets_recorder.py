@@ -6,7 +6,7 @@ import threading
 import time
 from decimal import Decimal
 from shutil import move
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 import pandas as pd
 from sqlalchemy.orm import Query, Session
@@ -35,6 +35,7 @@ from hummingbot.core.event.events import (
     SellOrderCreatedEvent,
 )
 from hummingbot.logger import HummingbotLogger
+from hummingbot.model.controller_performance import ControllerPerformance
 from hummingbot.model.controllers import Controllers
 from hummingbot.model.executors import Executors
 from hummingbot.model.funding_payment import FundingPayment
@@ -46,8 +47,9 @@ from hummingbot.model.range_position_collected_fees import RangePositionCollecte
 from hummingbot.model.range_position_update import RangePositionUpdate
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.strategy.order_attribution import OrderAttribution
 from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
-from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
+from hummingbot.strategy_v2.models.executors_info import ExecutorInfo, PerformanceReport
 
 
 class MarketsRecorder:
@@ -75,7 +77,13 @@ class MarketsRecorder:
                  markets: List[ConnectorBase],
                  config_file_path: str,
                  strategy_name: str,
-                 market_data_collection: MarketDataCollectionConfigMap):
+                 market_data_collection: MarketDataCollectionConfigMap,
+                 order_attribution: Optional[OrderAttribution] = None):
+        """
+        :param order_attribution: when the markets are shared by several strategies, the order events are recorded
+        under the configuration file and the name of the strategy that created the order. The events of unknown
+        orders are recorded under `config_file_path` and `strategy_name`.
+        """
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -86,15 +94,21 @@ class MarketsRecorder:
         self._strategy_name: str = strategy_name
         self._market_data_collection_config: MarketDataCollectionConfigMap = market_data_collection
         self._market_data_collection_task: Optional[asyncio.Task] = None
+        self._order_attribution: Optional[OrderAttribution] = order_attribution
+        config_file_paths: List[str] = [self._config_file_path]
+        if order_attribution is not None:
+            config_file_paths.extend(order_attribution.config_file_paths)
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
-            trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
-            market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(tf.market,
-                                                                               tf.exchange_trade_id,
-                                                                               tf.symbol) for tf in trade_fills})
+            for config_file_path in config_file_paths:
+                trade_fills = self.get_trades_for_config(config_file_path, 2000)
+                market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(tf.market,
+                                                                                   tf.exchange_trade_id,
+                                                                                   tf.symbol) for tf in trade_fills})
 
-            exchange_order_ids = self.get_orders_for_config_and_market(self._config_file_path, market, True, 2000)
-            market.add_exchange_order_ids_from_market_recorder({o.exchange_order_id: o.id for o in exchange_order_ids})
+                exchange_order_ids = self.get_orders_for_config_and_market(config_file_path, market, True, 2000)
+                market.add_exchange_order_ids_from_market_recorder(
+                    {o.exchange_order_id: o.id for o in exchange_order_ids})
 
         self._create_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_create_order)
         self._fill_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_fill_order)
@@ -192,21 +206,64 @@ class MarketsRecorder:
         if self._market_data_collection_task is not None:
             self._market_data_collection_task.cancel()
 
+    def _order_owner(self, order_id: str) -> Tuple[str, str]:
+        """
+        Returns the configuration file and the strategy name the events of the order are recorded under.
+        """
+        if self._order_attribution is not None:
+            config_file_path: Optional[str] = self._order_attribution.owner(order_id)
+            if config_file_path is not None:
+                return config_file_path, self._order_attribution.strategy_name(config_file_path)
+        return self._config_file_path, self._strategy_name
+
     def store_or_update_executor(self, executor):
+        executor_info = executor.executor_info
+        executor_columns = json.loads(executor_info.json())
         with self._sql_manager.get_new_session() as session:
             existing_executor = session.query(Executors).filter(Executors.id == executor.config.id).one_or_none()
+            performance = self._get_or_create_controller_performance(session, executor_info.controller_id)
 
             if existing_executor:
-                # Update existing executor
-                for attr, value in vars(executor).items():
+                # Update existing executor, replacing its contribution to the controller performance
+                performance.add_executor(existing_executor.net_pnl_quote,
+                                         existing_executor.filled_amount_quote,
+                                         existing_executor.close_type,
+                                         sign=-1)
+                for attr, value in executor_columns.items():
                     setattr(existing_executor, attr, value)
             else:
                 # Insert new executor
-                serialized_config = executor.executor_info.json()
-                new_executor = Executors(**json.loads(serialized_config))
-                session.add(new_executor)
+                session.add(Executors(**executor_columns))
+            performance.add_executor(executor_columns["net_pnl_quote"],
+                                     executor_columns["filled_amount_quote"],
+                                     executor_columns["close_type"])
+            performance.last_update_timestamp = time.time()
             session.commit()
 
+    @staticmethod
+    def _get_or_create_controller_performance(session: Session, controller_id: Optional[str]) -> ControllerPerformance:
+        # Executors without controller are aggregated with the ones of the default controller id
+        controller_id = controller_id or "main"
+        performance = session.query(ControllerPerformance).filter(
+            ControllerPerformance.controller_id == controller_id).one_or_none()
+        if performance is None:
+            performance = ControllerPerformance(controller_id=controller_id,
+                                                executors_count=0,
+                                                realized_pnl_quote=0.0,
+                                                volume_traded=0.0,
+                                                close_type_counts={})
+            session.add(performance)
+        return performance
+
+    def get_controllers_performance(self) -> Dict[str, PerformanceReport]:
+        """
+        Realized P&L, volume and close type counts of the stored executors of each controller, read from the
+        aggregates maintained when the executors are stored.
+        """
+        with self._sql_manager.get_new_session() as session:
+            return {performance.controller_id: performance.to_performance_report()
+                    for performance in session.query(ControllerPerformance).all()}
+
     def store_controller_config(self, controller_config: ControllerConfigBase):
         with self._sql_manager.get_new_session() as session:
             config = json.loads(controller_config.json())
@@ -223,16 +280,50 @@ class MarketsRecorder:
             executors = session.query(Executors).filter(Executors.id.in_(executor_ids)).all()
             return executors
 
-    def get_executors_by_controller(self, controller_id: str = None) -> List[ExecutorInfo]:
+    def get_executors_by_controller(self,
+                                    controller_id: str = None,
+                                    limit: Optional[int] = None,
+                                    offset: int = 0) -> List[ExecutorInfo]:
+        """
+        Stored executors of a controller, oldest first. Use `limit` and `offset` to get them in pages.
+        """
         with self._sql_manager.get_new_session() as session:
-            executors = session.query(Executors).filter(Executors.controller_id == controller_id).all()
-            return [executor.to_executor_info() for executor in executors]
+            query: Query = (session
+                            .query(Executors)
+                            .filter(Executors.controller_id == controller_id)
+                            .order_by(Executors.timestamp, Executors.id))
+            if limit is not None:
+                query = query.limit(limit).offset(offset)
+            return [executor.to_executor_info() for executor in query.all()]
 
     def get_all_executors(self) -> List[ExecutorInfo]:
         with self._sql_manager.get_new_session() as session:
             executors = session.query(Executors).all()
             return [executor.to_executor_info() for executor in executors]
 
+    def iter_executors(self, controller_id: Optional[str] = None, page_size: int = 1000) -> Iterator[ExecutorInfo]:
+        """
+        Iterates the stored executors (of a controller if `controller_id` is set) oldest first, loading them from the
+        database in pages of `page_size` executors.
+        """
+        last_key: Optional[Tuple[float, str]] = None
+        while True:
+            with self._sql_manager.get_new_session() as session:
+                query: Query = session.query(Executors)
+                if controller_id is not None:
+                    query = query.filter(Executors.controller_id == controller_id)
+                if last_key is not None:
+                    query = query.filter(
+                        (Executors.timestamp > last_key[0])
+                        | ((Executors.timestamp == last_key[0]) & (Executors.id > last_key[1])))
+                page = query.order_by(Executors.timestamp, Executors.id).limit(page_size).all()
+                executors_info = [executor.to_executor_info() for executor in page]
+                if len(page) > 0:
+                    last_key = (page[-1].timestamp, page[-1].id)
+            yield from executors_info
+            if len(executors_info) < page_size:
+                return
+
     def get_orders_for_config_and_market(self, config_file_path: str, market: ConnectorBase,
                                          with_exchange_order_id_present: Optional[bool] = False,
                                          number_of_rows: Optional[int] = None) -> List[Order]:
@@ -282,6 +373,22 @@ class MarketsRecorder:
             if market_states is not None:
                 market.restore_tracking_states(market_states.saved_state)
 
+    def restore_latest_market_states(self, config_file_paths: List[str], market: ConnectorBase):
+        """
+        Restores the most recent market states saved under any of the configuration files. The strategies hosted
+        together share the markets, so the states saved by each of them are snapshots of the whole market.
+        """
+        with self._sql_manager.get_new_session() as session:
+            market_states: Optional[MarketState] = (session
+                                                    .query(MarketState)
+                                                    .filter(MarketState.config_file_path.in_(config_file_paths),
+                                                            MarketState.market == market.display_name)
+                                                    .order_by(MarketState.timestamp.desc())
+                                                    .first())
+
+            if market_states is not None:
+                market.restore_tracking_states(market_states.saved_state)
+
     def get_market_states(self,
                           config_file_path: str,
                           market: ConnectorBase,
@@ -304,12 +411,13 @@ class MarketsRecorder:
         base_asset, quote_asset = evt.trading_pair.split("-")
         timestamp = int(evt.creation_timestamp * 1e3)
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
+        config_file_path, strategy_name = self._order_owner(evt.order_id)
 
         with self._sql_manager.get_new_session() as session:
             with session.begin():
                 order_record: Order = Order(id=evt.order_id,
-                                            config_file_path=self._config_file_path,
-                                            strategy=self._strategy_name,
+                                            config_file_path=config_file_path,
+                                            strategy=strategy_name,
                                             market=market.display_name,
                                             symbol=evt.trading_pair,
                                             base_asset=base_asset,
@@ -329,7 +437,7 @@ class MarketsRecorder:
                 session.add(order_record)
                 session.add(order_status)
                 market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-                self.save_market_states(self._config_file_path, market, session=session)
+                self.save_market_states(config_file_path, market, session=session)
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -343,6 +451,7 @@ class MarketsRecorder:
         timestamp: int = int(evt.timestamp * 1e3) if evt.timestamp is not None else self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
+        config_file_path, strategy_name = self._order_owner(order_id)
 
         with self._sql_manager.get_new_session() as session:
             with session.begin():
@@ -369,8 +478,8 @@ class MarketsRecorder:
                     self.logger().error(f"Error calculating fee in quote: {e}, will be stored in the DB as 0.")
                     fee_in_quote = 0
                 trade_fill_record: TradeFill = TradeFill(
-                    config_file_path=self.config_file_path,
-                    strategy=self.strategy_name,
+                    config_file_path=config_file_path,
+                    strategy=strategy_name,
                     market=market.display_name,
                     symbol=evt.trading_pair,
                     base_asset=base_asset,
@@ -389,7 +498,7 @@ class MarketsRecorder:
                 )
                 session.add(order_status)
                 session.add(trade_fill_record)
-                self.save_market_states(self._config_file_path, market, session=session)
+                self.save_market_states(config_file_path, market, session=session)
 
                 market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
                                                                                    trade_fill_record.exchange_trade_id,
@@ -475,7 +584,9 @@ class MarketsRecorder:
                                                             timestamp=timestamp,
                                                             status=event_type.name)
                     session.add(order_status)
-                    self.save_market_states(self._config_file_path, market, session=session)
+                    self.save_market_states(order_record.config_file_path, market, session=session)
+        if self._order_attribution is not None:
+            self._order_attribution.complete_order(order_id)
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -2,7 +2,7 @@ import asyncio
 import logging
 import time
 from collections import deque
-from typing import Awaitable, Deque
+from typing import Awaitable, Deque, Optional
 
 import numpy
 
@@ -22,6 +22,8 @@ class TimeSynchronizer:
 
     def __init__(self):
         self._time_offset_ms: Deque[float] = deque(maxlen=5)
+        # The offset is recalculated only when the samples change, not every time the current time is requested
+        self._calculated_time_offset_ms: Optional[float] = None
         self._lock = asyncio.Lock()
 
     @classmethod
@@ -35,17 +37,17 @@ class TimeSynchronizer:
         if not self._time_offset_ms:
             offset = (self._time() - self._current_seconds_counter()) * 1e3
         else:
-            median = numpy.median(self._time_offset_ms)
-            weighted_average = numpy.average(self._time_offset_ms, weights=range(1, len(self._time_offset_ms) * 2 + 1, 2))
-            offset = numpy.mean([median, weighted_average])
+            offset = self._calculated_time_offset_ms
 
         return offset
 
     def add_time_offset_ms_sample(self, offset: float):
         self._time_offset_ms.append(offset)
+        self._calculated_time_offset_ms = self._calculate_time_offset_ms()
 
     def clear_time_offset_ms_samples(self):
         self._time_offset_ms.clear()
+        self._calculated_time_offset_ms = None
 
     def time(self) -> float:
         """
@@ -89,6 +91,11 @@ class TimeSynchronizer:
                 # This is done to avoid the warning message from asyncio framework saying a coroutine was not awaited
                 time_provider.close()
 
+    def _calculate_time_offset_ms(self) -> float:
+        median = numpy.median(self._time_offset_ms)
+        weighted_average = numpy.average(self._time_offset_ms, weights=range(1, len(self._time_offset_ms) * 2 + 1, 2))
+        return numpy.mean([median, weighted_average])
+
     def _current_seconds_counter(self):
         return time.perf_counter()
 
@@ -1,5 +1,5 @@
 from decimal import Decimal
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from hummingbot.connector.utils import split_hb_trading_pair
 
@@ -53,3 +53,38 @@ cdef class TradingRule:
                f"buy_order_collateral_token={self.buy_order_collateral_token}, " \
                f"sell_order_collateral_token={self.sell_order_collateral_token}," \
                f")"
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "trading_pair": self.trading_pair,
+            "min_order_size": str(self.min_order_size),
+            "max_order_size": str(self.max_order_size),
+            "min_price_increment": str(self.min_price_increment),
+            "min_base_amount_increment": str(self.min_base_amount_increment),
+            "min_quote_amount_increment": str(self.min_quote_amount_increment),
+            "min_notional_size": str(self.min_notional_size),
+            "min_order_value": str(self.min_order_value),
+            "max_price_significant_digits": str(self.max_price_significant_digits),
+            "supports_limit_orders": self.supports_limit_orders,
+            "supports_market_orders": self.supports_market_orders,
+            "buy_order_collateral_token": self.buy_order_collateral_token,
+            "sell_order_collateral_token": self.sell_order_collateral_token,
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "TradingRule":
+        return TradingRule(
+            trading_pair=data["trading_pair"],
+            min_order_size=Decimal(data["min_order_size"]),
+            max_order_size=Decimal(data["max_order_size"]),
+            min_price_increment=Decimal(data["min_price_increment"]),
+            min_base_amount_increment=Decimal(data["min_base_amount_increment"]),
+            min_quote_amount_increment=Decimal(data["min_quote_amount_increment"]),
+            min_notional_size=Decimal(data["min_notional_size"]),
+            min_order_value=Decimal(data["min_order_value"]),
+            max_price_significant_digits=Decimal(data["max_price_significant_digits"]),
+            supports_limit_orders=data["supports_limit_orders"],
+            supports_market_orders=data["supports_market_orders"],
+            buy_order_collateral_token=data["buy_order_collateral_token"],
+            sell_order_collateral_token=data["sell_order_collateral_token"],
+        )
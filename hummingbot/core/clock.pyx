@@ -3,8 +3,9 @@
 import asyncio
 import logging
 import time
-from typing import List
+from typing import List, Optional
 
+from hummingbot.core.clock_tick_profiler import ClockTickProfiler
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.clock_mode import ClockMode
@@ -36,6 +37,7 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._tick_profiler = None
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -57,6 +59,20 @@ cdef class Clock:
     def current_timestamp(self) -> float:
         return self._current_tick
 
+    @property
+    def tick_profiler(self) -> Optional[ClockTickProfiler]:
+        return self._tick_profiler
+
+    def enable_tick_profiling(self, overrun_budget_pct: float = 80.0):
+        """
+        Records the tick durations of the child iterators and the tick lateness in real time mode, and warns when a
+        tick ends more than `overrun_budget_pct` percent of the tick size after its scheduled time.
+        """
+        self._tick_profiler = ClockTickProfiler(self._tick_size, overrun_budget_pct)
+
+    def disable_tick_profiling(self):
+        self._tick_profiler = None
+
     def __enter__(self) -> Clock:
         if self._current_context is not None:
             raise EnvironmentError("Clock context is not re-entrant.")
@@ -81,6 +97,8 @@ cdef class Clock:
             (<TimeIterator>iterator).c_stop(self)
             self._current_context.remove(iterator)
         self._child_iterators.remove(iterator)
+        if self._tick_profiler is not None:
+            self._tick_profiler.forget_iterator(iterator)
 
     async def run(self):
         await self.run_til(float("nan"))
@@ -90,6 +108,10 @@ cdef class Clock:
             TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            double tick_start
+            double iterator_start
+            int skipped_ticks
+            object tick_profiler
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
@@ -109,12 +131,24 @@ cdef class Clock:
 
                 # Sleep until the next tick
                 next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
+                tick_profiler = self._tick_profiler
+                if tick_profiler is not None:
+                    # Ticks are skipped when the previous tick ends after the scheduled time of the next one
+                    skipped_ticks = <int>round((next_tick_time - self._current_tick) / self._tick_size) - 1
+                    if skipped_ticks > 0:
+                        tick_profiler.record_skipped_ticks(skipped_ticks)
                 await asyncio.sleep(next_tick_time - now)
                 self._current_tick = next_tick_time
 
+                if tick_profiler is not None:
+                    tick_start = time.time()
+                    tick_profiler.record_lateness(next_tick_time, tick_start)
+
                 # Run through all the child iterators.
                 for ci in self._current_context:
                     child_iterator = ci
+                    if tick_profiler is not None:
+                        iterator_start = time.perf_counter()
                     try:
                         child_iterator.c_tick(self._current_tick)
                     except StopIteration:
@@ -122,6 +156,12 @@ cdef class Clock:
                         return
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                    if tick_profiler is not None:
+                        tick_profiler.record_iterator(child_iterator, time.perf_counter() - iterator_start)
+
+                if tick_profiler is not None:
+                    now = time.time()
+                    tick_profiler.record_tick(next_tick_time, now, now - tick_start)
         finally:
             for ci in self._current_context:
                 child_iterator = ci
@@ -0,0 +1,116 @@
+import logging
+from typing import Any, Dict, Optional
+
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
+from hummingbot.logger import HummingbotLogger
+
+
+class ClockTickProfiler:
+    """
+    Tick statistics of a real time clock: the duration of the ticks of each child iterator, the lateness of the ticks
+    (how long after the scheduled time they start) and the ticks skipped because the previous one took too long.
+
+    A tick overruns when its lateness plus its duration exceeds `overrun_budget_pct` percent of the tick size. Overruns
+    are logged as warnings, at most once every `warning_interval` seconds.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, tick_size: float, overrun_budget_pct: float = 80.0, warning_interval: float = 60.0):
+        self._tick_size = tick_size
+        self._overrun_budget = tick_size * overrun_budget_pct / 100
+        self._warning_interval = warning_interval
+        self._iterator_durations: Dict[Any, LatencyHistogram] = {}
+        self._tick_durations = LatencyHistogram()
+        self._lateness = LatencyHistogram()
+        self._overruns = 0
+        self._skipped_ticks = 0
+        self._overruns_since_warning = 0
+        self._last_warning_time = 0.0
+        self._slowest_iterator: Optional[Any] = None
+        self._slowest_iterator_duration = 0.0
+
+    @property
+    def overruns(self) -> int:
+        return self._overruns
+
+    @property
+    def skipped_ticks(self) -> int:
+        return self._skipped_ticks
+
+    def record_lateness(self, scheduled_time: float, start_time: float):
+        self._lateness.add(max(start_time - scheduled_time, 0.0))
+
+    def record_skipped_ticks(self, count: int):
+        self._skipped_ticks += count
+
+    def record_iterator(self, iterator: Any, duration: float):
+        histogram = self._iterator_durations.get(iterator)
+        if histogram is None:
+            histogram = self._iterator_durations[iterator] = LatencyHistogram()
+        histogram.add(duration)
+        if duration > self._slowest_iterator_duration:
+            self._slowest_iterator = iterator
+            self._slowest_iterator_duration = duration
+
+    def forget_iterator(self, iterator: Any):
+        """
+        Drops the tick durations of an iterator removed from the clock, so the profiler does not keep it alive.
+        """
+        self._iterator_durations.pop(iterator, None)
+        if self._slowest_iterator is iterator:
+            self._slowest_iterator = None
+            self._slowest_iterator_duration = 0.0
+
+    def record_tick(self, scheduled_time: float, end_time: float, duration: float):
+        self._tick_durations.add(duration)
+        if end_time - scheduled_time > self._overrun_budget:
+            self._overruns += 1
+            self._overruns_since_warning += 1
+            if end_time - self._last_warning_time >= self._warning_interval:
+                self.logger().warning(
+                    f"The clock tick scheduled at {scheduled_time} ended {end_time - scheduled_time:.3f}s later, over "
+                    f"the budget of {self._overrun_budget:.3f}s ({self._overruns_since_warning} overruns since the "
+                    f"last warning). The slowest iterator is {self.iterator_name(self._slowest_iterator)} "
+                    f"({self._slowest_iterator_duration * 1000:.1f} ms).")
+                self._last_warning_time = end_time
+                self._overruns_since_warning = 0
+        self._slowest_iterator = None
+        self._slowest_iterator_duration = 0.0
+
+    @staticmethod
+    def iterator_name(iterator: Any) -> str:
+        name = getattr(iterator, "name", None)
+        return name if isinstance(name, str) else type(iterator).__name__
+
+    def stats(self) -> Dict[str, Any]:
+        iterators: Dict[str, Dict[str, Any]] = {}
+        for iterator, histogram in self._iterator_durations.items():
+            name = self.iterator_name(iterator)
+            # Several iterators of the same class (hosted strategies) are told apart by their position
+            if name in iterators:
+                name = f"{name} #{sum(1 for key in iterators if key.split(' #')[0] == name) + 1}"
+            iterators[name] = histogram.to_dict()
+        return {
+            "tick_size": self._tick_size,
+            "overrun_budget": self._overrun_budget,
+            "overruns": self._overruns,
+            "skipped_ticks": self._skipped_ticks,
+            "lateness": self._lateness.to_dict(),
+            "tick_duration": self._tick_durations.to_dict(),
+            "iterators": iterators,
+        }
+
+    def format_status(self) -> str:
+        stats = self.stats()
+        lines = [f"  Clock ticks: {stats['tick_duration']['count']}, overruns: {self._overruns}, "
+                 f"skipped: {self._skipped_ticks}, "
+                 f"lateness mean/max: {stats['lateness']['mean_ms']:.1f}/{stats['lateness']['max_ms']:.1f} ms"]
+        for name, iterator_stats in sorted(stats["iterators"].items(), key=lambda item: -item[1]["mean_ms"]):
+            lines.append(f"    {name}: mean {iterator_stats['mean_ms']:.2f} ms, max {iterator_stats['max_ms']:.2f} ms")
+        return "\n".join(lines)
@@ -0,0 +1,125 @@
+#include "FlatOrderBookSide.h"
+#include <algorithm>
+#include <limits>
+
+FlatOrderBookSide::FlatOrderBookSide() {
+    this->bids = true;
+}
+
+FlatOrderBookSide::FlatOrderBookSide(bool bids) {
+    this->bids = bids;
+}
+
+FlatOrderBookSide::FlatOrderBookSide(const FlatOrderBookSide &other) {
+    this->levels = other.levels;
+    this->bids = other.bids;
+}
+
+FlatOrderBookSide &FlatOrderBookSide::operator=(const FlatOrderBookSide &other) {
+    this->levels = other.levels;
+    this->bids = other.bids;
+    return *this;
+}
+
+std::vector<OrderBookEntry>::iterator FlatOrderBookSide::position(double price) {
+    if (this->bids) {
+        return std::lower_bound(this->levels.begin(), this->levels.end(), price,
+                                [](const OrderBookEntry &entry, double p) { return entry.getPrice() < p; });
+    }
+    return std::lower_bound(this->levels.begin(), this->levels.end(), price,
+                            [](const OrderBookEntry &entry, double p) { return entry.getPrice() > p; });
+}
+
+void FlatOrderBookSide::shrink() {
+    // Releases the memory left unused after a deep snapshot or the truncation of a depth capped side
+    if (this->levels.capacity() > 2 * this->levels.size() + 64) {
+        this->levels.shrink_to_fit();
+    }
+}
+
+void FlatOrderBookSide::clear() {
+    this->levels.clear();
+}
+
+void FlatOrderBookSide::assign(const std::vector<OrderBookEntry> &entries) {
+    this->levels = entries;
+    if (this->bids) {
+        std::stable_sort(this->levels.begin(), this->levels.end(),
+                         [](const OrderBookEntry &a, const OrderBookEntry &b) { return a.getPrice() < b.getPrice(); });
+    } else {
+        std::stable_sort(this->levels.begin(), this->levels.end(),
+                         [](const OrderBookEntry &a, const OrderBookEntry &b) { return a.getPrice() > b.getPrice(); });
+    }
+    // As when inserting in a set, the first entry of a price is kept
+    this->levels.erase(
+        std::unique(this->levels.begin(), this->levels.end(),
+                    [](const OrderBookEntry &a, const OrderBookEntry &b) { return a.getPrice() == b.getPrice(); }),
+        this->levels.end());
+    this->shrink();
+}
+
+void FlatOrderBookSide::set(const OrderBookEntry &entry) {
+    std::vector<OrderBookEntry>::iterator it = this->position(entry.getPrice());
+    if (it != this->levels.end() && it->getPrice() == entry.getPrice()) {
+        *it = entry;
+    } else {
+        this->levels.insert(it, entry);
+    }
+}
+
+void FlatOrderBookSide::remove(double price) {
+    std::vector<OrderBookEntry>::iterator it = this->position(price);
+    if (it != this->levels.end() && it->getPrice() == price) {
+        this->levels.erase(it);
+    }
+}
+
+void FlatOrderBookSide::removeBest() {
+    this->levels.pop_back();
+}
+
+double FlatOrderBookSide::truncate(size_t maxDepth) {
+    // Returns the best price removed, NaN if no level was removed
+    if (this->levels.size() <= maxDepth) {
+        return std::numeric_limits<double>::quiet_NaN();
+    }
+    size_t removedCount = this->levels.size() - maxDepth;
+    double bestRemovedPrice = this->levels[removedCount - 1].getPrice();
+    this->levels.erase(this->levels.begin(), this->levels.begin() + removedCount);
+    this->shrink();
+    return bestRemovedPrice;
+}
+
+size_t FlatOrderBookSide::size() const {
+    return this->levels.size();
+}
+
+size_t FlatOrderBookSide::capacity() const {
+    return this->levels.capacity();
+}
+
+const OrderBookEntry &FlatOrderBookSide::level(size_t depth) const {
+    return this->levels[this->levels.size() - 1 - depth];
+}
+
+void truncateOverlapLevels(FlatOrderBookSide &bidSide, FlatOrderBookSide &askSide, const int &dex) {
+    // Same rules as truncateOverlapEntries() for the set based order book
+    while (!bidSide.levels.empty() && !askSide.levels.empty()) {
+        const OrderBookEntry &topBid = bidSide.levels.back();
+        const OrderBookEntry &topAsk = askSide.levels.back();
+        if (topBid.getPrice() < topAsk.getPrice()) {
+            break;
+        }
+        bool bidWins;
+        if (dex != 0) {
+            bidWins = topBid.getAmount() * topBid.getPrice() > topAsk.getAmount() * topAsk.getPrice();
+        } else {
+            bidWins = topBid.getUpdateId() > topAsk.getUpdateId();
+        }
+        if (bidWins) {
+            askSide.levels.pop_back();
+        } else {
+            bidSide.levels.pop_back();
+        }
+    }
+}
@@ -0,0 +1,37 @@
+#ifndef _FLAT_ORDER_BOOK_SIDE_H
+#define _FLAT_ORDER_BOOK_SIDE_H
+
+#include <stdint.h>
+#include <vector>
+#include "OrderBookEntry.h"
+
+class FlatOrderBookSide {
+    // Levels in a contiguous array sorted from the worst to the best price. Most diffs update the top levels, which
+    // are at the end of the array, so inserting or erasing them only moves the few levels after them.
+    std::vector<OrderBookEntry> levels;
+    bool bids;
+
+    std::vector<OrderBookEntry>::iterator position(double price);
+    void shrink();
+
+    public:
+        FlatOrderBookSide();
+        FlatOrderBookSide(bool bids);
+        FlatOrderBookSide(const FlatOrderBookSide &other);
+        FlatOrderBookSide &operator=(const FlatOrderBookSide &other);
+
+        void clear();
+        void assign(const std::vector<OrderBookEntry> &entries);
+        void set(const OrderBookEntry &entry);
+        void remove(double price);
+        void removeBest();
+        double truncate(size_t maxDepth);
+
+        size_t size() const;
+        size_t capacity() const;
+        const OrderBookEntry &level(size_t depth) const;
+
+        friend void truncateOverlapLevels(FlatOrderBookSide &bidSide, FlatOrderBookSide &askSide, const int &dex);
+};
+
+#endif
@@ -20,8 +20,11 @@ PyRef::~PyRef() {
 }
 
 PyRef &PyRef::operator=(const PyRef &other) {
+    // The new object is referenced before the old one is released, in case both are the same object
+    PyObject *old = this->obj;
     this->obj = other.obj;
     Py_XINCREF(this->obj);
+    Py_XDECREF(old);
     return *this;
 }
 
@@ -0,0 +1,23 @@
+# distutils: language=c++
+
+from libcpp.vector cimport vector
+
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+
+cdef extern from "../cpp/FlatOrderBookSide.h":
+    cdef cppclass FlatOrderBookSide:
+        FlatOrderBookSide()
+        FlatOrderBookSide(bint bids)
+        FlatOrderBookSide(const FlatOrderBookSide &other)
+        FlatOrderBookSide &operator=(const FlatOrderBookSide &other)
+        void clear()
+        void assign(const vector[OrderBookEntry] &entries)
+        void set(const OrderBookEntry &entry)
+        void remove(double price)
+        void removeBest()
+        double truncate(size_t max_depth)
+        size_t size() const
+        size_t capacity() const
+        const OrderBookEntry &level(size_t depth) const
+
+    void truncateOverlapLevels(FlatOrderBookSide &bid_side, FlatOrderBookSide &ask_side, const bint &dex)
@@ -0,0 +1,290 @@
+import bisect
+import itertools
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import OrderBookEvent, OrderBookUpdateEvent
+
+NaN = float("nan")
+
+# Merged ladder level: sort key, venue index, price in the venue order book
+LadderLevel = Tuple[float, int, float]
+
+
+class ConsolidatedOrderBookRow(NamedTuple):
+    """
+    A level of the consolidated order book. `price` is the venue price adjusted with the fee and conversion rate of
+    the venue, `venue_price` is the price in the venue order book.
+    """
+    price: float
+    amount: float
+    venue: str
+    venue_price: float
+
+
+class ConsolidatedQueryResult(NamedTuple):
+    """
+    Result of a query across venues. `result_price` is the adjusted price, and the volume taken from each venue and
+    its VWAP in the venue prices are given by `venue_volumes` and `venue_prices`.
+    """
+    query_volume: float
+    result_price: float
+    result_volume: float
+    venue_volumes: Dict[str, float]
+    venue_prices: Dict[str, float]
+
+
+class _VenueSide:
+    """
+    The best levels of one side of a venue order book, the ones merged in the ladder of the side.
+    """
+
+    def __init__(self, is_bid: bool):
+        self.is_bid = is_bid
+        # Venue price -> amount
+        self.levels: Dict[float, float] = {}
+        # The level prices, negated for bids so the best level comes first
+        self.ranks: List[float] = []
+        # Whether `depth` levels are held and the venue may have more levels beyond them
+        self.full = False
+
+    def rank(self, price: float) -> float:
+        return -price if self.is_bid else price
+
+    def price(self, rank: float) -> float:
+        return -rank if self.is_bid else rank
+
+
+class _Venue:
+
+    def __init__(self, name: str, index: int, order_book: OrderBook, taker_fee: float, conversion_rate: float):
+        self.name = name
+        self.index = index
+        self.order_book = order_book
+        self.taker_fee = taker_fee
+        self.conversion_rate = conversion_rate
+        self.bids = _VenueSide(is_bid=True)
+        self.asks = _VenueSide(is_bid=False)
+        self.update_forwarder: Optional[EventForwarder] = None
+
+    def sort_key(self, price: float, is_bid: bool) -> float:
+        # The best levels first: the highest adjusted bid prices and the lowest adjusted ask prices
+        if is_bid:
+            return -price * self.conversion_rate * (1 - self.taker_fee)
+        return price * self.conversion_rate * (1 + self.taker_fee)
+
+
+class ConsolidatedOrderBook:
+    """
+    Merges the order books of a market on several venues, to find the best execution across them in one query.
+
+    The consolidated book listens to the update events of the venue order books and holds the `depth` best levels of
+    each venue. The levels of a diff are applied to the levels held and moved in the merged ladders. The best levels
+    of the venue are only read again after a snapshot, or when the diff leaves the levels held unknown: a level
+    removed from a full side, levels crossing the other side, or a depth capped venue book dropping levels.
+
+    The ladder prices are adjusted with the taker fee and the conversion rate of each venue: a bid price is what
+    selling one unit returns after the fee, an ask price is what buying one unit costs with the fee, and both are
+    converted to a common quote asset with the conversion rate.
+    """
+
+    def __init__(self, depth: int = 100):
+        """
+        :param depth: number of best levels of each side of the venue order books merged
+        """
+        self._depth = depth
+        self._venues: Dict[str, _Venue] = {}
+        self._venues_by_index: Dict[int, _Venue] = {}
+        self._venue_indexes = itertools.count()
+        self._bid_ladder: List[LadderLevel] = []
+        self._ask_ladder: List[LadderLevel] = []
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    @property
+    def venues(self) -> List[str]:
+        return list(self._venues)
+
+    def add_venue(self, venue: str, order_book: OrderBook, taker_fee: float = 0.0, conversion_rate: float = 1.0):
+        """
+        Starts merging the order book of a venue.
+
+        :param venue: the name the levels of the venue are attributed to
+        :param order_book: the order book of the venue
+        :param taker_fee: the fee paid to take liquidity on the venue, as a fraction (0.001 for 0.1%)
+        :param conversion_rate: the rate converting the venue quote asset to the consolidated quote asset
+        """
+        if venue in self._venues:
+            raise ValueError(f"The {venue} order book is already consolidated.")
+        venue_state = _Venue(venue, next(self._venue_indexes), order_book, taker_fee, conversion_rate)
+        venue_state.update_forwarder = EventForwarder(lambda event: self._update_venue(venue_state, event))
+        order_book.add_listener(OrderBookEvent.OrderBookUpdateEvent, venue_state.update_forwarder)
+        self._venues[venue] = venue_state
+        self._venues_by_index[venue_state.index] = venue_state
+        self._read_venue(venue_state)
+
+    def remove_venue(self, venue: str):
+        venue_state = self._venues.pop(venue)
+        del self._venues_by_index[venue_state.index]
+        venue_state.order_book.remove_listener(OrderBookEvent.OrderBookUpdateEvent, venue_state.update_forwarder)
+        self._merge(self._bid_ladder, venue_state, venue_state.bids.levels, {}, is_bid=True)
+        self._merge(self._ask_ladder, venue_state, venue_state.asks.levels, {}, is_bid=False)
+
+    def set_venue_adjustments(self,
+                              venue: str,
+                              taker_fee: Optional[float] = None,
+                              conversion_rate: Optional[float] = None):
+        """
+        Changes the taker fee or the conversion rate of a venue, moving its levels in the merged ladders.
+        """
+        venue_state = self._venues[venue]
+        bids, asks = venue_state.bids.levels, venue_state.asks.levels
+        self._merge(self._bid_ladder, venue_state, bids, {}, is_bid=True)
+        self._merge(self._ask_ladder, venue_state, asks, {}, is_bid=False)
+        if taker_fee is not None:
+            venue_state.taker_fee = taker_fee
+        if conversion_rate is not None:
+            venue_state.conversion_rate = conversion_rate
+        self._merge(self._bid_ladder, venue_state, {}, bids, is_bid=True)
+        self._merge(self._ask_ladder, venue_state, {}, asks, is_bid=False)
+
+    def bid_entries(self) -> Iterator[ConsolidatedOrderBookRow]:
+        return self._entries(self._bid_ladder, is_bid=True)
+
+    def ask_entries(self) -> Iterator[ConsolidatedOrderBookRow]:
+        return self._entries(self._ask_ladder, is_bid=False)
+
+    def get_price(self, is_buy: bool) -> float:
+        """
+        Returns the best adjusted price to buy (the best ask) or to sell (the best bid) across the venues.
+        """
+        ladder = self._ask_ladder if is_buy else self._bid_ladder
+        if len(ladder) == 0:
+            raise EnvironmentError("Consolidated order book is empty - no price quote is possible.")
+        return abs(ladder[0][0])
+
+    def get_vwap_for_volume(self, is_buy: bool, volume: float) -> ConsolidatedQueryResult:
+        """
+        Takes `volume` from the best levels across the venues. The result price is the adjusted VWAP, NaN if the
+        merged levels do not have enough volume.
+        """
+        total_cost = 0.0
+        total_volume = 0.0
+        venue_volumes: Dict[str, float] = {}
+        venue_costs: Dict[str, float] = {}
+        for row in (self.ask_entries() if is_buy else self.bid_entries()):
+            amount = min(row.amount, volume - total_volume)
+            total_cost += amount * row.price
+            total_volume += amount
+            venue_volumes[row.venue] = venue_volumes.get(row.venue, 0.0) + amount
+            venue_costs[row.venue] = venue_costs.get(row.venue, 0.0) + amount * row.venue_price
+            if total_volume >= volume:
+                break
+        result_price = total_cost / total_volume if total_volume >= volume and total_volume > 0 else NaN
+        venue_prices = {venue: venue_costs[venue] / venue_volume
+                        for venue, venue_volume in venue_volumes.items() if venue_volume > 0}
+        return ConsolidatedQueryResult(volume, result_price, total_volume, venue_volumes, venue_prices)
+
+    def _entries(self, ladder: List[LadderLevel], is_bid: bool) -> Iterator[ConsolidatedOrderBookRow]:
+        for sort_key, venue_index, venue_price in ladder:
+            venue_state = self._venues_by_index[venue_index]
+            amount = (venue_state.bids if is_bid else venue_state.asks).levels[venue_price]
+            yield ConsolidatedOrderBookRow(abs(sort_key), amount, venue_state.name, venue_price)
+
+    def _update_venue(self, venue_state: _Venue, event: OrderBookUpdateEvent):
+        if event.is_snapshot or event.bids is None or venue_state.order_book.max_depth > 0:
+            self._read_venue(venue_state)
+            return
+        bids, asks = venue_state.bids, venue_state.asks
+        if not self._apply_rows(self._bid_ladder, venue_state, bids, event.bids):
+            self._read_side(self._bid_ladder, venue_state, bids, venue_state.order_book.bid_entries())
+        if not self._apply_rows(self._ask_ladder, venue_state, asks, event.asks):
+            self._read_side(self._ask_ladder, venue_state, asks, venue_state.order_book.ask_entries())
+        if len(bids.ranks) > 0 and len(asks.ranks) > 0 and bids.price(bids.ranks[0]) >= asks.price(asks.ranks[0]):
+            # The venue book removed the crossed levels, which the diff does not show
+            self._read_venue(venue_state)
+
+    def _apply_rows(self,
+                    ladder: List[LadderLevel],
+                    venue_state: _Venue,
+                    side: _VenueSide,
+                    rows: List[OrderBookRow]) -> bool:
+        """
+        Applies the levels of a diff to the levels held of a venue side. Returns False when a level held is removed
+        from a full side, since the venue level that moves into the `depth` best ones is not known.
+        """
+        levels = side.levels
+        for price, amount, _ in rows:
+            if amount > 0:
+                if price in levels:
+                    levels[price] = amount
+                    continue
+                rank = side.rank(price)
+                if side.full and rank > side.ranks[-1]:
+                    # Beyond the levels held
+                    continue
+                bisect.insort(side.ranks, rank)
+                levels[price] = amount
+                self._insert(ladder, venue_state, price, side.is_bid)
+            elif price in levels:
+                if side.full:
+                    return False
+                del side.ranks[bisect.bisect_left(side.ranks, side.rank(price))]
+                del levels[price]
+                self._remove(ladder, venue_state, price, side.is_bid)
+        while len(side.ranks) > self._depth:
+            price = side.price(side.ranks.pop())
+            del levels[price]
+            self._remove(ladder, venue_state, price, side.is_bid)
+            side.full = True
+        return True
+
+    def _read_venue(self, venue_state: _Venue):
+        order_book = venue_state.order_book
+        self._read_side(self._bid_ladder, venue_state, venue_state.bids, order_book.bid_entries())
+        self._read_side(self._ask_ladder, venue_state, venue_state.asks, order_book.ask_entries())
+
+    def _read_side(self,
+                   ladder: List[LadderLevel],
+                   venue_state: _Venue,
+                   side: _VenueSide,
+                   entries: Iterable[OrderBookRow]):
+        """
+        Reads the `depth` best levels of a venue side again, and moves the levels added or removed in the ladder.
+        """
+        levels = {row.price: row.amount for row in itertools.islice(entries, self._depth)}
+        self._merge(ladder, venue_state, side.levels, levels, side.is_bid)
+        side.levels = levels
+        side.ranks = sorted(side.rank(price) for price in levels)
+        side.full = len(levels) >= self._depth
+
+    @classmethod
+    def _merge(cls,
+               ladder: List[LadderLevel],
+               venue_state: _Venue,
+               old_levels: Dict[float, float],
+               new_levels: Dict[float, float],
+               is_bid: bool):
+        """
+        Removes from the ladder the venue levels that are not in the new levels and inserts the new ones. The levels
+        whose amount changed stay in place, their amount is read from the venue levels.
+        """
+        for price in old_levels.keys() - new_levels.keys():
+            cls._remove(ladder, venue_state, price, is_bid)
+        for price in new_levels.keys() - old_levels.keys():
+            cls._insert(ladder, venue_state, price, is_bid)
+
+    @staticmethod
+    def _insert(ladder: List[LadderLevel], venue_state: _Venue, price: float, is_bid: bool):
+        bisect.insort(ladder, (venue_state.sort_key(price, is_bid), venue_state.index, price))
+
+    @staticmethod
+    def _remove(ladder: List[LadderLevel], venue_state: _Venue, price: float, is_bid: bool):
+        level = (venue_state.sort_key(price, is_bid), venue_state.index, price)
+        position = bisect.bisect_left(ladder, level)
+        if position < len(ladder) and ladder[position] == level:
+            del ladder[position]
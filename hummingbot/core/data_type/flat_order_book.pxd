@@ -0,0 +1,9 @@
+# distutils: language=c++
+
+from hummingbot.core.data_type.FlatOrderBookSide cimport FlatOrderBookSide
+from hummingbot.core.data_type.order_book cimport OrderBook
+
+
+cdef class FlatOrderBook(OrderBook):
+    cdef FlatOrderBookSide _bid_levels
+    cdef FlatOrderBookSide _ask_levels
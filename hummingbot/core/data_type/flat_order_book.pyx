@@ -0,0 +1,113 @@
+# distutils: language=c++
+# distutils: sources=['hummingbot/core/cpp/OrderBookEntry.cpp', 'hummingbot/core/cpp/FlatOrderBookSide.cpp']
+from typing import Iterator
+
+from libc.math cimport isnan
+from libc.stdint cimport int64_t
+from libcpp.vector cimport vector
+
+from hummingbot.core.data_type.FlatOrderBookSide cimport FlatOrderBookSide, truncateOverlapLevels
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+NaN = float("nan")
+
+
+cdef class FlatOrderBook(OrderBook):
+    """
+    Order book keeping each side in a contiguous array of levels sorted by price (see FlatOrderBookSide.cpp), instead
+    of the node based std::set of OrderBook. The levels updated by the diffs are found with a binary search and most
+    of them are near the top of the book, so applying a diff moves few levels and allocates no memory once the arrays
+    have grown. It answers the same queries with the same results as OrderBook, and supports the depth capped mode.
+    """
+
+    def __cinit__(self, *args, **kwargs):
+        self._bid_levels = FlatOrderBookSide(True)
+        self._ask_levels = FlatOrderBookSide(False)
+
+    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        # Diffs with 0 amounts, or beyond the depth limits of a depth capped book, remove the level.
+        for bid in bids:
+            if bid.getAmount() > 0 and not bid.getPrice() <= self._bid_depth_limit:
+                self._bid_levels.set(bid)
+            else:
+                self._bid_levels.remove(bid.getPrice())
+        for ask in asks:
+            if ask.getAmount() > 0 and not ask.getPrice() >= self._ask_depth_limit:
+                self._ask_levels.set(ask)
+            else:
+                self._ask_levels.remove(ask.getPrice())
+
+        truncateOverlapLevels(self._bid_levels, self._ask_levels, self._dex)
+
+        if self._max_depth > 0:
+            self.c_truncate_depth()
+            if ((not isnan(self._bid_depth_limit) and <int64_t>self._bid_levels.size() * 2 < self._max_depth)
+                    or (not isnan(self._ask_depth_limit) and <int64_t>self._ask_levels.size() * 2 < self._max_depth)):
+                self._snapshot_required = True
+
+        if self._bid_levels.size() > 0:
+            self._best_bid = self._bid_levels.level(0).getPrice()
+        if self._ask_levels.size() > 0:
+            self._best_ask = self._ask_levels.level(0).getPrice()
+
+        self._last_diff_uid = update_id
+        self.c_notify_update(update_id, False, bids, asks)
+
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        self._bid_levels.assign(bids)
+        self._ask_levels.assign(asks)
+        self._bid_depth_limit = self._ask_depth_limit = NaN
+        self._snapshot_required = False
+
+        if self._dex:
+            truncateOverlapLevels(self._bid_levels, self._ask_levels, self._dex)
+        if self._max_depth > 0:
+            self.c_truncate_depth()
+
+        self._best_bid = self._bid_levels.level(0).getPrice() if self._bid_levels.size() > 0 else NaN
+        self._best_ask = self._ask_levels.level(0).getPrice() if self._ask_levels.size() > 0 else NaN
+
+        self._snapshot_uid = update_id
+        self.c_notify_update(update_id, True, bids, asks)
+
+    cdef c_truncate_depth(self):
+        cdef:
+            double best_removed_bid = self._bid_levels.truncate(self._max_depth)
+            double best_removed_ask = self._ask_levels.truncate(self._max_depth)
+
+        if not isnan(best_removed_bid) and not best_removed_bid <= self._bid_depth_limit:
+            self._bid_depth_limit = best_removed_bid
+        if not isnan(best_removed_ask) and not best_removed_ask >= self._ask_depth_limit:
+            self._ask_depth_limit = best_removed_ask
+
+    @property
+    def memory_usage(self) -> int:
+        """
+        Size in bytes of the level arrays, including their unused capacity
+        """
+        return (self._bid_levels.capacity() + self._ask_levels.capacity()) * sizeof(OrderBookEntry)
+
+    def bid_entries(self) -> Iterator[OrderBookRow]:
+        cdef:
+            size_t depth = 0
+            OrderBookEntry entry
+        while depth < self._bid_levels.size():
+            entry = self._bid_levels.level(depth)
+            yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
+            depth += 1
+
+    def ask_entries(self) -> Iterator[OrderBookRow]:
+        cdef:
+            size_t depth = 0
+            OrderBookEntry entry
+        while depth < self._ask_levels.size():
+            entry = self._ask_levels.level(depth)
+            yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
+            depth += 1
+
+    cdef double c_get_price(self, bint is_buy) except? -1:
+        if (self._ask_levels.size() if is_buy else self._bid_levels.size()) < 1:
+            raise EnvironmentError("Order book is empty - no price quote is possible.")
+        return self._best_ask if is_buy else self._best_bid
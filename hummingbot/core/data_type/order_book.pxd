@@ -20,10 +20,20 @@ cdef class OrderBook(PubSub):
     cdef double _last_applied_trade
     cdef double _last_trade_price_rest_updated
     cdef bint _dex
+    cdef int64_t _max_depth
+    cdef double _bid_depth_limit
+    cdef double _ask_depth_limit
+    cdef bint _snapshot_required
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_trade(self, object trade_event)
+    cdef c_truncate_depth(self)
+    cdef c_notify_update(self,
+                         int64_t update_id,
+                         bint is_snapshot,
+                         vector[OrderBookEntry] &bids,
+                         vector[OrderBookEntry] &asks)
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
                              np.ndarray[np.float64_t, ndim=2] asks_array)
@@ -14,10 +14,13 @@ from typing import (
 import numpy as np
 import pandas as pd
 
+from libc.math cimport isnan
+
 from cython.operator cimport(
     address as ref,
     dereference as deref,
     postincrement as inc,
+    predecrement as dec,
 )
 
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
@@ -27,13 +30,21 @@ from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
     OrderBookEvent,
-    OrderBookTradeEvent
+    OrderBookTradeEvent,
+    OrderBookUpdateEvent,
 )
 
 cimport numpy as np
 
 ob_logger = None
 NaN = float("nan")
+# Approximate size in memory of an order book level: the entry plus the node pointers and color of the tree
+ORDER_BOOK_LEVEL_SIZE = sizeof(OrderBookEntry) + 32
+cdef int64_t ORDER_BOOK_UPDATE_EVENT_TAG = OrderBookEvent.OrderBookUpdateEvent.value
+
+
+cdef list entries_to_rows(vector[OrderBookEntry] &entries):
+    return [OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId()) for entry in entries]
 
 
 cdef class OrderBook(PubSub):
@@ -46,7 +57,13 @@ cdef class OrderBook(PubSub):
             ob_logger = logging.getLogger(__name__)
         return ob_logger
 
-    def __init__(self, dex=False):
+    def __init__(self, dex=False, max_depth: int = 0):
+        """
+        :param dex: if True the overlapping entries between the bid and ask books are truncated as in a DEX
+        :param max_depth: number of best levels kept on each side, 0 to keep all the levels. When the book is depth
+        capped, the levels beyond the last one kept are ignored until the next snapshot, and `snapshot_required`
+        becomes True once less than half of `max_depth` levels are left on a side
+        """
         super().__init__()
         self._snapshot_uid = 0
         self._last_diff_uid = 0
@@ -55,6 +72,9 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._max_depth = max_depth
+        self._bid_depth_limit = self._ask_depth_limit = float("NaN")
+        self._snapshot_required = False
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -66,23 +86,30 @@ cdef class OrderBook(PubSub):
             OrderBookEntry top_bid
             OrderBookEntry top_ask
 
-        # Apply the diffs. Diffs with 0 amounts mean deletion.
+        # Apply the diffs. Diffs with 0 amounts mean deletion. In a depth capped book, the levels beyond the depth
+        # limits are not known and are not inserted (the depth limits are NaN when the book is not capped).
         for bid in bids:
             result = self._bid_book.find(bid)
             if result != bid_book_end:
                 self._bid_book.erase(result)
-            if bid.getAmount() > 0:
+            if bid.getAmount() > 0 and not bid.getPrice() <= self._bid_depth_limit:
                 self._bid_book.insert(bid)
         for ask in asks:
             result = self._ask_book.find(ask)
             if result != ask_book_end:
                 self._ask_book.erase(result)
-            if ask.getAmount() > 0:
+            if ask.getAmount() > 0 and not ask.getPrice() >= self._ask_depth_limit:
                 self._ask_book.insert(ask)
 
         # If any overlapping entries between the bid and ask books, centralised: newer entries win, dex: see OrderBookEntry.cpp
         truncateOverlapEntries(self._bid_book, self._ask_book, self._dex)
 
+        if self._max_depth > 0:
+            self.c_truncate_depth()
+            if ((not isnan(self._bid_depth_limit) and <int64_t>self._bid_book.size() * 2 < self._max_depth)
+                    or (not isnan(self._ask_depth_limit) and <int64_t>self._ask_book.size() * 2 < self._max_depth)):
+                self._snapshot_required = True
+
         # Record the current best prices, for faster c_get_price() calls.
         bid_iterator = self._bid_book.rbegin()
         ask_iterator = self._ask_book.begin()
@@ -95,6 +122,7 @@ cdef class OrderBook(PubSub):
 
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
+        self.c_notify_update(update_id, False, bids, asks)
 
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -108,6 +136,8 @@ cdef class OrderBook(PubSub):
         # Start with an empty order book, and then insert all entries.
         self._bid_book.clear()
         self._ask_book.clear()
+        self._bid_depth_limit = self._ask_depth_limit = NaN
+        self._snapshot_required = False
         for bid in bids:
             self._bid_book.insert(bid)
             if not (bid.getPrice() <= best_bid_price):
@@ -129,12 +159,55 @@ cdef class OrderBook(PubSub):
                 top_ask = deref(ask_iterator)
                 best_ask_price = top_ask.getPrice()
 
+        if self._max_depth > 0:
+            self.c_truncate_depth()
+
         # Record the current best prices, for faster c_get_price() calls.
         self._best_bid = best_bid_price
         self._best_ask = best_ask_price
 
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
+        self.c_notify_update(update_id, True, bids, asks)
+
+    cdef c_truncate_depth(self):
+        """
+        Removes the worst levels of each side beyond `max_depth`, and moves the depth limit of the side to the best
+        price removed.
+        """
+        cdef:
+            set[OrderBookEntry].iterator it
+            OrderBookEntry entry
+
+        while <int64_t>self._bid_book.size() > self._max_depth:
+            it = self._bid_book.begin()
+            entry = deref(it)
+            if not entry.getPrice() <= self._bid_depth_limit:
+                self._bid_depth_limit = entry.getPrice()
+            self._bid_book.erase(it)
+        while <int64_t>self._ask_book.size() > self._max_depth:
+            it = self._ask_book.end()
+            dec(it)
+            entry = deref(it)
+            if not entry.getPrice() >= self._ask_depth_limit:
+                self._ask_depth_limit = entry.getPrice()
+            self._ask_book.erase(it)
+
+    cdef c_notify_update(self,
+                         int64_t update_id,
+                         bint is_snapshot,
+                         vector[OrderBookEntry] &bids,
+                         vector[OrderBookEntry] &asks):
+        # The event is only created when there are live listeners, most order books have none. Getting the listeners
+        # drops the dead ones, the dispatch list is removed with the last one. Diff events carry the levels of the
+        # diff so listeners can apply them, snapshot listeners read the book again.
+        if (self._dispatch_lists.count(ORDER_BOOK_UPDATE_EVENT_TAG) > 0 and
+                len(self.c_get_listeners(ORDER_BOOK_UPDATE_EVENT_TAG)) > 0):
+            if is_snapshot:
+                event = OrderBookUpdateEvent(update_id, True)
+            else:
+                event = OrderBookUpdateEvent(update_id, False, entries_to_rows(bids), entries_to_rows(asks))
+            self.c_trigger_event(ORDER_BOOK_UPDATE_EVENT_TAG, event)
 
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
@@ -161,6 +234,25 @@ cdef class OrderBook(PubSub):
     def last_trade_price_rest_updated(self, value: float):
         self._last_trade_price_rest_updated = value
 
+    @property
+    def max_depth(self) -> int:
+        return self._max_depth
+
+    @property
+    def snapshot_required(self) -> bool:
+        """
+        True when the book is depth capped and too few levels are left on a side since the levels beyond the depth
+        limit were dropped. A new snapshot has to be applied to know the deeper levels again.
+        """
+        return self._snapshot_required
+
+    @property
+    def memory_usage(self) -> int:
+        """
+        Approximate size in bytes of the levels kept in the order book
+        """
+        return (self._bid_book.size() + self._ask_book.size()) * ORDER_BOOK_LEVEL_SIZE
+
     @property
     def snapshot_uid(self) -> int:
         return self._snapshot_uid
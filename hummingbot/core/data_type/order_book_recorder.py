@@ -0,0 +1,286 @@
+import bisect
+import logging
+import os
+import struct
+import time
+from datetime import datetime, timezone
+from enum import Enum
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from hummingbot import data_path
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.logger import HummingbotLogger
+
+FILE_MAGIC = b"HBOB"
+FILE_VERSION = 1
+FILE_EXTENSION = "hbob"
+
+# File header: magic, format version, length of the trading pair name (followed by the name in utf-8)
+_FILE_HEADER = struct.Struct("<4sHH")
+# Record header: record type, timestamp, payload length
+_RECORD_HEADER = struct.Struct("<BdI")
+# Book payload header (keyframes and diffs): update id, number of bid levels, number of ask levels
+_BOOK_HEADER = struct.Struct("<qII")
+# Trade payload header: price, amount, trade type (followed by the trade id in utf-8)
+_TRADE_HEADER = struct.Struct("<ddB")
+
+
+class OrderBookRecordType(Enum):
+    KEYFRAME = 1
+    DIFF = 2
+    TRADE = 3
+
+
+def _pack_levels(rows) -> bytes:
+    flat: List[float] = []
+    for row in rows:
+        flat.append(float(row[0]))
+        flat.append(float(row[1]))
+    return struct.pack(f"<{len(flat)}d", *flat)
+
+
+def _unpack_levels(payload: bytes, offset: int, count: int) -> List[List[float]]:
+    flat = struct.unpack_from(f"<{2 * count}d", payload, offset)
+    return [[flat[i], flat[i + 1]] for i in range(0, 2 * count, 2)]
+
+
+def recording_file_path(base_path: str, connector_name: str, trading_pair: str, timestamp: float) -> str:
+    """
+    Returns the path of the daily (UTC) recording file for a connector and trading pair.
+    """
+    day = datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y-%m-%d")
+    return os.path.join(base_path, connector_name, trading_pair, f"{trading_pair}_{day}.{FILE_EXTENSION}")
+
+
+class OrderBookRecorder:
+    """
+    Writes order book diffs, trades and periodic full book keyframes to an append-only binary log.
+
+    One file is written per trading pair and UTC day. Every file starts with a keyframe, so any file can be replayed
+    on its own, and `OrderBookRecordReader` can rebuild the book at any timestamp by seeking to the nearest keyframe.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, connector_name: str, base_path: Optional[str] = None, keyframe_interval: float = 60.0):
+        self._connector_name = connector_name
+        self._base_path = base_path or os.path.join(data_path(), "order_book_recordings")
+        self._keyframe_interval = keyframe_interval
+        self._files: Dict[str, BinaryIO] = {}
+        self._file_paths: Dict[str, str] = {}
+        self._last_keyframe_timestamps: Dict[str, float] = {}
+
+    @property
+    def base_path(self) -> str:
+        return self._base_path
+
+    @property
+    def connector_name(self) -> str:
+        return self._connector_name
+
+    def file_path(self, trading_pair: str, timestamp: float) -> str:
+        return recording_file_path(self._base_path, self._connector_name, trading_pair, timestamp)
+
+    def record_order_book(self, trading_pair: str, order_book: OrderBook, message: OrderBookMessage):
+        """
+        Records the book update carried by `message`. It must be called after the message has been applied to
+        `order_book`, because keyframes are taken from the book state instead of the message.
+        """
+        timestamp = self._message_timestamp(message)
+        rotated = self._ensure_file(trading_pair, timestamp)
+        last_keyframe = self._last_keyframe_timestamps.get(trading_pair)
+        if (rotated
+                or message.type is OrderBookMessageType.SNAPSHOT
+                or last_keyframe is None
+                or timestamp - last_keyframe >= self._keyframe_interval):
+            self._write_keyframe(trading_pair, order_book, timestamp)
+        elif message.type is OrderBookMessageType.DIFF:
+            payload = (_BOOK_HEADER.pack(message.update_id, len(message.content["bids"]), len(message.content["asks"]))
+                       + _pack_levels(message.content["bids"])
+                       + _pack_levels(message.content["asks"]))
+            self._write_record(trading_pair, OrderBookRecordType.DIFF, timestamp, payload)
+
+    def record_trade(self, message: OrderBookMessage):
+        trading_pair = message.trading_pair
+        timestamp = self._message_timestamp(message)
+        if (self._file_paths.get(trading_pair) != self.file_path(trading_pair, timestamp)
+                or trading_pair not in self._last_keyframe_timestamps):
+            # Trades are only written once the book has a keyframe in the current file. After a day rollover the file
+            # of the new day is opened by the next book update, which starts it with a keyframe.
+            return
+        content = message.content
+        payload = (_TRADE_HEADER.pack(float(content["price"]), float(content["amount"]), int(content["trade_type"]))
+                   + str(content["trade_id"]).encode("utf-8"))
+        self._write_record(trading_pair, OrderBookRecordType.TRADE, timestamp, payload)
+
+    def flush(self):
+        for file in self._files.values():
+            file.flush()
+
+    def close(self):
+        for file in self._files.values():
+            file.close()
+        self._files.clear()
+        self._file_paths.clear()
+        self._last_keyframe_timestamps.clear()
+
+    @staticmethod
+    def _message_timestamp(message: OrderBookMessage) -> float:
+        return message.timestamp if message.timestamp is not None else time.time()
+
+    def _ensure_file(self, trading_pair: str, timestamp: float) -> bool:
+        """
+        Opens (or rotates to) the file for the day of `timestamp`. Returns True if a new file was opened.
+        """
+        path = self.file_path(trading_pair, timestamp)
+        if self._file_paths.get(trading_pair) == path:
+            return False
+        if trading_pair in self._files:
+            self._files.pop(trading_pair).close()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        is_new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        file = open(path, "ab")
+        if is_new_file:
+            encoded_pair = trading_pair.encode("utf-8")
+            file.write(_FILE_HEADER.pack(FILE_MAGIC, FILE_VERSION, len(encoded_pair)) + encoded_pair)
+        self._files[trading_pair] = file
+        self._file_paths[trading_pair] = path
+        self._last_keyframe_timestamps.pop(trading_pair, None)
+        return True
+
+    def _write_keyframe(self, trading_pair: str, order_book: OrderBook, timestamp: float):
+        bids = list(order_book.bid_entries())
+        asks = list(order_book.ask_entries())
+        update_id = max(order_book.snapshot_uid, order_book.last_diff_uid)
+        payload = _BOOK_HEADER.pack(update_id, len(bids), len(asks)) + _pack_levels(bids) + _pack_levels(asks)
+        self._write_record(trading_pair, OrderBookRecordType.KEYFRAME, timestamp, payload)
+        self._files[trading_pair].flush()
+        self._last_keyframe_timestamps[trading_pair] = timestamp
+
+    def _write_record(self, trading_pair: str, record_type: OrderBookRecordType, timestamp: float, payload: bytes):
+        try:
+            self._files[trading_pair].write(_RECORD_HEADER.pack(record_type.value, timestamp, len(payload)) + payload)
+        except OSError:
+            # The updates lost until the next successful write can't be replayed as diffs, so the recording of the
+            # trading pair starts again with a keyframe
+            self._last_keyframe_timestamps.pop(trading_pair, None)
+            raise
+
+
+class OrderBookRecordReader:
+    """
+    Reads a file written by `OrderBookRecorder`. Keyframes are returned as snapshot messages, so the output can be
+    fed to anything that consumes `OrderBookMessage`s.
+    """
+
+    def __init__(self, file_path: str):
+        self._file_path = file_path
+        with open(file_path, "rb") as file:
+            magic, version, pair_length = _FILE_HEADER.unpack(file.read(_FILE_HEADER.size))
+            if magic != FILE_MAGIC:
+                raise ValueError(f"{file_path} is not an order book recording.")
+            if version != FILE_VERSION:
+                raise ValueError(f"Unsupported order book recording version {version} in {file_path}.")
+            self._trading_pair = file.read(pair_length).decode("utf-8")
+            self._data_offset = file.tell()
+        self._keyframe_index: Optional[List[Tuple[float, int]]] = None
+
+    @property
+    def file_path(self) -> str:
+        return self._file_path
+
+    @property
+    def trading_pair(self) -> str:
+        return self._trading_pair
+
+    @property
+    def keyframe_index(self) -> List[Tuple[float, int]]:
+        """
+        (timestamp, file offset) of every keyframe, built on first use by skipping over record payloads.
+        """
+        if self._keyframe_index is None:
+            index = []
+            with open(self._file_path, "rb") as file:
+                offset = self._data_offset
+                file.seek(offset)
+                while True:
+                    header = file.read(_RECORD_HEADER.size)
+                    if len(header) < _RECORD_HEADER.size:
+                        break
+                    record_type, timestamp, length = _RECORD_HEADER.unpack(header)
+                    if record_type == OrderBookRecordType.KEYFRAME.value:
+                        index.append((timestamp, offset))
+                    offset += _RECORD_HEADER.size + length
+                    file.seek(offset)
+            self._keyframe_index = index
+        return self._keyframe_index
+
+    def messages(self, start_time: Optional[float] = None, end_time: Optional[float] = None
+                 ) -> Iterator[OrderBookMessage]:
+        """
+        Iterates over the recorded messages. When `start_time` is given, iteration starts at the last keyframe at or
+        before it, so the first message is always a snapshot the following diffs can be applied on.
+        """
+        offset = self._data_offset
+        if start_time is not None:
+            index = self.keyframe_index
+            position = bisect.bisect_right([timestamp for timestamp, _ in index], start_time) - 1
+            if position >= 0:
+                offset = index[position][1]
+        with open(self._file_path, "rb") as file:
+            file.seek(offset)
+            while True:
+                header = file.read(_RECORD_HEADER.size)
+                if len(header) < _RECORD_HEADER.size:
+                    break
+                record_type, timestamp, length = _RECORD_HEADER.unpack(header)
+                payload = file.read(length)
+                if len(payload) < length:
+                    # Partially written record at the end of a file still being recorded
+                    break
+                if end_time is not None and timestamp > end_time:
+                    break
+                yield self._decode(OrderBookRecordType(record_type), timestamp, payload)
+
+    def order_book_at(self, timestamp: float) -> OrderBook:
+        """
+        Rebuilds the order book as it was at `timestamp`.
+        """
+        if len(self.keyframe_index) == 0 or self.keyframe_index[0][0] > timestamp:
+            raise ValueError(f"No keyframe at or before {timestamp} in {self._file_path}.")
+        order_book = OrderBook()
+        for message in self.messages(start_time=timestamp, end_time=timestamp):
+            if message.type is OrderBookMessageType.SNAPSHOT:
+                order_book.apply_snapshot(message.bids, message.asks, message.update_id)
+            elif message.type is OrderBookMessageType.DIFF:
+                order_book.apply_diffs(message.bids, message.asks, message.update_id)
+        return order_book
+
+    def _decode(self, record_type: OrderBookRecordType, timestamp: float, payload: bytes) -> OrderBookMessage:
+        if record_type is OrderBookRecordType.TRADE:
+            price, amount, trade_type = _TRADE_HEADER.unpack_from(payload)
+            return OrderBookMessage(OrderBookMessageType.TRADE, {
+                "trading_pair": self._trading_pair,
+                "trade_type": float(TradeType(trade_type).value),
+                "trade_id": payload[_TRADE_HEADER.size:].decode("utf-8"),
+                "price": price,
+                "amount": amount,
+            }, timestamp=timestamp)
+        update_id, bids_count, asks_count = _BOOK_HEADER.unpack_from(payload)
+        bids = _unpack_levels(payload, _BOOK_HEADER.size, bids_count)
+        asks = _unpack_levels(payload, _BOOK_HEADER.size + 16 * bids_count, asks_count)
+        message_type = (OrderBookMessageType.SNAPSHOT if record_type is OrderBookRecordType.KEYFRAME
+                        else OrderBookMessageType.DIFF)
+        return OrderBookMessage(message_type, {
+            "trading_pair": self._trading_pair,
+            "update_id": update_id,
+            "bids": bids,
+            "asks": asks,
+        }, timestamp=timestamp)
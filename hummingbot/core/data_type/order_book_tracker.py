@@ -3,13 +3,14 @@ import logging
 import time
 from collections import defaultdict, deque
 from enum import Enum
-from typing import Deque, Dict, List, Optional, Tuple
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
 
 import pandas as pd
 
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecorder
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.events import OrderBookTradeEvent
 from hummingbot.core.utils.async_utils import safe_ensure_future
@@ -21,8 +22,57 @@ class OrderBookTrackerDataSourceType(Enum):
     EXCHANGE_API = 3
 
 
+class OrderBookSyncMetrics:
+    """
+    Sequence gaps and resynchronizations of one order book, and the time since it was last updated.
+    """
+
+    def __init__(self):
+        self.gaps_count: int = 0
+        self.resyncs_count: int = 0
+        self.depth_resyncs_count: int = 0
+        self.last_resync_latency: float = 0.0
+        self.total_resync_latency: float = 0.0
+        self.resync_start: Optional[float] = None
+        self.last_update_timestamp: float = time.time()
+
+    @property
+    def resyncing(self) -> bool:
+        return self.resync_start is not None
+
+    def to_dict(self, buffered_diffs_count: int = 0) -> Dict[str, Any]:
+        return {
+            "gaps": self.gaps_count,
+            "resyncs": self.resyncs_count,
+            "depth_resyncs": self.depth_resyncs_count,
+            "resyncing": self.resyncing,
+            "buffered_diffs": buffered_diffs_count,
+            "last_resync_latency": self.last_resync_latency,
+            "average_resync_latency": (self.total_resync_latency / self.resyncs_count
+                                       if self.resyncs_count > 0 else 0.0),
+            "staleness": time.time() - self.last_update_timestamp,
+        }
+
+
+class _DiffDispatchQueue:
+    """
+    Replaces the diff stream queue of the tracker when the direct diff dispatch is enabled. The data source puts the
+    parsed diff messages in it as in any queue, and they are routed and applied to the order book right away.
+    """
+
+    def __init__(self, tracker: "OrderBookTracker"):
+        self._tracker = tracker
+
+    def put_nowait(self, message: OrderBookMessage):
+        self._tracker._route_diff_message(message)
+
+    async def put(self, message: OrderBookMessage):
+        self._tracker._route_diff_message(message)
+
+
 class OrderBookTracker:
     PAST_DIFF_WINDOW_SIZE: int = 32
+    RECORDING_ERROR_LOG_INTERVAL: float = 60.0
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -31,8 +81,20 @@ class OrderBookTracker:
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
-    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 direct_diff_dispatch: bool = False):
+        """
+        :param data_source: the data source providing the order book messages
+        :param trading_pairs: the trading pairs to track
+        :param domain: the exchange domain
+        :param direct_diff_dispatch: if True the data source applies the diff messages to the order books as soon as
+        they are parsed, instead of sending them through the diff stream, the router and the per pair queues
+        """
         self._domain: Optional[str] = domain
+        self._direct_diff_dispatch: bool = direct_diff_dispatch
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
         self._order_books_initialized: asyncio.Event = asyncio.Event()
@@ -45,6 +107,14 @@ class OrderBookTracker:
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
+        self._recorder: Optional[OrderBookRecorder] = None
+        self._last_recording_error_timestamp: float = 0
+        self._sync_metrics: Dict[str, OrderBookSyncMetrics] = defaultdict(OrderBookSyncMetrics)
+        self._resync_buffers: Dict[str, List[OrderBookMessage]] = {}
+        self._resync_tasks: Dict[str, asyncio.Task] = {}
+        self._depth_resync_pairs: Set[str] = set()
+        self._diff_router_stats: Dict[str, int] = {"accepted": 0, "rejected": 0, "queued": 0}
+        self._diff_router_last_message_timestamp: float = time.time()
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -64,6 +134,45 @@ class OrderBookTracker:
     def order_books(self) -> Dict[str, OrderBook]:
         return self._order_books
 
+    @property
+    def recorder(self) -> Optional[OrderBookRecorder]:
+        return self._recorder
+
+    def set_recorder(self, recorder: Optional[OrderBookRecorder]):
+        """
+        Sets the recorder that receives every applied diff, snapshot and trade. Pass None to stop recording.
+        """
+        if self._recorder is not None and self._recorder is not recorder:
+            self._recorder.close()
+        self._recorder = recorder
+
+    @property
+    def diff_router_stats(self) -> Dict[str, int]:
+        """
+        Diff messages accepted, rejected (older than the order book snapshot) and queued (received before the order
+        book was initialized) since the tracker was created.
+        """
+        return dict(self._diff_router_stats)
+
+    @property
+    def sync_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Sequence gaps, resynchronization latencies (in seconds) and staleness (seconds since the last applied diff or
+        snapshot) of each order book.
+        """
+        return {
+            trading_pair: self._sync_metrics[trading_pair].to_dict(
+                buffered_diffs_count=len(self._resync_buffers.get(trading_pair, [])))
+            for trading_pair in self._order_books
+        }
+
+    @property
+    def memory_usage(self) -> Dict[str, int]:
+        """
+        Approximate size in bytes of the levels kept in each order book
+        """
+        return {trading_pair: order_book.memory_usage for trading_pair, order_book in self._order_books.items()}
+
     @property
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
@@ -83,8 +192,9 @@ class OrderBookTracker:
         self._emit_trade_event_task = safe_ensure_future(
             self._emit_trade_event_loop()
         )
+        diff_output = _DiffDispatchQueue(self) if self._direct_diff_dispatch else self._order_book_diff_stream
         self._order_book_diff_listener_task = safe_ensure_future(
-            self._data_source.listen_for_order_book_diffs(self._ev_loop, self._order_book_diff_stream)
+            self._data_source.listen_for_order_book_diffs(self._ev_loop, diff_output)
         )
         self._order_book_trade_listener_task = safe_ensure_future(
             self._data_source.listen_for_trades(self._ev_loop, self._order_book_trade_stream)
@@ -95,9 +205,10 @@ class OrderBookTracker:
         self._order_book_stream_listener_task = safe_ensure_future(
             self._data_source.listen_for_subscriptions()
         )
-        self._order_book_diff_router_task = safe_ensure_future(
-            self._order_book_diff_router()
-        )
+        if not self._direct_diff_dispatch:
+            self._order_book_diff_router_task = safe_ensure_future(
+                self._order_book_diff_router()
+            )
         self._order_book_snapshot_router_task = safe_ensure_future(
             self._order_book_snapshot_router()
         )
@@ -137,6 +248,13 @@ class OrderBookTracker:
             for _, task in self._tracking_tasks.items():
                 task.cancel()
             self._tracking_tasks.clear()
+        for task in self._resync_tasks.values():
+            task.cancel()
+        self._resync_tasks.clear()
+        self._resync_buffers.clear()
+        self._depth_resync_pairs.clear()
+        if self._recorder is not None:
+            self._recorder.close()
         self._order_books_initialized.clear()
 
     async def wait_ready(self):
@@ -178,6 +296,8 @@ class OrderBookTracker:
         """
         for index, trading_pair in enumerate(self._trading_pairs):
             self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
+            if self._direct_diff_dispatch:
+                self._apply_saved_messages(trading_pair)
             self._tracking_message_queues[trading_pair] = asyncio.Queue()
             self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
             self.logger().info(f"Initialized order book for {trading_pair}. "
@@ -185,45 +305,24 @@ class OrderBookTracker:
             await self._sleep(delay=1)
         self._order_books_initialized.set()
 
+    def _apply_saved_messages(self, trading_pair: str):
+        """
+        Applies the diff messages received before the order book was initialized. With the direct diff dispatch this
+        has to happen before new diffs are applied, so they are applied in order.
+        """
+        order_book: OrderBook = self._order_books[trading_pair]
+        saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
+        while len(saved_messages) > 0:
+            self._apply_order_book_message(trading_pair, order_book, saved_messages.popleft())
+
     async def _order_book_diff_router(self):
         """
         Routes the real-time order book diff messages to the correct order book.
         """
-        last_message_timestamp: float = time.time()
-        messages_queued: int = 0
-        messages_accepted: int = 0
-        messages_rejected: int = 0
-
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_diff_stream.get()
-                trading_pair: str = ob_message.trading_pair
-
-                if trading_pair not in self._tracking_message_queues:
-                    messages_queued += 1
-                    # Save diff messages received before snapshots are ready
-                    self._saved_message_queues[trading_pair].append(ob_message)
-                    continue
-                message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
-                # Check the order book's initial update ID. If it's larger, don't bother.
-                order_book: OrderBook = self._order_books[trading_pair]
-
-                if order_book.snapshot_uid > ob_message.update_id:
-                    messages_rejected += 1
-                    continue
-                await message_queue.put(ob_message)
-                messages_accepted += 1
-
-                # Log some statistics.
-                now: float = time.time()
-                if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                    self.logger().debug(f"Diff messages processed: {messages_accepted}, "
-                                        f"rejected: {messages_rejected}, queued: {messages_queued}")
-                    messages_accepted = 0
-                    messages_rejected = 0
-                    messages_queued = 0
-
-                last_message_timestamp = now
+                self._route_diff_message(ob_message)
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -234,6 +333,38 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    def _route_diff_message(self, ob_message: OrderBookMessage):
+        """
+        Sends the diff message to its order book tracking queue, or applies it directly to the order book when the
+        direct diff dispatch is enabled.
+        """
+        router_stats: Dict[str, int] = self._diff_router_stats
+        trading_pair: str = ob_message.trading_pair
+
+        if trading_pair not in self._tracking_message_queues:
+            router_stats["queued"] += 1
+            # Save diff messages received before snapshots are ready
+            self._saved_message_queues[trading_pair].append(ob_message)
+            return
+        # Check the order book's initial update ID. If it's larger, don't bother.
+        order_book: OrderBook = self._order_books[trading_pair]
+
+        if order_book.snapshot_uid > ob_message.update_id:
+            router_stats["rejected"] += 1
+            return
+        if self._direct_diff_dispatch:
+            self._apply_order_book_message(trading_pair, order_book, ob_message)
+        else:
+            self._tracking_message_queues[trading_pair].put_nowait(ob_message)
+        router_stats["accepted"] += 1
+
+        # Log some statistics.
+        now: float = time.time()
+        if int(now / 60.0) > int(self._diff_router_last_message_timestamp / 60.0):
+            self.logger().debug(f"Diff messages processed: {router_stats['accepted']}, "
+                                f"rejected: {router_stats['rejected']}, queued: {router_stats['queued']}")
+        self._diff_router_last_message_timestamp = now
+
     async def _order_book_snapshot_router(self):
         """
         Route the real-time order book snapshot messages to the correct order book.
@@ -254,8 +385,6 @@ class OrderBookTracker:
                 await asyncio.sleep(5.0)
 
     async def _track_single_book(self, trading_pair: str):
-        past_diffs_window = self._past_diffs_windows[trading_pair]
-
         message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
         order_book: OrderBook = self._order_books[trading_pair]
         last_message_timestamp: float = time.time()
@@ -271,9 +400,7 @@ class OrderBookTracker:
                 else:
                     message = await message_queue.get()
 
-                if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
+                if self._apply_order_book_message(trading_pair, order_book, message):
                     diff_messages_accepted += 1
 
                     # Output some statistics periodically.
@@ -282,9 +409,6 @@ class OrderBookTracker:
                         self.logger().debug(f"Processed {diff_messages_accepted} order book diffs for {trading_pair}.")
                         diff_messages_accepted = 0
                     last_message_timestamp = now
-                elif message.type is OrderBookMessageType.SNAPSHOT:
-                    past_diffs: List[OrderBookMessage] = list(past_diffs_window)
-                    order_book.restore_from_snapshot_and_diffs(message, past_diffs)
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -295,6 +419,136 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    def _apply_order_book_message(self, trading_pair: str, order_book: OrderBook, message: OrderBookMessage) -> bool:
+        """
+        Applies a diff or snapshot message to the order book of the trading pair.
+
+        :return: True if the message was a diff and it was applied
+        """
+        diff_applied = False
+        sync_metrics: OrderBookSyncMetrics = self._sync_metrics[trading_pair]
+        past_diffs_window: Deque[OrderBookMessage] = self._past_diffs_windows[trading_pair]
+
+        if message.type is OrderBookMessageType.DIFF:
+            if (self._data_source.CONTIGUOUS_DIFF_UPDATE_IDS
+                    and not self._diff_in_sequence(trading_pair, order_book, message)):
+                return False
+            order_book.apply_diffs(message.bids, message.asks, message.update_id)
+            past_diffs_window.append(message)
+            sync_metrics.last_update_timestamp = time.time()
+            diff_applied = True
+            if order_book.snapshot_required:
+                self._start_depth_resync(trading_pair)
+        elif message.type is OrderBookMessageType.SNAPSHOT:
+            past_diffs: List[OrderBookMessage] = list(past_diffs_window)
+            buffered_diffs: Optional[List[OrderBookMessage]] = self._resync_buffers.pop(trading_pair, None)
+            if buffered_diffs is not None:
+                past_diffs.extend(buffered_diffs)
+                past_diffs_window.extend(buffered_diffs)
+            order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+            sync_metrics.last_update_timestamp = time.time()
+            self._depth_resync_pairs.discard(trading_pair)
+            if buffered_diffs is not None:
+                self._complete_resync(trading_pair, message, past_diffs)
+
+        if self._recorder is not None:
+            self._record(self._recorder.record_order_book, trading_pair, order_book, message)
+        return diff_applied
+
+    def _record(self, record_function: Callable, *args):
+        """
+        Writes to the recorder. The recording is best effort: a disk error is logged (at most once per
+        `RECORDING_ERROR_LOG_INTERVAL`) and must not stop the order book updates.
+        """
+        try:
+            record_function(*args)
+        except OSError:
+            now = time.time()
+            if now - self._last_recording_error_timestamp >= self.RECORDING_ERROR_LOG_INTERVAL:
+                self.logger().error("Error writing the order book recording. The updates are not recorded until the "
+                                    "error is solved.", exc_info=True)
+                self._last_recording_error_timestamp = now
+
+    def _diff_in_sequence(self, trading_pair: str, order_book: OrderBook, message: OrderBookMessage) -> bool:
+        """
+        Checks that the diff continues the update ids already applied to the order book. When there is a gap, the diff
+        and the next ones are buffered until a new snapshot for the trading pair is received.
+
+        :return: True if the diff can be applied to the order book
+        """
+        buffered_diffs: Optional[List[OrderBookMessage]] = self._resync_buffers.get(trading_pair)
+        if buffered_diffs is not None:
+            buffered_diffs.append(message)
+            return False
+        last_update_id: int = max(order_book.snapshot_uid, order_book.last_diff_uid)
+        if message.update_id > last_update_id and message.first_update_id > last_update_id + 1:
+            self.logger().warning(
+                f"Order book diffs gap detected for {trading_pair} (expected update {last_update_id + 1}, "
+                f"received {message.first_update_id}). Resynchronizing the order book from a snapshot.")
+            self._sync_metrics[trading_pair].gaps_count += 1
+            self._start_resync(trading_pair=trading_pair, buffered_diffs=[message])
+            return False
+        return True
+
+    def _start_resync(self, trading_pair: str, buffered_diffs: List[OrderBookMessage]):
+        self._resync_buffers[trading_pair] = buffered_diffs
+        sync_metrics = self._sync_metrics[trading_pair]
+        if sync_metrics.resync_start is None:
+            sync_metrics.resync_start = time.perf_counter()
+        resync_task = self._resync_tasks.get(trading_pair)
+        if resync_task is None or resync_task.done():
+            self._resync_tasks[trading_pair] = safe_ensure_future(self._request_resync_snapshot(trading_pair))
+
+    def _start_depth_resync(self, trading_pair: str):
+        """
+        Requests a new snapshot for a depth capped order book with too few levels left. Unlike the resynchronization
+        after a gap, the diffs are still applied while the snapshot is requested.
+        """
+        if trading_pair in self._depth_resync_pairs or trading_pair in self._resync_buffers:
+            return
+        self._depth_resync_pairs.add(trading_pair)
+        self._sync_metrics[trading_pair].depth_resyncs_count += 1
+        self.logger().debug(f"Requesting a snapshot of the depth capped {trading_pair} order book.")
+        self._resync_tasks[trading_pair] = safe_ensure_future(self._request_resync_snapshot(trading_pair))
+
+    def _complete_resync(self, trading_pair: str, snapshot: OrderBookMessage, replayed_diffs: List[OrderBookMessage]):
+        last_update_id: int = snapshot.update_id
+        for diff in replayed_diffs:
+            if diff.update_id <= last_update_id:
+                continue
+            if diff.first_update_id > last_update_id + 1:
+                # The snapshot is older than the gap, the diffs after it are buffered again until a newer snapshot
+                self._start_resync(trading_pair=trading_pair, buffered_diffs=[])
+                return
+            last_update_id = diff.update_id
+        sync_metrics = self._sync_metrics[trading_pair]
+        if sync_metrics.resync_start is not None:
+            sync_metrics.last_resync_latency = time.perf_counter() - sync_metrics.resync_start
+            sync_metrics.total_resync_latency += sync_metrics.last_resync_latency
+            sync_metrics.resyncs_count += 1
+            sync_metrics.resync_start = None
+            self.logger().info(f"Resynchronized the {trading_pair} order book "
+                               f"in {sync_metrics.last_resync_latency:.3f} seconds.")
+
+    async def _request_resync_snapshot(self, trading_pair: str):
+        """
+        Requests a snapshot for the trading pair and sends it to the order book tracking task.
+        """
+        while True:
+            try:
+                snapshot: OrderBookMessage = await self._data_source.get_order_book_snapshot(trading_pair)
+                await self._tracking_message_queues[trading_pair].put(snapshot)
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error requesting the {trading_pair} order book snapshot to resynchronize it.",
+                    exc_info=True,
+                    app_warning_msg="Unexpected error requesting an order book snapshot. Retrying after 5 seconds."
+                )
+                await self._sleep(5.0)
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
@@ -319,6 +573,8 @@ class OrderBookTracker:
                     type=TradeType.SELL if
                     trade_message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
                 ))
+                if self._recorder is not None:
+                    self._record(self._recorder.record_trade, trade_message)
 
                 messages_accepted += 1
 
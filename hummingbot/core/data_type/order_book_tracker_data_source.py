@@ -1,18 +1,27 @@
 import asyncio
 import logging
+import math
 import time
 from abc import ABCMeta, abstractmethod
 from collections import defaultdict
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
 from hummingbot.logger import HummingbotLogger
 
 
 class OrderBookTrackerDataSource(metaclass=ABCMeta):
     FULL_ORDER_BOOK_RESET_DELTA_SECONDS = 60 * 60
+    # Maximum number of trading pairs subscribed through a single websocket connection. When the data source has more
+    # trading pairs they are split in shards, each one with its own connection. None disables the sharding.
+    # Data sources enabling the sharding have to implement `_subscribe_channels_for_trading_pairs`
+    MAX_TRADING_PAIRS_PER_CONNECTION: Optional[int] = None
+    # True when the first_update_id of each diff message follows the update_id of the previous diff. Enables the
+    # sequence gaps detection in the order book tracker
+    CONTIGUOUS_DIFF_UPDATE_IDS: bool = False
 
     _logger: Optional[HummingbotLogger] = None
 
@@ -24,6 +33,7 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         self._trading_pairs: List[str] = trading_pairs
         self._order_book_create_function = lambda: OrderBook()
         self._message_queue: Dict[str, asyncio.Queue] = defaultdict(asyncio.Queue)
+        self._shards_stats: List[Dict[str, Any]] = []
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -39,6 +49,14 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
     def order_book_create_function(self, func: Callable[[], OrderBook]):
         self._order_book_create_function = func
 
+    @property
+    def shards_stats(self) -> List[Dict[str, Any]]:
+        """
+        Status of each websocket connection shard: its trading pairs, if it is connected and how many times it has
+        been reconnected. Empty when the data source is not sharding its subscriptions.
+        """
+        return [dict(stats) for stats in self._shards_stats]
+
     @abstractmethod
     async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
         """
@@ -67,28 +85,97 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
         return order_book
 
+    async def get_order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        """
+        Requests the full order book content from the exchange for a particular trading pair
+
+        :param trading_pair: the trading pair for which the snapshot has to be retrieved
+
+        :return: the snapshot message of the current order book in the exchange
+        """
+        return await self._order_book_snapshot(trading_pair=trading_pair)
+
     async def listen_for_subscriptions(self):
         """
         Connects to the trade events and order diffs websocket endpoints and listens to the messages sent by the
         exchange. Each message is stored in its own queue.
+        If the data source has more than MAX_TRADING_PAIRS_PER_CONNECTION trading pairs they are split across several
+        connections. Each connection is reconnected independently, so a disconnection affects only its trading pairs.
+        """
+        shards = self._trading_pairs_shards()
+        if len(shards) > 1:
+            self._shards_stats = [
+                {"trading_pairs": list(shard), "connected": False, "reconnections": 0} for shard in shards
+            ]
+            try:
+                await safe_gather(*[self._listen_for_shard_subscriptions(shard_index=index, trading_pairs=shard)
+                                    for index, shard in enumerate(shards)])
+            finally:
+                self._shards_stats = []
+            return
+
+        await self._listen_for_websocket_subscriptions(subscribe=self._subscribe_channels)
+
+    async def _listen_for_shard_subscriptions(self, shard_index: int, trading_pairs: List[str]):
+        """
+        Keeps the websocket connection of one shard of trading pairs, reconnecting and subscribing again to the shard
+        trading pairs channels when the connection is lost.
+
+        :param shard_index: the position of the shard in the shards list
+        :param trading_pairs: the trading pairs subscribed through the shard connection
+        """
+        await self._listen_for_websocket_subscriptions(
+            subscribe=lambda ws: self._subscribe_channels_for_trading_pairs(ws=ws, trading_pairs=trading_pairs),
+            stats=self._shards_stats[shard_index],
+            connection_description=f" of shard {shard_index}",
+        )
+
+    async def _listen_for_websocket_subscriptions(
+        self,
+        subscribe: Callable[[WSAssistant], Awaitable[None]],
+        stats: Optional[Dict[str, Any]] = None,
+        connection_description: str = "",
+    ):
+        """
+        Keeps a websocket connection subscribed, connecting and subscribing again when the connection is lost.
+
+        :param subscribe: subscribes to the channels through the connected websocket assistant
+        :param stats: the shard status updated when the connection is established and lost
+        :param connection_description: identifies the connection in the logs
         """
         ws: Optional[WSAssistant] = None
         while True:
             try:
                 ws: WSAssistant = await self._connected_websocket_assistant()
-                await self._subscribe_channels(ws)
+                await subscribe(ws)
+                if stats is not None:
+                    stats["connected"] = True
                 await self._process_websocket_messages(websocket_assistant=ws)
             except asyncio.CancelledError:
                 raise
             except ConnectionError as connection_exception:
-                self.logger().warning(f"The websocket connection was closed ({connection_exception})")
+                self.logger().warning(
+                    f"The websocket connection{connection_description} was closed ({connection_exception})")
             except Exception:
                 self.logger().exception(
-                    "Unexpected error occurred when listening to order book streams. Retrying in 5 seconds...",
+                    f"Unexpected error occurred when listening to order book streams{connection_description}. "
+                    f"Retrying in 5 seconds...",
                 )
                 await self._sleep(1.0)
             finally:
+                if stats is not None and stats["connected"]:
+                    stats["connected"] = False
+                    stats["reconnections"] += 1
                 await self._on_order_stream_interruption(websocket_assistant=ws)
+                ws = None
+
+    def _trading_pairs_shards(self) -> List[List[str]]:
+        max_trading_pairs = self.MAX_TRADING_PAIRS_PER_CONNECTION
+        if max_trading_pairs is None or len(self._trading_pairs) <= max_trading_pairs:
+            return [self._trading_pairs]
+        shards_count = math.ceil(len(self._trading_pairs) / max_trading_pairs)
+        # The trading pairs are distributed evenly instead of filling up the first shards
+        return [self._trading_pairs[index::shards_count] for index in range(shards_count)]
 
     async def listen_for_order_book_diffs(self, ev_loop: asyncio.AbstractEventLoop, output: asyncio.Queue):
         """
@@ -207,6 +294,16 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    async def _subscribe_channels_for_trading_pairs(self, ws: WSAssistant, trading_pairs: List[str]):
+        """
+        Subscribes to the trade events and diff orders events of some trading pairs through the provided websocket
+        connection. Required only when MAX_TRADING_PAIRS_PER_CONNECTION is set.
+
+        :param ws: the websocket assistant used to connect to the exchange
+        :param trading_pairs: the trading pairs to subscribe to
+        """
+        raise NotImplementedError
+
     def _channel_originating_message(self, event_message: Dict[str, Any]) -> str:
         """
         Identifies the channel for a particular event message. Used to find the correct queue to add the message in
@@ -37,6 +37,7 @@ class MarketEvent(Enum):
 
 class OrderBookEvent(int, Enum):
     TradeEvent = 901
+    OrderBookUpdateEvent = 902
     OrderBookDataSourceUpdateEvent = 904
 
 
@@ -156,6 +157,14 @@ class OrderBookTradeEvent(NamedTuple):
     is_taker: bool = True  # CEXs deliver trade events from the taker's perspective
 
 
+class OrderBookUpdateEvent(NamedTuple):
+    update_id: int
+    is_snapshot: bool
+    # The levels of a diff as received, 0 amounts remove a level. None for snapshots.
+    bids: Optional[List[OrderBookRow]] = None
+    asks: Optional[List[OrderBookRow]] = None
+
+
 class OrderFilledEvent(NamedTuple):
     timestamp: float
     order_id: str
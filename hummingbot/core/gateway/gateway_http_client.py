@@ -12,6 +12,7 @@ from hummingbot.client.config.security import Security
 from hummingbot.core.data_type.common import OrderType, PositionSide
 from hummingbot.core.data_type.in_flight_order import InFlightOrder
 from hummingbot.core.event.events import TradeType
+from hummingbot.core.gateway.gateway_price_quote_cache import GatewayPriceQuoteCache
 from hummingbot.logger import HummingbotLogger
 
 if TYPE_CHECKING:
@@ -46,6 +47,7 @@ class GatewayHttpClient:
 
     _ghc_logger: Optional[HummingbotLogger] = None
     _shared_client: Optional[aiohttp.ClientSession] = None
+    _price_quote_cache: Optional[GatewayPriceQuoteCache] = None
     _base_url: str
 
     __instance = None
@@ -96,6 +98,15 @@ class GatewayHttpClient:
         """
         cls._http_client(client_config_map, re_init=True)
 
+    @classmethod
+    def price_quote_cache(cls) -> GatewayPriceQuoteCache:
+        """
+        :returns Price quote cache shared by all the users of the client (see get_price)
+        """
+        if cls._price_quote_cache is None:
+            cls._price_quote_cache = GatewayPriceQuoteCache()
+        return cls._price_quote_cache
+
     @property
     def base_url(self) -> str:
         return self._base_url
@@ -330,7 +341,13 @@ class GatewayHttpClient:
         if chain is not None and network is not None:
             req_data["chain"] = chain
             req_data["network"] = network
-        return await self.api_request("get", "chain/status", req_data, fail_silently=fail_silently)
+        response = await self.api_request("get", "chain/status", req_data, fail_silently=fail_silently)
+        for status in (response if isinstance(response, list) else [response]):
+            if isinstance(status, dict) and status.get("currentBlockNumber") is not None:
+                self.price_quote_cache().update_block_number(
+                    status.get("chain", chain), status.get("network", network), int(status["currentBlockNumber"])
+                )
+        return response
 
     async def approve_token(
             self,
@@ -389,8 +406,13 @@ class GatewayHttpClient:
             amount: Decimal,
             side: TradeType,
             fail_silently: bool = False,
-            pool_id: Optional[str] = None
+            pool_id: Optional[str] = None,
+            use_cache: bool = True,
     ) -> Dict[str, Any]:
+        """
+        Quotes are served from the shared price quote cache when a recent enough one exists, and identical concurrent
+        requests share a single call to Gateway. Pass use_cache=False to always request a fresh quote.
+        """
         if side not in [TradeType.BUY, TradeType.SELL]:
             raise ValueError("Only BUY and SELL prices are supported.")
 
@@ -409,12 +431,19 @@ class GatewayHttpClient:
             request_payload["poolId"] = pool_id
 
         # XXX(martin_kou): The amount is always output with 18 decimal places.
-        return await self.api_request(
-            "post",
-            "amm/price",
-            request_payload,
-            fail_silently=fail_silently,
-        )
+        def fetch():
+            return self.api_request(
+                "post",
+                "amm/price",
+                request_payload,
+                fail_silently=fail_silently,
+            )
+
+        if not use_cache:
+            return await fetch()
+        cache = self.price_quote_cache()
+        key = cache.quote_key(chain, network, connector, base_asset, quote_asset, side, amount, pool_id, fail_silently)
+        return await cache.get_or_fetch(key, fetch)
 
     async def get_transaction_status(
             self,
@@ -0,0 +1,155 @@
+import asyncio
+import time
+from decimal import Context, Decimal
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from hummingbot.core.event.events import TradeType
+
+QuoteKey = Tuple[Hashable, ...]
+
+
+class GatewayPriceQuoteCache:
+    """
+    Short lived cache for Gateway price quotes (amm/price responses).
+
+    Quotes are keyed by chain, network, connector, pair, side and amount bucket. Amounts are bucketed by rounding them
+    to `amount_significant_digits` significant digits, so callers that compute the same amount through slightly
+    different arithmetic share the quote. An entry expires after `ttl` seconds, or as soon as a newer block number is
+    reported for its chain and network through `update_block_number`. Expired entries are swept at most once per
+    `ttl` when a new quote is stored, and the cache holds at most `max_size` quotes, the oldest ones are evicted first.
+
+    Concurrent requests for the same key share a single in-flight request.
+    """
+
+    def __init__(self, ttl: float = 2.0, amount_significant_digits: int = 8, max_size: int = 1000):
+        self._ttl = ttl
+        self._max_size = max_size
+        self._amount_context = Context(prec=amount_significant_digits)
+        # key -> (fetch time, block number at fetch time, response)
+        self._quotes: Dict[QuoteKey, Tuple[float, int, Dict[str, Any]]] = {}
+        self._in_flight: Dict[QuoteKey, asyncio.Future] = {}
+        self._block_numbers: Dict[Tuple[str, str], int] = {}
+        self._last_prune_time = float("-inf")
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._invalidations = 0
+        self._evictions = 0
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+
+    @ttl.setter
+    def ttl(self, value: float):
+        self._ttl = value
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "coalesced": self._coalesced,
+            "invalidations": self._invalidations,
+            "evictions": self._evictions,
+            "size": len(self._quotes),
+            "in_flight": len(self._in_flight),
+        }
+
+    def quote_key(self,
+                  chain: str,
+                  network: str,
+                  connector: str,
+                  base_asset: str,
+                  quote_asset: str,
+                  side: TradeType,
+                  amount: Decimal,
+                  pool_id: Optional[str] = None,
+                  fail_silently: bool = False) -> QuoteKey:
+        amount_bucket = Decimal(amount).normalize(self._amount_context)
+        return chain, network, connector, base_asset, quote_asset, side, amount_bucket, pool_id or "", fail_silently
+
+    async def get_or_fetch(self,
+                           key: QuoteKey,
+                           fetch: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Returns the cached quote for `key` if it is still valid. Otherwise joins the in-flight request for the key, or
+        starts one with `fetch`. Only responses that contain a price are cached; errors are raised to every waiter.
+        """
+        cached = self._quotes.get(key)
+        if cached is not None:
+            fetch_time, block_number, response = cached
+            if self._is_valid(key, fetch_time, block_number):
+                self._hits += 1
+                return response
+            del self._quotes[key]
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            self._coalesced += 1
+            # Shielded so a cancelled waiter does not cancel the request the other waiters depend on
+            return await asyncio.shield(in_flight)
+
+        self._misses += 1
+        task = asyncio.ensure_future(self._fetch(key, fetch))
+        self._in_flight[key] = task
+        return await asyncio.shield(task)
+
+    def update_block_number(self, chain: str, network: str, block_number: int):
+        """
+        Records the latest block of a chain network. Quotes fetched at an older block are no longer served.
+        """
+        if block_number > self._block_numbers.get((chain, network), -1):
+            self._block_numbers[(chain, network)] = block_number
+
+    def invalidate(self, chain: Optional[str] = None, network: Optional[str] = None):
+        """
+        Removes cached quotes, all of them or only the ones of a chain (and network).
+        """
+        keys = [key for key in self._quotes
+                if (chain is None or key[0] == chain) and (network is None or key[1] == network)]
+        for key in keys:
+            del self._quotes[key]
+        self._invalidations += len(keys)
+
+    def clear(self):
+        self._quotes.clear()
+
+    def _is_valid(self, key: QuoteKey, fetch_time: float, block_number: int) -> bool:
+        if self._time() - fetch_time > self._ttl:
+            return False
+        return block_number >= self._block_numbers.get((key[0], key[1]), -1)
+
+    async def _fetch(self, key: QuoteKey, fetch: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        block_number = self._block_numbers.get((key[0], key[1]), -1)
+        fetch_time = self._time()
+        try:
+            response = await fetch()
+        finally:
+            self._in_flight.pop(key, None)
+        if isinstance(response, dict) and "price" in response and self._ttl > 0:
+            self._store(key, (fetch_time, block_number, response))
+        return response
+
+    def _store(self, key: QuoteKey, entry: Tuple[float, int, Dict[str, Any]]):
+        now = self._time()
+        if now - self._last_prune_time >= self._ttl:
+            self._prune_expired()
+            self._last_prune_time = now
+        # Re-inserted so the dict order stays the storage order the oldest entries are evicted by
+        self._quotes.pop(key, None)
+        while len(self._quotes) >= self._max_size > 0:
+            del self._quotes[next(iter(self._quotes))]
+            self._evictions += 1
+        self._quotes[key] = entry
+
+    def _prune_expired(self):
+        expired = [key for key, (fetch_time, block_number, _) in self._quotes.items()
+                   if not self._is_valid(key, fetch_time, block_number)]
+        for key in expired:
+            del self._quotes[key]
+        self._evictions += len(expired)
+
+    @staticmethod
+    def _time() -> float:
+        return time.monotonic()
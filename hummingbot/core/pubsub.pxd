@@ -12,16 +12,20 @@ ctypedef unordered_set[PyRef].iterator EventListenersIterator
 ctypedef unordered_map[int64_t, EventListenersCollection] Events
 ctypedef unordered_map[int64_t, EventListenersCollection].iterator EventsIterator
 ctypedef pair[int64_t, EventListenersCollection] EventsPair
+ctypedef unordered_map[int64_t, PyRef] DispatchLists
+ctypedef unordered_map[int64_t, PyRef].iterator DispatchListsIterator
 
 
 cdef class PubSub:
     cdef:
         Events _events
+        DispatchLists _dispatch_lists
         object __weakref__
 
     cdef c_log_exception(self, int64_t event_tag, object arg)
     cdef c_add_listener(self, int64_t event_tag, EventListener listener)
     cdef c_remove_listener(self, int64_t event_tag, EventListener listener)
     cdef c_remove_dead_listeners(self, int64_t event_tag)
+    cdef c_rebuild_dispatch_list(self, int64_t event_tag)
     cdef c_get_listeners(self, int64_t event_tag)
     cdef c_trigger_event(self, int64_t event_tag, object arg)
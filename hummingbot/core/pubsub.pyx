@@ -29,6 +29,10 @@ cdef class PubSub:
     PubSub with weak references. This avoids the lapsed listener problem by periodically performing GC on dead
     event listener.
 
+    Besides the listeners set of each event, PubSub keeps an immutable tuple with the listener weak references, the
+    dispatch list. It is rebuilt only when listeners are added or removed, so triggering an event does not copy the
+    listeners. Listeners removed or added while an event is being dispatched do not change the tuple being iterated.
+
     Dead listener is done by calling c_remove_dead_listeners(), which checks whether the listener weak references are
     alive or not, and removes the dead ones. Each call to c_remove_dead_listeners() takes O(n).
 
@@ -40,7 +44,8 @@ cdef class PubSub:
     2. c_remove_listener():
        Every time. This assumes c_remove_listener() is called infrequently.
     3. c_get_listeners() and c_trigger_event():
-       Every time. Both functions take O(n) already.
+       Only when a dead listener is found while going through the dispatch list. Events with live listeners only are
+       dispatched without any GC work.
     """
 
     ADD_LISTENER_GC_PROBABILITY = 0.005
@@ -54,6 +59,7 @@ cdef class PubSub:
 
     def __init__(self):
         self._events = Events()
+        self._dispatch_lists = DispatchLists()
 
     def add_listener(self, event_tag: Enum, listener: EventListener):
         self.c_add_listener(event_tag.value, listener)
@@ -79,13 +85,16 @@ cdef class PubSub:
             PyRef listener_wrapper = PyRef(<PyObject *>listener_weakref)
         if it != self._events.end():
             listeners_ptr = address(deref(it).second)
-            deref(listeners_ptr).insert(listener_wrapper)
+            if not deref(listeners_ptr).insert(listener_wrapper).second:
+                return
         else:
             new_listeners.insert(listener_wrapper)
             self._events.insert(EventsPair(event_tag, new_listeners))
 
         if random.random() < PubSub.ADD_LISTENER_GC_PROBABILITY:
             self.c_remove_dead_listeners(event_tag)
+        else:
+            self.c_rebuild_dispatch_list(event_tag)
 
     cdef c_remove_listener(self, int64_t event_tag, EventListener listener):
         cdef:
@@ -110,6 +119,7 @@ cdef class PubSub:
             EventListenersIterator lit
             vector[EventListenersIterator] lit_to_remove
         if it == self._events.end():
+            self._dispatch_lists.erase(event_tag)
             return
         listeners_ptr = address(deref(it).second)
         lit = deref(listeners_ptr).begin()
@@ -122,44 +132,64 @@ cdef class PubSub:
             deref(listeners_ptr).erase(lit)
         if deref(listeners_ptr).size() < 1:
             self._events.erase(it)
+        self.c_rebuild_dispatch_list(event_tag)
 
-    cdef c_get_listeners(self, int64_t event_tag):
-        self.c_remove_dead_listeners(event_tag)
-
+    cdef c_rebuild_dispatch_list(self, int64_t event_tag):
         cdef:
             EventsIterator it = self._events.find(event_tag)
             EventListenersCollection *listeners_ptr
-            object listener_weafref
-            EventListener typed_listener
-
+            list listener_weakrefs = []
+            tuple dispatch_list
         if it == self._events.end():
+            self._dispatch_lists.erase(event_tag)
+            return
+        listeners_ptr = address(deref(it).second)
+        for pyref in deref(listeners_ptr):
+            listener_weakrefs.append(<object>pyref.get())
+        dispatch_list = tuple(listener_weakrefs)
+        self._dispatch_lists[event_tag] = PyRef(<PyObject *>dispatch_list)
+
+    cdef c_get_listeners(self, int64_t event_tag):
+        cdef:
+            DispatchListsIterator it = self._dispatch_lists.find(event_tag)
+            tuple dispatch_list
+            object listener
+            bint dead_listener_found = False
+
+        if it == self._dispatch_lists.end():
             return []
 
+        dispatch_list = <tuple>(deref(it).second.get())
         retval = []
-        listeners_ptr = address(deref(it).second)
-        for pyref in deref(listeners_ptr):
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
-            retval.append(typed_listener)
+        for listener_weakref in dispatch_list:
+            listener = <object>PyWeakref_GetObject(listener_weakref)
+            if listener is None:
+                dead_listener_found = True
+            else:
+                retval.append(listener)
+        if dead_listener_found:
+            self.c_remove_dead_listeners(event_tag)
         return retval
 
     cdef c_trigger_event(self, int64_t event_tag, object arg):
-        self.c_remove_dead_listeners(event_tag)
-
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection listeners
-            object listener_weafref
+            DispatchListsIterator it = self._dispatch_lists.find(event_tag)
+            tuple dispatch_list
+            object listener
             EventListener typed_listener
-        if it == self._events.end():
+            bint dead_listener_found = False
+        if it == self._dispatch_lists.end():
             return
 
-        # It is extremely important that this set of listeners is a C++ copy - because listeners are allowed to call
-        # c_remove_listener(), which breaks the iterator if we're using the underlying set.
-        listeners = deref(it).second
-        for pyref in listeners:
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
+        # The dispatch list is immutable and this function holds a reference to it, so listeners are allowed to call
+        # c_remove_listener() or c_add_listener() while the event is dispatched.
+        dispatch_list = <tuple>(deref(it).second.get())
+        for listener_weakref in dispatch_list:
+            listener = <object>PyWeakref_GetObject(listener_weakref)
+            if listener is None:
+                dead_listener_found = True
+                continue
+            typed_listener = listener
             try:
                 typed_listener.c_set_event_info(event_tag, self)
                 typed_listener.c_call(arg)
@@ -167,3 +197,5 @@ cdef class PubSub:
                 self.c_log_exception(event_tag, arg)
             finally:
                 typed_listener.c_set_event_info(0, None)
+        if dead_listener_found:
+            self.c_remove_dead_listeners(event_tag)
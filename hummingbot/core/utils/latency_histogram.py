@@ -0,0 +1,37 @@
+from bisect import bisect_left
+from typing import Any, Dict
+
+
+class LatencyHistogram:
+    """
+    Histogram of durations with fixed buckets in milliseconds.
+    """
+    BUCKETS_MS = (0.1, 0.5, 1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+    def __init__(self):
+        self._bucket_counts = [0] * (len(self.BUCKETS_MS) + 1)
+        self._count = 0
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def add(self, duration: float):
+        duration_ms = duration * 1000
+        self._bucket_counts[bisect_left(self.BUCKETS_MS, duration_ms)] += 1
+        self._count += 1
+        self._total_ms += duration_ms
+        self._max_ms = max(self._max_ms, duration_ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        buckets = {f"<={limit}ms": count for limit, count in zip(self.BUCKETS_MS, self._bucket_counts)}
+        buckets[f">{self.BUCKETS_MS[-1]}ms"] = self._bucket_counts[-1]
+        return {
+            "count": self._count,
+            "mean_ms": self._total_ms / self._count if self._count > 0 else 0.0,
+            "max_ms": self._max_ms,
+            "total_ms": self._total_ms,
+            "buckets": buckets,
+        }
@@ -3,6 +3,7 @@ from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.client.settings import AllConnectorSettings, ConnectorSetting
+from hummingbot.connector.exchange_info_cache import ExchangeInfoCache
 from hummingbot.logger import HummingbotLogger
 
 from ...client.config.security import Security
@@ -30,6 +31,7 @@ class TradingPairFetcher:
         self.ready = False
         self.trading_pairs: Dict[str, Any] = {}
         self.fetch_pairs_from_all_exchanges = client_config_map.fetch_pairs_from_all_exchanges
+        self._exchange_info_cache_config = client_config_map.exchange_info_cache
         self._fetch_task = safe_ensure_future(self.fetch_all(client_config_map))
 
     def _fetch_pairs_from_connector_setting(
@@ -37,6 +39,10 @@ class TradingPairFetcher:
             connector_setting: ConnectorSetting,
             connector_name: Optional[str] = None):
         connector_name = connector_name or connector_setting.name
+        cached_pairs = self._cached_trading_pairs(connector_setting.name)
+        if cached_pairs is not None:
+            self.trading_pairs[connector_name] = cached_pairs
+            return
         connector = connector_setting.non_trading_connector_instance_with_default_configuration()
         safe_ensure_future(self.call_fetch_pairs(connector.all_trading_pairs(), connector_name))
 
@@ -74,6 +80,17 @@ class TradingPairFetcher:
             # In case of error just assign empty list, this is st. the bot won't stop working
             self.trading_pairs[exchange_name] = []
 
+    def _cached_trading_pairs(self, connector_name: str) -> Optional[List[str]]:
+        """
+        Returns the trading pairs of the connector from the exchange info cache, None if the cache is disabled or the
+        connector trading pairs are not cached
+        """
+        if not self._exchange_info_cache_config.exchange_info_cache_enabled:
+            return None
+        cache = ExchangeInfoCache(connector_name, ttl=self._exchange_info_cache_config.exchange_info_cache_ttl)
+        symbol_map = cache.symbol_map()
+        return None if symbol_map is None else list(symbol_map.values())
+
     def _all_connector_settings(self) -> Dict[str, ConnectorSetting]:
         # Method created to enabling patching in unit tests
         return AllConnectorSettings.get_connector_settings()
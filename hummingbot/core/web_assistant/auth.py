@@ -1,4 +1,7 @@
+import hashlib
+import hmac
 from abc import ABC, abstractmethod
+from typing import Union
 
 from hummingbot.core.web_assistant.connections.data_types import RESTRequest, WSRequest
 
@@ -9,6 +12,9 @@ class AuthBase(ABC):
     Hint: If the authentication requires a simple REST request to acquire information from the
     server that is required in the message signature, this class can be passed a `RESTConnection`
     object that it can use to that end.
+
+    The authentication methods should return the authenticated request created with `request.copy_with(...)`,
+    replacing only the fields that change (usually `headers`, `params` or the WebSocket `payload`).
     """
 
     @abstractmethod
@@ -18,3 +24,26 @@ class AuthBase(ABC):
     @abstractmethod
     async def ws_authenticate(self, request: WSRequest) -> WSRequest:
         ...
+
+
+class HMACSigner:
+    """Generates HMAC signatures with a fixed secret.
+
+    The HMAC state keyed with the secret is created once and copied for each signature, instead of processing the
+    secret again for every signed request.
+    """
+
+    def __init__(self, secret: Union[str, bytes], digestmod=hashlib.sha256):
+        key = secret.encode("utf8") if isinstance(secret, str) else secret
+        self._keyed_hmac = hmac.new(key, digestmod=digestmod)
+
+    def digest(self, message: Union[str, bytes]) -> bytes:
+        return self._signature_hmac(message).digest()
+
+    def hexdigest(self, message: Union[str, bytes]) -> str:
+        return self._signature_hmac(message).hexdigest()
+
+    def _signature_hmac(self, message: Union[str, bytes]):
+        signature_hmac = self._keyed_hmac.copy()
+        signature_hmac.update(message.encode("utf8") if isinstance(message, str) else message)
+        return signature_hmac
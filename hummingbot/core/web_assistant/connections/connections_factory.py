@@ -1,9 +1,14 @@
-from typing import Optional
+import asyncio
+import logging
+from typing import Any, Dict, Optional
 
 import aiohttp
 
+from hummingbot.core.web_assistant.connections.data_types import ConnectionPoolSettings
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
+from hummingbot.core.web_assistant.request_tracer import get_request_tracer
+from hummingbot.logger import HummingbotLogger
 
 
 class ConnectionsFactory:
@@ -16,14 +21,39 @@ class ConnectionsFactory:
     `WebAssistantsFactory` to accommodate cases such as Bittrex that uses a specific WebSocket technology requiring
     a separate third-party library. In that case, a factory can be created that returns `RESTConnection`s using
     `aiohttp` and `WSConnection`s using `signalr_aio`.
+
+    Connections use a shared client session configured with the factory `ConnectionPoolSettings`. Each connector has
+    its own factory, so each exchange can have its own connection limits and keep-alive policy.
     """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
 
-    def __init__(self):
+    def __init__(self, pool_settings: Optional[ConnectionPoolSettings] = None):
         # _ws_independent_session is intended to be used only in unit tests
         self._ws_independent_session: Optional[aiohttp.ClientSession] = None
 
+        self._pool_settings = pool_settings or ConnectionPoolSettings()
         self._shared_client: Optional[aiohttp.ClientSession] = None
 
+    @property
+    def pool_settings(self) -> ConnectionPoolSettings:
+        return self._pool_settings
+
+    @pool_settings.setter
+    def pool_settings(self, pool_settings: ConnectionPoolSettings):
+        """
+        Changes the pool settings. The shared client session is created with the first connection, so the settings
+        must be set before it.
+        """
+        if self._shared_client is not None:
+            raise RuntimeError("The pool settings can't be changed once the client session is created.")
+        self._pool_settings = pool_settings
+
     async def get_rest_connection(self) -> RESTConnection:
         shared_client = await self._get_shared_client()
         connection = RESTConnection(aiohttp_client_session=shared_client)
@@ -34,6 +64,64 @@ class ConnectionsFactory:
         connection = WSConnection(aiohttp_client_session=shared_client)
         return connection
 
+    async def pre_warm(self, url: str, connections_count: Optional[int] = None):
+        """
+        Opens connections to the host of `url` and returns them to the pool, to have them ready (DNS resolved and
+        TLS handshake done) for the first requests. Failures are only logged.
+
+        :param url: any URL of the host, the response content is ignored
+        :param connections_count: number of connections to open, by default the pool `pre_warm_connections` setting
+        """
+        session = await self._get_shared_client()
+        if connections_count is None:
+            connections_count = self._pool_settings.pre_warm_connections
+
+        async def open_connection():
+            async with session.head(url, allow_redirects=False) as response:
+                await response.read()
+
+        results = await asyncio.gather(*[open_connection() for _ in range(connections_count)], return_exceptions=True)
+        failures = [result for result in results if isinstance(result, Exception)]
+        if len(failures) > 0:
+            self.logger().debug(f"{len(failures)} of {connections_count} connections to {url} could not be pre-warmed "
+                                f"({failures[0]}).")
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """
+        Connection pool usage of the shared client session, empty before the session is created. `in_use` counts the
+        connections currently acquired, `idle` the keep-alive connections ready to be reused, and `saturation` is
+        `in_use` relative to the pool limit. aiohttp does not expose the pool usage, it is read from private
+        attributes of the connector and left out of the stats when they are not available.
+        """
+        if self._shared_client is None or self._shared_client.connector is None:
+            return {}
+        connector = self._shared_client.connector
+        stats = {
+            "limit": connector.limit,
+            "limit_per_host": connector.limit_per_host,
+        }
+        acquired = getattr(connector, "_acquired", None)
+        idle_connections = getattr(connector, "_conns", None)
+        if acquired is not None and idle_connections is not None:
+            in_use = len(acquired)
+            stats["in_use"] = in_use
+            stats["idle"] = sum(len(connections) for connections in idle_connections.values())
+            stats["saturation"] = in_use / connector.limit if connector.limit else 0.0
+        return stats
+
+    async def close(self):
+        if self._shared_client is not None and not self._shared_client.closed:
+            await self._shared_client.close()
+        self._shared_client = None
+
     async def _get_shared_client(self) -> aiohttp.ClientSession:
-        self._shared_client = self._shared_client or aiohttp.ClientSession()
+        self._shared_client = self._shared_client or self._create_client_session(self._pool_settings)
         return self._shared_client
+
+    @staticmethod
+    def _create_client_session(pool_settings: ConnectionPoolSettings) -> aiohttp.ClientSession:
+        # The connection acquisition times are only traced for sessions created with the request tracer enabled, so
+        # that aiohttp does not call the trace hooks otherwise
+        tracer = get_request_tracer()
+        trace_configs = [tracer.aiohttp_trace_config()] if tracer.enabled else None
+        return aiohttp.ClientSession(connector=pool_settings.create_connector(), trace_configs=trace_configs)
@@ -1,10 +1,12 @@
 from abc import ABC, abstractmethod
+from copy import copy
 from dataclasses import dataclass
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Mapping, Optional
 
 import aiohttp
-import ujson
+
+from hummingbot.core.web_assistant.json_codec import get_json_codec
 
 if TYPE_CHECKING:
     from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
@@ -35,6 +37,29 @@ class RESTRequest:
     is_auth_required: bool = False
     throttler_limit_id: Optional[str] = None
 
+    def copy_with(self, **changes) -> "RESTRequest":
+        """Returns a shallow copy of the request with the given fields replaced.
+
+        Pre-processors and authenticators should use it to change a request instead of modifying it in place. Only
+        the replaced fields are new objects, the rest are shared with the original request.
+        """
+        request = copy(self)
+        for field_name, value in changes.items():
+            setattr(request, field_name, value)
+        return request
+
+    def owned_copy(self) -> "RESTRequest":
+        """Returns a copy of the request that can be modified in place without affecting the original one.
+
+        The `params` and `headers` mappings (and `data`, when it is not already serialized) are copied one level
+        deep, which is enough for the in-place updates done by pre-processors and authenticators.
+        """
+        return self.copy_with(
+            params=copy(self.params) if self.params is not None else None,
+            headers=copy(self.headers) if self.headers is not None else None,
+            data=copy(self.data) if isinstance(self.data, (dict, list)) else self.data,
+        )
+
 
 @dataclass
 class EndpointRESTRequest(RESTRequest, ABC):
@@ -73,7 +98,7 @@ class EndpointRESTRequest(RESTRequest, ABC):
     def _ensure_data(self):
         if self.method == RESTMethod.POST:
             if self.data is not None:
-                self.data = ujson.dumps(self.data)
+                self.data = get_json_codec().dumps(self.data)
         elif self.data is not None:
             raise ValueError("The `data` field should be used only for POST requests. Use `params` instead.")
 
@@ -109,9 +134,16 @@ class RESTResponse:
         return headers_
 
     async def json(self) -> Any:
-        json_ = await self._aiohttp_response.json()
+        json_ = await self._aiohttp_response.json(loads=get_json_codec().loads)
         return json_
 
+    async def read(self) -> bytes:
+        """
+        Returns the response body without decoding it, for callers that decode only part of it or decode it lazily.
+        """
+        body = await self._aiohttp_response.read()
+        return body
+
     async def text(self) -> str:
         text_ = await self._aiohttp_response.text()
         return text_
@@ -122,6 +154,24 @@ class WSRequest(ABC):
     async def send_with_connection(self, connection: "WSConnection"):
         return NotImplemented
 
+    def copy_with(self, **changes) -> "WSRequest":
+        """Returns a shallow copy of the request with the given fields replaced."""
+        request = copy(self)
+        for field_name, value in changes.items():
+            setattr(request, field_name, value)
+        return request
+
+    def owned_copy(self) -> "WSRequest":
+        """Returns a copy of the request that can be modified in place without affecting the original one.
+
+        A JSON payload is copied one level deep, which is enough for the in-place updates done by pre-processors and
+        authenticators.
+        """
+        payload = getattr(self, "payload", None)
+        if isinstance(payload, (dict, list)):
+            return self.copy_with(payload=copy(payload))
+        return copy(self)
+
 
 @dataclass
 class WSJSONRequest(WSRequest):
@@ -156,3 +206,33 @@ class WSBinaryRequest(WSRequest):
 @dataclass
 class WSResponse:
     data: Any
+
+
+@dataclass
+class ConnectionPoolSettings:
+    """Settings of the `aiohttp` connection pool behind a `ConnectionsFactory` client session.
+
+    The defaults are the `aiohttp.TCPConnector` defaults. Connections are kept alive between requests (HTTP/1.1
+    persistent connections) unless `force_close` is set. When `pre_warm_connections` is greater than zero, connectors
+    open that many connections to their API host when the network is started, so the first requests do not pay for
+    the DNS resolution and TLS handshakes.
+    """
+    limit: int = 100
+    limit_per_host: int = 0
+    use_dns_cache: bool = True
+    ttl_dns_cache: Optional[int] = 10
+    keepalive_timeout: float = 15.0
+    force_close: bool = False
+    enable_cleanup_closed: bool = False
+    pre_warm_connections: int = 0
+
+    def create_connector(self) -> aiohttp.TCPConnector:
+        return aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            use_dns_cache=self.use_dns_cache,
+            ttl_dns_cache=self.ttl_dns_cache,
+            keepalive_timeout=None if self.force_close else self.keepalive_timeout,
+            force_close=self.force_close,
+            enable_cleanup_closed=self.enable_cleanup_closed,
+        )
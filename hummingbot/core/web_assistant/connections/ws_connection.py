@@ -1,12 +1,12 @@
 import asyncio
 import time
-from json import JSONDecodeError
 from typing import Any, Dict, Mapping, Optional
 
 import aiohttp
 from aiohttp import WebSocketError, WSCloseCode
 
 from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
+from hummingbot.core.web_assistant.json_codec import get_json_codec
 
 
 class WSConnection:
@@ -17,6 +17,7 @@ class WSConnection:
         self._connection: Optional[aiohttp.ClientWebSocketResponse] = None
         self._connected = False
         self._message_timeout: Optional[float] = None
+        self._raw_messages = False
         self._last_recv_time = 0
 
     @property
@@ -33,8 +34,14 @@ class WSConnection:
         ping_timeout: float = 10,
         message_timeout: Optional[float] = None,
         ws_headers: Optional[Dict] = {},
-        max_msg_size: Optional[int] = None
+        max_msg_size: Optional[int] = None,
+        raw_messages: bool = False,
     ):
+        """
+        :param raw_messages: if True the received messages are not decoded, and the responses data is the message
+        payload as received (str for text messages, bytes for binary messages). It allows data sources to decode only
+        the messages they need, or to decode them lazily.
+        """
         self._ensure_not_connected()
         self._connection = await self._client_session.ws_connect(
             ws_url,
@@ -44,6 +51,7 @@ class WSConnection:
             max_msg_size=max_msg_size,
         )
         self._message_timeout = message_timeout
+        self._raw_messages = raw_messages
         self._connected = True
 
     async def disconnect(self):
@@ -133,7 +141,7 @@ class WSConnection:
         self._last_recv_time = time.time()
 
     async def _send_json(self, payload: Mapping[str, Any]):
-        await self._connection.send_json(payload)
+        await self._connection.send_json(payload, dumps=get_json_codec().dumps)
 
     async def _send_plain_text(self, payload: str):
         await self._connection.send_str(payload)
@@ -141,14 +149,13 @@ class WSConnection:
     async def _send_binary(self, payload: bytes):
         await self._connection.send_bytes(payload)
 
-    @staticmethod
-    def _build_resp(msg: aiohttp.WSMessage) -> WSResponse:
-        if msg.type == aiohttp.WSMsgType.BINARY:
+    def _build_resp(self, msg: aiohttp.WSMessage) -> WSResponse:
+        if msg.type == aiohttp.WSMsgType.BINARY or self._raw_messages:
             data = msg.data
         else:
             try:
-                data = msg.json()
-            except JSONDecodeError:
+                data = get_json_codec().loads(msg.data)
+            except ValueError:
                 data = msg.data
         response = WSResponse(data)
         return response
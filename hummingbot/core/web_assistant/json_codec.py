@@ -0,0 +1,108 @@
+import json
+import math
+from decimal import Decimal
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def _encode_default(obj: Any) -> Any:
+    """
+    Encodes the values the JSON encoders do not support: Decimal values as numbers, NaN and Infinity Decimal values as
+    null, and numpy scalars and arrays as the equivalent Python values.
+    """
+    if isinstance(obj, Decimal):
+        return float(obj) if obj.is_finite() else None
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _replace_non_finite(obj: Any) -> Any:
+    """
+    Returns the document with its NaN and Infinity float values replaced by None, the same way orjson encodes them.
+    """
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _replace_non_finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_replace_non_finite(value) for value in obj]
+    return obj
+
+
+class JSONCodec:
+    """
+    Encodes and decodes the JSON payloads of the REST and websocket connections using the standard library.
+
+    Documents are encoded in the compact form orjson writes: no spaces after the separators, non ASCII characters
+    written as they are, and NaN and Infinity values written as null.
+    """
+    name = "json"
+
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        try:
+            return self._dumps(obj)
+        except ValueError:
+            # NaN and Infinity are not valid JSON
+            return self._dumps(_replace_non_finite(obj))
+
+    @staticmethod
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, default=_encode_default, separators=(",", ":"), ensure_ascii=False, allow_nan=False)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    JSON codec based on orjson, several times faster than the standard library.
+
+    Documents orjson does not accept (integers out of the 64 bits range, NaN or Infinity values) are decoded and
+    encoded with the standard library, which writes them in the same form.
+    """
+    name = "orjson"
+
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        try:
+            encoded = orjson.dumps(obj,
+                                   default=_encode_default,
+                                   option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        except orjson.JSONEncodeError:
+            return super().dumps(obj)
+        return encoded.decode()
+
+
+_json_codec: Optional[JSONCodec] = None
+
+
+def default_json_codec() -> JSONCodec:
+    """
+    The fastest codec available: orjson if it is installed, otherwise the standard library.
+    """
+    return OrjsonCodec() if orjson is not None else JSONCodec()
+
+
+def get_json_codec() -> JSONCodec:
+    global _json_codec
+    if _json_codec is None:
+        _json_codec = default_json_codec()
+    return _json_codec
+
+
+def set_json_codec(codec: Optional[JSONCodec]):
+    """
+    Changes the codec used by all the web assistants. Passing None restores the default codec.
+    """
+    global _json_codec
+    _json_codec = codec
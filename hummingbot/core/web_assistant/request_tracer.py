@@ -0,0 +1,295 @@
+import asyncio
+import contextvars
+import logging
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+import aiohttp
+from aiohttp import web
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
+from hummingbot.logger import HummingbotLogger
+
+# Trace of the request being executed in the current task, used to attribute the aiohttp connection times
+_current_trace: contextvars.ContextVar[Optional["RequestTrace"]] = contextvars.ContextVar("_current_trace", default=None)
+# Connector sending the requests in the current task, and client order id of the order being created if any
+_current_context: contextvars.ContextVar[Optional[Tuple[str, Optional[str]]]] = contextvars.ContextVar(
+    "_current_context", default=None)
+
+
+class RequestTrace:
+    """
+    Timings of the stages of one request. Each call to `mark` records the time since the previous mark as the duration
+    of a stage. Durations recorded with `record` (measured elsewhere, like the aiohttp connection acquisition) are
+    excluded from the next marked stage.
+    """
+    __slots__ = ("connector", "endpoint", "order_id", "start", "end", "stages", "_last_mark", "_recorded_since_mark",
+                 "_context_token")
+
+    def __init__(self, endpoint: str, connector: Optional[str] = None, order_id: Optional[str] = None):
+        self.connector = connector
+        self.endpoint = endpoint
+        self.order_id = order_id
+        self.start = self._last_mark = time.perf_counter()
+        self.end: Optional[float] = None
+        self.stages: Dict[str, float] = {}
+        self._recorded_since_mark = 0.0
+        self._context_token: Optional[contextvars.Token] = None
+
+    @property
+    def total(self) -> float:
+        return (self.end or self._last_mark) - self.start
+
+    def mark(self, stage: str):
+        now = time.perf_counter()
+        self.stages[stage] = self.stages.get(stage, 0.0) + now - self._last_mark - self._recorded_since_mark
+        self._last_mark = now
+        self._recorded_since_mark = 0.0
+
+    def record(self, stage: str, duration: float):
+        self.stages[stage] = self.stages.get(stage, 0.0) + duration
+        self._recorded_since_mark += duration
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "connector": self.connector,
+            "endpoint": self.endpoint,
+            "order_id": self.order_id,
+            "total_ms": self.total * 1000,
+            "stages_ms": {stage: duration * 1000 for stage, duration in self.stages.items()},
+        }
+
+
+class LatencySink:
+    """
+    Receives the latency summaries of the tracer every time they are exported.
+    """
+
+    def export(self, summaries: Dict[str, Dict[str, Dict[str, Any]]]):
+        raise NotImplementedError
+
+    def stop(self):
+        pass
+
+
+class LoggerLatencySink(LatencySink):
+    """
+    Logs the mean and maximum duration of each stage, one line per connector and endpoint.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def export(self, summaries: Dict[str, Dict[str, Dict[str, Any]]]):
+        for key, stages in summaries.items():
+            stages_text = ", ".join(f"{stage}: {histogram['mean_ms']:.2f}ms (max {histogram['max_ms']:.2f}ms)"
+                                    for stage, histogram in stages.items())
+            self.logger().info(f"Request latency {key} - {stages_text}")
+
+
+class CallbackLatencySink(LatencySink):
+    """
+    Sends the summaries to a callable, for example an `ETopicPublisher` to publish them through MQTT.
+    """
+
+    def __init__(self, callback: Callable[[Dict[str, Any]], None]):
+        self._callback = callback
+
+    def export(self, summaries: Dict[str, Dict[str, Dict[str, Any]]]):
+        self._callback({"timestamp": time.time(), "latencies": summaries})
+
+
+class PrometheusLatencySink(LatencySink):
+    """
+    Keeps the last summaries in the Prometheus text format. `start_server` serves them in a local HTTP endpoint.
+    """
+    METRIC_NAME = "hummingbot_request_stage_latency_ms"
+    LABEL_VALUE_ESCAPES = str.maketrans({"\\": "\\\\", "\"": "\\\"", "\n": "\\n"})
+
+    def __init__(self):
+        self._text = ""
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    def export(self, summaries: Dict[str, Dict[str, Dict[str, Any]]]):
+        lines = [f"# TYPE {self.METRIC_NAME} histogram"]
+        for key, stages in summaries.items():
+            connector, endpoint = key.split(" ", 1)
+            for stage, histogram in stages.items():
+                labels = (f'connector="{self._escape(connector)}",endpoint="{self._escape(endpoint)}",'
+                          f'stage="{self._escape(stage)}"')
+                cumulative_count = 0
+                for limit, count in histogram["buckets"].items():
+                    cumulative_count += count
+                    upper_bound = "+Inf" if limit.startswith(">") else limit[2:-2]
+                    lines.append(f'{self.METRIC_NAME}_bucket{{{labels},le="{upper_bound}"}} {cumulative_count}')
+                lines.append(f"{self.METRIC_NAME}_sum{{{labels}}} {histogram['total_ms']}")
+                lines.append(f"{self.METRIC_NAME}_count{{{labels}}} {histogram['count']}")
+        self._text = "\n".join(lines) + "\n"
+
+    @classmethod
+    def _escape(cls, label_value: str) -> str:
+        return label_value.translate(cls.LABEL_VALUE_ESCAPES)
+
+    async def start_server(self, host: str = "127.0.0.1", port: int = 9090):
+        app = web.Application()
+        app.router.add_get("/metrics", self._handle_metrics_request)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+
+    def stop(self):
+        if self._runner is not None:
+            safe_ensure_future(self._runner.cleanup())
+            self._runner = None
+
+    async def _handle_metrics_request(self, _: web.Request) -> web.Response:
+        return web.Response(text=self._text, content_type="text/plain")
+
+
+class RequestTracer:
+    """
+    Collects the stage timings of the REST and websocket requests and of the order creations, tagged with the
+    connector, the endpoint (the throttler limit id) and the client order id.
+
+    The tracer is disabled by default, the `request_tracing` client settings enable it. When disabled `start_trace`
+    returns None and the traced code only checks that value, so the overhead is one method call per request.
+    """
+    RECENT_TRACES_SIZE = 1000
+
+    def __init__(self):
+        self._enabled = False
+        self._sinks: List[LatencySink] = []
+        self._histograms: Dict[str, Dict[str, LatencyHistogram]] = defaultdict(lambda: defaultdict(LatencyHistogram))
+        self._recent_traces: Deque[RequestTrace] = deque(maxlen=self.RECENT_TRACES_SIZE)
+        self._export_task: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def enable(self, sinks: Optional[List[LatencySink]] = None, export_interval: Optional[float] = None):
+        """
+        :param sinks: the sinks receiving the summaries when they are exported
+        :param export_interval: if set, the summaries are exported periodically with that interval in seconds
+        """
+        self._enabled = True
+        self._sinks = list(sinks or [])
+        if export_interval is not None and self._export_task is None:
+            self._export_task = safe_ensure_future(self._export_loop(export_interval))
+
+    def disable(self):
+        self._enabled = False
+        if self._export_task is not None:
+            self._export_task.cancel()
+            self._export_task = None
+        for sink in self._sinks:
+            sink.stop()
+        self._sinks = []
+
+    def reset(self):
+        self._histograms.clear()
+        self._recent_traces.clear()
+
+    def start_trace(self, endpoint: str) -> Optional[RequestTrace]:
+        """
+        Starts the trace of a request, tagged with the connector and order id of the current `request_context`.
+        Returns None when the tracer is disabled.
+        """
+        if not self._enabled:
+            return None
+        connector, order_id = _current_context.get() or (None, None)
+        trace = RequestTrace(endpoint=endpoint, connector=connector, order_id=order_id)
+        trace._context_token = _current_trace.set(trace)
+        return trace
+
+    def finish_trace(self, trace: RequestTrace):
+        """
+        Records the stage durations of the trace, and makes the trace that was current when it started (the trace of
+        the order creation for the requests it sends) the current trace again.
+        """
+        trace.end = time.perf_counter()
+        if trace._context_token is not None:
+            _current_trace.reset(trace._context_token)
+            trace._context_token = None
+        histograms = self._histograms[f"{trace.connector or 'unknown'} {trace.endpoint}"]
+        for stage, duration in trace.stages.items():
+            histograms[stage].add(duration)
+        histograms["total"].add(trace.total)
+        self._recent_traces.append(trace)
+
+    @contextmanager
+    def request_context(self, connector: str, order_id: Optional[str] = None):
+        """
+        Tags the requests sent inside the context with the connector and the client order id. Contexts without order
+        id opened inside the context of an order of the same connector keep the order id.
+        """
+        if order_id is None:
+            current_connector, current_order_id = _current_context.get() or (None, None)
+            order_id = current_order_id if current_connector == connector else None
+        token = _current_context.set((connector, order_id))
+        try:
+            yield
+        finally:
+            _current_context.reset(token)
+
+    def summaries(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Histograms of the stage durations, by "<connector> <endpoint>" and stage.
+        """
+        return {key: {stage: histogram.to_dict() for stage, histogram in stages.items()}
+                for key, stages in self._histograms.items()}
+
+    def recent_traces(self, order_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        return [trace.to_dict() for trace in self._recent_traces if order_id is None or trace.order_id == order_id]
+
+    def export(self):
+        summaries = self.summaries()
+        for sink in self._sinks:
+            try:
+                sink.export(summaries)
+            except Exception:
+                logging.getLogger(__name__).error(f"Error exporting request latencies to {sink}.", exc_info=True)
+
+    def aiohttp_trace_config(self) -> aiohttp.TraceConfig:
+        """
+        aiohttp trace configuration recording the time waiting for a free connection in the pool and the time opening
+        new connections as the `connection` stage of the current request trace.
+        """
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_queued_start.append(self._on_connection_start)
+        trace_config.on_connection_create_start.append(self._on_connection_start)
+        trace_config.on_connection_queued_end.append(self._on_connection_end)
+        trace_config.on_connection_create_end.append(self._on_connection_end)
+        return trace_config
+
+    async def _on_connection_start(self, session, trace_config_ctx, params):
+        trace_config_ctx.connection_start = time.perf_counter()
+
+    async def _on_connection_end(self, session, trace_config_ctx, params):
+        trace = _current_trace.get()
+        connection_start = getattr(trace_config_ctx, "connection_start", None)
+        if trace is not None and connection_start is not None:
+            trace.record("connection", time.perf_counter() - connection_start)
+
+    async def _export_loop(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            self.export()
+
+
+_request_tracer = RequestTracer()
+
+
+def get_request_tracer() -> RequestTracer:
+    return _request_tracer
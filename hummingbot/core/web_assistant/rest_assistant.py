@@ -1,12 +1,13 @@
-import json
 from asyncio import wait_for
-from copy import deepcopy
+from copy import copy
 from typing import Any, Dict, List, Optional, Union
 
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
+from hummingbot.core.web_assistant.json_codec import get_json_codec
+from hummingbot.core.web_assistant.request_tracer import RequestTrace, RequestTracer, get_request_tracer
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
 
@@ -17,6 +18,9 @@ class RESTAssistant:
     The class can be injected with additional functionality by passing a list of objects inheriting from
     the `RESTPreProcessorBase` and `RESTPostProcessorBase` classes. The pre-processors are applied to a request
     before it is sent out, while the post-processors are applied to a response before it is returned to the caller.
+
+    When the request tracer is enabled, the time spent in each stage of the requests (request preparation, throttler,
+    pre-processors, authentication, network, post-processors and response decoding) is recorded under the request throttler limit id.
     """
     def __init__(
         self,
@@ -25,12 +29,14 @@ class RESTAssistant:
         rest_pre_processors: Optional[List[RESTPreProcessorBase]] = None,
         rest_post_processors: Optional[List[RESTPostProcessorBase]] = None,
         auth: Optional[AuthBase] = None,
+        tracer: Optional[RequestTracer] = None,
     ):
         self._connection = connection
         self._rest_pre_processors = rest_pre_processors or []
         self._rest_post_processors = rest_post_processors or []
         self._auth = auth
         self._throttler = throttler
+        self._tracer = tracer or get_request_tracer()
 
     async def execute_request(
         self,
@@ -44,19 +50,27 @@ class RESTAssistant:
         timeout: Optional[float] = None,
         headers: Optional[Dict[str, Any]] = None,
     ) -> Union[str, Dict[str, Any]]:
-        response = await self.execute_request_and_get_response(
-            url=url,
-            throttler_limit_id=throttler_limit_id,
-            params=params,
-            data=data,
-            method=method,
-            is_auth_required=is_auth_required,
-            return_err=return_err,
-            timeout=timeout,
-            headers=headers,
-        )
-        response_json = await response.json()
-        return response_json
+        trace = self._tracer.start_trace(throttler_limit_id)
+        try:
+            response = await self._execute_request_and_get_response(
+                url=url,
+                throttler_limit_id=throttler_limit_id,
+                params=params,
+                data=data,
+                method=method,
+                is_auth_required=is_auth_required,
+                return_err=return_err,
+                timeout=timeout,
+                headers=headers,
+                trace=trace,
+            )
+            response_json = await response.json()
+            if trace is not None:
+                trace.mark("read_and_decode")
+            return response_json
+        finally:
+            if trace is not None:
+                self._tracer.finish_trace(trace)
 
     async def execute_request_and_get_response(
             self,
@@ -70,6 +84,45 @@ class RESTAssistant:
             timeout: Optional[float] = None,
             headers: Optional[Dict[str, Any]] = None,
     ) -> RESTResponse:
+        trace = self._tracer.start_trace(throttler_limit_id)
+        try:
+            return await self._execute_request_and_get_response(
+                url=url,
+                throttler_limit_id=throttler_limit_id,
+                params=params,
+                data=data,
+                method=method,
+                is_auth_required=is_auth_required,
+                return_err=return_err,
+                timeout=timeout,
+                headers=headers,
+                trace=trace,
+            )
+        finally:
+            if trace is not None:
+                self._tracer.finish_trace(trace)
+
+    async def call(self, request: RESTRequest, timeout: Optional[float] = None) -> RESTResponse:
+        trace = self._tracer.start_trace(request.throttler_limit_id or request.url)
+        try:
+            return await self._call(request=request.owned_copy(), timeout=timeout, trace=trace)
+        finally:
+            if trace is not None:
+                self._tracer.finish_trace(trace)
+
+    async def _execute_request_and_get_response(
+            self,
+            url: str,
+            throttler_limit_id: str,
+            params: Optional[Dict[str, Any]],
+            data: Optional[Dict[str, Any]],
+            method: RESTMethod,
+            is_auth_required: bool,
+            return_err: bool,
+            timeout: Optional[float],
+            headers: Optional[Dict[str, Any]],
+            trace: Optional[RequestTrace],
+    ) -> RESTResponse:
 
         headers = headers or {}
 
@@ -78,20 +131,25 @@ class RESTAssistant:
 
         local_headers.update(headers)
 
-        data = json.dumps(data) if data is not None else data
+        data = get_json_codec().dumps(data) if data is not None else data
 
         request = RESTRequest(
             method=method,
             url=url,
-            params=params,
+            params=copy(params) if params is not None else None,
             data=data,
             headers=local_headers,
             is_auth_required=is_auth_required,
             throttler_limit_id=throttler_limit_id
         )
+        if trace is not None:
+            trace.mark("prepare")
 
         async with self._throttler.execute_task(limit_id=throttler_limit_id):
-            response = await self.call(request=request, timeout=timeout)
+            if trace is not None:
+                trace.mark("throttler")
+            # The request and its mutable fields were created here, so it does not need another copy before being processed
+            response = await self._call(request=request, timeout=timeout, trace=trace)
 
             if 400 <= response.status:
                 if not return_err:
@@ -101,12 +159,23 @@ class RESTAssistant:
                                   f"Error: {error_text}")
             return response
 
-    async def call(self, request: RESTRequest, timeout: Optional[float] = None) -> RESTResponse:
-        request = deepcopy(request)
-        request = await self._pre_process_request(request)
-        request = await self._authenticate(request)
-        resp = await wait_for(self._connection.call(request), timeout)
-        resp = await self._post_process_response(resp)
+    async def _call(
+            self, request: RESTRequest, timeout: Optional[float] = None, trace: Optional[RequestTrace] = None
+    ) -> RESTResponse:
+        if trace is None:
+            request = await self._pre_process_request(request)
+            request = await self._authenticate(request)
+            resp = await wait_for(self._connection.call(request), timeout)
+            resp = await self._post_process_response(resp)
+        else:
+            request = await self._pre_process_request(request)
+            trace.mark("pre_process")
+            request = await self._authenticate(request)
+            trace.mark("authentication")
+            resp = await wait_for(self._connection.call(request), timeout)
+            trace.mark("network")
+            resp = await self._post_process_response(resp)
+            trace.mark("post_process")
         return resp
 
     async def _pre_process_request(self, request: RESTRequest) -> RESTRequest:
@@ -1,8 +1,9 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.connections_factory import ConnectionsFactory
+from hummingbot.core.web_assistant.connections.data_types import ConnectionPoolSettings
 from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
@@ -29,8 +30,9 @@ class WebAssistantsFactory:
         ws_pre_processors: Optional[List[WSPreProcessorBase]] = None,
         ws_post_processors: Optional[List[WSPostProcessorBase]] = None,
         auth: Optional[AuthBase] = None,
+        connection_pool_settings: Optional[ConnectionPoolSettings] = None,
     ):
-        self._connections_factory = ConnectionsFactory()
+        self._connections_factory = ConnectionsFactory(pool_settings=connection_pool_settings)
         self._rest_pre_processors = rest_pre_processors or []
         self._rest_post_processors = rest_post_processors or []
         self._ws_pre_processors = ws_pre_processors or []
@@ -46,6 +48,20 @@ class WebAssistantsFactory:
     def auth(self) -> Optional[AuthBase]:
         return self._auth
 
+    @property
+    def connection_pool_settings(self) -> ConnectionPoolSettings:
+        return self._connections_factory.pool_settings
+
+    @connection_pool_settings.setter
+    def connection_pool_settings(self, pool_settings: ConnectionPoolSettings):
+        self._connections_factory.pool_settings = pool_settings
+
+    async def pre_warm_connections(self, url: str, connections_count: Optional[int] = None):
+        await self._connections_factory.pre_warm(url=url, connections_count=connections_count)
+
+    def connection_pool_stats(self) -> Dict[str, Any]:
+        return self._connections_factory.pool_stats()
+
     async def get_rest_assistant(self) -> RESTAssistant:
         connection = await self._connections_factory.get_rest_connection()
         assistant = RESTAssistant(
@@ -1,9 +1,9 @@
-from copy import deepcopy
 from typing import AsyncGenerator, Dict, List, Optional
 
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
+from hummingbot.core.web_assistant.request_tracer import RequestTracer, get_request_tracer
 from hummingbot.core.web_assistant.ws_post_processors import WSPostProcessorBase
 from hummingbot.core.web_assistant.ws_pre_processors import WSPreProcessorBase
 
@@ -14,6 +14,9 @@ class WSAssistant:
     The class can be injected with additional functionality by passing a list of objects inheriting from
     the `WSPreProcessorBase` and `WSPostProcessorBase` classes. The pre-processors are applied to a request
     before it is sent out, while the post-processors are applied to a response before it is returned to the caller.
+
+    When the request tracer is enabled, the time spent pre-processing, authenticating and sending each request is
+    recorded under the request throttler limit id ("ws_send" for requests without one).
     """
 
     def __init__(
@@ -22,11 +25,13 @@ class WSAssistant:
         ws_pre_processors: Optional[List[WSPreProcessorBase]] = None,
         ws_post_processors: Optional[List[WSPostProcessorBase]] = None,
         auth: Optional[AuthBase] = None,
+        tracer: Optional[RequestTracer] = None,
     ):
         self._connection = connection
         self._ws_pre_processors = ws_pre_processors or []
         self._ws_post_processors = ws_post_processors or []
         self._auth = auth
+        self._tracer = tracer or get_request_tracer()
 
     @property
     def last_recv_time(self) -> float:
@@ -40,6 +45,7 @@ class WSAssistant:
         message_timeout: Optional[float] = None,
         ws_headers: Optional[Dict] = {},
         max_msg_size: Optional[int] = None,
+        raw_messages: bool = False,
     ):
         max_msg_size = max_msg_size if max_msg_size else self._connection._MAX_MSG_SIZE
         await self._connection.connect(
@@ -47,7 +53,8 @@ class WSAssistant:
             ws_headers=ws_headers,
             ping_timeout=ping_timeout,
             message_timeout=message_timeout,
-            max_msg_size=max_msg_size)
+            max_msg_size=max_msg_size,
+            raw_messages=raw_messages)
 
     async def disconnect(self):
         await self._connection.disconnect()
@@ -57,10 +64,23 @@ class WSAssistant:
         await self.send(request)
 
     async def send(self, request: WSRequest):
-        request = deepcopy(request)
-        request = await self._pre_process_request(request)
-        request = await self._authenticate(request)
-        await self._connection.send(request)
+        trace = self._tracer.start_trace(getattr(request, "throttler_limit_id", None) or "ws_send")
+        if trace is None:
+            request = request.owned_copy()
+            request = await self._pre_process_request(request)
+            request = await self._authenticate(request)
+            await self._connection.send(request)
+            return
+        try:
+            request = request.owned_copy()
+            request = await self._pre_process_request(request)
+            trace.mark("pre_process")
+            request = await self._authenticate(request)
+            trace.mark("authentication")
+            await self._connection.send(request)
+            trace.mark("send")
+        finally:
+            self._tracer.finish_trace(trace)
 
     async def ping(self):
         await self._connection.ping()
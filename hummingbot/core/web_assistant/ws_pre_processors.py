@@ -7,7 +7,8 @@ class WSPreProcessorBase(abc.ABC):
     """An interface class that enables functionality injection into the `WSAssistant`.
 
     The logic provided by a class implementing this interface is applied to a request
-    before it is sent out to the server.
+    before it is sent out to the server. Changes should be returned in a new request created with
+    `request.copy_with(...)`, replacing only the fields that are modified.
     """
 
     @abc.abstractmethod
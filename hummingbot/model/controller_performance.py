@@ -0,0 +1,45 @@
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy import JSON, Column, Float, Integer, Text
+
+from hummingbot.model import HummingbotBase
+from hummingbot.strategy_v2.models.executors import CloseType
+from hummingbot.strategy_v2.models.executors_info import PerformanceReport
+
+
+class ControllerPerformance(HummingbotBase):
+    """
+    Aggregated performance of the stored executors of a controller. The rows are updated every time an executor is
+    stored, so the performance of a controller is available without loading its executors.
+    """
+    __tablename__ = "ControllerPerformance"
+
+    controller_id = Column(Text, primary_key=True)
+    executors_count = Column(Integer, nullable=False, default=0)
+    realized_pnl_quote = Column(Float, nullable=False, default=0.0)
+    volume_traded = Column(Float, nullable=False, default=0.0)
+    # Number of executors by close type value (as a string, JSON keys can't be integers)
+    close_type_counts = Column(JSON, nullable=False, default=dict)
+    last_update_timestamp = Column(Float, nullable=True)
+
+    def add_executor(self, net_pnl_quote: float, filled_amount_quote: float, close_type: Optional[int], sign: int = 1):
+        """
+        Adds the contribution of a stored executor to the aggregates, or removes it when `sign` is -1.
+        """
+        self.executors_count = (self.executors_count or 0) + sign
+        self.realized_pnl_quote = (self.realized_pnl_quote or 0.0) + sign * net_pnl_quote
+        self.volume_traded = (self.volume_traded or 0.0) + sign * filled_amount_quote
+        if close_type:
+            # A new dictionary is assigned so that the JSON column change is detected
+            close_type_counts = dict(self.close_type_counts or {})
+            close_type_counts[str(close_type)] = close_type_counts.get(str(close_type), 0) + sign
+            self.close_type_counts = {key: count for key, count in close_type_counts.items() if count != 0}
+
+    def to_performance_report(self) -> PerformanceReport:
+        return PerformanceReport(
+            realized_pnl_quote=Decimal(self.realized_pnl_quote),
+            volume_traded=Decimal(self.volume_traded),
+            close_type_counts={CloseType(int(close_type)): count
+                               for close_type, count in (self.close_type_counts or {}).items()},
+        )
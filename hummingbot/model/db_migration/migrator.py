@@ -28,10 +28,11 @@ class Migrator:
         original_db_name = Path(original_db_path).stem
         backup_db_path = original_db_path + '.backup_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S")
         new_db_path = original_db_path + '.new'
+        # Closing the connections first checkpoints the write-ahead log (if any) into the file being copied
+        db_handle.dispose()
         copyfile(original_db_path, new_db_path)
         copyfile(original_db_path, backup_db_path)
 
-        db_handle.engine.dispose()
         new_db_handle = SQLConnectionManager(
             client_config_map, SQLConnectionType.TRADE_FILLS, new_db_path, original_db_name, True
         )
@@ -54,10 +55,12 @@ class Migrator:
                                       exc_info=True)
         finally:
             try:
-                new_db_handle.engine.dispose()
+                new_db_handle.dispose()
                 if migration_successful:
                     move(new_db_path, original_db_path)
-                db_handle.__init__(SQLConnectionType.TRADE_FILLS, original_db_path, original_db_name, True)
+                db_handle.__init__(
+                    client_config_map, SQLConnectionType.TRADE_FILLS, original_db_path, original_db_name, True
+                )
             except Exception as e:
                 logging.getLogger().error(f"Fatal error migrating DB {original_db_path}")
                 raise e
@@ -1,7 +1,12 @@
-from sqlalchemy import Column, Integer, Text
+import time
+from typing import Any, Dict
 
+from sqlalchemy import Column, Integer, Text, func, select
+
+from hummingbot.model.controller_performance import ControllerPerformance
 from hummingbot.model.db_migration.base_transformation import DatabaseTransformation
 from hummingbot.model.decimal_type_decorator import SqliteDecimal
+from hummingbot.model.executors import Executors
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 
 
@@ -149,3 +154,56 @@ class AddTradeFeeInQuote(DatabaseTransformation):
     @property
     def to_version(self):
         return 20230516
+
+
+class AddControllerPerformanceRollups(DatabaseTransformation):
+    """
+    Adds the controller id index to the Executors table, and fills the ControllerPerformance table with the aggregates
+    of the executors already stored.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    def apply(self, db_handle: SQLConnectionManager) -> SQLConnectionManager:
+        engine = db_handle.engine
+        executors_table = Executors.__table__
+        performance_table = ControllerPerformance.__table__
+        executors_table.create(engine, checkfirst=True)
+        performance_table.create(engine, checkfirst=True)
+        for index in executors_table.indexes:
+            if index.name == "ex_controller_id_timestamp":
+                index.create(engine, checkfirst=True)
+
+        query = (select(executors_table.c.controller_id,
+                        executors_table.c.close_type,
+                        func.count(),
+                        func.sum(executors_table.c.net_pnl_quote),
+                        func.sum(executors_table.c.filled_amount_quote))
+                 .group_by(executors_table.c.controller_id, executors_table.c.close_type))
+        rollups: Dict[str, Dict[str, Any]] = {}
+        for controller_id, close_type, count, net_pnl_quote, filled_amount_quote in engine.execute(query):
+            controller_id = controller_id or "main"
+            rollup = rollups.setdefault(controller_id, {"controller_id": controller_id,
+                                                        "executors_count": 0,
+                                                        "realized_pnl_quote": 0.0,
+                                                        "volume_traded": 0.0,
+                                                        "close_type_counts": {},
+                                                        "last_update_timestamp": time.time()})
+            rollup["executors_count"] += count
+            rollup["realized_pnl_quote"] += net_pnl_quote or 0.0
+            rollup["volume_traded"] += filled_amount_quote or 0.0
+            if close_type:
+                rollup["close_type_counts"][str(close_type)] = count
+
+        engine.execute(performance_table.delete())
+        if len(rollups) > 0:
+            engine.execute(performance_table.insert(), list(rollups.values()))
+        return db_handle
+
+    @property
+    def name(self):
+        return "AddControllerPerformanceRollups"
+
+    @property
+    def to_version(self):
+        return 20241019
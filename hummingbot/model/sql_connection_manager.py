@@ -1,11 +1,12 @@
 import logging
 from enum import Enum
 from os.path import join
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-from sqlalchemy import MetaData, create_engine, inspect
+from sqlalchemy import MetaData, create_engine, event, inspect
 from sqlalchemy.engine.base import Engine
 from sqlalchemy.orm import Query, Session, sessionmaker
+from sqlalchemy.pool import SingletonThreadPool
 from sqlalchemy.schema import DropConstraint, ForeignKeyConstraint, Table
 
 from hummingbot import data_path
@@ -27,7 +28,7 @@ class SQLConnectionManager(TransactionBase):
     _scm_trade_fills_instance: Optional["SQLConnectionManager"] = None
 
     LOCAL_DB_VERSION_KEY = "local_db_version"
-    LOCAL_DB_VERSION_VALUE = "20230516"
+    LOCAL_DB_VERSION_VALUE = "20241019"
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -70,9 +71,15 @@ class SQLConnectionManager(TransactionBase):
                  called_from_migrator = False):
         db_path = self.create_db_path(db_path, db_name)
         self.db_path = db_path
+        self._read_only_engine: Optional[Engine] = None
+        sqlite_pragmas: Dict[str, Any] = {}
 
         if connection_type is SQLConnectionType.TRADE_FILLS:
-            self._engine: Engine = create_engine(client_config_map.db_mode.get_url(self.db_path))
+            db_url = client_config_map.db_mode.get_url(self.db_path)
+            sqlite_pragmas = client_config_map.db_mode.get_sqlite_pragmas()
+            self._engine: Engine = (self._create_sqlite_engine(db_url, sqlite_pragmas)
+                                    if sqlite_pragmas
+                                    else create_engine(db_url))
             self._metadata: MetaData = self.get_declarative_base().metadata
             self._metadata.create_all(self._engine)
 
@@ -92,6 +99,15 @@ class SQLConnectionManager(TransactionBase):
                             conn.execute(DropConstraint(fk_constraint))
 
         self._session_cls = sessionmaker(bind=self._engine)
+        self._read_only_session_cls = self._session_cls
+        if sqlite_pragmas:
+            # The journal mode is stored in the database file, the read-only connections can't (and don't need to)
+            # set it
+            read_only_pragmas = {name: value for name, value in sqlite_pragmas.items() if name != "journal_mode"}
+            read_only_pragmas["query_only"] = "ON"
+            self._read_only_engine = self._create_sqlite_engine(
+                f"sqlite:///file:{self.db_path}?mode=ro&uri=true", read_only_pragmas)
+            self._read_only_session_cls = sessionmaker(bind=self._read_only_engine)
 
         if connection_type is SQLConnectionType.TRADE_FILLS and (not called_from_migrator):
             self.check_and_migrate_db(client_config_map)
@@ -103,6 +119,37 @@ class SQLConnectionManager(TransactionBase):
     def get_new_session(self) -> Session:
         return self._session_cls()
 
+    def get_read_only_session(self) -> Session:
+        """
+        Session for reporting queries. With the SQLite performance profile it uses read-only connections, that don't
+        block (and are not blocked by) the writer connection. Otherwise it is a regular session.
+        """
+        return self._read_only_session_cls()
+
+    def dispose(self):
+        """
+        Closes all the connections. With the SQLite performance profile closing the writer connection checkpoints the
+        write-ahead log into the database file.
+        """
+        if self._read_only_engine is not None:
+            self._read_only_engine.dispose()
+        self._engine.dispose()
+
+    @staticmethod
+    def _create_sqlite_engine(db_url: str, pragmas: Dict[str, Any]) -> Engine:
+        # One connection per thread, kept open. The trades are recorded from the main thread, so all the writes go
+        # through a single connection and the pragmas are only applied once
+        engine = create_engine(db_url, poolclass=SingletonThreadPool, connect_args={"check_same_thread": False})
+
+        @event.listens_for(engine, "connect")
+        def set_sqlite_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+            cursor.close()
+
+        return engine
+
     def get_local_db_version(self, session: Session):
         query: Query = (session.query(LocalMetadata)
                         .filter(LocalMetadata.key == self.LOCAL_DB_VERSION_KEY))
@@ -111,6 +158,7 @@ class SQLConnectionManager(TransactionBase):
 
     def check_and_migrate_db(self, client_config_map: "ClientConfigAdapter"):
         from hummingbot.model.db_migration.migrator import Migrator
+        from_version: Optional[str] = None
         with self.get_new_session() as session:
             with session.begin():
                 local_db_version = self.get_local_db_version(session=session)
@@ -119,14 +167,15 @@ class SQLConnectionManager(TransactionBase):
                                                                 value=self.LOCAL_DB_VERSION_VALUE)
                     session.add(version_info)
                     session.commit()
-                else:
-                    # There's no past db version to upgrade from at this moment. So we'll just update the version value
-                    # if needed.
-                    if local_db_version.value < self.LOCAL_DB_VERSION_VALUE:
-                        was_migration_successful = Migrator().migrate_db_to_version(
-                            client_config_map, self, int(local_db_version.value), int(self.LOCAL_DB_VERSION_VALUE)
-                        )
-                        if was_migration_successful:
-                            # Cannot use variable local_db_version because reference is not valid
-                            # since Migrator changed it
-                            self.get_local_db_version(session=session).value = self.LOCAL_DB_VERSION_VALUE
+                elif local_db_version.value < self.LOCAL_DB_VERSION_VALUE:
+                    from_version = local_db_version.value
+
+        if from_version is not None:
+            # The migrator replaces the database file, so the version is updated with a new session afterwards
+            was_migration_successful = Migrator().migrate_db_to_version(
+                client_config_map, self, int(from_version), int(self.LOCAL_DB_VERSION_VALUE)
+            )
+            if was_migration_successful:
+                with self.get_new_session() as session:
+                    with session.begin():
+                        self.get_local_db_version(session=session).value = self.LOCAL_DB_VERSION_VALUE
@@ -286,10 +286,12 @@ class MQTTCommands:
         response = StatusCommandMessage.Response()
         timeout = 30  # seconds
         try:
-            if self._hb_app.strategy is None:
+            if self._hb_app.strategy is None and not self._hb_app.hosted_strategies:
                 response.status = MQTT_STATUS_CODE.ERROR
                 response.msg = 'No strategy is currently running!'
                 return response
+            if self._hb_app.clock is not None and self._hb_app.clock.tick_profiler is not None:
+                response.data = {"tick_profile": self._hb_app.clock.tick_profiler.stats()}
             if msg.async_backend:
                 self._ev_loop.call_soon_threadsafe(
                     self._hb_app.status
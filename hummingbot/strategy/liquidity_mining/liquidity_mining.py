@@ -1,8 +1,7 @@
 import asyncio
 import logging
 from decimal import Decimal
-from statistics import mean
-from typing import Dict, List, Set, Union
+from typing import Dict, List, Optional, Set, Union
 
 import numpy as np
 import pandas as pd
@@ -25,6 +24,7 @@ from hummingbot.strategy.utils import order_age
 from ...client.config.client_config_map import ClientConfigMap
 from ...client.config.config_helpers import ClientConfigAdapter
 from .data_types import PriceSize, Proposal
+from .market_state import MarketStateTable
 
 NaN = float("nan")
 s_decimal_zero = Decimal(0)
@@ -81,12 +81,12 @@ class LiquidityMiningStrategy(StrategyPyBase):
         self._last_timestamp = 0
         self._status_report_interval = status_report_interval
         self._ready_to_trade = False
-        self._refresh_times = {market: 0 for market in market_infos}
         self._token_balances = {}
-        self._sell_budgets = {}
-        self._buy_budgets = {}
-        self._mid_prices = {market: [] for market in market_infos}
-        self._volatility = {market: s_decimal_nan for market in self._market_infos}
+        self._sell_budgets: Dict[str, Decimal] = {}
+        self._buy_budgets: Dict[str, Decimal] = {}
+        # Created with the budget allocation, for the markets with an order book
+        self._market_state: Optional[MarketStateTable] = None
+        self._orders_by_market: Dict[str, List[LimitOrder]] = {}
         self._last_vol_reported = 0.
         self._hb_app_notification = hb_app_notification
 
@@ -101,32 +101,40 @@ class LiquidityMiningStrategy(StrategyPyBase):
         return [o[1] for o in limit_orders]
 
     @property
-    def sell_budgets(self):
+    def sell_budgets(self) -> Dict[str, Decimal]:
         return self._sell_budgets
 
     @property
-    def buy_budgets(self):
+    def buy_budgets(self) -> Dict[str, Decimal]:
         return self._buy_budgets
 
+    def active_orders_by_market(self) -> Dict[str, List[LimitOrder]]:
+        """
+        The active orders grouped by trading pair, in a single pass over the active orders
+        """
+        orders_by_market = {}
+        for order in self.active_orders:
+            orders_by_market.setdefault(order.trading_pair, []).append(order)
+        return orders_by_market
+
     def tick(self, timestamp: float):
         """
         Clock tick entry point, is run every second (on normal tick setting).
         :param timestamp: current tick timestamp
         """
         if not self._ready_to_trade:
-            # Check if there are restored orders, they should be canceled before strategy starts.
-            self._ready_to_trade = self._exchange.ready and len(self._exchange.limit_orders) == 0
             if not self._exchange.ready:
                 self.logger().warning(f"{self._exchange.name} is not ready. Please wait...")
                 return
-            else:
-                self.logger().info(f"{self._exchange.name} is ready. Trading started.")
-                if self._validate_order_book_for_markets() >= 1:
-                    self.create_budget_allocation()
-                else:
-                    self.logger().warning(f"{self._exchange.name} has no pairs with order book. Consider redefining your strategy.")
-                    return
+            if self._validate_order_book_for_markets() < 1:
+                self.logger().warning(f"{self._exchange.name} has no pairs with order book. Consider redefining your strategy.")
+                return
+            self.logger().info(f"{self._exchange.name} is ready. Trading started.")
+            self.create_budget_allocation()
+            # Check if there are restored orders, they should be canceled before strategy starts.
+            self._ready_to_trade = len(self._exchange.limit_orders) == 0
 
+        self._orders_by_market = self.active_orders_by_market()
         self.update_mid_prices()
         self.update_volatility()
         proposals = self.create_base_proposals()
@@ -201,6 +209,7 @@ class LiquidityMiningStrategy(StrategyPyBase):
         columns = ["Market", "Mid price", "Best bid", "Best ask", "Volatility"]
         for market, market_info in self._market_infos.items():
             mid_price = market_info.get_mid_price()
+            volatility = self._market_state.volatility[self._market_state.index[market]]
             best_bid = self._exchange.get_price(market, False)
             best_ask = self._exchange.get_price(market, True)
             best_bid_pct = abs(best_bid - mid_price) / mid_price
@@ -210,7 +219,7 @@ class LiquidityMiningStrategy(StrategyPyBase):
                 float(mid_price),
                 f"{best_bid_pct:.2%}",
                 f"{best_ask_pct:.2%}",
-                "" if self._volatility[market].is_nan() else f"{self._volatility[market]:.2%}",
+                "" if np.isnan(volatility) else f"{volatility:.2%}",
             ])
         df = pd.DataFrame(data=data, columns=columns).replace(np.nan, '', regex=True)
         df.sort_values(by=["Market"], inplace=True)
@@ -303,22 +312,20 @@ class LiquidityMiningStrategy(StrategyPyBase):
     def create_base_proposals(self):
         """
         Each tick this strategy creates a set of proposals based on the market_info and the parameters from the
-        constructor.
-        """
+        constructor, one per market in the order of the market state table.
+        """
+        state = self._market_state
+        # volatility applies only when it is higher than the spread setting (fmax ignores the NaN volatility).
+        spreads = np.fmax(float(self._spread), state.volatility * float(self._volatility_to_spread_multiplier))
+        if self._max_spread > s_decimal_zero:
+            spreads = np.minimum(spreads, float(self._max_spread))
+        buy_prices = state.mid_prices * (1 - spreads)
+        sell_prices = state.mid_prices * (1 + spreads)
         proposals = []
-        for market, market_info in self._market_infos.items():
-            spread = self._spread
-            if not self._volatility[market].is_nan():
-                # volatility applies only when it is higher than the spread setting.
-                spread = max(spread, self._volatility[market] * self._volatility_to_spread_multiplier)
-            if self._max_spread > s_decimal_zero:
-                spread = min(spread, self._max_spread)
-            mid_price = market_info.get_mid_price()
-            buy_price = mid_price * (Decimal("1") - spread)
-            buy_price = self._exchange.quantize_order_price(market, buy_price)
+        for i, market in enumerate(state.markets):
+            buy_price = self._exchange.quantize_order_price(market, state.to_decimal(buy_prices[i]))
             buy_size = self.base_order_size(market, buy_price)
-            sell_price = mid_price * (Decimal("1") + spread)
-            sell_price = self._exchange.quantize_order_price(market, sell_price)
+            sell_price = self._exchange.quantize_order_price(market, state.to_decimal(sell_prices[i]))
             sell_size = self.base_order_size(market, sell_price)
             proposals.append(Proposal(market, PriceSize(buy_price, buy_size), PriceSize(sell_price, sell_size)))
         return proposals
@@ -339,8 +346,10 @@ class LiquidityMiningStrategy(StrategyPyBase):
 
     def create_budget_allocation(self):
         """
-        Create buy and sell budgets for every market
+        Create the market state table of the markets with an order book, and the buy and sell budgets for every market
         """
+        self._market_state = MarketStateTable(list(self._market_infos.keys()),
+                                              self._volatility_interval * self._avg_volatility_period)
         self._sell_budgets = {m: s_decimal_zero for m in self._market_infos}
         self._buy_budgets = {m: s_decimal_zero for m in self._market_infos}
         portfolio_value = self.total_port_value_in_token()
@@ -390,43 +399,51 @@ class LiquidityMiningStrategy(StrategyPyBase):
         """
         cur_buy = [o for o in cur_orders if o.is_buy]
         cur_sell = [o for o in cur_orders if not o.is_buy]
-        if (cur_buy and proposal.buy.size <= 0) or (cur_sell and proposal.sell.size <= 0):
-            return False
-        if cur_buy and \
-                abs(proposal.buy.price - cur_buy[0].price) / cur_buy[0].price > self._order_refresh_tolerance_pct:
-            return False
-        if cur_sell and \
-                abs(proposal.sell.price - cur_sell[0].price) / cur_sell[0].price > self._order_refresh_tolerance_pct:
-            return False
-        return True
+        return bool(MarketStateTable.within_tolerance(
+            np.array([float(cur_buy[0].price) if cur_buy else np.nan]),
+            np.array([float(cur_sell[0].price) if cur_sell else np.nan]),
+            np.array([float(proposal.buy.price)]),
+            np.array([float(proposal.buy.size)]),
+            np.array([float(proposal.sell.price)]),
+            np.array([float(proposal.sell.size)]),
+            float(self._order_refresh_tolerance_pct),
+        )[0])
 
     def cancel_active_orders(self, proposals: List[Proposal]):
         """
         Cancel any orders that have an order age greater than self._max_order_age or if orders are not within tolerance
         """
-        for proposal in proposals:
-            to_cancel = False
-            cur_orders = [o for o in self.active_orders if o.trading_pair == proposal.market]
-            if cur_orders and any(order_age(o, self.current_timestamp) > self._max_order_age for o in cur_orders):
-                to_cancel = True
-            elif self._refresh_times[proposal.market] <= self.current_timestamp and \
-                    cur_orders and not self.is_within_tolerance(cur_orders, proposal):
-                to_cancel = True
-            if to_cancel:
+        state = self._market_state
+        state.update_order_prices(self._orders_by_market)
+        within_tolerance = state.within_tolerance(
+            state.buy_order_prices,
+            state.sell_order_prices,
+            np.array([float(proposal.buy.price) for proposal in proposals]),
+            np.array([float(proposal.buy.size) for proposal in proposals]),
+            np.array([float(proposal.sell.price) for proposal in proposals]),
+            np.array([float(proposal.sell.size) for proposal in proposals]),
+            float(self._order_refresh_tolerance_pct),
+        )
+        to_refresh = (state.refresh_times <= self.current_timestamp) & ~within_tolerance
+        for i, proposal in enumerate(proposals):
+            cur_orders = self._orders_by_market.get(proposal.market)
+            if not cur_orders:
+                continue
+            if to_refresh[i] or any(order_age(o, self.current_timestamp) > self._max_order_age for o in cur_orders):
                 for order in cur_orders:
                     self.cancel_order(self._market_infos[proposal.market], order.client_order_id)
-                    # To place new order on the next tick
-                    self._refresh_times[order.trading_pair] = self.current_timestamp + 0.1
+                # To place new order on the next tick
+                state.refresh_times[i] = self.current_timestamp + 0.1
 
     def execute_orders_proposal(self, proposals: List[Proposal]):
         """
         Execute a list of proposals if the current timestamp is less than its refresh timestamp.
         Update the refresh timestamp.
         """
-        for proposal in proposals:
-            maker_order_type: OrderType = self._exchange.get_maker_order_type()
-            cur_orders = [o for o in self.active_orders if o.trading_pair == proposal.market]
-            if cur_orders or self._refresh_times[proposal.market] > self.current_timestamp:
+        state = self._market_state
+        maker_order_type: OrderType = self._exchange.get_maker_order_type()
+        for i, proposal in enumerate(proposals):
+            if proposal.market in self._orders_by_market or state.refresh_times[i] > self.current_timestamp:
                 continue
             mid_price = self._market_infos[proposal.market].get_mid_price()
             spread = s_decimal_zero
@@ -453,13 +470,13 @@ class LiquidityMiningStrategy(StrategyPyBase):
                     price=proposal.sell.price
                 )
             if proposal.buy.size > 0 or proposal.sell.size > 0:
-                if not self._volatility[proposal.market].is_nan() and spread > self._spread:
-                    adjusted_vol = self._volatility[proposal.market] * self._volatility_to_spread_multiplier
+                if not np.isnan(state.volatility[i]) and spread > self._spread:
+                    adjusted_vol = state.volatility[i] * float(self._volatility_to_spread_multiplier)
                     if adjusted_vol > self._spread:
                         self.logger().info(f"({proposal.market}) Spread is widened to {spread:.2%} due to high "
                                            f"market volatility")
 
-                self._refresh_times[proposal.market] = self.current_timestamp + self._order_refresh_time
+                state.refresh_times[i] = self.current_timestamp + self._order_refresh_time
 
     def is_token_a_quote_token(self):
         """
@@ -520,15 +537,13 @@ class LiquidityMiningStrategy(StrategyPyBase):
         """
         Apply an inventory split between the quote and base asset
         """
-        for proposal in proposals:
-            buy_budget = self._buy_budgets[proposal.market]
-            sell_budget = self._sell_budgets[proposal.market]
-            mid_price = self._market_infos[proposal.market].get_mid_price()
+        state = self._market_state
+        for i, proposal in enumerate(proposals):
             total_order_size = proposal.sell.size + proposal.buy.size
             bid_ask_ratios = calculate_bid_ask_ratios_from_base_asset_ratio(
-                float(sell_budget),
-                float(buy_budget),
-                float(mid_price),
+                float(self._sell_budgets[proposal.market]),
+                float(self._buy_budgets[proposal.market]),
+                state.mid_prices[i],
                 float(self._target_base_pct),
                 float(total_order_size * self._inventory_range_multiplier)
             )
@@ -561,33 +576,19 @@ class LiquidityMiningStrategy(StrategyPyBase):
         """
         Query asset markets for mid price
         """
-        for market in self._market_infos:
-            mid_price = self._market_infos[market].get_mid_price()
-            self._mid_prices[market].append(mid_price)
-            # To avoid memory leak, we store only the last part of the list needed for volatility calculation
-            max_len = self._volatility_interval * self._avg_volatility_period
-            self._mid_prices[market] = self._mid_prices[market][-1 * max_len:]
+        # The state table keeps only the samples needed for the volatility calculation
+        self._market_state.add_mid_prices(
+            np.array([float(self._market_infos[market].get_mid_price()) for market in self._market_state.markets]))
 
     def update_volatility(self):
         """
         Update volatility data from the market
         """
-        self._volatility = {market: s_decimal_nan for market in self._market_infos}
-        for market, mid_prices in self._mid_prices.items():
-            last_index = len(mid_prices) - 1
-            atr = []
-            first_index = last_index - (self._volatility_interval * self._avg_volatility_period)
-            first_index = max(first_index, 0)
-            for i in range(last_index, first_index, self._volatility_interval * -1):
-                prices = mid_prices[i - self._volatility_interval + 1: i + 1]
-                if not prices:
-                    break
-                atr.append((max(prices) - min(prices)) / min(prices))
-            if atr:
-                self._volatility[market] = mean(atr)
+        state = self._market_state
+        state.update_volatility(self._volatility_interval)
         if self._last_vol_reported < self.current_timestamp - self._volatility_interval:
-            for market, vol in self._volatility.items():
-                if not vol.is_nan():
+            for market, vol in zip(state.markets, state.volatility):
+                if not np.isnan(vol):
                     self.logger().info(f"{market} volatility: {vol:.2%}")
             self._last_vol_reported = self.current_timestamp
 
@@ -0,0 +1,101 @@
+from decimal import Decimal
+from typing import Dict, List
+
+import numpy as np
+
+
+class MarketStateTable:
+    """
+    The per market state of the liquidity mining strategy, in NumPy arrays with one row per market, so that the
+    proposals, the volatility and the refresh tolerance are computed for all the markets at once.
+
+    The mid prices of the last `mid_price_samples` ticks are kept in a buffer of twice that length: every sample is
+    written at its position and at its position plus `mid_price_samples`, so that the last samples are always a
+    contiguous slice of the buffer.
+    """
+
+    def __init__(self, markets: List[str], mid_price_samples: int):
+        self.markets: List[str] = list(markets)
+        self.index: Dict[str, int] = {market: i for i, market in enumerate(self.markets)}
+        self.bases: List[str] = [market.split("-")[0] for market in self.markets]
+        self.quotes: List[str] = [market.split("-")[1] for market in self.markets]
+        markets_count = len(self.markets)
+        self.mid_prices = np.full(markets_count, np.nan)
+        self.volatility = np.full(markets_count, np.nan)
+        self.buy_order_prices = np.full(markets_count, np.nan)
+        self.sell_order_prices = np.full(markets_count, np.nan)
+        self.refresh_times = np.zeros(markets_count)
+        self._mid_price_samples = mid_price_samples
+        self._mid_price_buffer = np.full((markets_count, 2 * mid_price_samples), np.nan)
+        self._mid_prices_count = 0
+
+    def __len__(self):
+        return len(self.markets)
+
+    @staticmethod
+    def to_decimal(value: float) -> Decimal:
+        return Decimal(str(value))
+
+    def add_mid_prices(self, mid_prices: np.ndarray):
+        self.mid_prices = mid_prices
+        position = self._mid_prices_count % self._mid_price_samples
+        self._mid_price_buffer[:, position] = mid_prices
+        self._mid_price_buffer[:, position + self._mid_price_samples] = mid_prices
+        self._mid_prices_count += 1
+
+    def mid_price_history(self) -> np.ndarray:
+        """
+        Returns the mid prices sampled, one row per market and one column per tick (the oldest first).
+        """
+        count = min(self._mid_prices_count, self._mid_price_samples)
+        end = (self._mid_prices_count - 1) % self._mid_price_samples + self._mid_price_samples + 1
+        return self._mid_price_buffer[:, end - count:end]
+
+    def update_volatility(self, volatility_interval: int):
+        """
+        The volatility of a market is the mean of the (max - min) / min ratios of its mid prices over windows of
+        `volatility_interval` samples, counted back from the last sample. It is NaN until two samples are available.
+        """
+        history = self.mid_price_history()
+        last_index = history.shape[1] - 1
+        ratios = []
+        for window_end in range(last_index, 0, -volatility_interval):
+            window = history[:, max(window_end - volatility_interval + 1, 0):window_end + 1]
+            window_min = window.min(axis=1)
+            ratios.append((window.max(axis=1) - window_min) / window_min)
+        self.volatility = np.mean(ratios, axis=0) if ratios else np.full(len(self.markets), np.nan)
+
+    def update_order_prices(self, orders_by_market: Dict[str, list]):
+        """
+        Stores the price of the first active buy and sell order of each market, NaN for a market without orders.
+        """
+        self.buy_order_prices.fill(np.nan)
+        self.sell_order_prices.fill(np.nan)
+        for market, orders in orders_by_market.items():
+            i = self.index.get(market)
+            if i is None:
+                continue
+            for order in reversed(orders):
+                if order.is_buy:
+                    self.buy_order_prices[i] = float(order.price)
+                else:
+                    self.sell_order_prices[i] = float(order.price)
+
+    @staticmethod
+    def within_tolerance(buy_order_prices: np.ndarray,
+                         sell_order_prices: np.ndarray,
+                         buy_prices: np.ndarray,
+                         buy_sizes: np.ndarray,
+                         sell_prices: np.ndarray,
+                         sell_sizes: np.ndarray,
+                         tolerance: float) -> np.ndarray:
+        """
+        False for the markets where a side has an order and no proposed size, or where the difference between the
+        proposed and the current price of a side is more than the tolerance. NaN order prices mean no order.
+        """
+        has_buy = ~np.isnan(buy_order_prices)
+        has_sell = ~np.isnan(sell_order_prices)
+        with np.errstate(invalid="ignore"):
+            buy_moved = np.abs(buy_prices - buy_order_prices) / buy_order_prices > tolerance
+            sell_moved = np.abs(sell_prices - sell_order_prices) / sell_order_prices > tolerance
+        return ~((has_buy & ((buy_sizes <= 0) | buy_moved)) | (has_sell & ((sell_sizes <= 0) | sell_moved)))
@@ -0,0 +1,53 @@
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+
+class OrderAttribution:
+    """
+    Keeps track of the strategy that created each order when several strategies run on the same connectors (see the
+    `host` command). The strategies register the ids of the orders they create, and the markets recorder stores the
+    order events under the configuration file of the strategy that created each order.
+
+    The markets recorder marks the orders as complete when they are filled, canceled, failed or expired. Once there are
+    more than `max_orders` orders, the oldest complete orders are forgotten and their late events are attributed to
+    the host. The orders that are not complete are never forgotten.
+    """
+
+    def __init__(self, max_orders: int = 100000):
+        self._max_orders = max_orders
+        # order id -> configuration file of the strategy that created the order
+        self._order_owners: Dict[str, str] = {}
+        # ids of the complete orders, the oldest first
+        self._completed_order_ids: "OrderedDict[str, None]" = OrderedDict()
+        # configuration file -> strategy name
+        self._strategy_names: Dict[str, str] = {}
+
+    @property
+    def config_file_paths(self) -> List[str]:
+        return list(self._strategy_names.keys())
+
+    def add_strategy(self, config_file_path: str, strategy_name: str):
+        self._strategy_names[config_file_path] = strategy_name
+
+    def strategy_name(self, config_file_path: str) -> Optional[str]:
+        return self._strategy_names.get(config_file_path)
+
+    def register_order(self, order_id: str, config_file_path: str):
+        self._order_owners[order_id] = config_file_path
+        self._forget_completed_orders()
+
+    def complete_order(self, order_id: str):
+        if order_id in self._order_owners:
+            self._completed_order_ids[order_id] = None
+            self._forget_completed_orders()
+
+    def owner(self, order_id: str) -> Optional[str]:
+        """
+        Returns the configuration file of the strategy that created the order, or None if the order is unknown.
+        """
+        return self._order_owners.get(order_id)
+
+    def _forget_completed_orders(self):
+        while len(self._order_owners) > self._max_orders and self._completed_order_ids:
+            order_id, _ = self._completed_order_ids.popitem(last=False)
+            del self._order_owners[order_id]
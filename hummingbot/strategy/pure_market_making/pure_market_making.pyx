@@ -27,6 +27,7 @@ from .inventory_skew_calculator cimport c_calculate_bid_ask_ratios_from_base_ass
 from .inventory_skew_calculator import calculate_total_order_size
 from .pure_market_making_order_tracker import PureMarketMakingOrderTracker
 from .moving_price_band import MovingPriceBand
+from .stage_timer import StageTimer
 
 
 NaN = float("nan")
@@ -85,7 +86,8 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                     bid_order_level_spreads: List[Decimal] = None,
                     ask_order_level_spreads: List[Decimal] = None,
                     should_wait_order_cancel_confirmation: bool = True,
-                    moving_price_band: Optional[MovingPriceBand] = None
+                    moving_price_band: Optional[MovingPriceBand] = None,
+                    stage_timing_enabled: bool = False
                     ):
         if order_override is None:
             order_override = {}
@@ -144,6 +146,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         self._last_own_trade_price = Decimal('nan')
         self._should_wait_order_cancel_confirmation = should_wait_order_cancel_confirmation
         self._moving_price_band = moving_price_band
+        self._stage_timer = StageTimer() if stage_timing_enabled else None
         self.c_add_markets([market_info.market])
 
     def all_markets_ready(self):
@@ -299,6 +302,21 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     def order_optimization_enabled(self, value: bool):
         self._order_optimization_enabled = value
 
+    @property
+    def stage_timing_enabled(self) -> bool:
+        return self._stage_timer is not None
+
+    @stage_timing_enabled.setter
+    def stage_timing_enabled(self, value: bool):
+        if value and self._stage_timer is None:
+            self._stage_timer = StageTimer()
+        elif not value:
+            self._stage_timer = None
+
+    @property
+    def stage_timer(self) -> Optional[StageTimer]:
+        return self._stage_timer
+
     @property
     def order_refresh_time(self) -> float:
         return self._order_refresh_time
@@ -676,6 +694,9 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         else:
             lines.extend(["", "  No active maker orders."])
 
+        if self._stage_timer is not None:
+            lines.extend(["", self._stage_timer.format_status()])
+
         warning_lines.extend(self.balance_warning([self._market_info]))
 
         if len(warning_lines) > 0:
@@ -720,6 +741,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             int64_t last_tick = <int64_t>(self._last_timestamp // self._status_report_interval)
             bint should_report_warnings = ((current_tick > last_tick) and
                                            (self._logging_options & self.OPTION_LOG_STATUS_REPORT))
+            object stage_timer = self._stage_timer
             cdef object proposal
         try:
             if not self._all_markets_ready:
@@ -738,28 +760,48 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                                           f"making may be dangerous when markets or networks are unstable.")
 
             proposal = None
+            if stage_timer is not None:
+                stage_timer.start()
             if self._create_timestamp <= self._current_timestamp:
                 # 1. Create base order proposals
                 proposal = self.c_create_base_proposal()
+                if stage_timer is not None:
+                    stage_timer.mark("create_base_proposal")
                 # 2. Apply functions that limit numbers of buys and sells proposal
                 self.c_apply_order_levels_modifiers(proposal)
+                if stage_timer is not None:
+                    stage_timer.mark("order_levels_modifiers")
                 # 3. Apply functions that modify orders price
                 self.c_apply_order_price_modifiers(proposal)
+                if stage_timer is not None:
+                    stage_timer.mark("order_price_modifiers")
                 # 4. Apply functions that modify orders size
                 self.c_apply_order_size_modifiers(proposal)
+                if stage_timer is not None:
+                    stage_timer.mark("order_size_modifiers")
                 # 5. Apply budget constraint, i.e. can't buy/sell more than what you have.
                 self.c_apply_budget_constraint(proposal)
+                if stage_timer is not None:
+                    stage_timer.mark("budget_constraint")
 
                 if not self._take_if_crossed:
                     self.c_filter_out_takers(proposal)
+                    if stage_timer is not None:
+                        stage_timer.mark("filter_out_takers")
 
             self._hanging_orders_tracker.process_tick()
+            if stage_timer is not None:
+                stage_timer.mark("hanging_orders")
 
             self.c_cancel_active_orders_on_max_age_limit()
             self.c_cancel_active_orders(proposal)
             self.c_cancel_orders_below_min_spread()
+            if stage_timer is not None:
+                stage_timer.mark("cancel_orders")
             if self.c_to_create_orders(proposal):
                 self.c_execute_orders_proposal(proposal)
+                if stage_timer is not None:
+                    stage_timer.mark("execute_orders_proposal")
         finally:
             self._last_timestamp = timestamp
 
@@ -445,4 +445,10 @@ pure_market_making_config_map = {
                       "split_order_levels_enabled").value,
                   type_str="str",
                   validator=validate_decimal_list),
+    "stage_timing_enabled":
+        ConfigVar(key="stage_timing_enabled",
+                  prompt="Do you want to time the stages of each tick and show them in the status? (Yes/No) >>> ",
+                  type_str="bool",
+                  default=False,
+                  validator=validate_bool),
 }
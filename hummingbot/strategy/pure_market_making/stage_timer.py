@@ -0,0 +1,66 @@
+import time
+from collections import deque
+from typing import Deque, Dict, List
+
+import numpy as np
+
+PERCENTILES = (50, 90, 99)
+
+
+class StageTimer:
+    """
+    Times the stages of a strategy tick. `start()` is called at the beginning of the tick and `mark(stage)` after each
+    stage, the time since the previous call is recorded as the duration of the stage.
+
+    Only the last `max_samples` durations of each stage are kept, the percentiles are computed over them.
+    """
+
+    def __init__(self, max_samples: int = 1000):
+        self._max_samples = max_samples
+        self._durations: Dict[str, Deque[float]] = {}
+        self._last_mark = 0.0
+
+    @property
+    def stages(self) -> List[str]:
+        return list(self._durations.keys())
+
+    def start(self):
+        self._last_mark = time.perf_counter()
+
+    def mark(self, stage: str):
+        now = time.perf_counter()
+        durations = self._durations.get(stage)
+        if durations is None:
+            durations = self._durations[stage] = deque(maxlen=self._max_samples)
+        durations.append(now - self._last_mark)
+        self._last_mark = now
+
+    def reset(self):
+        self._durations.clear()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Returns the number of samples, the percentiles and the maximum duration (in milliseconds) of each stage.
+        """
+        stats = {}
+        for stage, durations in self._durations.items():
+            samples_ms = np.array(durations) * 1000
+            stage_stats = {"count": len(samples_ms)}
+            for percentile, value in zip(PERCENTILES, np.percentile(samples_ms, PERCENTILES)):
+                stage_stats[f"p{percentile}_ms"] = float(value)
+            stage_stats["max_ms"] = float(samples_ms.max())
+            stats[stage] = stage_stats
+        return stats
+
+    def format_status(self) -> str:
+        stats = self.stats()
+        if len(stats) == 0:
+            return "  Tick stages: no samples yet."
+        stage_width = max(len(stage) for stage in stats)
+        header = " ".join(f"{'p' + str(percentile):>8}" for percentile in PERCENTILES)
+        lines = [f"  Tick stages (ms, last {self._max_samples} ticks):",
+                 f"    {'stage':<{stage_width}} {'count':>6} {header} {'max':>8}"]
+        for stage, stage_stats in stats.items():
+            values = " ".join(f"{stage_stats[f'p{percentile}_ms']:>8.3f}" for percentile in PERCENTILES)
+            lines.append(f"    {stage:<{stage_width}} {stage_stats['count']:>6} {values} {stage_stats['max_ms']:>8.3f}")
+        return "\n".join(lines)
@@ -99,6 +99,7 @@ def start(self):
         take_if_crossed = c_map.get("take_if_crossed").value
 
         should_wait_order_cancel_confirmation = c_map.get("should_wait_order_cancel_confirmation")
+        stage_timing_enabled = c_map.get("stage_timing_enabled").value
 
         strategy_logging_options = PureMarketMakingStrategy.OPTION_LOG_ALL
         self.strategy = PureMarketMakingStrategy()
@@ -138,7 +139,8 @@ def start(self):
             bid_order_level_spreads=bid_order_level_spreads,
             ask_order_level_spreads=ask_order_level_spreads,
             should_wait_order_cancel_confirmation=should_wait_order_cancel_confirmation,
-            moving_price_band=moving_price_band
+            moving_price_band=moving_price_band,
+            stage_timing_enabled=stage_timing_enabled
         )
     except Exception as e:
         self.notify(str(e))
@@ -27,6 +27,8 @@ cdef class StrategyBase(TimeIterator):
         EventListener _sb_range_position_closed_listener
         bint _sb_delegate_lock
         public OrderTracker _sb_order_tracker
+        object _sb_order_attribution
+        str _sb_order_owner
 
     cdef c_add_markets(self, list markets)
     cdef c_remove_markets(self, list markets)
@@ -14,6 +14,7 @@ from hummingbot.connector.connector_base cimport ConnectorBase
 from hummingbot.core.data_type.trade import Trade
 from hummingbot.core.event.events import OrderFilledEvent
 from hummingbot.core.data_type.common import OrderType, PositionAction
+from hummingbot.strategy.order_attribution import OrderAttribution
 from hummingbot.strategy.order_tracker import OrderTracker
 from hummingbot.connector.derivative_base import DerivativeBase
 
@@ -162,6 +163,8 @@ cdef class StrategyBase(TimeIterator):
         self._sb_delegate_lock = False
 
         self._sb_order_tracker = OrderTracker()
+        self._sb_order_attribution = None
+        self._sb_order_owner = None
 
     def init_params(self, *args, **kwargs):
         """
@@ -179,6 +182,14 @@ cdef class StrategyBase(TimeIterator):
     def order_tracker(self) -> OrderTracker:
         return self._sb_order_tracker
 
+    def set_order_attribution(self, order_attribution: OrderAttribution, owner: str):
+        """
+        Registers the orders created by the strategy in `order_attribution` under `owner`, so that the events of the
+        orders can be attributed to this strategy when the connectors are shared with other strategies.
+        """
+        self._sb_order_attribution = order_attribution
+        self._sb_order_owner = owner
+
     def format_status(self):
         raise NotImplementedError
 
@@ -607,6 +618,8 @@ cdef class StrategyBase(TimeIterator):
     cdef c_start_tracking_limit_order(self, object market_pair, str order_id, bint is_buy, object price,
                                       object quantity):
         self._sb_order_tracker.c_start_tracking_limit_order(market_pair, order_id, is_buy, price, quantity)
+        if self._sb_order_attribution is not None:
+            self._sb_order_attribution.register_order(order_id, self._sb_order_owner)
 
     def start_tracking_limit_order(self, market_pair: MarketTradingPairTuple, order_id: str, is_buy: bool, price: Decimal,
                                    quantity: Decimal):
@@ -621,6 +634,8 @@ cdef class StrategyBase(TimeIterator):
 
     cdef c_start_tracking_market_order(self, object market_pair, str order_id, bint is_buy, object quantity):
         self._sb_order_tracker.c_start_tracking_market_order(market_pair, order_id, is_buy, quantity)
+        if self._sb_order_attribution is not None:
+            self._sb_order_attribution.register_order(order_id, self._sb_order_owner)
 
     def start_tracking_market_order(self, market_pair: MarketTradingPairTuple, order_id: str, is_buy: bool, quantity: Decimal):
         self.c_start_tracking_market_order(market_pair, order_id, is_buy, quantity)
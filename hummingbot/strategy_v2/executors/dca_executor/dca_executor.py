@@ -275,6 +275,18 @@ class DCAExecutor(ExecutorBase):
             await self.control_shutdown_process()
         self.evaluate_max_retries()
 
+    def is_idle(self) -> bool:
+        """
+        The executor is idle once all the levels are placed and none of them is filled: there is no order left to
+        create and no position the barriers apply to until an order event arrives.
+        """
+        return (self.status == RunnableStatus.RUNNING
+                and len(self._open_orders) == self.n_levels
+                and len(self._close_orders) == 0
+                and not any(order.is_done for order in self._open_orders)
+                and self.open_filled_amount == Decimal("0")
+                and not self.is_expired)
+
     def control_open_order_process(self):
         """
         This method is responsible for controlling the opening process
@@ -1,6 +1,6 @@
 from decimal import Decimal
 from functools import lru_cache
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.connector.connector_base import ConnectorBase
@@ -20,6 +20,7 @@ from hummingbot.core.event.events import (
 )
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 from hummingbot.strategy_v2.executors.data_types import ExecutorConfigBase
+from hummingbot.strategy_v2.executors.executor_event_router import ExecutorEventRouter
 from hummingbot.strategy_v2.models.base import RunnableStatus
 from hummingbot.strategy_v2.models.executors import CloseType
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
@@ -48,13 +49,20 @@ class ExecutorBase(RunnableBase):
                            connector_name in connectors}
 
         # Event forwarders for different order events
-        self._create_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._create_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._fill_order_forwarder = SourceInfoEventForwarder(self.process_order_filled_event)
-        self._complete_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._complete_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._cancel_order_forwarder = SourceInfoEventForwarder(self.process_order_canceled_event)
-        self._failed_order_forwarder = SourceInfoEventForwarder(self.process_order_failed_event)
+        self._create_buy_order_forwarder = SourceInfoEventForwarder(
+            self._invalidating_executor_info(self.process_order_created_event))
+        self._create_sell_order_forwarder = SourceInfoEventForwarder(
+            self._invalidating_executor_info(self.process_order_created_event))
+        self._fill_order_forwarder = SourceInfoEventForwarder(
+            self._invalidating_executor_info(self.process_order_filled_event))
+        self._complete_buy_order_forwarder = SourceInfoEventForwarder(
+            self._invalidating_executor_info(self.process_order_completed_event))
+        self._complete_sell_order_forwarder = SourceInfoEventForwarder(
+            self._invalidating_executor_info(self.process_order_completed_event))
+        self._cancel_order_forwarder = SourceInfoEventForwarder(
+            self._invalidating_executor_info(self.process_order_canceled_event))
+        self._failed_order_forwarder = SourceInfoEventForwarder(
+            self._invalidating_executor_info(self.process_order_failed_event))
 
         # Pairs of market events and their corresponding event forwarders
         self._event_pairs: List[Tuple[MarketEvent, SourceInfoEventForwarder]] = [
@@ -66,6 +74,13 @@ class ExecutorBase(RunnableBase):
             (MarketEvent.SellOrderCompleted, self._complete_sell_order_forwarder),
             (MarketEvent.OrderFailure, self._failed_order_forwarder),
         ]
+        # When set, the router delivers the events of the executor orders instead of the executor forwarders
+        self._event_router: Optional[ExecutorEventRouter] = None
+
+        # The executor info is rebuilt at most once per strategy tick, unless the executor state changes
+        self._executor_info_version = 0
+        self._executor_info_cache_key: Optional[Tuple] = None
+        self._executor_info_cache: Optional[ExecutorInfo] = None
 
     @property
     def status(self):
@@ -105,8 +120,24 @@ class ExecutorBase(RunnableBase):
     @property
     def executor_info(self) -> ExecutorInfo:
         """
-        Returns the executor info.
+        Returns the executor info. The same object is returned until the strategy timestamp changes, the executor
+        status changes or the executor processes an order event.
+        """
+        cache_key = (self._strategy.current_timestamp, self._status, self.close_type, self.close_timestamp,
+                     self._executor_info_version)
+        if self._executor_info_cache is None or cache_key != self._executor_info_cache_key:
+            self._executor_info_cache = self._build_executor_info()
+            self._executor_info_cache_key = cache_key
+        return self._executor_info_cache
+
+    def invalidate_executor_info(self):
         """
+        Forces the next executor info to be rebuilt. It has to be called when the executor state changes outside of
+        its order event processing methods.
+        """
+        self._executor_info_version += 1
+
+    def _build_executor_info(self) -> ExecutorInfo:
         ei = ExecutorInfo(
             id=self.config.id,
             timestamp=self.config.timestamp,
@@ -130,6 +161,14 @@ class ExecutorBase(RunnableBase):
         ei.net_pnl_pct = ei.net_pnl_pct if not ei.net_pnl_pct.is_nan() else Decimal("0")
         return ei
 
+    def _invalidating_executor_info(self, process_event: Callable) -> Callable:
+        def process_event_and_invalidate_executor_info(event_tag: int, market: ConnectorBase, event):
+            try:
+                process_event(event_tag, market, event)
+            finally:
+                self.invalidate_executor_info()
+        return process_event_and_invalidate_executor_info
+
     def get_custom_info(self) -> Dict:
         """
         Returns the custom info of the executor. Returns an empty dictionary by default, and can be reimplemented
@@ -242,10 +281,21 @@ class ExecutorBase(RunnableBase):
         """
         return self.connectors[connector_name]._order_tracker.fetch_order(client_order_id=order_id)
 
+    def set_event_router(self, event_router: Optional[ExecutorEventRouter]):
+        """
+        Sets the router that delivers the order events to the executor. It has to be set before the executor starts.
+
+        :param event_router: The event router shared by the executors, or None to listen to the connectors directly.
+        """
+        self._event_router = event_router
+
     def register_events(self):
         """
         Registers the events with the connectors.
         """
+        if self._event_router is not None:
+            self._event_router.register_executor(self)
+            return
         for connector in self.connectors.values():
             for event_pair in self._event_pairs:
                 connector.add_listener(event_pair[0], event_pair[1])
@@ -254,6 +304,9 @@ class ExecutorBase(RunnableBase):
         """
         Unregisters the events from the connectors.
         """
+        if self._event_router is not None:
+            self._event_router.unregister_executor(self)
+            return
         for connector in self.connectors.values():
             for event_pair in self._event_pairs:
                 connector.remove_listener(event_pair[0], event_pair[1])
@@ -286,9 +339,12 @@ class ExecutorBase(RunnableBase):
         :return: The result of the order placement.
         """
         if side == TradeType.BUY:
-            return self._strategy.buy(connector_name, trading_pair, amount, order_type, price, position_action)
+            order_id = self._strategy.buy(connector_name, trading_pair, amount, order_type, price, position_action)
         else:
-            return self._strategy.sell(connector_name, trading_pair, amount, order_type, price, position_action)
+            order_id = self._strategy.sell(connector_name, trading_pair, amount, order_type, price, position_action)
+        if self._event_router is not None:
+            self._event_router.track_order(self, order_id)
+        return order_id
 
     def get_price(self, connector_name: str, trading_pair: str, price_type: PriceType = PriceType.MidPrice):
         """
@@ -0,0 +1,113 @@
+import logging
+from typing import TYPE_CHECKING, Dict, List, Set
+
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.events import MarketEvent
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
+
+
+class ExecutorEventRouter:
+    """
+    Delivers the order events of the connectors to the executors that own the orders.
+
+    The router listens once to each order event of each connector used by the registered executors, and finds the
+    executor that placed the order through an index by client order id. Executors add their orders to the index with
+    `track_order` when they place them. Events for orders that are not tracked are ignored.
+    """
+    _logger = None
+
+    # Routed events and the name of the executor method processing them
+    EVENT_HANDLERS: Dict[MarketEvent, str] = {
+        MarketEvent.OrderCancelled: "process_order_canceled_event",
+        MarketEvent.BuyOrderCreated: "process_order_created_event",
+        MarketEvent.SellOrderCreated: "process_order_created_event",
+        MarketEvent.OrderFilled: "process_order_filled_event",
+        MarketEvent.BuyOrderCompleted: "process_order_completed_event",
+        MarketEvent.SellOrderCompleted: "process_order_completed_event",
+        MarketEvent.OrderFailure: "process_order_failed_event",
+    }
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self):
+        self._event_forwarder = SourceInfoEventForwarder(self._route_event)
+        self._connectors: Dict[int, ConnectorBase] = {}
+        self._connector_executors: Dict[int, Set["ExecutorBase"]] = {}
+        self._executor_orders: Dict["ExecutorBase", List[str]] = {}
+        self._order_owners: Dict[str, "ExecutorBase"] = {}
+        self._handler_names: Dict[int, str] = {event.value: name for event, name in self.EVENT_HANDLERS.items()}
+
+    @property
+    def tracked_orders_count(self) -> int:
+        return len(self._order_owners)
+
+    def register_executor(self, executor: "ExecutorBase"):
+        """
+        Starts routing the order events of the executor connectors. The router subscribes to a connector only when
+        the first executor using it is registered.
+        """
+        self._executor_orders.setdefault(executor, [])
+        for connector in executor.connectors.values():
+            connector_key = id(connector)
+            if connector_key not in self._connectors:
+                self._connectors[connector_key] = connector
+                self._connector_executors[connector_key] = set()
+                for event in self.EVENT_HANDLERS:
+                    connector.add_listener(event, self._event_forwarder)
+            self._connector_executors[connector_key].add(executor)
+
+    def unregister_executor(self, executor: "ExecutorBase"):
+        """
+        Stops routing events to the executor and removes its orders from the index. The router unsubscribes from the
+        connectors no longer used by any executor.
+        """
+        for order_id in self._executor_orders.pop(executor, []):
+            if self._order_owners.get(order_id) is executor:
+                del self._order_owners[order_id]
+        for connector in executor.connectors.values():
+            connector_key = id(connector)
+            executors = self._connector_executors.get(connector_key)
+            if executors is None:
+                continue
+            executors.discard(executor)
+            if len(executors) == 0:
+                for event in self.EVENT_HANDLERS:
+                    connector.remove_listener(event, self._event_forwarder)
+                del self._connector_executors[connector_key]
+                del self._connectors[connector_key]
+
+    def track_order(self, executor: "ExecutorBase", order_id: str):
+        """
+        Routes the events of the order to the executor.
+        """
+        if executor not in self._executor_orders:
+            self.logger().warning(f"Order {order_id} is tracked for an executor that is not registered.")
+            return
+        self._order_owners[order_id] = executor
+        self._executor_orders[executor].append(order_id)
+
+    def stop(self):
+        for connector in self._connectors.values():
+            for event in self.EVENT_HANDLERS:
+                connector.remove_listener(event, self._event_forwarder)
+        self._connectors.clear()
+        self._connector_executors.clear()
+        self._executor_orders.clear()
+        self._order_owners.clear()
+
+    def _route_event(self, event_tag: int, market: ConnectorBase, event):
+        executor = self._order_owners.get(getattr(event, "order_id", None))
+        if executor is None:
+            return
+        try:
+            getattr(executor, self._handler_names[event_tag])(event_tag, market, event)
+        finally:
+            executor.invalidate_executor_info()
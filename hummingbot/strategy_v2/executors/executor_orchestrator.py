@@ -1,22 +1,27 @@
+import asyncio
 import logging
-from copy import deepcopy
 from decimal import Decimal
-from typing import Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 from hummingbot.strategy_v2.executors.arbitrage_executor.arbitrage_executor import ArbitrageExecutor
 from hummingbot.strategy_v2.executors.arbitrage_executor.data_types import ArbitrageExecutorConfig
 from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig
 from hummingbot.strategy_v2.executors.dca_executor.dca_executor import DCAExecutor
+from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
+from hummingbot.strategy_v2.executors.executor_event_router import ExecutorEventRouter
+from hummingbot.strategy_v2.executors.executor_scheduler import ExecutorScheduler
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
 from hummingbot.strategy_v2.executors.position_executor.position_executor import PositionExecutor
 from hummingbot.strategy_v2.executors.twap_executor.data_types import TWAPExecutorConfig
 from hummingbot.strategy_v2.executors.twap_executor.twap_executor import TWAPExecutor
 from hummingbot.strategy_v2.executors.xemm_executor.data_types import XEMMExecutorConfig
 from hummingbot.strategy_v2.executors.xemm_executor.xemm_executor import XEMMExecutor
+from hummingbot.strategy_v2.models.base import RunnableStatus
 from hummingbot.strategy_v2.models.executor_actions import (
     CreateExecutorAction,
     ExecutorAction,
@@ -31,6 +36,8 @@ class ExecutorOrchestrator:
     Orchestrator for various executors.
     """
     _logger = None
+    # Maximum time, in seconds, the scheduler and the event router wait for the executors to close after a stop
+    EXECUTORS_CLOSE_TIMEOUT = 60.0
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -38,49 +45,126 @@ class ExecutorOrchestrator:
             cls._logger = logging.getLogger(__name__)
         return cls._logger
 
-    def __init__(self, strategy: ScriptStrategyBase, executors_update_interval: float = 1.0):
+    def __init__(self,
+                 strategy: ScriptStrategyBase,
+                 executors_update_interval: float = 1.0,
+                 use_shared_scheduler: bool = False,
+                 scheduler_time_budget: Optional[float] = None):
+        """
+        :param strategy: The strategy the executors place orders for.
+        :param executors_update_interval: The interval between two control tasks of an executor, in seconds.
+        :param use_shared_scheduler: Whether to run the control tasks of all executors from a single scheduler task,
+        instead of one control loop task per executor.
+        :param scheduler_time_budget: The maximum duration of a scheduler pass, in seconds.
+        """
         self.strategy = strategy
         self.executors_update_interval = executors_update_interval
         self.active_executors = {}
         self.archived_executors = {}
         self.cached_performance = {}
+        self.event_router = ExecutorEventRouter()
+        # Closed executors not stored yet whose performance is already in the cached performance, with their inventory
+        # imbalance and open order volume, which are counted in the reports until they are stored
+        self._closed_executors: Dict[ExecutorBase, Tuple[Decimal, Decimal]] = {}
+        # Sum of the inventory imbalance and open order volume of the closed executors not stored yet, by controller
+        self._closed_executors_volumes: Dict[str, Tuple[Decimal, Decimal]] = {}
+        self.scheduler: Optional[ExecutorScheduler] = None
+        self._stop_task: Optional[asyncio.Task] = None
+        if use_shared_scheduler:
+            self.scheduler = ExecutorScheduler(interval=executors_update_interval, time_budget=scheduler_time_budget)
         self._initialize_cached_performance()
 
     def _initialize_cached_performance(self):
         """
-        Initialize cached performance by querying the database for stored executors.
+        Initialize cached performance with the aggregated performance of the stored executors of each controller.
         """
-        db_executors = MarketsRecorder.get_instance().get_all_executors()
-        for executor in db_executors:
-            controller_id = executor.controller_id
-            if controller_id not in self.cached_performance:
-                self.cached_performance[controller_id] = PerformanceReport()
-            self._update_cached_performance(controller_id, executor)
+        controllers_performance = MarketsRecorder.get_instance().get_controllers_performance()
+        for controller_id, report in controllers_performance.items():
+            self.cached_performance[controller_id] = report
 
     def _update_cached_performance(self, controller_id: str, executor_info: ExecutorInfo):
         """
         Update the cached performance for a specific controller with an executor's information.
         """
-        report = self.cached_performance[controller_id]
+        report = self.cached_performance.setdefault(controller_id, PerformanceReport())
         report.realized_pnl_quote += executor_info.net_pnl_quote
         report.volume_traded += executor_info.filled_amount_quote
         if executor_info.close_type:
             report.close_type_counts[executor_info.close_type] = report.close_type_counts.get(executor_info.close_type, 0) + 1
 
+    @staticmethod
+    def _executor_volumes(executor_info: ExecutorInfo) -> Tuple[Decimal, Decimal]:
+        """
+        The inventory imbalance and the open order volume of an executor.
+        """
+        inventory_imbalance = Decimal(0)
+        open_order_volume = Decimal(0)
+        side = executor_info.custom_info.get("side", None)
+        if side:
+            inventory_imbalance = executor_info.filled_amount_quote if side == TradeType.BUY else -executor_info.filled_amount_quote
+        if executor_info.type == "dca_executor":
+            open_order_volume = sum(executor_info.config.amounts_quote) - executor_info.filled_amount_quote
+        elif executor_info.type == "position_executor":
+            open_order_volume = (executor_info.config.amount * executor_info.config.entry_price) - executor_info.filled_amount_quote
+        return inventory_imbalance, open_order_volume
+
+    def _add_closed_executor_performance(self, controller_id: str, executor: ExecutorBase):
+        """
+        Add the performance of a closed executor to the cached performance of its controller, and its inventory
+        imbalance and open order volume to the totals of the closed executors of the controller, only once.
+        """
+        if executor not in self._closed_executors:
+            executor_info = executor.executor_info
+            volumes = self._executor_volumes(executor_info)
+            self._closed_executors[executor] = volumes
+            inventory_imbalance, open_order_volume = self._closed_executors_volumes.get(controller_id, (Decimal(0), Decimal(0)))
+            self._closed_executors_volumes[controller_id] = (inventory_imbalance + volumes[0], open_order_volume + volumes[1])
+            self._update_cached_performance(controller_id, executor_info)
+
+    def _archive_executor(self, controller_id: str, executor: ExecutorBase):
+        """
+        Move a closed executor that has been stored to the archived executors. Its performance stays in the cached
+        performance, its inventory imbalance and open order volume are no longer counted.
+        """
+        self._add_closed_executor_performance(controller_id, executor)
+        volumes = self._closed_executors.pop(executor)
+        inventory_imbalance, open_order_volume = self._closed_executors_volumes[controller_id]
+        self._closed_executors_volumes[controller_id] = (inventory_imbalance - volumes[0], open_order_volume - volumes[1])
+        self.active_executors[controller_id].remove(executor)
+        self.archived_executors[controller_id].append(executor.executor_info)
+
     def stop(self):
         """
-        Stop the orchestrator task and all active executors.
+        Stop the orchestrator task and all active executors. The scheduler and the event router keep running the
+        control tasks and delivering the order events of the executors until they are closed, and are stopped then.
         """
         # first we stop all active executors
         for controller_id, executors_list in self.active_executors.items():
             for executor in executors_list:
                 if not executor.is_closed:
                     executor.early_stop()
+        self._stop_task = safe_ensure_future(self._stop_when_executors_closed())
+
+    async def _stop_when_executors_closed(self):
+        closing_executors = [executor.terminated.wait()
+                             for executors_list in self.active_executors.values()
+                             for executor in executors_list
+                             if not executor.is_closed]
+        try:
+            await asyncio.wait_for(asyncio.gather(*closing_executors), timeout=self.EXECUTORS_CLOSE_TIMEOUT)
+        except asyncio.TimeoutError:
+            self.logger().warning("Executors still active after the orchestrator stopped, stopping their updates.")
+        finally:
+            if self.scheduler is not None:
+                self.scheduler.stop()
+            self.event_router.stop()
 
     def store_all_executors(self):
         for controller_id, executors_list in self.active_executors.items():
-            for executor in executors_list:
+            for executor in list(executors_list):
                 MarketsRecorder.get_instance().store_or_update_executor(executor)
+                if not executor.is_active:
+                    self._archive_executor(controller_id, executor)
 
     def execute_action(self, action: ExecutorAction):
         """
@@ -90,7 +174,8 @@ class ExecutorOrchestrator:
         if controller_id not in self.active_executors:
             self.active_executors[controller_id] = []
             self.archived_executors[controller_id] = []
-            self.cached_performance[controller_id] = PerformanceReport()
+            # Keep the performance of the stored executors loaded at start
+            self.cached_performance.setdefault(controller_id, PerformanceReport())
 
         if isinstance(action, CreateExecutorAction):
             self.create_executor(action)
@@ -130,6 +215,8 @@ class ExecutorOrchestrator:
         else:
             raise ValueError("Unsupported executor config type")
 
+        executor.set_event_router(self.event_router)
+        executor.set_scheduler(self.scheduler)
         executor.start()
         self.active_executors[controller_id].append(executor)
         self.logger().debug(f"Created {type(executor).__name__} for controller {controller_id}")
@@ -164,11 +251,22 @@ class ExecutorOrchestrator:
             self.logger().error(f"Executor ID {executor_id} is still active.")
             return
         MarketsRecorder.get_instance().store_or_update_executor(executor)
-        self._update_cached_performance(controller_id, executor.executor_info)
-        self.active_executors[controller_id].remove(executor)
-        self.archived_executors[controller_id].append(executor.executor_info)
+        self._archive_executor(controller_id, executor)
         del executor
 
+    def get_control_task_stats(self) -> Dict[str, Any]:
+        """
+        Control task duration histograms of the active executors, by executor id, and of all the executors run by
+        the shared scheduler. Empty when the shared scheduler is not used.
+        """
+        if self.scheduler is None:
+            return {}
+        return {
+            "scheduler": self.scheduler.stats,
+            "all_executors": self.scheduler.global_control_task_histogram(),
+            "executors": self.scheduler.control_task_histograms(),
+        }
+
     def get_executors_report(self) -> Dict[str, List[ExecutorInfo]]:
         """
         Generate a report of all executors.
@@ -179,25 +277,34 @@ class ExecutorOrchestrator:
         return report
 
     def generate_performance_report(self, controller_id: str) -> PerformanceReport:
-        # Start with a deep copy of the cached performance for this controller
-        report = deepcopy(self.cached_performance.get(controller_id, PerformanceReport()))
-
-        # Add data from active executors
+        """
+        Generate the performance report of a controller. The performance of the closed executors is added to running
+        totals once when the executors close, so only the executors still running are aggregated on each report.
+        """
         active_executors = self.active_executors.get(controller_id, [])
         for executor in active_executors:
+            if executor.executor_info.status == RunnableStatus.TERMINATED:
+                self._add_closed_executor_performance(controller_id, executor)
+
+        # Start with a copy of the cached performance for this controller
+        report = self._copy_report(self.cached_performance.get(controller_id, PerformanceReport()))
+        inventory_imbalance, open_order_volume = self._closed_executors_volumes.get(controller_id, (Decimal(0), Decimal(0)))
+        report.inventory_imbalance += inventory_imbalance
+        report.open_order_volume += open_order_volume
+
+        # Add data from the executors still running
+        for executor in active_executors:
+            if executor in self._closed_executors:
+                continue
             executor_info = executor.executor_info
             if executor_info.is_active:
                 report.unrealized_pnl_quote += executor_info.net_pnl_quote
             else:
                 report.realized_pnl_quote += executor_info.net_pnl_quote
             report.volume_traded += executor_info.filled_amount_quote
-            side = executor_info.custom_info.get("side", None)
-            if side:
-                report.inventory_imbalance += executor_info.filled_amount_quote if side == TradeType.BUY else -executor_info.filled_amount_quote
-            if executor_info.type == "dca_executor":
-                report.open_order_volume += sum(executor_info.config.amounts_quote) - executor_info.filled_amount_quote
-            elif executor_info.type == "position_executor":
-                report.open_order_volume += (executor_info.config.amount * executor_info.config.entry_price) - executor_info.filled_amount_quote
+            inventory_imbalance, open_order_volume = self._executor_volumes(executor_info)
+            report.inventory_imbalance += inventory_imbalance
+            report.open_order_volume += open_order_volume
 
         # Calculate global PNL values
         report.global_pnl_quote = report.unrealized_pnl_quote + report.realized_pnl_quote
@@ -209,6 +316,13 @@ class ExecutorOrchestrator:
 
         return report
 
+    @staticmethod
+    def _copy_report(report: PerformanceReport) -> PerformanceReport:
+        # All the report fields are immutable except the close type counts
+        report_copy = report.copy()
+        report_copy.close_type_counts = dict(report.close_type_counts)
+        return report_copy
+
     def generate_global_performance_report(self) -> PerformanceReport:
         global_report = PerformanceReport()
 
@@ -0,0 +1,229 @@
+import asyncio
+import logging
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.strategy_v2.runnable_base import RunnableBase
+
+
+class ControlTaskHistogram:
+    """
+    Histogram of the `control_task` durations of a runnable, with fixed buckets in milliseconds.
+    """
+    BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+    def __init__(self):
+        self._bucket_counts = [0] * (len(self.BUCKETS_MS) + 1)
+        self._count = 0
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def add(self, duration: float):
+        duration_ms = duration * 1000
+        self._bucket_counts[bisect_left(self.BUCKETS_MS, duration_ms)] += 1
+        self._count += 1
+        self._total_ms += duration_ms
+        self._max_ms = max(self._max_ms, duration_ms)
+
+    def merge(self, other: "ControlTaskHistogram"):
+        self._bucket_counts = [count + other_count
+                               for count, other_count in zip(self._bucket_counts, other._bucket_counts)]
+        self._count += other._count
+        self._total_ms += other._total_ms
+        self._max_ms = max(self._max_ms, other._max_ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        buckets = {f"<={limit}ms": count for limit, count in zip(self.BUCKETS_MS, self._bucket_counts)}
+        buckets[f">{self.BUCKETS_MS[-1]}ms"] = self._bucket_counts[-1]
+        return {
+            "count": self._count,
+            "mean_ms": self._total_ms / self._count if self._count > 0 else 0.0,
+            "max_ms": self._max_ms,
+            "buckets": buckets,
+        }
+
+
+class _ScheduledRunnable:
+    __slots__ = ("runnable", "started", "histogram")
+
+    def __init__(self, runnable: "RunnableBase"):
+        self.runnable = runnable
+        self.started = False
+        self.histogram = ControlTaskHistogram()
+
+
+class ExecutorScheduler:
+    """
+    Runs the control tasks of many runnables (usually executors) from a single asyncio task, instead of one
+    `control_loop` task per runnable.
+
+    Every `interval` seconds the scheduler runs one pass calling `control_task` of each active runnable in turn.
+    A pass stops when it has been running for more than `time_budget` seconds, and the runnables that could not run
+    are the first ones in the next pass, so slow passes delay the same runnables only once. Runnables reporting
+    `is_idle()` are skipped. The duration of each `control_task` is recorded in a histogram per runnable.
+
+    `on_start` is called before the first control task of a runnable, and `on_stop` after it is terminated, as
+    the `RunnableBase.control_loop` does.
+    """
+    _logger = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, interval: float = 1.0, time_budget: Optional[float] = None):
+        """
+        :param interval: The time between the start of two passes, in seconds.
+        :param time_budget: The maximum duration of a pass, in seconds. Half the interval by default.
+        """
+        self._interval = interval
+        self._time_budget = time_budget if time_budget is not None else interval / 2
+        self._runnables: "OrderedDict[RunnableBase, _ScheduledRunnable]" = OrderedDict()
+        self._finished_histogram = ControlTaskHistogram()
+        self._wake_up_event = asyncio.Event()
+        self._loop_task: Optional[asyncio.Task] = None
+        self._passes_count = 0
+        self._over_budget_passes_count = 0
+        self._deferred_count = 0
+        self._idle_skipped_count = 0
+
+    @property
+    def interval(self) -> float:
+        return self._interval
+
+    @property
+    def time_budget(self) -> float:
+        return self._time_budget
+
+    @property
+    def runnables_count(self) -> int:
+        return len(self._runnables)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "runnables": len(self._runnables),
+            "passes": self._passes_count,
+            "over_budget_passes": self._over_budget_passes_count,
+            "deferred_control_tasks": self._deferred_count,
+            "idle_skipped_control_tasks": self._idle_skipped_count,
+        }
+
+    def add(self, runnable: "RunnableBase"):
+        """
+        Schedules the control task of the runnable, starting with the next pass.
+        """
+        if runnable in self._runnables:
+            return
+        self._runnables[runnable] = _ScheduledRunnable(runnable)
+        self._wake_up_event.set()
+        if self._loop_task is None or self._loop_task.done():
+            self._loop_task = safe_ensure_future(self._run_loop())
+
+    def stop(self):
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            self._loop_task = None
+
+    def control_task_histograms(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Control task durations of the scheduled runnables, by runnable id (the executor id for executors).
+        """
+        return {self._runnable_id(runnable): scheduled.histogram.to_dict()
+                for runnable, scheduled in self._runnables.items()}
+
+    def global_control_task_histogram(self) -> Dict[str, Any]:
+        """
+        Control task durations of all the runnables, including the ones that already finished.
+        """
+        histogram = ControlTaskHistogram()
+        histogram.merge(self._finished_histogram)
+        for scheduled in self._runnables.values():
+            histogram.merge(scheduled.histogram)
+        return histogram.to_dict()
+
+    async def _run_loop(self):
+        while len(self._runnables) > 0:
+            self._wake_up_event.clear()
+            next_pass_time = time.perf_counter() + self._interval
+            await self.run_pass()
+            while len(self._runnables) > 0 and (remaining_time := next_pass_time - time.perf_counter()) > 0:
+                try:
+                    await asyncio.wait_for(self._wake_up_event.wait(), timeout=remaining_time)
+                except asyncio.TimeoutError:
+                    break
+                # Runnables added between passes run their first control task right away
+                self._wake_up_event.clear()
+                await self._start_new_runnables()
+
+    async def run_pass(self):
+        """
+        Runs the control task of the active runnables, until the time budget is exhausted.
+        """
+        self._passes_count += 1
+        deadline = time.perf_counter() + self._time_budget
+        pending = list(self._runnables.values())
+        for index, scheduled in enumerate(pending):
+            if index > 0 and time.perf_counter() > deadline:
+                self._over_budget_passes_count += 1
+                self._deferred_count += len(pending) - index
+                break
+            # Runnables that ran go to the end of the queue, the deferred ones run first in the next pass
+            self._runnables.move_to_end(scheduled.runnable)
+            await self._run_control_task(scheduled)
+
+    async def _start_new_runnables(self):
+        for scheduled in [scheduled for scheduled in self._runnables.values() if not scheduled.started]:
+            await self._run_control_task(scheduled)
+
+    async def _run_control_task(self, scheduled: _ScheduledRunnable):
+        runnable = scheduled.runnable
+        if runnable.terminated.is_set():
+            self._remove(scheduled)
+            return
+        if not scheduled.started:
+            scheduled.started = True
+            try:
+                runnable.on_start()
+            except Exception:
+                self.logger().error(f"Error starting {self._runnable_id(runnable)}.", exc_info=True)
+                self._runnables.pop(runnable, None)
+                return
+            if runnable.terminated.is_set():
+                self._remove(scheduled)
+                return
+        if runnable.is_idle():
+            self._idle_skipped_count += 1
+            return
+        start = time.perf_counter()
+        try:
+            await runnable.control_task()
+        except Exception as e:
+            runnable.logger().error(e, exc_info=True)
+        finally:
+            scheduled.histogram.add(time.perf_counter() - start)
+
+    def _remove(self, scheduled: _ScheduledRunnable):
+        self._runnables.pop(scheduled.runnable, None)
+        self._finished_histogram.merge(scheduled.histogram)
+        try:
+            scheduled.runnable.on_stop()
+        except Exception:
+            self.logger().error(f"Error stopping {self._runnable_id(scheduled.runnable)}.", exc_info=True)
+
+    @staticmethod
+    def _runnable_id(runnable: "RunnableBase") -> str:
+        config = getattr(runnable, "config", None)
+        return str(getattr(config, "id", None) or id(runnable))
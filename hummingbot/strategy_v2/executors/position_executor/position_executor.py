@@ -296,6 +296,21 @@ class PositionExecutor(ExecutorBase):
             await self.control_shutdown_process()
         self.evaluate_max_retries()
 
+    def is_idle(self) -> bool:
+        """
+        The executor is idle while its open order waits to be filled and only an order event can change its state:
+        the barriers are not controlled until the open order is filled, and the open order is only cancelled when the
+        price leaves the activation bounds.
+
+        :return: True if the control task has nothing to do, False otherwise.
+        """
+        return (self.status == RunnableStatus.RUNNING
+                and self._open_order is not None
+                and not self._open_order.is_filled
+                and (self._open_order.order is None or not self.config.activation_bounds)
+                and self._close_order is None
+                and not self.is_expired)
+
     def open_orders_completed(self):
         """
         This method is responsible for checking if the open orders are completed.
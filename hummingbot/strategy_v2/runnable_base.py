@@ -1,11 +1,15 @@
 import asyncio
 import logging
 from abc import ABC
+from typing import TYPE_CHECKING, Optional
 
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy_v2.models.base import RunnableStatus
 
+if TYPE_CHECKING:
+    from hummingbot.strategy_v2.executors.executor_scheduler import ExecutorScheduler
+
 
 class RunnableBase(ABC):
     """
@@ -29,6 +33,7 @@ class RunnableBase(ABC):
         self.update_interval = update_interval
         self._status: RunnableStatus = RunnableStatus.NOT_STARTED
         self.terminated = asyncio.Event()
+        self._scheduler: Optional["ExecutorScheduler"] = None
 
     @property
     def status(self):
@@ -39,15 +44,28 @@ class RunnableBase(ABC):
         """
         return self._status
 
+    def set_scheduler(self, scheduler: Optional["ExecutorScheduler"]):
+        """
+        Set the scheduler that runs the control task of the smart component, instead of its own control loop.
+        It has to be set before the component is started.
+
+        :param scheduler: The shared scheduler, or None to use the control loop.
+        """
+        self._scheduler = scheduler
+
     def start(self):
         """
         Start the control loop of the smart component.
-        If the component is not already started, it will start the control loop.
+        If the component is not already started, it will start the control loop, or add the component to its
+        scheduler if it has one.
         """
         if self._status == RunnableStatus.NOT_STARTED:
             self.terminated.clear()
             self._status = RunnableStatus.RUNNING
-            safe_ensure_future(self.control_loop())
+            if self._scheduler is not None:
+                self._scheduler.add(self)
+            else:
+                safe_ensure_future(self.control_loop())
 
     def stop(self):
         """
@@ -87,6 +105,13 @@ class RunnableBase(ABC):
         """
         pass
 
+    def is_idle(self) -> bool:
+        """
+        Whether the control task has nothing to do. Schedulers skip the control task of idle components.
+        This method can be overridden in subclasses, by default components are never idle.
+        """
+        return False
+
     async def control_task(self):
         """
         The main task to be executed in the control loop.
@@ -0,0 +1,32 @@
+import os
+from typing import Dict
+
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecorder
+from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
+
+
+class RecordOrderBookL2(ScriptStrategyBase):
+    """
+    Records the full L2 order book (keyframes + diffs) and public trades of the configured pairs into the compact
+    binary format read by OrderBookRecordReader. Files are written to data/order_book_recordings and rotate daily.
+    """
+    exchange = os.getenv("EXCHANGE", "binance_paper_trade")
+    trading_pairs = os.getenv("TRADING_PAIRS", "ETH-USDT,BTC-USDT")
+    keyframe_interval = float(os.getenv("KEYFRAME_INTERVAL", 60))
+    trading_pairs = [pair for pair in trading_pairs.split(",")]
+    markets = {exchange: set(trading_pairs)}
+
+    def __init__(self, connectors: Dict[str, ConnectorBase]):
+        super().__init__(connectors)
+        self.recorder = OrderBookRecorder(connector_name=self.exchange, keyframe_interval=self.keyframe_interval)
+        self.recorder_attached = False
+
+    def on_tick(self):
+        if not self.recorder_attached:
+            self.connectors[self.exchange].order_book_tracker.set_recorder(self.recorder)
+            self.recorder_attached = True
+
+    async def on_stop(self):
+        self.connectors[self.exchange].order_book_tracker.set_recorder(None)
+        self.recorder.close()
@@ -0,0 +1,91 @@
+"""
+Measures the decoding and encoding time of the JSON codecs available to the web assistants.
+
+By default the messages are samples of the Binance depth update and trade streams. A file with one recorded websocket
+message per line can be used instead with --file.
+
+Usage:
+    python -m test.benchmarks.bench_json_codec [--file PATH] [--iterations N]
+"""
+import argparse
+import json
+import random
+import time
+from typing import List
+
+from hummingbot.core.web_assistant import json_codec
+from hummingbot.core.web_assistant.json_codec import JSONCodec, OrjsonCodec
+
+
+def _sample_messages() -> List[str]:
+    generator = random.Random(0)
+    messages = []
+    for update_id in range(100):
+        levels = generator.randint(1, 40)
+        messages.append(json.dumps({
+            "e": "depthUpdate",
+            "E": 1700000000000 + update_id,
+            "s": "BTCUSDT",
+            "U": update_id * 10,
+            "u": update_id * 10 + 9,
+            "b": [[f"{40000 - generator.random() * 100:.2f}", f"{generator.random() * 5:.5f}"] for _ in range(levels)],
+            "a": [[f"{40000 + generator.random() * 100:.2f}", f"{generator.random() * 5:.5f}"] for _ in range(levels)],
+        }))
+        messages.append(json.dumps({
+            "e": "trade",
+            "E": 1700000000000 + update_id,
+            "s": "BTCUSDT",
+            "t": 12345 + update_id,
+            "p": f"{40000 + generator.random():.2f}",
+            "q": f"{generator.random():.5f}",
+            "b": 88,
+            "a": 50,
+            "T": 1700000000000 + update_id,
+            "m": True,
+            "M": True,
+        }))
+    return messages
+
+
+def _bench(codec: JSONCodec, messages: List[str], iterations: int):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for message in messages:
+            codec.loads(message)
+    decode_time = time.perf_counter() - start
+
+    documents = [codec.loads(message) for message in messages]
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for document in documents:
+            codec.dumps(document)
+    encode_time = time.perf_counter() - start
+
+    count = iterations * len(messages)
+    return decode_time / count * 1e6, encode_time / count * 1e6
+
+
+def main(file_path: str, iterations: int):
+    if file_path:
+        with open(file_path) as messages_file:
+            messages = [line.strip() for line in messages_file if line.strip()]
+    else:
+        messages = _sample_messages()
+    average_size = sum(len(message) for message in messages) / len(messages)
+    print(f"{len(messages)} messages, {average_size:.0f} bytes on average")
+
+    codecs = [JSONCodec()]
+    if json_codec.orjson is not None:
+        codecs.append(OrjsonCodec())
+    print(f"{'codec':>8} {'decode (us / msg)':>18} {'encode (us / msg)':>18}")
+    for codec in codecs:
+        decode_us, encode_us = _bench(codec, messages, iterations)
+        print(f"{codec.name:>8} {decode_us:>18.2f} {encode_us:>18.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--file", default=None, help="file with one JSON message per line")
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    main(args.file, args.iterations)
@@ -0,0 +1,110 @@
+"""
+Compares the set based `OrderBook` with the flat sorted array `FlatOrderBook` replaying the same stream of diffs: the
+diffs applied per second, the best price lookup and the depth queries (VWAP and volume for price) on the final book.
+
+The stream is read from an order book recording (`OrderBookRecorder` file) when one is given, and generated
+otherwise: a snapshot of `--levels` levels per side and diffs that mostly update the top levels of the book. With
+`--max-depth` both books are depth capped.
+
+Usage:
+    python -m test.benchmarks.bench_order_book_backends [--recording FILE] [--levels N] [--diffs N] [--queries N]
+                                                        [--max-depth N]
+"""
+import argparse
+import time
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from hummingbot.core.data_type.flat_order_book import FlatOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecordReader
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+TICK_SIZE = 0.01
+MID_PRICE = 1000.0
+Diff = Tuple[List[OrderBookRow], List[OrderBookRow], int]
+
+
+def _synthetic_stream(levels: int, diffs_count: int, seed: int = 42) -> Tuple[Diff, List[Diff]]:
+    random = np.random.default_rng(seed)
+    bids = [OrderBookRow(round(MID_PRICE - (i + 1) * TICK_SIZE, 2), float(random.uniform(0.1, 10)), 1)
+            for i in range(levels)]
+    asks = [OrderBookRow(round(MID_PRICE + (i + 1) * TICK_SIZE, 2), float(random.uniform(0.1, 10)), 1)
+            for i in range(levels)]
+    diffs = []
+    for update_id in range(2, diffs_count + 2):
+        rows = ([], [])
+        for _ in range(int(random.integers(1, 6))):
+            is_bid = random.random() < 0.5
+            # Most updates are near the top of the book, a few anywhere in it
+            depth = int(random.geometric(0.1)) if random.random() < 0.95 else int(random.integers(1, levels))
+            price = round(MID_PRICE - depth * TICK_SIZE if is_bid else MID_PRICE + depth * TICK_SIZE, 2)
+            amount = 0.0 if random.random() < 0.3 else float(random.uniform(0.1, 10))
+            rows[0 if is_bid else 1].append(OrderBookRow(price, amount, update_id))
+        diffs.append((rows[0], rows[1], update_id))
+    return (bids, asks, 1), diffs
+
+
+def _recorded_stream(file_path: str) -> Tuple[Diff, List[Diff]]:
+    snapshot: Optional[Diff] = None
+    diffs = []
+    for message in OrderBookRecordReader(file_path).messages():
+        if message.type is OrderBookMessageType.SNAPSHOT and snapshot is None:
+            snapshot = (message.bids, message.asks, message.update_id)
+        elif message.type is OrderBookMessageType.DIFF and snapshot is not None:
+            diffs.append((message.bids, message.asks, message.update_id))
+    if snapshot is None:
+        raise ValueError(f"No keyframe in {file_path}.")
+    return snapshot, diffs
+
+
+def _bench(order_book: OrderBook, snapshot: Diff, diffs: List[Diff], queries: int):
+    order_book.apply_snapshot(*snapshot)
+    start = time.perf_counter()
+    for bids, asks, update_id in diffs:
+        order_book.apply_diffs(bids, asks, update_id)
+    apply_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(queries):
+        order_book.get_price(True)
+        order_book.get_price(False)
+    best_price_time = (time.perf_counter() - start) / (2 * queries)
+
+    # Queries walking the 50 best levels of the asks
+    top_asks = [row for _, row in zip(range(50), order_book.ask_entries())]
+    volume = sum(row.amount for row in top_asks)
+    price = top_asks[-1].price
+    depth_queries = max(queries // 100, 1)
+    start = time.perf_counter()
+    for _ in range(depth_queries):
+        order_book.get_vwap_for_volume(True, volume)
+        order_book.get_volume_for_price(True, price)
+    depth_query_time = (time.perf_counter() - start) / (2 * depth_queries)
+
+    return len(diffs) / apply_time, best_price_time * 1e9, depth_query_time * 1e6, order_book.memory_usage / 1024
+
+
+def main(recording: Optional[str], levels: int, diffs_count: int, queries: int, max_depth: int):
+    snapshot, diffs = _recorded_stream(recording) if recording else _synthetic_stream(levels, diffs_count)
+    print(f"{len(snapshot[0])} bid and {len(snapshot[1])} ask levels in the snapshot, {len(diffs)} diffs")
+    print(f"{'backend':>8} {'diffs / s':>12} {'best price (ns)':>16} {'depth query (us)':>17} {'memory (KB)':>12}")
+    order_books = {"set": OrderBook(max_depth=max_depth), "flat": FlatOrderBook(max_depth=max_depth)}
+    for name, order_book in order_books.items():
+        diffs_per_second, best_price_ns, depth_query_us, memory_kb = _bench(order_book, snapshot, diffs, queries)
+        print(f"{name:>8} {diffs_per_second:>12.0f} {best_price_ns:>16.1f} {depth_query_us:>17.1f} {memory_kb:>12.0f}")
+    if list(order_books["set"].bid_entries()) != list(order_books["flat"].bid_entries()):
+        print("The books differ after the replay.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--recording", type=str, default=None)
+    parser.add_argument("--levels", type=int, default=20000)
+    parser.add_argument("--diffs", type=int, default=200000)
+    parser.add_argument("--queries", type=int, default=200000)
+    parser.add_argument("--max-depth", type=int, default=0)
+    args = parser.parse_args()
+    main(args.recording, args.levels, args.diffs, args.queries, args.max_depth)
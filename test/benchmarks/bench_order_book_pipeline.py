@@ -0,0 +1,100 @@
+"""
+Measures the latency and throughput of order book diffs, from the data source message queue to the order book, with
+the default queued pipeline and with the direct diff dispatch of the order book tracker.
+
+The data source parses each raw message into an `OrderBookMessage` with a single bid. The latency is measured
+sending one message at a time and waiting until it is applied. The throughput is measured sending a burst of messages.
+
+Usage:
+    python -m test.benchmarks.bench_order_book_pipeline [--messages N] [--latency-samples N]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any, Dict, List
+
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+TRADING_PAIR = "COINALPHA-HBOT"
+
+
+class _BenchmarkDataSource(OrderBookTrackerDataSource):
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain=None) -> Dict[str, float]:
+        return {trading_pair: 1000.0 for trading_pair in trading_pairs}
+
+    async def listen_for_subscriptions(self):
+        # The benchmark puts the raw messages in the data source queue itself
+        await asyncio.Event().wait()
+
+    async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": trading_pair, "update_id": 0, "bids": [], "asks": []}, timestamp=0)
+
+    async def _parse_order_book_diff_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
+        message_queue.put_nowait(OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": TRADING_PAIR,
+            "update_id": raw_message["u"],
+            "bids": [[1000 + raw_message["u"] % 100, 1.0]],
+            "asks": [],
+        }, timestamp=raw_message["u"]))
+
+
+class _BenchmarkTracker(OrderBookTracker):
+
+    @staticmethod
+    async def _sleep(delay: float):
+        pass
+
+
+async def _wait_applied(tracker: OrderBookTracker, update_id: int):
+    order_book = tracker.order_books[TRADING_PAIR]
+    while order_book.last_diff_uid < update_id:
+        await asyncio.sleep(0)
+
+
+async def _bench(direct_diff_dispatch: bool, messages_count: int, latency_samples: int):
+    data_source = _BenchmarkDataSource(trading_pairs=[TRADING_PAIR])
+    tracker = _BenchmarkTracker(
+        data_source=data_source, trading_pairs=[TRADING_PAIR], direct_diff_dispatch=direct_diff_dispatch)
+    tracker.start()
+    await tracker.wait_ready()
+    raw_queue = data_source._message_queue[data_source._diff_messages_queue_key]
+
+    update_id = 0
+    latencies = []
+    for _ in range(latency_samples):
+        update_id += 1
+        start = time.perf_counter()
+        raw_queue.put_nowait({"u": update_id})
+        await _wait_applied(tracker, update_id)
+        latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(messages_count):
+        update_id += 1
+        raw_queue.put_nowait({"u": update_id})
+    await _wait_applied(tracker, update_id)
+    elapsed = time.perf_counter() - start
+
+    tracker.stop()
+    return statistics.median(latencies) * 1e6, messages_count / elapsed, tracker.diff_router_stats["accepted"]
+
+
+def main(messages_count: int, latency_samples: int):
+    print(f"{'pipeline':>8} {'median latency (us)':>20} {'diffs / s':>12} {'routed':>8}")
+    for direct_diff_dispatch in (False, True):
+        latency, throughput, routed = asyncio.run(_bench(direct_diff_dispatch, messages_count, latency_samples))
+        name = "direct" if direct_diff_dispatch else "queued"
+        print(f"{name:>8} {latency:>20.1f} {throughput:>12.0f} {routed:>8}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=100000)
+    parser.add_argument("--latency-samples", type=int, default=5000)
+    args = parser.parse_args()
+    main(args.messages, args.latency_samples)
@@ -0,0 +1,133 @@
+"""
+Measures the time spent by `BinanceExchange._place_order` before the request reaches the network: building the order
+parameters, the REST assistant pre-processors, the server time synchronization and the request signature.
+
+The network connection is replaced by one returning an order creation response immediately, and the throttler by one
+that never waits. The current path is compared with the previous one, that recalculated the time offset for every
+signature and created a new HMAC object for each request.
+
+Usage:
+    python -m test.benchmarks.bench_order_placement [--orders N]
+"""
+import argparse
+import asyncio
+import hashlib
+import hmac
+import time
+from contextlib import asynccontextmanager
+from decimal import Decimal
+from typing import Any, Dict
+from urllib.parse import urlencode
+
+import numpy
+from bidict import bidict
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.binance.binance_auth import BinanceAuth
+from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
+from hummingbot.connector.time_synchronizer import TimeSynchronizer
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.web_assistant.connections.data_types import RESTRequest
+from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
+
+TRADING_PAIR = "COINALPHA-HBOT"
+
+
+class _NoWaitThrottler:
+
+    @asynccontextmanager
+    async def execute_task(self, limit_id: str):
+        yield
+
+
+class _OrderCreatedResponse:
+    status = 200
+
+    async def json(self):
+        return {"orderId": 28, "transactTime": 1507725176595}
+
+
+class _NoNetworkConnection:
+
+    async def call(self, request: RESTRequest):
+        return _OrderCreatedResponse()
+
+
+class _RecalculatingTimeSynchronizer(TimeSynchronizer):
+    """Previous behavior, the offset was calculated from the samples every time the current time was requested."""
+
+    @property
+    def time_offset_ms(self) -> float:
+        median = numpy.median(self._time_offset_ms)
+        weighted_average = numpy.average(self._time_offset_ms, weights=range(1, len(self._time_offset_ms) * 2 + 1, 2))
+        return numpy.mean([median, weighted_average])
+
+
+class _NewHMACBinanceAuth(BinanceAuth):
+    """Previous behavior, a new HMAC object keyed with the secret was created for every signature."""
+
+    def _generate_signature(self, params: Dict[str, Any]) -> str:
+        encoded_params_str = urlencode(params)
+        return hmac.new(self.secret_key.encode("utf8"), encoded_params_str.encode("utf8"), hashlib.sha256).hexdigest()
+
+
+def _exchange(previous_path: bool) -> BinanceExchange:
+    exchange = BinanceExchange(
+        client_config_map=ClientConfigAdapter(ClientConfigMap()),
+        binance_api_key="someKey",
+        binance_api_secret="someSecret",
+        trading_pairs=[TRADING_PAIR],
+    )
+    exchange._set_trading_pair_symbol_map(bidict({"COINALPHAHBOT": TRADING_PAIR}))
+    factory = exchange._web_assistants_factory
+    auth = factory._auth
+    if previous_path:
+        time_synchronizer = _RecalculatingTimeSynchronizer()
+        auth = _NewHMACBinanceAuth(api_key=auth.api_key, secret_key=auth.secret_key, time_provider=time_synchronizer)
+        for pre_processor in factory._rest_pre_processors:
+            pre_processor._synchronizer = time_synchronizer
+    else:
+        time_synchronizer = exchange._time_synchronizer
+    for offset in (10, 12, 9, 11, 10):
+        time_synchronizer.add_time_offset_ms_sample(offset)
+    rest_assistant = RESTAssistant(
+        connection=_NoNetworkConnection(),
+        throttler=_NoWaitThrottler(),
+        rest_pre_processors=factory._rest_pre_processors,
+        auth=auth,
+    )
+
+    async def get_rest_assistant():
+        return rest_assistant
+
+    factory.get_rest_assistant = get_rest_assistant
+    return exchange
+
+
+async def _bench(exchange: BinanceExchange, orders_count: int) -> float:
+    start = time.perf_counter()
+    for index in range(orders_count):
+        await exchange._place_order(
+            order_id=f"HBOT-B-COINALPHA-HBOT-{index}",
+            trading_pair=TRADING_PAIR,
+            amount=Decimal("1.5"),
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal("10.25"),
+        )
+    return (time.perf_counter() - start) / orders_count * 1e6
+
+
+async def main(orders_count: int):
+    previous = await _bench(_exchange(previous_path=True), orders_count)
+    current = await _bench(_exchange(previous_path=False), orders_count)
+    print(f"{'previous (us / order)':>22} {'current (us / order)':>21} {'speedup':>8}")
+    print(f"{previous:>22.2f} {current:>21.2f} {previous / current:>7.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--orders", type=int, default=20000)
+    args = parser.parse_args()
+    asyncio.run(main(args.orders))
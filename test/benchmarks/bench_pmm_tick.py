@@ -0,0 +1,117 @@
+"""
+Measures the time spent in each stage of the `PureMarketMakingStrategy` tick, with the stage timers of the strategy.
+
+The strategy runs on a backtest clock against a `MockPaperExchange`. The order book is synthetic: at every tick it is
+replaced by a snapshot of `--depth` levels per side around a mid price following a seeded random walk, and a trade
+crossing the best own order is applied every `--trade-interval` ticks so that orders are filled. The order refresh
+time is one second, so the orders are re-evaluated at every tick.
+
+Usage:
+    python -m test.benchmarks.bench_pmm_tick [--ticks N] [--levels N] [--depth N] [--trade-interval N]
+        [--hanging-orders] [--order-optimization] [--inventory-skew] [--seed N]
+"""
+import argparse
+import random
+import time
+from decimal import Decimal
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.pure_market_making.pure_market_making import PureMarketMakingStrategy
+
+TRADING_PAIR = "COINALPHA-HBOT"
+BASE_ASSET, QUOTE_ASSET = TRADING_PAIR.split("-")
+START_TIMESTAMP = 1700000000.0
+
+
+def _apply_synthetic_snapshot(market: MockPaperExchange, mid_price: float, depth: int, update_id: int):
+    price_step = mid_price * 0.0005
+    bids = [OrderBookRow(mid_price - price_step * (level + 0.5), 10.0 * (level + 1), update_id)
+            for level in range(depth)]
+    asks = [OrderBookRow(mid_price + price_step * (level + 0.5), 10.0 * (level + 1), update_id)
+            for level in range(depth)]
+    market.get_order_book(TRADING_PAIR).apply_snapshot(bids, asks, update_id)
+
+
+def _apply_crossing_trade(market: MockPaperExchange, strategy: PureMarketMakingStrategy, timestamp: float,
+                          is_buy: bool):
+    orders = strategy.active_sells if is_buy else strategy.active_buys
+    if len(orders) == 0:
+        return
+    prices = [order.price for order in orders]
+    price = max(prices) if is_buy else min(prices)
+    market.get_order_book(TRADING_PAIR).apply_trade(OrderBookTradeEvent(
+        TRADING_PAIR, timestamp, TradeType.BUY if is_buy else TradeType.SELL, float(price), 1000.0))
+
+
+def main(ticks: int, levels: int, depth: int, trade_interval: int, hanging_orders: bool, order_optimization: bool,
+         inventory_skew: bool, seed: int):
+    rng = random.Random(seed)
+    clock = Clock(ClockMode.BACKTEST, 1.0, START_TIMESTAMP, START_TIMESTAMP + ticks + 1)
+    market = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+    mid_price = 100.0
+    market.set_balanced_order_book(trading_pair=TRADING_PAIR, mid_price=mid_price, min_price=1, max_price=200,
+                                   price_step_size=1, volume_step_size=10)
+    market.set_balance(BASE_ASSET, 1000000)
+    market.set_balance(QUOTE_ASSET, 100000000)
+    market.set_quantization_param(QuantizationParams(TRADING_PAIR, 6, 6, 6, 6))
+    clock.add_iterator(market)
+
+    strategy = PureMarketMakingStrategy()
+    strategy.init_params(
+        MarketTradingPairTuple(market, TRADING_PAIR, BASE_ASSET, QUOTE_ASSET),
+        bid_spread=Decimal("0.001"),
+        ask_spread=Decimal("0.001"),
+        order_amount=Decimal("1"),
+        order_levels=levels,
+        order_level_spread=Decimal("0.001"),
+        order_refresh_time=1,
+        order_refresh_tolerance_pct=Decimal("0"),
+        filled_order_delay=1,
+        hanging_orders_enabled=hanging_orders,
+        hanging_orders_cancel_pct=Decimal("0.1"),
+        order_optimization_enabled=order_optimization,
+        inventory_skew_enabled=inventory_skew,
+        stage_timing_enabled=True,
+    )
+    clock.add_iterator(strategy)
+
+    start = time.perf_counter()
+    for tick in range(1, ticks + 1):
+        timestamp = START_TIMESTAMP + tick
+        mid_price *= 1 + rng.gauss(0, 0.0005)
+        _apply_synthetic_snapshot(market, mid_price, depth, tick)
+        if trade_interval > 0 and tick % trade_interval == 0:
+            _apply_crossing_trade(market, strategy, timestamp, rng.random() < 0.5)
+        clock.backtest_til(timestamp)
+    elapsed = time.perf_counter() - start
+
+    print(f"{ticks} ticks in {elapsed:.2f}s ({ticks / elapsed:.0f} ticks / s), {levels} levels, "
+          f"{depth} order book levels, hanging orders {hanging_orders}, order optimization {order_optimization}, "
+          f"inventory skew {inventory_skew}")
+    print(f"{'stage':>25} {'count':>7} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for stage, stats in strategy.stage_timer.stats().items():
+        print(f"{stage:>25} {stats['count']:>7} {stats['p50_ms']:>9.3f} {stats['p90_ms']:>9.3f} "
+              f"{stats['p99_ms']:>9.3f} {stats['max_ms']:>9.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ticks", type=int, default=2000)
+    parser.add_argument("--levels", type=int, default=10, help="order levels per side")
+    parser.add_argument("--depth", type=int, default=200, help="synthetic order book levels per side")
+    parser.add_argument("--trade-interval", type=int, default=5, help="ticks between crossing trades, 0 for none")
+    parser.add_argument("--hanging-orders", action="store_true")
+    parser.add_argument("--order-optimization", action="store_true")
+    parser.add_argument("--inventory-skew", action="store_true")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    main(args.ticks, args.levels, args.depth, args.trade_interval, args.hanging_orders, args.order_optimization,
+         args.inventory_skew, args.seed)
@@ -0,0 +1,53 @@
+"""
+Measures the cost of `PubSub.trigger_event` with 1, 10 and 500 listeners.
+
+The listeners are `EventForwarder`s calling an empty function, so the result is the dispatch overhead plus one Python
+call per listener. The time per listener call is reported to make the listener counts comparable.
+
+Usage:
+    python -m test.benchmarks.bench_pubsub [--events N] [--listeners N]
+"""
+import argparse
+import time
+from enum import Enum
+
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.pubsub import PubSub
+
+
+class BenchmarkEvent(Enum):
+    Tick = 1
+    Unused = 2
+
+
+def _noop(arg):
+    pass
+
+
+def _bench(listeners_count: int, events_count: int) -> float:
+    pubsub = PubSub()
+    listeners = [EventForwarder(_noop) for _ in range(listeners_count)]
+    for listener in listeners:
+        pubsub.add_listener(BenchmarkEvent.Tick, listener)
+    event = object()
+    start = time.perf_counter()
+    for _ in range(events_count):
+        pubsub.trigger_event(BenchmarkEvent.Tick, event)
+    return (time.perf_counter() - start) / events_count * 1e9
+
+
+def main(events_count: int, listeners_counts):
+    print(f"{'listeners':>9} {'ns / event':>12} {'ns / listener call':>19}")
+    for listeners_count in listeners_counts:
+        # Fewer events for the large listener counts, to keep the run time similar
+        events = max(1000, events_count // listeners_count)
+        ns_per_event = _bench(listeners_count, events)
+        print(f"{listeners_count:>9} {ns_per_event:>12.0f} {ns_per_event / listeners_count:>19.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=200000)
+    parser.add_argument("--listeners", type=int, action="append", dest="listeners_counts")
+    args = parser.parse_args()
+    main(args.events, args.listeners_counts or [1, 10, 500])
@@ -0,0 +1,122 @@
+"""
+Measures the `RESTAssistant` overhead of placing orders, without network I/O.
+
+Compares the current request handling with the previous one, that deep copied every request before running the
+pre-processors and the authenticator.
+
+Usage:
+    python -m test.benchmarks.bench_rest_assistant [--iterations N] [--batch-size N]
+"""
+import argparse
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from copy import deepcopy
+from typing import Optional
+
+from hummingbot.core.web_assistant.auth import AuthBase
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, WSRequest
+from hummingbot.core.web_assistant.request_tracer import RequestTrace
+from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
+
+LIMIT_ID = "order"
+
+
+class _NoWaitThrottler:
+    """The throttler is left out of the measures, its cost does not depend on the request handling."""
+
+    @asynccontextmanager
+    async def execute_task(self, limit_id: str):
+        yield
+
+
+class _Response:
+    status = 200
+
+
+class _NoNetworkConnection:
+    async def call(self, request: RESTRequest):
+        return _Response()
+
+
+class _HeaderAuth(AuthBase):
+    async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
+        headers = dict(request.headers or {})
+        headers["X-API-KEY"] = "someKey"
+        headers["X-SIGNATURE"] = "someSignature"
+        return request.copy_with(headers=headers)
+
+    async def ws_authenticate(self, request: WSRequest) -> WSRequest:
+        return request
+
+
+class _DeepCopyRESTAssistant(RESTAssistant):
+    """Previous behavior, every request was deep copied before being processed."""
+
+    async def _call(
+            self, request: RESTRequest, timeout: Optional[float] = None, trace: Optional[RequestTrace] = None
+    ):
+        return await super()._call(request=deepcopy(request), timeout=timeout, trace=trace)
+
+
+def _order_payload(batch_size: int):
+    order = {
+        "symbol": "COINALPHA-HBOT",
+        "side": "BUY",
+        "type": "LIMIT",
+        "timeInForce": "GTC",
+        "quantity": "1.00000000",
+        "price": "10.00000000",
+        "newClientOrderId": "HBOT-B-COINALPHA-HBOT-1700000000000000",
+    }
+    if batch_size <= 1:
+        return order
+    return {"batchOrders": [dict(order, newClientOrderId=f"{order['newClientOrderId']}{i}") for i in range(batch_size)]}
+
+
+async def _run(assistant: RESTAssistant, iterations: int, batch_size: int, use_call: bool) -> float:
+    payload = _order_payload(batch_size)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        if use_call:
+            request = RESTRequest(
+                method=RESTMethod.POST,
+                url="https://api.test.com/api/v3/order",
+                data=payload,
+                headers={"Content-Type": "application/json"},
+                is_auth_required=True,
+                throttler_limit_id=LIMIT_ID,
+            )
+            await assistant.call(request=request)
+        else:
+            await assistant.execute_request_and_get_response(
+                url="https://api.test.com/api/v3/order",
+                throttler_limit_id=LIMIT_ID,
+                data=payload,
+                method=RESTMethod.POST,
+                is_auth_required=True,
+            )
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+async def main(iterations: int, batch_sizes):
+    throttler = _NoWaitThrottler()
+    assistants = {
+        "deepcopy": _DeepCopyRESTAssistant(connection=_NoNetworkConnection(), throttler=throttler, auth=_HeaderAuth()),
+        "current": RESTAssistant(connection=_NoNetworkConnection(), throttler=throttler, auth=_HeaderAuth()),
+    }
+    print(f"{'batch size':>10} {'entry point':>28} {'deepcopy (us)':>14} {'current (us)':>13} {'speedup':>8}")
+    for batch_size in batch_sizes:
+        for use_call, entry_point in ((False, "execute_request_and_get_response"), (True, "call")):
+            results = {name: await _run(assistant, iterations, batch_size, use_call)
+                       for name, assistant in assistants.items()}
+            print(f"{batch_size:>10} {entry_point:>28} {results['deepcopy']:>14.2f} {results['current']:>13.2f} "
+                  f"{results['deepcopy'] / results['current']:>7.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument("--batch-size", type=int, action="append", dest="batch_sizes")
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations, args.batch_sizes or [1, 20, 100]))
@@ -0,0 +1,104 @@
+"""
+Measures the number of order fills per second `MarketsRecorder` can record in a SQLite database, with the default
+`sqlite_db_engine` mode and with the `sqlite_performance_db_engine` mode (WAL journal, synchronous NORMAL, dedicated
+writer connection).
+
+Each fill is recorded in its own transaction, as in a running bot: the order status, the trade fill and the market
+states are written and committed. The CSV export of the fills is disabled. Optionally, a reader thread runs the
+`history` command query in a loop on a read-only session while the fills are recorded.
+
+Usage:
+    python -m test.benchmarks.bench_trade_fill_recording [--fills N] [--with-reader]
+"""
+import argparse
+import os
+import tempfile
+import threading
+import time
+from decimal import Decimal
+
+from hummingbot.client.config.client_config_map import ClientConfigMap, DBSqliteMode, DBSqlitePerformanceMode
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.markets_recorder import MarketsRecorder
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.trade_fill import TradeFill
+
+CONFIG_FILE_PATH = "bench_config.yml"
+
+
+class _BenchmarkMarket:
+    display_name = "bench_exchange"
+    tracking_states = {}
+
+    def add_trade_fills_from_market_recorder(self, current_trade_fills):
+        pass
+
+    def add_exchange_order_ids_from_market_recorder(self, current_exchange_order_ids):
+        pass
+
+
+def _read_history_loop(sql_manager: SQLConnectionManager, stop_event: threading.Event, reads: list):
+    while not stop_event.is_set():
+        with sql_manager.get_read_only_session() as session:
+            session.query(TradeFill).filter(TradeFill.config_file_path == CONFIG_FILE_PATH).all()
+        reads[0] += 1
+
+
+def _bench(db_mode, fills_count: int, with_reader: bool):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.db_mode = db_mode
+        sql_manager = SQLConnectionManager(
+            client_config_map, SQLConnectionType.TRADE_FILLS, db_path=os.path.join(temp_dir, "bench.sqlite"))
+        market = _BenchmarkMarket()
+        recorder = MarketsRecorder(sql=sql_manager,
+                                   markets=[market],
+                                   config_file_path=CONFIG_FILE_PATH,
+                                   strategy_name="bench_strategy",
+                                   market_data_collection=client_config_map.market_data_collection.hb_config)
+        recorder.append_to_csv = lambda trade_fill_record: None
+
+        stop_event = threading.Event()
+        reads = [0]
+        reader = threading.Thread(target=_read_history_loop, args=(sql_manager, stop_event, reads))
+        if with_reader:
+            reader.start()
+
+        start = time.perf_counter()
+        for index in range(fills_count):
+            recorder._did_fill_order(MarketEvent.OrderFilled.value, market, OrderFilledEvent(
+                timestamp=1700000000 + index,
+                order_id=f"OID-{index}",
+                trading_pair="COINALPHA-HBOT",
+                trade_type=TradeType.BUY,
+                order_type=OrderType.LIMIT,
+                price=Decimal("10.5"),
+                amount=Decimal("1"),
+                trade_fee=AddedToCostTradeFee(),
+                exchange_trade_id=f"TID-{index}",
+            ))
+        elapsed = time.perf_counter() - start
+
+        stop_event.set()
+        if with_reader:
+            reader.join()
+        sql_manager.dispose()
+        return fills_count / elapsed, reads[0]
+
+
+def main(fills_count: int, with_reader: bool):
+    print(f"{'db mode':>30} {'fills / s':>10} {'history reads':>14}")
+    for db_mode in (DBSqliteMode(), DBSqlitePerformanceMode()):
+        fills_per_second, reads = _bench(db_mode, fills_count, with_reader)
+        print(f"{db_mode.Config.title:>30} {fills_per_second:>10.0f} {reads:>14}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fills", type=int, default=2000)
+    parser.add_argument("--with-reader", action="store_true", help="run history queries in a thread meanwhile")
+    args = parser.parse_args()
+    main(args.fills, args.with_reader)
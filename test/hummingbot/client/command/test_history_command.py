@@ -172,3 +172,41 @@ class HistoryCommandTest(unittest.TestCase):
         )
 
         self.assertEqual(df_str_expected, captures[0])
+
+    def test_trades_of_hosted_strategies_are_reported(self):
+        self.client_config_map.db_mode = DBSqliteMode()
+        # In host mode the trades are recorded under the configuration file of each hosted strategy
+        self.app.strategy_file_name = "test-host.yml"
+        self.addCleanup(Path(SQLConnectionManager.create_db_path(db_name="test-host")).unlink, missing_ok=True)
+        self.app._hosted_config_file_paths = ["conf_pure_mm_1.yml", "conf_pure_mm_2.yml"]
+
+        trade_fee = AddedToCostTradeFee(percent=Decimal("5"))
+        with self.app.trade_fill_db.get_new_session() as session:
+            for i, config_file_path in enumerate(["conf_pure_mm_1.yml", "conf_pure_mm_2.yml", "conf_other.yml"]):
+                session.add(TradeFill(
+                    config_file_path=config_file_path,
+                    strategy="pure_market_making",
+                    market="binance",
+                    symbol="BTC-USDT",
+                    base_asset="BTC",
+                    quote_asset="USDT",
+                    timestamp=i + 1,
+                    order_id=f"someId{i}",
+                    trade_type="BUY",
+                    order_type="LIMIT",
+                    price=1,
+                    amount=2,
+                    leverage=1,
+                    trade_fee=trade_fee.to_json(),
+                    exchange_trade_id=f"someExchangeId{i}",
+                ))
+            session.commit()
+
+        with self.app.trade_fill_db.get_read_only_session() as session:
+            trades = self.app._get_trades_from_session(
+                0, session=session, config_file_paths=self.app.strategy_config_file_paths)
+
+        self.assertEqual(["conf_pure_mm_1.yml", "conf_pure_mm_2.yml"], [trade.config_file_path for trade in trades])
+
+        self.app.strategy_file_name = "test-host.yml"
+        self.assertEqual(["test-host.yml"], self.app.strategy_config_file_paths)
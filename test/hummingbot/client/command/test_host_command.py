@@ -0,0 +1,233 @@
+import asyncio
+import unittest
+from test.mock.mock_cli import CLIMockingAssistant
+from typing import Awaitable, Dict, List
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
+from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.client.settings import ConnectorType
+from hummingbot.strategy.order_attribution import OrderAttribution
+
+
+class HostCommandTest(unittest.TestCase):
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher")
+    def setUp(self, _: MagicMock) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+
+        self.async_run_with_timeout(read_system_configs_from_yml())
+        self.client_config_map = ClientConfigAdapter(ClientConfigMap())
+
+        self.app = HummingbotApplication(client_config_map=self.client_config_map)
+        self.cli_mock_assistant = CLIMockingAssistant(self.app.app)
+        self.cli_mock_assistant.start()
+
+        # trading pairs of the strategy of each hosted configuration file
+        self.trading_pairs: Dict[str, List[str]] = {}
+        self.created_connectors: List[MagicMock] = []
+
+    def tearDown(self) -> None:
+        self.cli_mock_assistant.stop()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def create_connector(self, *_, **__) -> MagicMock:
+        connector = MagicMock()
+        self.created_connectors.append(connector)
+        return connector
+
+    def initialize_strategy(self, _: str):
+        # The configuration map mock is the path of the configuration file
+        trading_pairs = self.trading_pairs[self.app.strategy_config_map.name]
+        self.app._initialize_markets([("binance_paper_trade", trading_pairs)])
+        strategy = MagicMock()
+        strategy.active_markets = [self.app.markets["binance_paper_trade"]]
+        self.app.strategy = strategy
+
+    def initialize_hosted_strategies(self, hosted_configs: Dict[str, str]):
+        connector_settings = MagicMock(type=ConnectorType.Exchange, parent_name="binance")
+        with patch("hummingbot.client.command.host_command.load_strategy_config_map_from_file",
+                   new=AsyncMock(side_effect=lambda path: path)), \
+                patch("hummingbot.client.hummingbot_application.AllConnectorSettings.get_connector_settings",
+                      return_value={"binance_paper_trade": connector_settings}), \
+                patch("hummingbot.client.hummingbot_application.create_paper_trade_market",
+                      side_effect=self.create_connector), \
+                patch.object(self.app, "_initialize_strategy", side_effect=self.initialize_strategy) as initialize:
+            self.async_run_with_timeout(self.app._initialize_hosted_strategies(hosted_configs))
+        return initialize
+
+    @patch("hummingbot.client.command.host_command.validate_strategy_file")
+    @patch("hummingbot.client.command.host_command.load_strategy_config_map_from_file", new_callable=AsyncMock)
+    def test_load_hosted_configs(self, load_config_mock: AsyncMock, validate_mock: MagicMock):
+        validate_mock.return_value = None
+        load_config_mock.side_effect = [MagicMock(strategy="pure_market_making"), MagicMock(strategy="avellaneda_market_making")]
+
+        hosted_configs = self.async_run_with_timeout(self.app._load_hosted_configs(["conf_a", "conf_b.yml"]))
+
+        self.assertEqual({"conf_a.yml": "pure_market_making", "conf_b.yml": "avellaneda_market_making"}, hosted_configs)
+
+    @patch("hummingbot.client.command.host_command.validate_strategy_file")
+    @patch("hummingbot.client.command.host_command.load_strategy_config_map_from_file", new_callable=AsyncMock)
+    def test_load_hosted_configs_rejects_invalid_files_and_strategies(self, load_config_mock: AsyncMock,
+                                                                      validate_mock: MagicMock):
+        validate_mock.return_value = "File does not exist."
+
+        self.assertIsNone(self.async_run_with_timeout(self.app._load_hosted_configs(["conf_a.yml"])))
+        self.assertTrue(self.cli_mock_assistant.check_log_called_with(msg="conf_a.yml: File does not exist."))
+
+        validate_mock.return_value = None
+        load_config_mock.return_value = MagicMock(strategy="unknown_strategy")
+
+        self.assertIsNone(self.async_run_with_timeout(self.app._load_hosted_configs(["conf_a.yml"])))
+        self.assertTrue(self.cli_mock_assistant.check_log_called_with(
+            msg="conf_a.yml: the unknown_strategy strategy can't be hosted."))
+
+    def test_host_check_aborts_when_bot_is_running(self):
+        self.app.strategy_task = MagicMock()
+        self.app.strategy_task.done.return_value = False
+
+        self.async_run_with_timeout(self.app.host_check(["conf_a.yml"]))
+
+        self.assertTrue(self.cli_mock_assistant.check_log_called_with(
+            msg='The bot is already running - please run "stop" first'))
+
+    @patch("hummingbot.client.command.host_command.HostCommand._hosted_status_check", new_callable=AsyncMock)
+    @patch("hummingbot.client.command.host_command.HostCommand._load_hosted_configs", new_callable=AsyncMock)
+    def test_host_check_aborts_when_status_check_fails(self, load_configs_mock: AsyncMock,
+                                                       status_check_mock: AsyncMock):
+        load_configs_mock.return_value = {"conf_a.yml": "pure_market_making"}
+        status_check_mock.return_value = False
+
+        self.async_run_with_timeout(self.app.host_check(["conf_a.yml"]))
+
+        self.assertTrue(self.cli_mock_assistant.check_log_called_with(msg="Start aborted."))
+        self.assertFalse(self.app._in_start_check)
+
+    @patch("hummingbot.client.command.host_command.RateOracle")
+    @patch("hummingbot.client.command.host_command.init_logging")
+    @patch("hummingbot.client.hummingbot_application.SQLConnectionManager.get_trade_fills_instance")
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication._initialize_markets_recorder")
+    @patch("hummingbot.client.command.start_command.StartCommand.start_market_making", new_callable=AsyncMock)
+    @patch("hummingbot.client.command.host_command.HostCommand._initialize_hosted_strategies",
+           new_callable=AsyncMock)
+    @patch("hummingbot.client.command.host_command.HostCommand._hosted_status_check", new_callable=AsyncMock)
+    @patch("hummingbot.client.command.host_command.HostCommand._load_hosted_configs", new_callable=AsyncMock)
+    def test_host_check_starts_the_hosted_strategies(self, load_configs_mock: AsyncMock,
+                                                     status_check_mock: AsyncMock,
+                                                     initialize_strategies_mock: AsyncMock,
+                                                     start_market_making_mock: AsyncMock,
+                                                     initialize_recorder_mock: MagicMock, *_):
+        hosted_configs = {"conf_a.yml": "pure_market_making", "conf_b.yml": "avellaneda_market_making"}
+        load_configs_mock.return_value = hosted_configs
+        status_check_mock.return_value = True
+
+        async def initialize_strategies(_):
+            self.app.hosted_strategies = {"conf_a.yml": MagicMock(), "conf_b.yml": MagicMock()}
+        initialize_strategies_mock.side_effect = initialize_strategies
+
+        self.async_run_with_timeout(self.app.host_check(["conf_a.yml", "conf_b.yml"], name="fleet"))
+
+        initialize_strategies_mock.assert_awaited_once_with(hosted_configs)
+        initialize_recorder_mock.assert_called_once()
+        start_market_making_mock.assert_awaited_once()
+        self.assertEqual("fleet.yml", self.app.strategy_file_name)
+        self.assertEqual("fleet", self.app.strategy_name)
+        self.assertEqual(["fleet.yml", "conf_a.yml", "conf_b.yml"], self.app.strategy_config_file_paths)
+        self.assertTrue(self.cli_mock_assistant.check_log_called_with(
+            msg="\nStatus check complete. Starting 2 strategies on shared connectors..."))
+
+    @patch("hummingbot.client.command.host_command.init_logging")
+    @patch("hummingbot.client.hummingbot_application.SQLConnectionManager.get_trade_fills_instance")
+    @patch("hummingbot.client.command.start_command.StartCommand.start_market_making", new_callable=AsyncMock)
+    @patch("hummingbot.client.command.host_command.HostCommand._initialize_hosted_strategies",
+           new_callable=AsyncMock)
+    @patch("hummingbot.client.command.host_command.HostCommand._hosted_status_check", new_callable=AsyncMock)
+    @patch("hummingbot.client.command.host_command.HostCommand._load_hosted_configs", new_callable=AsyncMock)
+    def test_host_check_resets_the_hosted_strategies_when_initialization_fails(
+            self, load_configs_mock: AsyncMock, status_check_mock: AsyncMock, initialize_strategies_mock: AsyncMock,
+            start_market_making_mock: AsyncMock, *_):
+        load_configs_mock.return_value = {"conf_a.yml": "pure_market_making"}
+        status_check_mock.return_value = True
+
+        async def initialize_strategies(_):
+            self.app._order_attribution = OrderAttribution()
+            self.app.hosted_strategies = {"conf_a.yml": MagicMock()}
+            self.app.markets = {"binance_paper_trade": MagicMock()}
+            raise ValueError("The strategy configured in conf_a.yml could not be initialized.")
+        initialize_strategies_mock.side_effect = initialize_strategies
+
+        self.async_run_with_timeout(self.app.host_check(["conf_a.yml"]))
+
+        start_market_making_mock.assert_not_awaited()
+        self.assertEqual({}, self.app.hosted_strategies)
+        self.assertEqual({}, self.app.markets)
+        self.assertIsNone(self.app._order_attribution)
+        self.assertTrue(self.cli_mock_assistant.check_log_called_with(
+            msg="The strategy configured in conf_a.yml could not be initialized. Start aborted."))
+
+    def test_hosted_strategies_share_one_connector(self):
+        self.trading_pairs = {"conf_a.yml": ["ETH-USDT"], "conf_b.yml": ["ETH-USDT"]}
+
+        initialize = self.initialize_hosted_strategies({"conf_a.yml": "pure_market_making",
+                                                        "conf_b.yml": "pure_market_making"})
+
+        self.assertEqual(2, initialize.call_count)
+        self.assertEqual(1, len(self.created_connectors))
+        self.assertEqual({"binance_paper_trade": self.created_connectors[0]}, self.app.markets)
+        for file_name, strategy in self.app.hosted_strategies.items():
+            self.assertEqual([self.created_connectors[0]], strategy.active_markets)
+            strategy.set_order_attribution.assert_called_once_with(self.app._order_attribution, file_name)
+        self.assertEqual("pure_market_making", self.app._order_attribution.strategy_name("conf_b.yml"))
+
+    def test_strategies_are_initialized_again_when_their_connector_is_created_again(self):
+        self.trading_pairs = {"conf_a.yml": ["ETH-USDT"], "conf_b.yml": ["BTC-USDT"]}
+
+        initialize = self.initialize_hosted_strategies({"conf_a.yml": "pure_market_making",
+                                                        "conf_b.yml": "avellaneda_market_making"})
+
+        # The connector is created again with the trading pairs of both strategies, and the first strategy is
+        # initialized again with it
+        self.assertEqual(3, initialize.call_count)
+        self.assertEqual(2, len(self.created_connectors))
+        final_connector = self.created_connectors[-1]
+        self.assertEqual({"binance_paper_trade": final_connector}, self.app.markets)
+        self.assertEqual({"ETH-USDT", "BTC-USDT"}, self.app._hosted_trading_pairs["binance_paper_trade"])
+        for strategy in self.app.hosted_strategies.values():
+            self.assertEqual([final_connector], strategy.active_markets)
+
+    def test_initialize_hosted_strategy_raises_when_the_strategy_is_not_created(self):
+        self.app._order_attribution = OrderAttribution()
+
+        with patch("hummingbot.client.command.host_command.load_strategy_config_map_from_file",
+                   new_callable=AsyncMock), \
+                patch.object(self.app, "_initialize_strategy"):
+            with self.assertRaises(ValueError):
+                self.async_run_with_timeout(
+                    self.app._initialize_hosted_strategy("conf_a.yml", "pure_market_making"))
+
+        self.assertEqual({}, self.app.hosted_strategies)
+
+    @patch("hummingbot.client.command.stop_command.asyncio", new=MagicMock(sleep=AsyncMock()))
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication._cancel_outstanding_orders",
+           new_callable=AsyncMock)
+    def test_stop_removes_the_hosted_strategies(self, cancel_orders_mock: AsyncMock):
+        cancel_orders_mock.return_value = True
+        hosted_strategies = {"conf_a.yml": MagicMock(), "conf_b.yml": MagicMock()}
+        clock = MagicMock()
+        self.app.clock = clock
+        self.app.hosted_strategies = dict(hosted_strategies)
+        self.app._order_attribution = OrderAttribution()
+        self.app._hosted_trading_pairs = {"binance_paper_trade": {"ETH-USDT"}}
+
+        self.async_run_with_timeout(self.app.stop_loop())
+
+        for strategy in hosted_strategies.values():
+            clock.remove_iterator.assert_any_call(strategy)
+        self.assertEqual({}, self.app.hosted_strategies)
+        self.assertIsNone(self.app._order_attribution)
+        self.assertEqual({}, self.app._hosted_trading_pairs)
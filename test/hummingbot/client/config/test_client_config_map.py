@@ -0,0 +1,31 @@
+import unittest
+
+from hummingbot.client.config.client_config_map import ClientConfigMap, ConnectionPoolConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter, ConfigValidationError
+from hummingbot.core.web_assistant.connections.data_types import ConnectionPoolSettings
+
+
+class ConnectionPoolConfigMapTest(unittest.TestCase):
+
+    def test_defaults_match_the_pool_settings(self):
+        self.assertEqual(ConnectionPoolSettings(), ConnectionPoolConfigMap().build_settings())
+
+    def test_connection_pools_are_parsed_into_typed_settings(self):
+        config_map = ClientConfigAdapter(ClientConfigMap())
+        config_map.connection_pools = {
+            "binance": {"limit": 20.0, "force_close": "false", "enable_cleanup_closed": "true"},
+        }
+
+        settings = config_map.connection_pools["binance"].build_settings()
+
+        self.assertEqual(
+            ConnectionPoolSettings(limit=20, force_close=False, enable_cleanup_closed=True), settings)
+        self.assertIsInstance(settings.limit, int)
+
+    def test_unknown_or_invalid_settings_are_rejected(self):
+        config_map = ClientConfigAdapter(ClientConfigMap())
+
+        with self.assertRaises(ConfigValidationError):
+            config_map.connection_pools = {"binance": {"pipelining": 1}}
+        with self.assertRaises(ConfigValidationError):
+            config_map.connection_pools = {"binance": {"limit": -1}}
@@ -1,17 +1,20 @@
 import asyncio
 import json
 import re
+import tempfile
 from decimal import Decimal
 from typing import Any, Callable, Dict, List, Optional, Tuple
 from unittest.mock import AsyncMock, patch
 
 from aioresponses import aioresponses
 from aioresponses.core import RequestCall
+from yarl import URL
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.exchange.binance import binance_constants as CONSTANTS, binance_web_utils as web_utils
 from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
+from hummingbot.connector.exchange_info_cache import ExchangeInfoCache
 from hummingbot.connector.test_support.exchange_connector_test import AbstractExchangeConnectorTests
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
@@ -1227,6 +1230,78 @@ class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
 
         self.assertEqual(result[0].min_notional_size, Decimal("10"))
 
+    @aioresponses()
+    def test_all_trading_pairs_from_exchange_info_cache(self, mock_api):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            self.exchange._exchange_info_cache = ExchangeInfoCache(self.exchange.name, ttl=60, cache_dir=cache_dir)
+            self.exchange._set_trading_pair_symbol_map(None)
+            self.configure_all_symbols_response(mock_api=mock_api)
+
+            all_trading_pairs = self.async_run_with_timeout(coroutine=self.exchange.all_trading_pairs())
+            self.assertEqual(self.exchange.exchange_info_cache.symbol_map(),
+                             {self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset): self.trading_pair})
+
+            self.exchange._set_trading_pair_symbol_map(None)
+            # The symbol map is taken from the cache, without requesting the exchange info again
+            cached_trading_pairs = self.async_run_with_timeout(coroutine=self.exchange.all_trading_pairs())
+
+            self.assertEqual(all_trading_pairs, cached_trading_pairs)
+            self.assertEqual(1, len(mock_api.requests))
+
+    @aioresponses()
+    def test_load_trading_rules_from_exchange_info_cache(self, mock_api):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            self.exchange._exchange_info_cache = ExchangeInfoCache(self.exchange.name, ttl=60, cache_dir=cache_dir)
+            self.configure_trading_rules_response(mock_api=mock_api)
+            self.async_run_with_timeout(coroutine=self.exchange._update_trading_rules())
+            self.async_run_with_timeout(coroutine=self.exchange._save_exchange_info_to_cache())
+
+            self.exchange._trading_rules.clear()
+            self.exchange._set_trading_pair_symbol_map(None)
+            refresh_delay = self.exchange._load_exchange_info_from_cache()
+
+            self.assertAlmostEqual(self.exchange.TRADING_RULES_INTERVAL, refresh_delay, delta=5)
+            self.assertEqual(repr(self.expected_trading_rule), repr(self.exchange.trading_rules[self.trading_pair]))
+            self.assertTrue(self.exchange.trading_pair_symbol_map_ready())
+
+    def test_load_exchange_info_from_cache_when_disabled(self):
+        self.assertIsNone(self.exchange.exchange_info_cache)
+        self.assertEqual(0, self.exchange._load_exchange_info_from_cache())
+
+    def test_order_books_depth_capped_by_client_configuration(self):
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.order_book_max_depth = {"binance": 100}
+        exchange = BinanceExchange(
+            client_config_map=client_config_map,
+            binance_api_key="testAPIKey",
+            binance_api_secret="testSecret",
+            trading_pairs=[self.trading_pair],
+        )
+
+        self.assertEqual(100, exchange.order_book_tracker.data_source.order_book_create_function().max_depth)
+        self.assertEqual(0, self.exchange.order_book_tracker.data_source.order_book_create_function().max_depth)
+
+    @aioresponses()
+    def test_connections_pre_warmed_on_start_with_client_configuration(self, mock_api):
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.connection_pools = {"binance": {"limit": 20, "pre_warm_connections": 2}}
+        exchange = BinanceExchange(
+            client_config_map=client_config_map,
+            binance_api_key="testAPIKey",
+            binance_api_secret="testSecret",
+            trading_pairs=[self.trading_pair],
+            trading_required=False,
+        )
+        mock_api.head(self.network_status_url, status=200, repeat=True)
+
+        with patch.object(exchange.order_book_tracker, "start"):
+            self.async_run_with_timeout(exchange.start_network())
+            self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.assertEqual(2, len(mock_api.requests[("HEAD", URL(self.network_status_url))]))
+        self.assertEqual(20, exchange.connection_pool_stats["limit"])
+        self.assertEqual({}, self.exchange.connection_pool_stats)
+
     def _validate_auth_credentials_taking_parameters_from_argument(self,
                                                                    request_call_tuple: RequestCall,
                                                                    params: Dict[str, Any]):
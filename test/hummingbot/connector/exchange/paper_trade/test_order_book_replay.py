@@ -0,0 +1,125 @@
+import tempfile
+from decimal import Decimal
+from unittest import TestCase
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.paper_trade import create_replay_paper_trade_market
+from hummingbot.connector.exchange.paper_trade.order_book_replay import (
+    OrderBookReplayIterator,
+    ReplayOrderBookTracker,
+    recording_files_for_pair,
+)
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecorder
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent
+
+
+class OrderBookReplayTests(TestCase):
+    # 2024-01-01 00:00:00 UTC
+    start_timestamp = 1704067200.0
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.trading_pair = "COINALPHA-HBOT"
+        self._record_market()
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def _record_market(self):
+        recorder = OrderBookRecorder(connector_name="binance", base_path=self.temp_dir.name, keyframe_interval=60)
+        order_book = OrderBook()
+        messages = [
+            OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+                "trading_pair": self.trading_pair,
+                "update_id": 1,
+                "bids": [["10", "1"], ["9", "2"]],
+                "asks": [["11", "1"], ["12", "2"]],
+            }, timestamp=self.start_timestamp),
+            OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": self.trading_pair,
+                "update_id": 2,
+                "bids": [["10", "0"], ["9.8", "4"]],
+                "asks": [],
+            }, timestamp=self.start_timestamp + 5),
+        ]
+        for message in messages:
+            if message.type is OrderBookMessageType.SNAPSHOT:
+                order_book.apply_snapshot(message.bids, message.asks, message.update_id)
+            else:
+                order_book.apply_diffs(message.bids, message.asks, message.update_id)
+            recorder.record_order_book(self.trading_pair, order_book, message)
+        recorder.record_trade(OrderBookMessage(OrderBookMessageType.TRADE, {
+            "trading_pair": self.trading_pair,
+            "trade_type": float(TradeType.SELL.value),
+            "trade_id": 1,
+            "update_id": 3,
+            "price": "9.4",
+            "amount": "5",
+        }, timestamp=self.start_timestamp + 8))
+        recorder.close()
+
+    def _create_market(self):
+        return create_replay_paper_trade_market(
+            exchange_name="binance",
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            trading_pairs=[self.trading_pair],
+            recordings_path=self.temp_dir.name,
+            start_time=self.start_timestamp,
+            end_time=self.start_timestamp + 60)
+
+    def test_recording_files_for_pair(self):
+        files = recording_files_for_pair(
+            self.temp_dir.name, "binance", self.trading_pair, self.start_timestamp, self.start_timestamp + 60)
+        self.assertEqual(1, len(files))
+
+        files = recording_files_for_pair(
+            self.temp_dir.name, "binance", self.trading_pair, self.start_timestamp + 24 * 60 * 60)
+        self.assertEqual([], files)
+
+    def test_tracker_advances_books_with_recorded_messages(self):
+        market = self._create_market()
+        tracker: ReplayOrderBookTracker = market.order_book_tracker
+
+        tracker.start()
+        self.assertTrue(tracker.ready)
+        order_book = tracker.order_books[self.trading_pair]
+        self.assertEqual(10, order_book.get_price(False))
+
+        tracker.advance_to(self.start_timestamp + 5)
+        self.assertEqual(9.8, order_book.get_price(False))
+        self.assertFalse(tracker.replay_finished)
+
+        tracker.advance_to(self.start_timestamp + 10)
+        self.assertEqual(9.4, order_book.last_trade_price)
+        self.assertTrue(tracker.replay_finished)
+        self.assertEqual(3, tracker.replayed_messages_count)
+
+    def test_backtest_fills_limit_order_with_recorded_trade(self):
+        market = self._create_market()
+        market.set_balance("COINALPHA", Decimal("10"))
+        market.set_balance("HBOT", Decimal("1000"))
+        fills_logger = EventLogger()
+        market.add_listener(MarketEvent.OrderFilled, fills_logger)
+
+        clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.start_timestamp + 60)
+        clock.add_iterator(OrderBookReplayIterator(market.order_book_tracker))
+        clock.add_iterator(market)
+
+        clock.backtest_til(self.start_timestamp + 1)
+        self.assertTrue(market.ready)
+        order_id = market.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("9.5"))
+
+        clock.backtest()
+
+        self.assertEqual(1, len(fills_logger.event_log))
+        self.assertEqual(order_id, fills_logger.event_log[0].order_id)
+        # The clock stops once every recorded message has been replayed
+        self.assertEqual(self.start_timestamp + 8, clock.current_timestamp)
@@ -0,0 +1,101 @@
+import json
+import os
+import tempfile
+from decimal import Decimal
+from unittest import TestCase
+from unittest.mock import patch
+
+from hummingbot.connector.exchange_info_cache import (
+    CACHE_VERSION,
+    SYMBOL_MAP_SECTION,
+    TRADING_RULES_SECTION,
+    ExchangeInfoCache,
+)
+from hummingbot.connector.trading_rule import TradingRule
+
+
+class ExchangeInfoCacheTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = ExchangeInfoCache("binance", ttl=60, cache_dir=self.temp_dir.name)
+        self.trading_rule = TradingRule(
+            trading_pair="COINALPHA-HBOT",
+            min_order_size=Decimal("0.01"),
+            min_price_increment=Decimal("0.0001"),
+            min_base_amount_increment=Decimal("0.01"),
+            min_notional_size=Decimal("10"),
+            supports_market_orders=False,
+        )
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def test_nothing_cached(self):
+        self.assertIsNone(self.cache.symbol_map())
+        self.assertIsNone(self.cache.trading_rules())
+        self.assertIsNone(self.cache.age(SYMBOL_MAP_SECTION))
+
+    def test_save_and_load_sections(self):
+        self.cache.save_symbol_map({"COINALPHAHBOT": "COINALPHA-HBOT"})
+        self.cache.save_trading_rules([self.trading_rule])
+
+        cache = ExchangeInfoCache("binance", ttl=60, cache_dir=self.temp_dir.name)
+        trading_rules = cache.trading_rules()
+
+        self.assertEqual({"COINALPHAHBOT": "COINALPHA-HBOT"}, cache.symbol_map())
+        self.assertEqual(1, len(trading_rules))
+        self.assertEqual(repr(self.trading_rule), repr(trading_rules[0]))
+        self.assertLess(cache.age(TRADING_RULES_SECTION), 5)
+
+    def test_writers_use_their_own_temporary_file(self):
+        other_cache = ExchangeInfoCache("binance", ttl=60, cache_dir=self.temp_dir.name)
+        temp_file_names = []
+        with patch("hummingbot.connector.exchange_info_cache.os.replace",
+                   side_effect=lambda source, destination: temp_file_names.append(source)):
+            self.cache.save_symbol_map({"COINALPHAHBOT": "COINALPHA-HBOT"})
+            other_cache.save_symbol_map({"COINALPHAHBOT": "COINALPHA-HBOT"})
+
+        self.assertEqual(2, len(set(temp_file_names)))
+
+    @patch("hummingbot.connector.exchange_info_cache.os.replace", side_effect=OSError("Disk full"))
+    def test_temporary_file_is_removed_when_the_write_fails(self, _):
+        self.cache.save_symbol_map({"COINALPHAHBOT": "COINALPHA-HBOT"})
+
+        self.assertEqual([], os.listdir(self.temp_dir.name))
+
+    @patch("hummingbot.connector.exchange_info_cache.time.time")
+    def test_expired_sections_are_not_used(self, time_mock):
+        time_mock.return_value = 1000
+        self.cache.save_symbol_map({"COINALPHAHBOT": "COINALPHA-HBOT"})
+        time_mock.return_value = 1050
+        self.cache.save_trading_rules([self.trading_rule])
+
+        time_mock.return_value = 1070
+
+        self.assertIsNone(self.cache.symbol_map())
+        self.assertEqual(1, len(self.cache.trading_rules()))
+        self.assertEqual(70, self.cache.age(SYMBOL_MAP_SECTION))
+
+    def test_cache_with_other_version_is_ignored(self):
+        self.cache.save_symbol_map({"COINALPHAHBOT": "COINALPHA-HBOT"})
+        with open(self.cache.file_path) as cache_file:
+            content = json.load(cache_file)
+        content["version"] = CACHE_VERSION + 1
+        with open(self.cache.file_path, "w") as cache_file:
+            json.dump(content, cache_file)
+
+        self.assertIsNone(self.cache.symbol_map())
+
+    def test_unreadable_cache_is_ignored(self):
+        self.cache.file_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.cache.file_path, "w") as cache_file:
+            cache_file.write("{not json")
+
+        with self.assertLogs("hummingbot.connector.exchange_info_cache", level="WARNING"):
+            self.assertIsNone(self.cache.symbol_map())
+
+        self.cache.save_symbol_map({"COINALPHAHBOT": "COINALPHA-HBOT"})
+        self.assertEqual({"COINALPHAHBOT": "COINALPHA-HBOT"}, self.cache.symbol_map())
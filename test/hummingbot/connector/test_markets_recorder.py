@@ -1,7 +1,7 @@
 import asyncio
 import time
 from decimal import Decimal
-from typing import Awaitable
+from typing import Awaitable, Optional
 from unittest import TestCase
 from unittest.mock import MagicMock, PropertyMock, patch
 
@@ -18,15 +18,22 @@ from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
     BuyOrderCreatedEvent,
     MarketEvent,
+    OrderCancelledEvent,
     OrderFilledEvent,
     SellOrderCreatedEvent,
 )
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.market_data import MarketData
+from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.strategy.order_attribution import OrderAttribution
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
+from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.models.executors import CloseType
+from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 
 
 class MarketsRecorderTests(TestCase):
@@ -85,6 +92,45 @@ class MarketsRecorderTests(TestCase):
     def add_exchange_order_ids_from_market_recorder(self, current_exchange_order_ids):
         pass
 
+    def create_recorder(self) -> MarketsRecorder:
+        return MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+        )
+
+    @staticmethod
+    def create_mock_executor(executor_id: str, controller_id: str, timestamp: float, net_pnl_quote: Decimal,
+                             filled_amount_quote: Decimal, close_type: Optional[CloseType]) -> MagicMock:
+        config = PositionExecutorConfig(id=executor_id, timestamp=timestamp, trading_pair="ETH-USDT",
+                                        connector_name="binance", side=TradeType.BUY, entry_price=Decimal("100"),
+                                        amount=Decimal("1"), controller_id=controller_id)
+        executor = MagicMock()
+        executor.config = config
+        executor.executor_info = ExecutorInfo(
+            id=executor_id,
+            controller_id=controller_id,
+            type="position_executor",
+            status=RunnableStatus.TERMINATED if close_type else RunnableStatus.RUNNING,
+            timestamp=timestamp,
+            close_type=close_type,
+            config=config,
+            net_pnl_pct=Decimal(0),
+            net_pnl_quote=net_pnl_quote,
+            cum_fees_quote=Decimal(0),
+            filled_amount_quote=filled_amount_quote,
+            is_active=close_type is None,
+            is_trading=False,
+            custom_info={},
+        )
+        return executor
+
     def test_properties(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -394,6 +440,98 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(MarketEvent.BuyOrderCompleted.name, order_status[1].status)
         self.assertEqual(0, len(trade_fills))
 
+    def test_order_events_recorded_under_the_strategy_that_created_the_order(self):
+        order_attribution = OrderAttribution()
+        order_attribution.add_strategy("conf_pure_mm_1.yml", "pure_market_making")
+        order_attribution.register_order("OID1", "conf_pure_mm_1.yml")
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+            order_attribution=order_attribution,
+        )
+
+        for order_id in ("OID1", "OID2"):
+            recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, BuyOrderCreatedEvent(
+                timestamp=1642010000,
+                type=OrderType.LIMIT,
+                trading_pair=self.trading_pair,
+                amount=Decimal(1),
+                price=Decimal(1000),
+                order_id=order_id,
+                creation_timestamp=1640001112.223,
+                exchange_order_id=f"E{order_id}",
+            ))
+            recorder._did_fill_order(MarketEvent.OrderFilled.value, self, OrderFilledEvent(
+                timestamp=1642020000,
+                order_id=order_id,
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                order_type=OrderType.LIMIT,
+                price=Decimal(1010),
+                amount=Decimal(1),
+                trade_fee=AddedToCostTradeFee(),
+                exchange_trade_id=f"T{order_id}",
+            ))
+
+        with self.manager.get_new_session() as session:
+            orders = {order.id: (order.config_file_path, order.strategy) for order in session.query(Order).all()}
+            trade_fills = {trade_fill.order_id: (trade_fill.config_file_path, trade_fill.strategy)
+                           for trade_fill in session.query(TradeFill).all()}
+
+        self.assertEqual(("conf_pure_mm_1.yml", "pure_market_making"), orders["OID1"])
+        self.assertEqual(("conf_pure_mm_1.yml", "pure_market_making"), trade_fills["OID1"])
+        self.assertEqual((self.config_file_path, self.strategy_name), orders["OID2"])
+        self.assertEqual((self.config_file_path, self.strategy_name), trade_fills["OID2"])
+
+    def test_complete_orders_can_be_forgotten_by_the_order_attribution(self):
+        order_attribution = OrderAttribution(max_orders=1)
+        order_attribution.add_strategy("conf_pure_mm_1.yml", "pure_market_making")
+        order_attribution.register_order("OID1", "conf_pure_mm_1.yml")
+        order_attribution.register_order("OID2", "conf_pure_mm_1.yml")
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+            order_attribution=order_attribution,
+        )
+
+        recorder._did_cancel_order(MarketEvent.OrderCancelled.value, self, OrderCancelledEvent(
+            timestamp=1642010000, order_id="OID1"))
+
+        self.assertIsNone(order_attribution.owner("OID1"))
+        self.assertEqual("conf_pure_mm_1.yml", order_attribution.owner("OID2"))
+
+    def test_restore_latest_market_states_of_hosted_strategies(self):
+        recorder = self.create_recorder()
+        with self.manager.get_new_session() as session:
+            with session.begin():
+                for config_file_path, timestamp in (("conf_pure_mm_1.yml", 1000), ("conf_pure_mm_2.yml", 2000),
+                                                    ("conf_other.yml", 3000)):
+                    session.add(MarketState(config_file_path=config_file_path,
+                                            market=self.display_name,
+                                            timestamp=timestamp,
+                                            saved_state={"order": config_file_path}))
+        market = MagicMock()
+        market.display_name = self.display_name
+
+        recorder.restore_latest_market_states([self.config_file_path, "conf_pure_mm_1.yml", "conf_pure_mm_2.yml"],
+                                              market)
+
+        market.restore_tracking_states.assert_called_once_with({"order": "conf_pure_mm_2.yml"})
+
     @patch("hummingbot.connector.markets_recorder.MarketsRecorder._sleep")
     def test_market_data_collection_enabled(self, sleep_mock):
         sleep_mock.side_effect = [0.1, asyncio.CancelledError]
@@ -434,3 +572,65 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(market_data[0].best_ask, Decimal("101"))
         self.assertEqual(market_data[0].best_bid, Decimal("99"))
         self.assertEqual(market_data[0].mid_price, Decimal("100"))
+
+    def test_store_executors_updates_controller_performance(self):
+        recorder = self.create_recorder()
+        recorder.store_or_update_executor(self.create_mock_executor(
+            "1", "controller_1", 10, Decimal("5"), Decimal("100"), CloseType.TAKE_PROFIT))
+        recorder.store_or_update_executor(self.create_mock_executor(
+            "2", "controller_1", 20, Decimal("-2"), Decimal("50"), CloseType.STOP_LOSS))
+        recorder.store_or_update_executor(self.create_mock_executor(
+            "3", "controller_2", 30, Decimal("1"), Decimal("10"), None))
+
+        performance = recorder.get_controllers_performance()
+
+        self.assertEqual({"controller_1", "controller_2"}, set(performance))
+        self.assertEqual(Decimal("3"), performance["controller_1"].realized_pnl_quote)
+        self.assertEqual(Decimal("150"), performance["controller_1"].volume_traded)
+        self.assertEqual({CloseType.TAKE_PROFIT: 1, CloseType.STOP_LOSS: 1},
+                         performance["controller_1"].close_type_counts)
+        self.assertEqual(Decimal("1"), performance["controller_2"].realized_pnl_quote)
+        self.assertEqual({}, performance["controller_2"].close_type_counts)
+
+    def test_update_executor_replaces_its_contribution_to_controller_performance(self):
+        recorder = self.create_recorder()
+        recorder.store_or_update_executor(self.create_mock_executor(
+            "1", "controller_1", 10, Decimal("1"), Decimal("10"), None))
+        recorder.store_or_update_executor(self.create_mock_executor(
+            "1", "controller_1", 10, Decimal("4"), Decimal("40"), CloseType.TAKE_PROFIT))
+
+        performance = recorder.get_controllers_performance()["controller_1"]
+
+        self.assertEqual(Decimal("4"), performance.realized_pnl_quote)
+        self.assertEqual(Decimal("40"), performance.volume_traded)
+        self.assertEqual({CloseType.TAKE_PROFIT: 1}, performance.close_type_counts)
+        self.assertEqual(1, len(recorder.get_all_executors()))
+        self.assertEqual(CloseType.TAKE_PROFIT, recorder.get_all_executors()[0].close_type)
+
+    def test_get_executors_by_controller_in_pages(self):
+        recorder = self.create_recorder()
+        for index in range(5):
+            recorder.store_or_update_executor(self.create_mock_executor(
+                str(index), "controller_1", 10 + index, Decimal("1"), Decimal("10"), CloseType.TAKE_PROFIT))
+        recorder.store_or_update_executor(self.create_mock_executor(
+            "other", "controller_2", 1, Decimal("1"), Decimal("10"), CloseType.TAKE_PROFIT))
+
+        all_executors = recorder.get_executors_by_controller("controller_1")
+        second_page = recorder.get_executors_by_controller("controller_1", limit=2, offset=2)
+
+        self.assertEqual(["0", "1", "2", "3", "4"], [executor.id for executor in all_executors])
+        self.assertEqual(["2", "3"], [executor.id for executor in second_page])
+
+    def test_iter_executors_loads_all_pages(self):
+        recorder = self.create_recorder()
+        for index in range(5):
+            recorder.store_or_update_executor(self.create_mock_executor(
+                str(index), "controller_1", 10, Decimal("1"), Decimal("10"), CloseType.TAKE_PROFIT))
+        recorder.store_or_update_executor(self.create_mock_executor(
+            "other", "controller_2", 1, Decimal("1"), Decimal("10"), CloseType.TAKE_PROFIT))
+
+        controller_executors = list(recorder.iter_executors(controller_id="controller_1", page_size=2))
+        all_executors = list(recorder.iter_executors(page_size=2))
+
+        self.assertEqual(["0", "1", "2", "3", "4"], [executor.id for executor in controller_executors])
+        self.assertEqual(["other", "0", "1", "2", "3", "4"], [executor.id for executor in all_executors])
@@ -75,3 +75,22 @@ class TimeSynchronizerTests(TestCase):
         calculated_offset = numpy.mean([calculated_median, calculated_weighted_average])
 
         self.assertEqual(calculated_offset + seconds_difference_when_calculating_current_time, synchronized_time)
+
+    def test_time_offset_calculated_only_when_samples_change(self):
+        time_provider = TimeSynchronizer()
+        time_provider.add_time_offset_ms_sample(1000)
+        time_provider.add_time_offset_ms_sample(3000)
+
+        with patch("hummingbot.connector.time_synchronizer.numpy.median") as median_mock:
+            first_offset = time_provider.time_offset_ms
+            second_offset = time_provider.time_offset_ms
+
+        median_mock.assert_not_called()
+        self.assertEqual(first_offset, second_offset)
+        self.assertEqual(numpy.mean([2000, (1000 + 3000 * 3) / 4]), first_offset)
+
+        time_provider.add_time_offset_ms_sample(5000)
+        self.assertEqual(numpy.mean([3000, (1000 + 3000 * 3 + 5000 * 5) / 9]), time_provider.time_offset_ms)
+
+        time_provider.clear_time_offset_ms_samples()
+        self.assertNotEqual(first_offset, time_provider.time_offset_ms)
@@ -0,0 +1,176 @@
+import gc
+import itertools
+import math
+import random
+import unittest
+from unittest.mock import patch
+
+from hummingbot.core.data_type.consolidated_order_book import ConsolidatedOrderBook, ConsolidatedOrderBookRow
+from hummingbot.core.data_type.flat_order_book import FlatOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+
+class ReadCountingOrderBook(FlatOrderBook):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.reads = 0
+
+    def bid_entries(self):
+        self.reads += 1
+        return super().bid_entries()
+
+    def ask_entries(self):
+        self.reads += 1
+        return super().ask_entries()
+
+
+class ConsolidatedOrderBookUnitTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.venue_a = OrderBook()
+        self.venue_a.apply_snapshot([OrderBookRow(99, 1, 1), OrderBookRow(98, 2, 1)],
+                                    [OrderBookRow(101, 1, 1), OrderBookRow(103, 2, 1)], 1)
+        self.venue_b = FlatOrderBook()
+        self.venue_b.apply_snapshot([OrderBookRow(100, 3, 1), OrderBookRow(97, 1, 1)],
+                                    [OrderBookRow(102, 3, 1), OrderBookRow(104, 1, 1)], 1)
+        self.consolidated = ConsolidatedOrderBook()
+        self.consolidated.add_venue("venue_a", self.venue_a)
+        self.consolidated.add_venue("venue_b", self.venue_b)
+
+    def test_levels_merged_with_venue_attribution(self):
+        self.assertEqual(["venue_a", "venue_b"], self.consolidated.venues)
+        self.assertEqual([ConsolidatedOrderBookRow(100, 3, "venue_b", 100),
+                          ConsolidatedOrderBookRow(99, 1, "venue_a", 99),
+                          ConsolidatedOrderBookRow(98, 2, "venue_a", 98),
+                          ConsolidatedOrderBookRow(97, 1, "venue_b", 97)],
+                         list(self.consolidated.bid_entries()))
+        self.assertEqual([101, 102, 103, 104], [row.price for row in self.consolidated.ask_entries()])
+        self.assertEqual(101, self.consolidated.get_price(True))
+        self.assertEqual(100, self.consolidated.get_price(False))
+
+    def test_venue_updates_applied(self):
+        self.venue_a.apply_diffs([OrderBookRow(100.5, 2, 2), OrderBookRow(99, 0, 2)], [OrderBookRow(101, 4, 2)], 2)
+        self.venue_b.apply_snapshot([OrderBookRow(96, 1, 3)], [OrderBookRow(100.8, 1, 3)], 3)
+
+        self.assertEqual([(100.5, 2, "venue_a"), (98, 2, "venue_a"), (96, 1, "venue_b")],
+                         [(row.price, row.amount, row.venue) for row in self.consolidated.bid_entries()])
+        self.assertEqual([(100.8, 1, "venue_b"), (101, 4, "venue_a"), (103, 2, "venue_a")],
+                         [(row.price, row.amount, row.venue) for row in self.consolidated.ask_entries()])
+
+    def test_fee_and_conversion_rate_adjustments(self):
+        self.consolidated.set_venue_adjustments("venue_b", taker_fee=0.01, conversion_rate=2)
+
+        bids = list(self.consolidated.bid_entries())
+        self.assertEqual(("venue_b", 100), (bids[0].venue, bids[0].venue_price))
+        self.assertAlmostEqual(198, bids[0].price)
+        self.assertEqual(99, bids[2].price)
+        asks = list(self.consolidated.ask_entries())
+        self.assertEqual([("venue_a", 101), ("venue_a", 103), ("venue_b", 102), ("venue_b", 104)],
+                         [(row.venue, row.venue_price) for row in asks])
+        self.assertAlmostEqual(102 * 2 * 1.01, asks[2].price)
+
+        # The adjustments apply to the levels of later updates too
+        self.venue_b.apply_diffs([], [OrderBookRow(50, 1, 2)], 2)
+        self.assertAlmostEqual(101, self.consolidated.get_price(True))
+        self.assertAlmostEqual(50 * 2 * 1.01, list(self.consolidated.ask_entries())[1].price)
+
+    def test_vwap_for_volume_across_venues(self):
+        result = self.consolidated.get_vwap_for_volume(True, 3)
+
+        self.assertEqual(3, result.result_volume)
+        self.assertAlmostEqual((101 + 102 * 2) / 3, result.result_price)
+        self.assertEqual({"venue_a": 1, "venue_b": 2}, result.venue_volumes)
+        self.assertEqual({"venue_a": 101, "venue_b": 102}, result.venue_prices)
+
+        result = self.consolidated.get_vwap_for_volume(False, 10)
+        self.assertTrue(math.isnan(result.result_price))
+        self.assertEqual(7, result.result_volume)
+
+    def test_remove_venue(self):
+        self.consolidated.remove_venue("venue_b")
+        self.venue_b.apply_diffs([OrderBookRow(100.5, 1, 2)], [], 2)
+
+        self.assertEqual(["venue_a"], self.consolidated.venues)
+        self.assertEqual([99, 98], [row.price for row in self.consolidated.bid_entries()])
+        self.assertEqual([101, 103], [row.price for row in self.consolidated.ask_entries()])
+
+        self.consolidated.remove_venue("venue_a")
+        self.assertRaises(EnvironmentError, self.consolidated.get_price, True)
+
+    def test_no_update_events_after_the_consolidated_book_is_gone(self):
+        self.consolidated = None
+        gc.collect()
+
+        with patch("hummingbot.core.data_type.order_book.OrderBookUpdateEvent") as update_event_mock:
+            self.venue_a.apply_diffs([OrderBookRow(100.5, 2, 2)], [], 2)
+            self.venue_a.apply_diffs([OrderBookRow(100.6, 2, 3)], [], 3)
+
+        update_event_mock.assert_not_called()
+
+    def test_depth_limits_merged_levels(self):
+        consolidated = ConsolidatedOrderBook(depth=1)
+        consolidated.add_venue("venue_a", self.venue_a)
+        consolidated.add_venue("venue_b", self.venue_b)
+
+        self.assertEqual([100, 99], [row.price for row in consolidated.bid_entries()])
+        self.venue_a.apply_diffs([OrderBookRow(99, 0, 2)], [], 2)
+        self.assertEqual([100, 98], [row.price for row in consolidated.bid_entries()])
+        self.assertRaises(ValueError, consolidated.add_venue, "venue_a", self.venue_a)
+
+    def test_diffs_applied_without_reading_venue_book(self):
+        venue = ReadCountingOrderBook()
+        venue.apply_snapshot([OrderBookRow(99, 1, 1), OrderBookRow(98, 2, 1)], [OrderBookRow(101, 1, 1)], 1)
+        consolidated = ConsolidatedOrderBook(depth=3)
+        consolidated.add_venue("venue", venue)
+        self.assertEqual(2, venue.reads)
+
+        venue.apply_diffs([OrderBookRow(100, 1, 2), OrderBookRow(98, 5, 2), OrderBookRow(99, 0, 2)],
+                          [OrderBookRow(102, 3, 2)], 2)
+        venue.apply_diffs([OrderBookRow(97, 1, 3)], [], 3)
+
+        self.assertEqual(2, venue.reads)
+        self.assertEqual([(100, 1), (98, 5), (97, 1)],
+                         [(row.price, row.amount) for row in consolidated.bid_entries()])
+        self.assertEqual([101, 102], [row.price for row in consolidated.ask_entries()])
+
+        # The side holds `depth` levels, the level moving into them is read from the venue book
+        venue.apply_diffs([OrderBookRow(96, 1, 4)], [], 4)
+        venue.apply_diffs([OrderBookRow(100, 0, 5)], [], 5)
+        self.assertEqual(3, venue.reads)
+        self.assertEqual([98, 97, 96], [row.price for row in consolidated.bid_entries()])
+
+        venue.apply_snapshot([OrderBookRow(90, 1, 6)], [OrderBookRow(91, 1, 6)], 6)
+        self.assertEqual(5, venue.reads)
+        self.assertEqual([90], [row.price for row in consolidated.bid_entries()])
+
+    def test_crossed_levels_removed_by_venue_book(self):
+        self.venue_a.apply_diffs([OrderBookRow(102, 1, 2)], [], 2)
+
+        self.assertEqual([(102, "venue_a"), (100, "venue_b"), (99, "venue_a")],
+                         [(row.price, row.venue) for row in itertools.islice(self.consolidated.bid_entries(), 3)])
+        self.assertEqual([(102, "venue_b"), (103, "venue_a")],
+                         [(row.price, row.venue) for row in itertools.islice(self.consolidated.ask_entries(), 2)])
+
+    def test_levels_match_venue_books_after_random_diffs(self):
+        rng = random.Random(42)
+        consolidated = ConsolidatedOrderBook(depth=5)
+        venues = {"order_book": OrderBook(), "flat": FlatOrderBook(), "capped": FlatOrderBook(max_depth=8)}
+        for name, venue in venues.items():
+            venue.apply_snapshot([OrderBookRow(100 - i, 1, 1) for i in range(1, 10)],
+                                 [OrderBookRow(100 + i, 1, 1) for i in range(1, 10)], 1)
+            consolidated.add_venue(name, venue)
+
+        for update_id in range(2, 500):
+            venue = venues[rng.choice(list(venues))]
+            bids = [OrderBookRow(rng.randint(85, 101), rng.choice([0, 0, 1, 2]), update_id) for _ in range(3)]
+            asks = [OrderBookRow(rng.randint(99, 115), rng.choice([0, 0, 1, 2]), update_id) for _ in range(3)]
+            venue.apply_diffs(bids, asks, update_id)
+
+            expected = ConsolidatedOrderBook(depth=5)
+            for name, venue in venues.items():
+                expected.add_venue(name, venue)
+            self.assertEqual(list(expected.bid_entries()), list(consolidated.bid_entries()))
+            self.assertEqual(list(expected.ask_entries()), list(consolidated.ask_entries()))
@@ -0,0 +1,70 @@
+import unittest
+
+import numpy as np
+
+from hummingbot.core.data_type.flat_order_book import FlatOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+
+class FlatOrderBookUnitTest(unittest.TestCase):
+
+    @staticmethod
+    def random_rows(random: np.random.Generator, count: int, center: float, update_id: int, zero_ratio: float = 0.3):
+        prices = np.round(center + random.normal(0, 20, size=count)).astype(float)
+        amounts = np.where(random.random(count) < zero_ratio, 0.0, np.round(random.uniform(0.1, 5, size=count), 2))
+        return [OrderBookRow(price, amount, update_id) for price, amount in zip(prices, amounts)]
+
+    def replay(self, order_books, diffs_count: int = 500, seed: int = 7):
+        random = np.random.default_rng(seed)
+        snapshot_bids = self.random_rows(random, 200, 950, 1, zero_ratio=0)
+        snapshot_asks = self.random_rows(random, 200, 1050, 1, zero_ratio=0)
+        for order_book in order_books:
+            order_book.apply_snapshot(snapshot_bids, snapshot_asks, 1)
+        self.assert_same_books(*order_books)
+
+        for update_id in range(2, diffs_count + 2):
+            # Mid price drifting so the diffs sometimes cross the book
+            center = 1000 + 30 * np.sin(update_id / 40)
+            bids = self.random_rows(random, 5, center - 40, update_id)
+            asks = self.random_rows(random, 5, center + 40, update_id)
+            for order_book in order_books:
+                order_book.apply_diffs(bids, asks, update_id)
+            self.assert_same_books(*order_books)
+
+    def assert_same_books(self, order_book, flat_order_book):
+        self.assertEqual(list(order_book.bid_entries()), list(flat_order_book.bid_entries()))
+        self.assertEqual(list(order_book.ask_entries()), list(flat_order_book.ask_entries()))
+        self.assertEqual(order_book.snapshot_required, flat_order_book.snapshot_required)
+        for is_buy in (True, False):
+            if len(list(order_book.ask_entries() if is_buy else order_book.bid_entries())) == 0:
+                self.assertRaises(EnvironmentError, flat_order_book.get_price, is_buy)
+                continue
+            self.assertEqual(order_book.get_price(is_buy), flat_order_book.get_price(is_buy))
+            np.testing.assert_equal(order_book.get_vwap_for_volume(is_buy, 25).result_price,
+                                    flat_order_book.get_vwap_for_volume(is_buy, 25).result_price)
+
+    def test_same_book_as_set_based_order_book(self):
+        self.replay([OrderBook(), FlatOrderBook()])
+
+    def test_same_book_as_set_based_order_book_dex(self):
+        self.replay([OrderBook(dex=True), FlatOrderBook(dex=True)])
+
+    def test_same_book_as_set_based_order_book_depth_capped(self):
+        self.replay([OrderBook(max_depth=30), FlatOrderBook(max_depth=30)], diffs_count=2000)
+
+    def test_update_and_removal_of_levels(self):
+        order_book = FlatOrderBook()
+        order_book.apply_snapshot([OrderBookRow(99, 1, 1), OrderBookRow(98, 1, 1), OrderBookRow(99, 3, 1)],
+                                  [OrderBookRow(101, 1, 1)], 1)
+
+        # The first entry of a price is kept, as in the set based book
+        self.assertEqual([OrderBookRow(99, 1, 1), OrderBookRow(98, 1, 1)], list(order_book.bid_entries()))
+
+        order_book.apply_diffs([OrderBookRow(98, 2, 2), OrderBookRow(99, 0, 2), OrderBookRow(97, 1, 2)],
+                               [OrderBookRow(101, 0, 2)], 2)
+
+        self.assertEqual([OrderBookRow(98, 2, 2), OrderBookRow(97, 1, 2)], list(order_book.bid_entries()))
+        self.assertEqual(98, order_book.get_price(False))
+        self.assertRaises(EnvironmentError, order_book.get_price, True)
+        self.assertGreater(order_book.memory_usage, 0)
@@ -2,9 +2,11 @@
 
 import logging
 import unittest
-from hummingbot.core.data_type.order_book import OrderBook
+
 import numpy as np
 
+from hummingbot.core.data_type.order_book import ORDER_BOOK_LEVEL_SIZE, OrderBook
+
 
 class OrderBookUnitTest(unittest.TestCase):
     @classmethod
@@ -51,6 +53,63 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_ask, 0)
 
 
+class DepthCappedOrderBookUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.order_book = OrderBook(max_depth=4)
+        bids_array = np.array([[price, 1, 1] for price in range(91, 100)], dtype=np.float64)
+        asks_array = np.array([[price, 1, 1] for price in range(101, 110)], dtype=np.float64)
+        self.order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+    @staticmethod
+    def rows(*rows):
+        return np.array(rows, dtype=np.float64).reshape(-1, 3)
+
+    def test_snapshot_keeps_best_levels(self):
+        bids, asks = self.order_book.snapshot
+
+        self.assertEqual([99., 98., 97., 96.], bids.price.tolist())
+        self.assertEqual([101., 102., 103., 104.], asks.price.tolist())
+        self.assertEqual(99., self.order_book.get_price(False))
+        self.assertEqual(101., self.order_book.get_price(True))
+        self.assertFalse(self.order_book.snapshot_required)
+        self.assertEqual(8 * ORDER_BOOK_LEVEL_SIZE, self.order_book.memory_usage)
+
+    def test_diffs_beyond_depth_limit_are_ignored(self):
+        # 95 was dropped with the snapshot, so its level is not known anymore
+        self.order_book.apply_numpy_diffs(self.rows([95, 3, 2], [96, 2, 2]), self.rows([105, 3, 2]))
+        bids, asks = self.order_book.snapshot
+
+        self.assertEqual([99., 98., 97., 96.], bids.price.tolist())
+        self.assertEqual(2., bids.amount.iloc[-1])
+        self.assertEqual([101., 102., 103., 104.], asks.price.tolist())
+
+    def test_better_levels_push_out_worst_levels(self):
+        self.order_book.apply_numpy_diffs(self.rows([99.5, 1, 2]), self.rows([100.5, 1, 2]))
+        bids, asks = self.order_book.snapshot
+
+        self.assertEqual([99.5, 99., 98., 97.], bids.price.tolist())
+        self.assertEqual([100.5, 101., 102., 103.], asks.price.tolist())
+
+        # The level pushed out is beyond the depth limit now
+        self.order_book.apply_numpy_diffs(self.rows([99.5, 0, 3], [96, 1, 3]), self.rows())
+        bids, _ = self.order_book.snapshot
+        self.assertEqual([99., 98., 97.], bids.price.tolist())
+
+    def test_underflow_requires_snapshot(self):
+        self.order_book.apply_numpy_diffs(self.rows([99, 0, 2]), self.rows())
+        self.assertFalse(self.order_book.snapshot_required)
+
+        self.order_book.apply_numpy_diffs(self.rows([98, 0, 3], [97, 0, 3]), self.rows())
+        self.assertTrue(self.order_book.snapshot_required)
+        self.assertEqual(96., self.order_book.get_price(False))
+
+        self.order_book.apply_numpy_snapshot(self.rows([96, 1, 4], [95, 1, 4]), self.rows([101, 1, 4]))
+        self.assertFalse(self.order_book.snapshot_required)
+        # The new snapshot has all the levels, none beyond the depth limit
+        self.order_book.apply_numpy_diffs(self.rows([96, 0, 5], [95, 0, 5]), self.rows())
+        self.assertFalse(self.order_book.snapshot_required)
+
+
 def main():
     logging.basicConfig(level=logging.INFO)
     unittest.main()
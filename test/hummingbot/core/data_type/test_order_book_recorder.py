@@ -0,0 +1,174 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecorder, OrderBookRecordReader
+
+
+class OrderBookRecorderTest(unittest.TestCase):
+    # 2024-01-01 00:00:00 UTC
+    start_timestamp = 1704067200.0
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.trading_pair = "COINALPHA-HBOT"
+        self.recorder = OrderBookRecorder(
+            connector_name="binance", base_path=self.temp_dir.name, keyframe_interval=10)
+        self.order_book = OrderBook()
+
+    def tearDown(self) -> None:
+        self.recorder.close()
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def _apply(self, message: OrderBookMessage):
+        if message.type is OrderBookMessageType.SNAPSHOT:
+            self.order_book.apply_snapshot(message.bids, message.asks, message.update_id)
+        else:
+            self.order_book.apply_diffs(message.bids, message.asks, message.update_id)
+        self.recorder.record_order_book(self.trading_pair, self.order_book, message)
+
+    def _snapshot(self, timestamp: float, update_id: int) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": self.trading_pair,
+            "update_id": update_id,
+            "bids": [["10", "1"], ["9", "2"]],
+            "asks": [["11", "1"], ["12", "2"]],
+        }, timestamp=timestamp)
+
+    def _diff(self, timestamp: float, update_id: int, bids, asks) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": self.trading_pair,
+            "update_id": update_id,
+            "bids": bids,
+            "asks": asks,
+        }, timestamp=timestamp)
+
+    def _book_state(self, order_book: OrderBook):
+        return ([(row.price, row.amount) for row in order_book.bid_entries()],
+                [(row.price, row.amount) for row in order_book.ask_entries()])
+
+    def test_reconstructs_order_book_at_any_timestamp(self):
+        self._apply(self._snapshot(self.start_timestamp, 1))
+        states = {}
+        for i in range(1, 30):
+            self._apply(self._diff(self.start_timestamp + i, i + 1, [[str(10 - i * 0.01), "3"]], [["11", str(i)]]))
+            states[self.start_timestamp + i] = self._book_state(self.order_book)
+        self.recorder.flush()
+
+        reader = OrderBookRecordReader(self.recorder.file_path(self.trading_pair, self.start_timestamp))
+        self.assertEqual(self.trading_pair, reader.trading_pair)
+        # Initial snapshot plus a keyframe every 10 seconds
+        self.assertEqual([self.start_timestamp, self.start_timestamp + 10, self.start_timestamp + 20],
+                         [timestamp for timestamp, _ in reader.keyframe_index])
+
+        for timestamp, expected_state in states.items():
+            rebuilt = reader.order_book_at(timestamp + 0.5)
+            self.assertEqual(expected_state, self._book_state(rebuilt))
+
+    def test_messages_from_start_time_begin_with_keyframe(self):
+        self._apply(self._snapshot(self.start_timestamp, 1))
+        for i in range(1, 15):
+            self._apply(self._diff(self.start_timestamp + i, i + 1, [], [["11", str(i)]]))
+        self.recorder.flush()
+
+        reader = OrderBookRecordReader(self.recorder.file_path(self.trading_pair, self.start_timestamp))
+        messages = list(reader.messages(start_time=self.start_timestamp + 12, end_time=self.start_timestamp + 13))
+
+        self.assertEqual(OrderBookMessageType.SNAPSHOT, messages[0].type)
+        self.assertEqual(self.start_timestamp + 10, messages[0].timestamp)
+        self.assertEqual([11, 12, 13, 14], [message.update_id for message in messages])
+
+    def test_records_trades(self):
+        self._apply(self._snapshot(self.start_timestamp, 1))
+        self.recorder.record_trade(OrderBookMessage(OrderBookMessageType.TRADE, {
+            "trading_pair": self.trading_pair,
+            "trade_type": float(TradeType.SELL.value),
+            "trade_id": 12345,
+            "update_id": 2,
+            "price": "10.5",
+            "amount": "0.25",
+        }, timestamp=self.start_timestamp + 1))
+        self.recorder.flush()
+
+        reader = OrderBookRecordReader(self.recorder.file_path(self.trading_pair, self.start_timestamp))
+        trades = [message for message in reader.messages() if message.type is OrderBookMessageType.TRADE]
+
+        self.assertEqual(1, len(trades))
+        self.assertEqual("12345", trades[0].trade_id)
+        self.assertEqual(10.5, trades[0].content["price"])
+        self.assertEqual(0.25, trades[0].content["amount"])
+        self.assertEqual(float(TradeType.SELL.value), trades[0].content["trade_type"])
+
+    def test_rotates_daily_with_a_keyframe_at_the_start_of_each_file(self):
+        self._apply(self._snapshot(self.start_timestamp, 1))
+        next_day = self.start_timestamp + 24 * 60 * 60
+        self._apply(self._diff(next_day, 2, [["10", "5"]], []))
+        self.recorder.flush()
+
+        first_path = self.recorder.file_path(self.trading_pair, self.start_timestamp)
+        second_path = self.recorder.file_path(self.trading_pair, next_day)
+        self.assertNotEqual(first_path, second_path)
+        self.assertTrue(os.path.exists(first_path))
+
+        messages = list(OrderBookRecordReader(second_path).messages())
+        self.assertEqual(1, len(messages))
+        self.assertEqual(OrderBookMessageType.SNAPSHOT, messages[0].type)
+        self.assertEqual([[10.0, 5.0], [9.0, 2.0]], messages[0].content["bids"])
+
+    def _trade(self, timestamp: float, trade_id: int) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.TRADE, {
+            "trading_pair": self.trading_pair,
+            "trade_type": float(TradeType.BUY.value),
+            "trade_id": trade_id,
+            "update_id": trade_id,
+            "price": "10.5",
+            "amount": "1",
+        }, timestamp=timestamp)
+
+    def test_trades_after_day_rollover_wait_for_the_keyframe(self):
+        self._apply(self._snapshot(self.start_timestamp, 1))
+        next_day = self.start_timestamp + 24 * 60 * 60
+        self.recorder.record_trade(self._trade(next_day, 1))
+        self._apply(self._diff(next_day + 1, 2, [["10", "5"]], []))
+        self.recorder.record_trade(self._trade(next_day + 2, 2))
+        self.recorder.flush()
+
+        messages = list(OrderBookRecordReader(self.recorder.file_path(self.trading_pair, next_day)).messages())
+
+        self.assertEqual([OrderBookMessageType.SNAPSHOT, OrderBookMessageType.TRADE],
+                         [message.type for message in messages])
+        self.assertEqual("2", messages[1].trade_id)
+
+    def test_keyframe_written_after_a_write_error(self):
+        self._apply(self._snapshot(self.start_timestamp, 1))
+        file = self.recorder._files[self.trading_pair]
+        with patch.object(self.recorder, "_files", {self.trading_pair: MagicMock()}) as files:
+            files[self.trading_pair].write.side_effect = OSError("No space left on device")
+            with self.assertRaises(OSError):
+                self._apply(self._diff(self.start_timestamp + 1, 2, [["10", "5"]], []))
+            # Trades are not written until the next keyframe
+            self.recorder.record_trade(self._trade(self.start_timestamp + 2, 1))
+            self.assertEqual(1, files[self.trading_pair].write.call_count)
+
+        self._apply(self._diff(self.start_timestamp + 3, 3, [["10", "6"]], []))
+        file.flush()
+
+        messages = list(OrderBookRecordReader(self.recorder.file_path(self.trading_pair, self.start_timestamp))
+                        .messages())
+        self.assertEqual([OrderBookMessageType.SNAPSHOT, OrderBookMessageType.SNAPSHOT],
+                         [message.type for message in messages])
+        self.assertEqual([[10.0, 6.0], [9.0, 2.0]], messages[1].content["bids"])
+
+    def test_rejects_files_of_other_formats(self):
+        path = os.path.join(self.temp_dir.name, "not_a_recording")
+        with open(path, "wb") as file:
+            file.write(b"\x00" * 16)
+
+        with self.assertRaises(ValueError):
+            OrderBookRecordReader(path)
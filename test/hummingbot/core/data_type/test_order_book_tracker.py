@@ -0,0 +1,224 @@
+import asyncio
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import Dict, List
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from hummingbot.core.data_type.order_book import ORDER_BOOK_LEVEL_SIZE, OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker, _DiffDispatchQueue
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+class MockOrderBookTrackerDataSource(OrderBookTrackerDataSource):
+    CONTIGUOUS_DIFF_UPDATE_IDS = True
+
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__(trading_pairs=trading_pairs)
+        self.snapshots: asyncio.Queue = asyncio.Queue()
+        self.requested_snapshots: List[str] = []
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain=None) -> Dict[str, float]:
+        return {}
+
+    async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        self.requested_snapshots.append(trading_pair)
+        return await self.snapshots.get()
+
+
+class OrderBookTrackerSequenceGapsTests(IsolatedAsyncioWrapperTestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.data_source = MockOrderBookTrackerDataSource(trading_pairs=[self.trading_pair])
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=[self.trading_pair])
+        self.order_book = OrderBook()
+        self.order_book.apply_snapshot([], [], 10)
+        # Simulate start()
+        self.tracker._order_books[self.trading_pair] = self.order_book
+        self.tracker._tracking_message_queues[self.trading_pair] = asyncio.Queue()
+        self.tracking_task = None
+
+    def tearDown(self) -> None:
+        self.tracking_task and self.tracking_task.cancel()
+        self.tracker.stop()
+        super().tearDown()
+
+    def _diff(self, first_update_id: int, update_id: int, bid_price: float = 1.0) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": self.trading_pair,
+            "first_update_id": first_update_id,
+            "update_id": update_id,
+            "bids": [[bid_price, 1.0]],
+            "asks": [],
+        }, timestamp=float(update_id))
+
+    def _snapshot(self, update_id: int, bid_price: float) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": self.trading_pair,
+            "update_id": update_id,
+            "bids": [[bid_price, 1.0]],
+            "asks": [],
+        }, timestamp=float(update_id))
+
+    async def _process_messages(self, *messages: OrderBookMessage):
+        message_queue = self.tracker._tracking_message_queues[self.trading_pair]
+        for message in messages:
+            message_queue.put_nowait(message)
+        if self.tracking_task is None:
+            self.tracking_task = asyncio.create_task(self.tracker._track_single_book(self.trading_pair))
+        # Gives time to the resync task to deliver the snapshots and to the tracking task to process the messages
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+    async def test_contiguous_diffs_are_applied(self):
+        await self._process_messages(self._diff(11, 12), self._diff(13, 15, bid_price=2.0))
+
+        self.assertEqual(15, self.order_book.last_diff_uid)
+        self.assertEqual(2.0, self.order_book.get_price(False))
+        self.assertEqual(0, self.tracker.sync_metrics[self.trading_pair]["gaps"])
+        self.assertEqual([], self.data_source.requested_snapshots)
+
+    async def test_gap_buffers_diffs_and_replays_them_after_snapshot(self):
+        await self._process_messages(self._diff(11, 12), self._diff(20, 21, bid_price=3.0), self._diff(22, 23))
+
+        self.assertEqual(12, self.order_book.last_diff_uid)
+        self.assertEqual([self.trading_pair], self.data_source.requested_snapshots)
+        metrics = self.tracker.sync_metrics[self.trading_pair]
+        self.assertEqual(1, metrics["gaps"])
+        self.assertTrue(metrics["resyncing"])
+        self.assertEqual(2, metrics["buffered_diffs"])
+
+        self.data_source.snapshots.put_nowait(self._snapshot(update_id=20, bid_price=5.0))
+        await self._process_messages()
+
+        self.assertEqual(20, self.order_book.snapshot_uid)
+        self.assertEqual(23, self.order_book.last_diff_uid)
+        self.assertEqual(5.0, self.order_book.get_price(False))
+        metrics = self.tracker.sync_metrics[self.trading_pair]
+        self.assertEqual(1, metrics["resyncs"])
+        self.assertFalse(metrics["resyncing"])
+        self.assertEqual(0, metrics["buffered_diffs"])
+
+    async def test_snapshot_older_than_gap_requests_another_snapshot(self):
+        await self._process_messages(self._diff(20, 21))
+        self.data_source.snapshots.put_nowait(self._snapshot(update_id=15, bid_price=5.0))
+        await self._process_messages()
+
+        metrics = self.tracker.sync_metrics[self.trading_pair]
+        self.assertTrue(metrics["resyncing"])
+        self.assertEqual(0, metrics["resyncs"])
+        self.assertEqual(2, len(self.data_source.requested_snapshots))
+
+        await self._process_messages(self._diff(22, 22))
+        self.data_source.snapshots.put_nowait(self._snapshot(update_id=21, bid_price=6.0))
+        await self._process_messages()
+
+        self.assertEqual(22, self.order_book.last_diff_uid)
+        self.assertEqual(1, self.tracker.sync_metrics[self.trading_pair]["resyncs"])
+
+    async def test_depth_capped_order_book_underflow_requests_snapshot(self):
+        self.order_book = OrderBook(max_depth=2)
+        self.order_book.apply_snapshot([OrderBookRow(price, 1.0, 10) for price in (1.0, 2.0, 3.0)], [], 10)
+        self.tracker._order_books[self.trading_pair] = self.order_book
+        removal_diff = OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": self.trading_pair,
+            "first_update_id": 11,
+            "update_id": 11,
+            "bids": [[3.0, 0.0], [2.0, 0.0]],
+            "asks": [],
+        }, timestamp=11.0)
+
+        await self._process_messages(removal_diff, self._diff(12, 12, bid_price=0.5))
+
+        # The diffs are still applied while the snapshot is requested
+        self.assertTrue(self.order_book.snapshot_required)
+        self.assertEqual(12, self.order_book.last_diff_uid)
+        self.assertEqual([self.trading_pair], self.data_source.requested_snapshots)
+        self.assertEqual(1, self.tracker.sync_metrics[self.trading_pair]["depth_resyncs"])
+
+        self.data_source.snapshots.put_nowait(self._snapshot(update_id=12, bid_price=1.5))
+        await self._process_messages(self._diff(13, 13, bid_price=2.5))
+
+        self.assertFalse(self.order_book.snapshot_required)
+        self.assertEqual(2.5, self.order_book.get_price(False))
+        self.assertEqual({self.trading_pair: 2 * ORDER_BOOK_LEVEL_SIZE}, self.tracker.memory_usage)
+
+    async def test_recording_errors_do_not_stop_the_order_book_updates(self):
+        recorder = MagicMock()
+        recorder.record_order_book.side_effect = OSError("No space left on device")
+        self.tracker.set_recorder(recorder)
+
+        with self.assertLogs(OrderBookTracker.logger().name, level="ERROR") as logs:
+            await self._process_messages(self._diff(11, 12), self._diff(13, 15, bid_price=2.0))
+
+        self.assertEqual(15, self.order_book.last_diff_uid)
+        self.assertEqual(2.0, self.order_book.get_price(False))
+        self.assertEqual(2, recorder.record_order_book.call_count)
+        # The error is only logged once per interval
+        self.assertEqual(1, len(logs.records))
+
+    async def test_gaps_not_checked_without_contiguous_update_ids(self):
+        self.data_source.CONTIGUOUS_DIFF_UPDATE_IDS = False
+
+        await self._process_messages(self._diff(20, 21))
+
+        self.assertEqual(21, self.order_book.last_diff_uid)
+        self.assertEqual(0, self.tracker.sync_metrics[self.trading_pair]["gaps"])
+
+
+class OrderBookTrackerDirectDiffDispatchTests(IsolatedAsyncioWrapperTestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.data_source = MockOrderBookTrackerDataSource(trading_pairs=[self.trading_pair])
+        self.tracker = OrderBookTracker(
+            data_source=self.data_source, trading_pairs=[self.trading_pair], direct_diff_dispatch=True)
+        self.diff_output = _DiffDispatchQueue(self.tracker)
+
+    def tearDown(self) -> None:
+        self.tracker.stop()
+        super().tearDown()
+
+    def _diff(self, update_id: int, bid_price: float = 1.0) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": self.trading_pair,
+            "first_update_id": update_id,
+            "update_id": update_id,
+            "bids": [[bid_price, 1.0]],
+            "asks": [],
+        }, timestamp=float(update_id))
+
+    async def _init_order_book(self):
+        self.data_source.snapshots.put_nowait(OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": self.trading_pair,
+            "update_id": 10,
+            "bids": [],
+            "asks": [],
+        }, timestamp=10.0))
+        with patch.object(OrderBookTracker, "_sleep", new_callable=AsyncMock):
+            await self.tracker._init_order_books()
+
+    async def test_diffs_are_applied_when_parsed(self):
+        await self._init_order_book()
+
+        self.diff_output.put_nowait(self._diff(11, bid_price=2.0))
+        await self.diff_output.put(self._diff(5))
+
+        order_book = self.tracker.order_books[self.trading_pair]
+        self.assertEqual(11, order_book.last_diff_uid)
+        self.assertEqual(2.0, order_book.get_price(False))
+        self.assertEqual({"accepted": 1, "rejected": 1, "queued": 0}, self.tracker.diff_router_stats)
+
+    async def test_diffs_received_before_initialization_are_applied_first(self):
+        self.diff_output.put_nowait(self._diff(11))
+        self.diff_output.put_nowait(self._diff(12, bid_price=3.0))
+
+        await self._init_order_book()
+
+        order_book = self.tracker.order_books[self.trading_pair]
+        self.assertEqual(12, order_book.last_diff_uid)
+        self.assertEqual(3.0, order_book.get_price(False))
+        self.assertEqual({"accepted": 0, "rejected": 0, "queued": 2}, self.tracker.diff_router_stats)
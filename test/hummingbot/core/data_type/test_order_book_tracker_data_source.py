@@ -0,0 +1,111 @@
+import asyncio
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import Any, Dict, List
+
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.web_assistant.connections.data_types import WSResponse
+
+
+class MockWebsocketAssistant:
+    def __init__(self):
+        self.messages: asyncio.Queue = asyncio.Queue()
+        self.disconnect_count = 0
+
+    async def iter_messages(self):
+        while True:
+            message = await self.messages.get()
+            if isinstance(message, Exception):
+                raise message
+            yield WSResponse(data=message)
+
+    async def disconnect(self):
+        self.disconnect_count += 1
+
+
+class ShardedOrderBookTrackerDataSource(OrderBookTrackerDataSource):
+    MAX_TRADING_PAIRS_PER_CONNECTION = 2
+
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__(trading_pairs=trading_pairs)
+        self.websockets: List[MockWebsocketAssistant] = []
+        self.subscriptions: List[List[str]] = []
+        self.subscribed_event = asyncio.Event()
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain=None) -> Dict[str, float]:
+        return {}
+
+    async def _connected_websocket_assistant(self) -> MockWebsocketAssistant:
+        websocket = MockWebsocketAssistant()
+        self.websockets.append(websocket)
+        return websocket
+
+    async def _subscribe_channels(self, ws: MockWebsocketAssistant):
+        await self._subscribe_channels_for_trading_pairs(ws=ws, trading_pairs=self._trading_pairs)
+
+    async def _subscribe_channels_for_trading_pairs(self, ws: MockWebsocketAssistant, trading_pairs: List[str]):
+        self.subscriptions.append(list(trading_pairs))
+        self.subscribed_event.set()
+
+    def _channel_originating_message(self, event_message: Dict[str, Any]) -> str:
+        return self._diff_messages_queue_key
+
+    async def _sleep(self, delay):
+        pass
+
+
+class OrderBookTrackerDataSourceShardingTests(IsolatedAsyncioWrapperTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.listening_task = None
+
+    def tearDown(self) -> None:
+        self.listening_task and self.listening_task.cancel()
+        super().tearDown()
+
+    async def _wait_for_subscriptions(self, data_source: ShardedOrderBookTrackerDataSource, count: int):
+        while len(data_source.subscriptions) < count:
+            data_source.subscribed_event.clear()
+            await asyncio.wait_for(data_source.subscribed_event.wait(), timeout=1)
+
+    async def test_trading_pairs_under_the_limit_use_a_single_connection(self):
+        data_source = ShardedOrderBookTrackerDataSource(trading_pairs=["A-USDT", "B-USDT"])
+
+        self.listening_task = asyncio.create_task(data_source.listen_for_subscriptions())
+        await self._wait_for_subscriptions(data_source, 1)
+
+        self.assertEqual([["A-USDT", "B-USDT"]], data_source.subscriptions)
+        self.assertEqual(1, len(data_source.websockets))
+        self.assertEqual([], data_source.shards_stats)
+
+    async def test_trading_pairs_are_split_evenly_across_connections(self):
+        data_source = ShardedOrderBookTrackerDataSource(
+            trading_pairs=["A-USDT", "B-USDT", "C-USDT", "D-USDT", "E-USDT"])
+
+        self.listening_task = asyncio.create_task(data_source.listen_for_subscriptions())
+        await self._wait_for_subscriptions(data_source, 3)
+
+        self.assertEqual(
+            [["A-USDT", "D-USDT"], ["B-USDT", "E-USDT"], ["C-USDT"]],
+            sorted(data_source.subscriptions))
+        self.assertEqual(3, len(data_source.websockets))
+        self.assertTrue(all(stats["connected"] for stats in data_source.shards_stats))
+
+    async def test_shard_disconnection_reconnects_only_that_shard(self):
+        data_source = ShardedOrderBookTrackerDataSource(trading_pairs=["A-USDT", "B-USDT", "C-USDT"])
+
+        self.listening_task = asyncio.create_task(data_source.listen_for_subscriptions())
+        await self._wait_for_subscriptions(data_source, 2)
+        first_shard_pairs = data_source.subscriptions[0]
+        data_source.websockets[0].messages.put_nowait({"update": 1})
+        data_source.websockets[0].messages.put_nowait(ConnectionError("Connection lost"))
+        await self._wait_for_subscriptions(data_source, 3)
+
+        self.assertEqual(first_shard_pairs, data_source.subscriptions[2])
+        self.assertEqual(1, data_source.websockets[0].disconnect_count)
+        self.assertEqual(0, data_source.websockets[1].disconnect_count)
+        self.assertEqual(3, len(data_source.websockets))
+        reconnections = {tuple(stats["trading_pairs"]): stats["reconnections"] for stats in data_source.shards_stats}
+        self.assertEqual(1, reconnections[tuple(first_shard_pairs)])
+        self.assertEqual(1, sum(reconnections.values()))
+        self.assertEqual({"update": 1}, data_source._message_queue[data_source._diff_messages_queue_key].get_nowait())
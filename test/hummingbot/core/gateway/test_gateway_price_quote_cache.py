@@ -0,0 +1,119 @@
+import asyncio
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import patch
+
+from hummingbot.core.event.events import TradeType
+from hummingbot.core.gateway.gateway_price_quote_cache import GatewayPriceQuoteCache
+
+
+class GatewayPriceQuoteCacheTest(IsolatedAsyncioWrapperTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.cache = GatewayPriceQuoteCache(ttl=2.0)
+        self.fetch_count = 0
+
+    def _key(self, amount: Decimal = Decimal("1"), side: TradeType = TradeType.BUY, network: str = "mainnet"):
+        return self.cache.quote_key("ethereum", network, "uniswap", "WETH", "USDC", side, amount)
+
+    async def _fetch(self):
+        self.fetch_count += 1
+        await asyncio.sleep(0)
+        return {"price": str(1000 + self.fetch_count)}
+
+    async def test_cached_quote_is_returned_until_ttl_expires(self):
+        with patch.object(GatewayPriceQuoteCache, "_time", return_value=100.0):
+            first = await self.cache.get_or_fetch(self._key(), self._fetch)
+            second = await self.cache.get_or_fetch(self._key(), self._fetch)
+        with patch.object(GatewayPriceQuoteCache, "_time", return_value=103.0):
+            third = await self.cache.get_or_fetch(self._key(), self._fetch)
+
+        self.assertEqual({"price": "1001"}, first)
+        self.assertEqual(first, second)
+        self.assertEqual({"price": "1002"}, third)
+        self.assertEqual(1, self.cache.stats["hits"])
+        self.assertEqual(2, self.cache.stats["misses"])
+
+    async def test_amounts_in_same_bucket_share_quote(self):
+        self.assertEqual(self._key(Decimal("1")), self._key(Decimal("1.000000000001")))
+        self.assertNotEqual(self._key(Decimal("1")), self._key(Decimal("1.1")))
+        self.assertNotEqual(self._key(side=TradeType.BUY), self._key(side=TradeType.SELL))
+
+    async def test_concurrent_requests_share_one_fetch(self):
+        results = await asyncio.gather(*[self.cache.get_or_fetch(self._key(), self._fetch) for _ in range(5)])
+
+        self.assertEqual(1, self.fetch_count)
+        self.assertTrue(all(result == {"price": "1001"} for result in results))
+        self.assertEqual(1, self.cache.stats["misses"])
+        self.assertEqual(4, self.cache.stats["coalesced"])
+        self.assertEqual(0, self.cache.stats["in_flight"])
+
+    async def test_newer_block_invalidates_quote(self):
+        self.cache.update_block_number("ethereum", "mainnet", 10)
+        await self.cache.get_or_fetch(self._key(), self._fetch)
+        await self.cache.get_or_fetch(self._key(), self._fetch)
+        self.assertEqual(1, self.fetch_count)
+
+        self.cache.update_block_number("ethereum", "mainnet", 11)
+        await self.cache.get_or_fetch(self._key(), self._fetch)
+
+        self.assertEqual(2, self.fetch_count)
+
+    async def test_errors_are_not_cached_and_reach_every_waiter(self):
+        async def failing_fetch():
+            self.fetch_count += 1
+            await asyncio.sleep(0)
+            raise ValueError("Gateway error")
+
+        results = await asyncio.gather(
+            *[self.cache.get_or_fetch(self._key(), failing_fetch) for _ in range(2)], return_exceptions=True)
+
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+        self.assertEqual(0, self.cache.stats["size"])
+
+        await self.cache.get_or_fetch(self._key(), self._fetch)
+        self.assertEqual(2, self.fetch_count)
+
+    async def test_responses_without_price_are_not_cached(self):
+        async def error_fetch():
+            return {"error": "not found"}
+
+        await self.cache.get_or_fetch(self._key(), error_fetch)
+
+        self.assertEqual(0, self.cache.stats["size"])
+
+    async def test_invalidate_by_network(self):
+        await self.cache.get_or_fetch(self._key(network="mainnet"), self._fetch)
+        await self.cache.get_or_fetch(self._key(network="goerli"), self._fetch)
+
+        self.cache.invalidate(chain="ethereum", network="goerli")
+
+        self.assertEqual(1, self.cache.stats["size"])
+        self.assertEqual(1, self.cache.stats["invalidations"])
+
+    async def test_expired_quotes_of_other_keys_are_evicted(self):
+        with patch.object(GatewayPriceQuoteCache, "_time", return_value=100.0):
+            await self.cache.get_or_fetch(self._key(Decimal("1")), self._fetch)
+            await self.cache.get_or_fetch(self._key(Decimal("2")), self._fetch)
+        self.assertEqual(2, self.cache.stats["size"])
+
+        with patch.object(GatewayPriceQuoteCache, "_time", return_value=103.0):
+            await self.cache.get_or_fetch(self._key(Decimal("3")), self._fetch)
+
+        self.assertEqual(1, self.cache.stats["size"])
+        self.assertEqual(2, self.cache.stats["evictions"])
+
+    async def test_oldest_quotes_evicted_above_max_size(self):
+        cache = GatewayPriceQuoteCache(ttl=60.0, max_size=2)
+        keys = [cache.quote_key("ethereum", "mainnet", "uniswap", "WETH", "USDC", TradeType.BUY, Decimal(amount))
+                for amount in range(1, 4)]
+        for key in keys:
+            await cache.get_or_fetch(key, self._fetch)
+
+        self.assertEqual(2, cache.stats["size"])
+        self.assertEqual(1, cache.stats["evictions"])
+        await cache.get_or_fetch(keys[2], self._fetch)
+        self.assertEqual(3, self.fetch_count)
+        await cache.get_or_fetch(keys[0], self._fetch)
+        self.assertEqual(4, self.fetch_count)
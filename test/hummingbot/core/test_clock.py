@@ -5,9 +5,16 @@ import unittest
 import pandas as pd
 
 from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.py_time_iterator import PyTimeIterator
 from hummingbot.core.time_iterator import TimeIterator
 
 
+class SlowPyTimeIterator(PyTimeIterator):
+
+    def tick(self, timestamp: float):
+        time.sleep(0.15)
+
+
 class ClockUnitTest(unittest.TestCase):
 
     backtest_start_timestamp: float = pd.Timestamp("2021-01-01", tz="UTC").timestamp()
@@ -110,6 +117,39 @@ class ClockUnitTest(unittest.TestCase):
 
         self.assertGreaterEqual(self.clock_realtime.current_timestamp, self.realtime_end_timestamp)
 
+    def test_run_til_with_tick_profiling(self):
+        clock = Clock(ClockMode.REALTIME, tick_size=0.1)
+        clock.add_iterator(TimeIterator())
+        clock.add_iterator(SlowPyTimeIterator())
+        clock.enable_tick_profiling(overrun_budget_pct=100)
+
+        with self.assertLogs("hummingbot.core.clock_tick_profiler", level="WARNING"), clock:
+            self.ev_loop.run_until_complete(clock.run_til(time.time() + 0.6))
+
+        stats = clock.tick_profiler.stats()
+        self.assertGreater(stats["tick_duration"]["count"], 0)
+        self.assertEqual({"TimeIterator", "SlowPyTimeIterator"}, set(stats["iterators"].keys()))
+        self.assertGreaterEqual(stats["iterators"]["SlowPyTimeIterator"]["mean_ms"], 150)
+        self.assertEqual(stats["tick_duration"]["count"], clock.tick_profiler.overruns)
+        self.assertGreater(clock.tick_profiler.skipped_ticks, 0)
+        self.assertIn("SlowPyTimeIterator", clock.tick_profiler.format_status())
+
+        clock.disable_tick_profiling()
+        self.assertIsNone(clock.tick_profiler)
+
+    def test_removed_iterators_are_dropped_from_the_tick_profiler(self):
+        clock = Clock(ClockMode.REALTIME, tick_size=0.1)
+        iterator = TimeIterator()
+        clock.add_iterator(iterator)
+        clock.enable_tick_profiling()
+
+        with clock:
+            self.ev_loop.run_until_complete(clock.run_til(time.time() + 0.2))
+            self.assertEqual({"TimeIterator"}, set(clock.tick_profiler.stats()["iterators"].keys()))
+            clock.remove_iterator(iterator)
+
+        self.assertEqual({}, clock.tick_profiler.stats()["iterators"])
+
     def test_backtest(self):
         # Note: Technically you do not execute `backtest()` when in REALTIME mode
 
@@ -1,11 +1,12 @@
-import unittest
 import gc
+import sys
+import unittest
 import weakref
+from test.mock.mock_events import MockEvent, MockEventType
 
-from hummingbot.core.pubsub import PubSub
+from hummingbot.core.event.event_listener import EventListener
 from hummingbot.core.event.event_logger import EventLogger
-
-from test.mock.mock_events import MockEventType, MockEvent
+from hummingbot.core.pubsub import PubSub
 
 
 class PubSubTest(unittest.TestCase):
@@ -89,6 +90,62 @@ class PubSubTest(unittest.TestCase):
         listeners = self.pubsub.get_listeners(self.event_tag_zero)
         self.assertEqual(0, len(listeners))
 
+    def test_lapsed_listener_remove_on_trigger_event(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+        self.listener_zero = None  # remove strong reference
+        gc.collect()
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        self.assertEqual(1, len(self.listener_one.event_log))
+        listeners = self.pubsub.get_listeners(self.event_tag_zero)
+        self.assertEqual([self.listener_one], listeners)
+
+    def test_listener_added_twice_is_triggered_once(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        self.assertEqual(1, len(self.listener_zero.event_log))
+
+    def test_listeners_changed_while_triggering_event(self):
+        pubsub = self.pubsub
+        late_listener = EventLogger()
+        triggered = []
+
+        class SelfRemovingListener(EventListener):
+            def __call__(self, arg):
+                triggered.append(arg)
+                pubsub.remove_listener(MockEventType.EVENT_ZERO, self)
+                pubsub.add_listener(MockEventType.EVENT_ZERO, late_listener)
+
+        listener = SelfRemovingListener()
+        pubsub.add_listener(self.event_tag_zero, listener)
+
+        pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual([self.event], triggered)
+        self.assertEqual(0, len(late_listener.event_log))
+
+        pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual([self.event], triggered)
+        self.assertEqual(1, len(late_listener.event_log))
+
 
 if __name__ == "__main__":
     unittest.main()
+
+    def test_dispatch_lists_released_when_listeners_change(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+        # Every dispatch list of the event holds the listener weak reference, which is shared
+        listener_one_weakref = weakref.ref(self.listener_one)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.remove_listener(self.event_tag_zero, self.listener_zero)
+        refcount = sys.getrefcount(listener_one_weakref)
+
+        for _ in range(200):
+            self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+            self.pubsub.remove_listener(self.event_tag_zero, self.listener_zero)
+
+        self.assertEqual(refcount, sys.getrefcount(listener_one_weakref))
@@ -0,0 +1,22 @@
+from unittest import TestCase
+
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
+
+
+class LatencyHistogramTests(TestCase):
+
+    def test_durations_are_counted_in_their_buckets(self):
+        histogram = LatencyHistogram()
+        histogram.add(0.0004)
+        histogram.add(0.003)
+        histogram.add(10)
+
+        summary = histogram.to_dict()
+
+        self.assertEqual(3, summary["count"])
+        self.assertEqual(10000, summary["max_ms"])
+        self.assertAlmostEqual(10003.4, summary["total_ms"])
+        self.assertEqual(1, summary["buckets"]["<=0.5ms"])
+        self.assertEqual(1, summary["buckets"]["<=5ms"])
+        self.assertEqual(1, summary["buckets"][">5000ms"])
+        self.assertEqual(3, sum(summary["buckets"].values()))
@@ -1,5 +1,6 @@
 import asyncio
 import json
+import tempfile
 import unittest
 from decimal import Decimal
 from typing import Any, Awaitable, Dict
@@ -13,6 +14,7 @@ from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.client.config.security import Security
 from hummingbot.client.settings import ConnectorSetting, ConnectorType
 from hummingbot.connector.exchange.binance import binance_constants as CONSTANTS, binance_web_utils
+from hummingbot.connector.exchange_info_cache import ExchangeInfoCache
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
 
@@ -104,6 +106,29 @@ class TestTradingPairFetcher(unittest.TestCase):
         self.assertEqual(2, len(trading_pairs))
         self.assertEqual({"mockConnector": ["MOCK-HBOT"], "mock_paper_trade": ["MOCK-HBOT"]}, trading_pairs)
 
+    @patch("hummingbot.connector.exchange_info_cache.data_path")
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._sf_shared_instance")
+    def test_fetched_connector_trading_pairs_from_exchange_info_cache(self, _, mock_connector_settings, data_path_mock):
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mockConnector", connector=connector),
+        }
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_path_mock.return_value = temp_dir
+            ExchangeInfoCache("mockConnector", ttl=60).save_symbol_map({"MOCKHBOT": "MOCK-HBOT", "HBOTUSDT": "HBOT-USDT"})
+
+            client_config_map = ClientConfigAdapter(ClientConfigMap())
+            client_config_map.fetch_pairs_from_all_exchanges = True
+            client_config_map.exchange_info_cache.exchange_info_cache_enabled = True
+            trading_pair_fetcher = TradingPairFetcher(client_config_map)
+            self.async_run_with_timeout(self.wait_until_trading_pair_fetcher_ready(trading_pair_fetcher), 1.0)
+
+        self.assertEqual({"mockConnector": ["MOCK-HBOT", "HBOT-USDT"]}, trading_pair_fetcher.trading_pairs)
+        connector.all_trading_pairs.assert_not_called()
+
     @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
     @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._sf_shared_instance")
     @patch("hummingbot.client.config.security.Security.connector_config_file_exists")
@@ -2,12 +2,12 @@ import asyncio
 import unittest
 from typing import Awaitable
 
-from hummingbot.core.web_assistant.connections.connections_factory import (
-    ConnectionsFactory
-)
-from hummingbot.core.web_assistant.connections.rest_connection import (
-    RESTConnection
-)
+from aioresponses import aioresponses
+from yarl import URL
+
+from hummingbot.core.web_assistant.connections.connections_factory import ConnectionsFactory
+from hummingbot.core.web_assistant.connections.data_types import ConnectionPoolSettings
+from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
 
@@ -34,3 +34,68 @@ class ConnectionsFactoryTest(unittest.TestCase):
         rest_connection = self.async_run_with_timeout(factory.get_ws_connection())
 
         self.assertIsInstance(rest_connection, WSConnection)
+
+    def test_shared_session_uses_pool_settings(self):
+        factory = ConnectionsFactory(pool_settings=ConnectionPoolSettings(limit=20, limit_per_host=5))
+
+        rest_connection = self.async_run_with_timeout(factory.get_rest_connection())
+        connector = rest_connection._client_session.connector
+
+        self.assertEqual(20, connector.limit)
+        self.assertEqual(5, connector.limit_per_host)
+        self.async_run_with_timeout(factory.close())
+
+    def test_pool_stats(self):
+        factory = ConnectionsFactory(pool_settings=ConnectionPoolSettings(limit=7))
+        self.assertEqual({}, factory.pool_stats())
+
+        self.async_run_with_timeout(factory.get_rest_connection())
+        stats = factory.pool_stats()
+
+        self.assertEqual(7, stats["limit"])
+        self.assertEqual(0, stats["in_use"])
+        self.assertEqual(0, stats["idle"])
+        self.assertEqual(0.0, stats["saturation"])
+        self.async_run_with_timeout(factory.close())
+
+    def test_pool_settings_can_only_change_before_the_session_is_created(self):
+        factory = ConnectionsFactory()
+        factory.pool_settings = ConnectionPoolSettings(limit=7)
+        rest_connection = self.async_run_with_timeout(factory.get_rest_connection())
+
+        self.assertEqual(7, rest_connection._client_session.connector.limit)
+        with self.assertRaises(RuntimeError):
+            factory.pool_settings = ConnectionPoolSettings(limit=8)
+        self.async_run_with_timeout(factory.close())
+
+    def test_pool_stats_without_connector_internals(self):
+        factory = ConnectionsFactory(pool_settings=ConnectionPoolSettings(limit=7))
+        rest_connection = self.async_run_with_timeout(factory.get_rest_connection())
+        connector = rest_connection._client_session.connector
+        del connector._acquired
+
+        stats = factory.pool_stats()
+
+        self.assertEqual({"limit": 7, "limit_per_host": 0}, stats)
+        connector._acquired = set()
+        self.async_run_with_timeout(factory.close())
+
+    @aioresponses()
+    def test_pre_warm_opens_configured_connections(self, mocked_api):
+        url = "https://api.test.com/api/v3/ping"
+        mocked_api.head(url, status=200, repeat=True)
+        factory = ConnectionsFactory(pool_settings=ConnectionPoolSettings(pre_warm_connections=3))
+
+        self.async_run_with_timeout(factory.pre_warm(url))
+
+        self.assertEqual(3, len(mocked_api.requests[("HEAD", URL(url))]))
+        self.async_run_with_timeout(factory.close())
+
+    @aioresponses()
+    def test_pre_warm_errors_are_not_raised(self, mocked_api):
+        url = "https://api.test.com/api/v3/ping"
+        mocked_api.head(url, exception=ConnectionError("test error"))
+        factory = ConnectionsFactory()
+
+        self.async_run_with_timeout(factory.pre_warm(url, connections_count=1))
+        self.async_run_with_timeout(factory.close())
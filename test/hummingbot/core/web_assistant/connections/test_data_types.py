@@ -1,12 +1,19 @@
 import asyncio
 import json
 import unittest
+from decimal import Decimal
 from typing import Awaitable
 
 import aiohttp
 from aioresponses import aioresponses
 
-from hummingbot.core.web_assistant.connections.data_types import EndpointRESTRequest, RESTMethod, RESTResponse
+from hummingbot.core.web_assistant.connections.data_types import (
+    EndpointRESTRequest,
+    RESTMethod,
+    RESTRequest,
+    RESTResponse,
+    WSJSONRequest,
+)
 
 
 class DataTypesTest(unittest.TestCase):
@@ -67,6 +74,40 @@ class DataTypesTest(unittest.TestCase):
 
         self.assertEqual(expected, actual)
 
+    def test_rest_request_copy_with_replaces_only_given_fields(self):
+        params = {"symbol": "COINALPHA-HBOT"}
+        request = RESTRequest(method=RESTMethod.GET, url="https://some.url", params=params, headers={"one": "1"})
+
+        copied_request = request.copy_with(headers={"two": "2"})
+
+        self.assertIsNot(request, copied_request)
+        self.assertIs(params, copied_request.params)
+        self.assertEqual({"two": "2"}, copied_request.headers)
+        self.assertEqual({"one": "1"}, request.headers)
+
+    def test_rest_request_owned_copy_isolates_mutable_fields(self):
+        request = RESTRequest(
+            method=RESTMethod.POST, url="https://some.url", params={"one": "1"}, data={"two": 2}, headers={"three": "3"})
+
+        copied_request = request.owned_copy()
+        copied_request.params["signature"] = "sig"
+        copied_request.data["signature"] = "sig"
+        copied_request.headers["signature"] = "sig"
+
+        self.assertEqual({"one": "1"}, request.params)
+        self.assertEqual({"two": 2}, request.data)
+        self.assertEqual({"three": "3"}, request.headers)
+        self.assertEqual(request.url, copied_request.url)
+
+    def test_ws_request_owned_copy_isolates_payload(self):
+        request = WSJSONRequest(payload={"op": "subscribe"}, is_auth_required=True)
+
+        copied_request = request.owned_copy()
+        copied_request.payload["signature"] = "sig"
+
+        self.assertEqual({"op": "subscribe"}, request.payload)
+        self.assertTrue(copied_request.is_auth_required)
+
 
 class EndpointRESTRequestDummy(EndpointRESTRequest):
     @property
@@ -115,6 +156,15 @@ class EndpointRESTRequestTest(unittest.TestCase):
         self.assertIsInstance(request.data, str)
         self.assertEqual(data, json.loads(request.data))
 
+    def test_decimal_data_to_number(self):
+        request = EndpointRESTRequestDummy(
+            method=RESTMethod.POST,
+            endpoint="some/endpoint",
+            data={"price": Decimal("1234.000000001"), "quantity": Decimal("0.5")},
+        )
+
+        self.assertEqual({"price": 1234.000000001, "quantity": 0.5}, json.loads(request.data))
+
     def test_raises_on_data_supplied_to_non_post_request(self):
         endpoint = "some/endpoint"
         data = {"one": 1}
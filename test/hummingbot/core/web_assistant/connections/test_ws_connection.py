@@ -123,6 +123,27 @@ class WSConnectionTest(unittest.TestCase):
         self.assertEqual(data, response.data)
         self.assertNotEqual(0, self.ws_connection.last_recv_time)
 
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_receive_plain_text(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.async_run_with_timeout(self.ws_connection.connect(self.ws_url))
+        self.mocking_assistant.add_websocket_aiohttp_message(ws_connect_mock.return_value, message="pong")
+
+        response = self.async_run_with_timeout(self.ws_connection.receive())
+
+        self.assertEqual("pong", response.data)
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_receive_raw_messages(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.async_run_with_timeout(self.ws_connection.connect(self.ws_url, raw_messages=True))
+        message = json.dumps({"one": 1})
+        self.mocking_assistant.add_websocket_aiohttp_message(ws_connect_mock.return_value, message=message)
+
+        response = self.async_run_with_timeout(self.ws_connection.receive())
+
+        self.assertEqual(message, response.data)
+
     @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
     def test_receive_disconnects_and_raises_on_aiohttp_closed(self, ws_connect_mock):
         ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
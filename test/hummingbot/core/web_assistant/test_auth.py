@@ -0,0 +1,22 @@
+import hashlib
+import hmac
+import unittest
+
+from hummingbot.core.web_assistant.auth import HMACSigner
+
+
+class HMACSignerTest(unittest.TestCase):
+
+    def test_signatures_match_new_hmac_for_each_message(self):
+        signer = HMACSigner("testSecret")
+
+        for message in ["symbol=LTCBTC&timestamp=1", "symbol=ETHBTC&timestamp=2", ""]:
+            expected = hmac.new(b"testSecret", message.encode("utf8"), hashlib.sha256)
+            self.assertEqual(expected.hexdigest(), signer.hexdigest(message))
+            self.assertEqual(expected.digest(), signer.digest(message.encode("utf8")))
+
+    def test_digestmod(self):
+        signer = HMACSigner(b"testSecret", digestmod=hashlib.sha512)
+
+        expected = hmac.new(b"testSecret", b"payload", hashlib.sha512).hexdigest()
+        self.assertEqual(expected, signer.hexdigest("payload"))
@@ -0,0 +1,76 @@
+import json
+import unittest
+from decimal import Decimal
+
+import numpy as np
+
+from hummingbot.core.web_assistant import json_codec
+from hummingbot.core.web_assistant.json_codec import JSONCodec, OrjsonCodec, get_json_codec, set_json_codec
+
+
+class JSONCodecTest(unittest.TestCase):
+
+    def tearDown(self) -> None:
+        set_json_codec(None)
+        super().tearDown()
+
+    def test_default_codec_is_orjson_when_installed(self):
+        expected_name = "orjson" if json_codec.orjson is not None else "json"
+
+        self.assertEqual(expected_name, get_json_codec().name)
+
+    def test_set_json_codec(self):
+        codec = JSONCodec()
+        set_json_codec(codec)
+
+        self.assertIs(codec, get_json_codec())
+
+        set_json_codec(None)
+
+        self.assertIsNot(codec, get_json_codec())
+
+    def test_codecs_round_trip(self):
+        document = {"e": "depthUpdate", "U": 157, "b": [["0.0024", "10"]], "price": 1.5, "valid": True, "id": None}
+        codecs = [JSONCodec()]
+        if json_codec.orjson is not None:
+            codecs.append(OrjsonCodec())
+
+        for codec in codecs:
+            self.assertEqual(document, codec.loads(codec.dumps(document)))
+            self.assertEqual(document, codec.loads(codec.dumps(document).encode()))
+
+    @unittest.skipIf(json_codec.orjson is None, "orjson is not installed")
+    def test_orjson_codec_decodes_documents_only_accepted_by_standard_library(self):
+        codec = OrjsonCodec()
+
+        self.assertEqual({"id": 2 ** 70}, codec.loads('{"id": 1180591620717411303424}'))
+        self.assertEqual(1, codec.dumps({1: "one"}).count('"1"'))
+        with self.assertRaises(ValueError):
+            codec.loads("pong")
+
+    def test_codecs_encode_decimal_and_numpy_values(self):
+        document = {"price": Decimal("0.123456789012345678901"), "amount": np.float64(1.5), "count": np.int64(3),
+                    "stop": Decimal("NaN")}
+        codecs = [JSONCodec()]
+        if json_codec.orjson is not None:
+            codecs.append(OrjsonCodec())
+
+        for codec in codecs:
+            self.assertEqual({"price": float(Decimal("0.123456789012345678901")), "amount": 1.5, "count": 3, "stop": None},
+                             json.loads(codec.dumps(document)))
+
+    def test_codecs_encode_in_compact_form(self):
+        document = {"id": None, "status": "null", "prices": [1.5, float("nan"), float("inf")], "name": "café"}
+        codecs = [JSONCodec()]
+        if json_codec.orjson is not None:
+            codecs.append(OrjsonCodec())
+
+        for codec in codecs:
+            self.assertEqual('{"id":null,"status":"null","prices":[1.5,null,null],"name":"café"}', codec.dumps(document))
+
+    @unittest.skipIf(json_codec.orjson is None, "orjson is not installed")
+    def test_orjson_codec_encodes_documents_only_accepted_by_standard_library(self):
+        codec = OrjsonCodec()
+
+        self.assertEqual('{"id":1180591620717411303424,"price":null}',
+                         codec.dumps({"id": 2 ** 70, "price": float("nan")}))
@@ -0,0 +1,145 @@
+import asyncio
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
+from hummingbot.core.web_assistant.request_tracer import (
+    CallbackLatencySink,
+    LoggerLatencySink,
+    PrometheusLatencySink,
+    RequestTrace,
+    RequestTracer,
+)
+
+
+class RequestTraceTests(TestCase):
+
+    def test_recorded_durations_are_excluded_from_the_next_stage(self):
+        trace = RequestTrace(endpoint="test_limit")
+        trace._last_mark -= 0.01
+        trace.record("connection", 0.004)
+        trace.mark("network")
+
+        self.assertEqual(0.004, trace.stages["connection"])
+        self.assertAlmostEqual(0.006, trace.stages["network"], delta=0.001)
+
+
+class RequestTracerTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.tracer = RequestTracer()
+
+    def test_start_trace_returns_none_when_disabled(self):
+        self.assertIsNone(self.tracer.start_trace("test_limit"))
+
+        self.tracer.enable()
+        self.assertIsNotNone(self.tracer.start_trace("test_limit"))
+
+        self.tracer.disable()
+        self.assertIsNone(self.tracer.start_trace("test_limit"))
+
+    def test_traces_are_tagged_with_the_request_context(self):
+        self.tracer.enable()
+
+        with self.tracer.request_context(connector="test_exchange", order_id="OID1"):
+            with self.tracer.request_context(connector="test_exchange"):
+                order_trace = self.tracer.start_trace("order")
+            with self.tracer.request_context(connector="other_exchange"):
+                other_trace = self.tracer.start_trace("balances")
+        no_context_trace = self.tracer.start_trace("time")
+
+        self.assertEqual(("test_exchange", "OID1"), (order_trace.connector, order_trace.order_id))
+        self.assertEqual(("other_exchange", None), (other_trace.connector, other_trace.order_id))
+        self.assertEqual((None, None), (no_context_trace.connector, no_context_trace.order_id))
+
+    def test_finished_traces_are_summarized_by_connector_and_endpoint(self):
+        self.tracer.enable()
+        with self.tracer.request_context(connector="test_exchange", order_id="OID1"):
+            trace = self.tracer.start_trace("order")
+        trace.mark("network")
+        self.tracer.finish_trace(trace)
+        trace = self.tracer.start_trace("time")
+        self.tracer.finish_trace(trace)
+
+        summaries = self.tracer.summaries()
+
+        self.assertEqual({"test_exchange order", "unknown time"}, set(summaries))
+        self.assertEqual(1, summaries["test_exchange order"]["network"]["count"])
+        self.assertEqual(1, summaries["test_exchange order"]["total"]["count"])
+        self.assertEqual(1, len(self.tracer.recent_traces(order_id="OID1")))
+        self.assertEqual(2, len(self.tracer.recent_traces()))
+
+        self.tracer.reset()
+
+        self.assertEqual({}, self.tracer.summaries())
+        self.assertEqual([], self.tracer.recent_traces())
+
+    def test_finishing_a_nested_trace_restores_the_outer_trace(self):
+        self.tracer.enable()
+        order_trace = self.tracer.start_trace("create_order")
+        request_trace = self.tracer.start_trace("order")
+        trace_config_ctx = MagicMock()
+
+        async def acquire_connection():
+            await self.tracer._on_connection_start(None, trace_config_ctx, None)
+            await self.tracer._on_connection_end(None, trace_config_ctx, None)
+
+        self.tracer.finish_trace(request_trace)
+        asyncio.get_event_loop().run_until_complete(acquire_connection())
+        self.tracer.finish_trace(order_trace)
+
+        self.assertIn("connection", order_trace.stages)
+        self.assertNotIn("connection", request_trace.stages)
+
+    def test_prometheus_label_values_are_escaped(self):
+        sink = PrometheusLatencySink()
+
+        sink.export({'test_exchange /api/"v3"\\order\n': {"network": LatencyHistogram().to_dict()}})
+
+        self.assertIn('_count{connector="test_exchange",endpoint="/api/\\"v3\\"\\\\order\\n",stage="network"} 0',
+                      sink.text)
+
+    def test_export_sends_the_summaries_to_all_sinks(self):
+        callback = MagicMock()
+        failing_sink = MagicMock()
+        failing_sink.export.side_effect = Exception("Test error")
+        prometheus_sink = PrometheusLatencySink()
+        self.tracer.enable(sinks=[failing_sink, CallbackLatencySink(callback), prometheus_sink])
+        with self.tracer.request_context(connector="test_exchange"):
+            trace = self.tracer.start_trace("order")
+        trace.mark("network")
+        self.tracer.finish_trace(trace)
+
+        self.tracer.export()
+
+        published = callback.call_args[0][0]
+        self.assertEqual(1, published["latencies"]["test_exchange order"]["network"]["count"])
+        self.assertIn(
+            'hummingbot_request_stage_latency_ms_count{connector="test_exchange",endpoint="order",stage="network"} 1',
+            prometheus_sink.text)
+        self.assertIn(
+            'hummingbot_request_stage_latency_ms_bucket{connector="test_exchange",endpoint="order",stage="network",'
+            'le="+Inf"} 1',
+            prometheus_sink.text)
+
+    def test_logger_sink_logs_one_line_per_endpoint(self):
+        sink = LoggerLatencySink()
+        with self.assertLogs(sink.logger().name, level="INFO") as logs:
+            sink.export({"test_exchange order": {"network": LatencyHistogram().to_dict()}})
+
+        self.assertEqual(1, len(logs.records))
+        self.assertIn("Request latency test_exchange order - network: 0.00ms", logs.records[0].getMessage())
+
+    def test_connection_times_are_recorded_in_the_current_trace(self):
+        self.tracer.enable()
+        trace = self.tracer.start_trace("order")
+        trace_config_ctx = MagicMock()
+
+        async def acquire_connection():
+            await self.tracer._on_connection_start(None, trace_config_ctx, None)
+            await self.tracer._on_connection_end(None, trace_config_ctx, None)
+
+        asyncio.get_event_loop().run_until_complete(acquire_connection())
+
+        self.assertIn("connection", trace.stages)
@@ -8,9 +8,11 @@ import aiohttp
 from aioresponses import aioresponses
 
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse, WSRequest
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
+from hummingbot.core.web_assistant.request_tracer import RequestTracer
 from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
@@ -100,3 +102,69 @@ class RESTAssistantTest(unittest.TestCase):
         self.assertIsNotNone(call_request)
         self.assertIsNotNone(call_request.headers)
         self.assertEqual(call_request.headers, auth_header)
+
+    @patch("hummingbot.core.web_assistant.connections.rest_connection.RESTConnection.call")
+    def test_rest_assistant_call_does_not_modify_original_request(self, mocked_call):
+        url = "https://www.test.com/url"
+        call_request: Optional[RESTRequest] = None
+
+        async def register_request_and_return(request: RESTRequest):
+            nonlocal call_request
+            call_request = request
+            return {}
+
+        mocked_call.side_effect = register_request_and_return
+
+        class AuthDummy(AuthBase):
+            async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
+                request.params["signature"] = "sig"
+                return request
+
+            async def ws_authenticate(self, request: WSRequest) -> WSRequest:
+                pass
+
+        connection = RESTConnection(aiohttp.ClientSession(loop=self.ev_loop))
+        assistant = RESTAssistant(connection, throttler=AsyncThrottler(rate_limits=[]), auth=AuthDummy())
+        params = {"symbol": "COINALPHA-HBOT"}
+        req = RESTRequest(method=RESTMethod.GET, url=url, params=params, is_auth_required=True)
+
+        self.async_run_with_timeout(assistant.call(req))
+
+        self.assertEqual({"symbol": "COINALPHA-HBOT", "signature": "sig"}, call_request.params)
+        self.assertEqual({"symbol": "COINALPHA-HBOT"}, params)
+        self.assertIs(params, req.params)
+
+    @aioresponses()
+    def test_rest_assistant_records_request_stages_when_tracing(self, mocked_api):
+        url = "https://www.test.com/url"
+        mocked_api.get(url, body=json.dumps({"one": 1}).encode())
+        tracer = RequestTracer()
+        tracer.enable()
+        connection = RESTConnection(aiohttp.ClientSession(loop=self.ev_loop))
+        assistant = RESTAssistant(connection, throttler=AsyncThrottler(rate_limits=[RateLimit("test_limit", 10, 1)]), tracer=tracer)
+
+        with tracer.request_context(connector="test_exchange", order_id="OID1"):
+            result = self.async_run_with_timeout(assistant.execute_request(url=url, throttler_limit_id="test_limit"))
+
+        self.assertEqual({"one": 1}, result)
+        traces = tracer.recent_traces(order_id="OID1")
+        self.assertEqual(1, len(traces))
+        self.assertEqual("test_exchange", traces[0]["connector"])
+        self.assertEqual("test_limit", traces[0]["endpoint"])
+        self.assertEqual(
+            ["prepare", "throttler", "pre_process", "authentication", "network", "post_process", "read_and_decode"],
+            list(traces[0]["stages_ms"]))
+        self.assertEqual(1, tracer.summaries()["test_exchange test_limit"]["total"]["count"])
+
+    @aioresponses()
+    def test_rest_assistant_does_not_record_requests_when_tracing_disabled(self, mocked_api):
+        url = "https://www.test.com/url"
+        mocked_api.get(url, body=json.dumps({"one": 1}).encode())
+        tracer = RequestTracer()
+        connection = RESTConnection(aiohttp.ClientSession(loop=self.ev_loop))
+        assistant = RESTAssistant(connection, throttler=AsyncThrottler(rate_limits=[RateLimit("test_limit", 10, 1)]), tracer=tracer)
+
+        self.async_run_with_timeout(assistant.execute_request(url=url, throttler_limit_id="test_limit"))
+
+        self.assertEqual({}, tracer.summaries())
+        self.assertEqual([], tracer.recent_traces())
@@ -1,7 +1,16 @@
 from unittest import TestCase
 from unittest.mock import MagicMock
 
-from hummingbot.model.db_migration.transformations import AddTradeFeeInQuote, ConvertPriceAndAmountColumnsToBigint
+from sqlalchemy import create_engine, inspect
+
+from hummingbot.model.controller_performance import ControllerPerformance
+from hummingbot.model.db_migration.transformations import (
+    AddControllerPerformanceRollups,
+    AddTradeFeeInQuote,
+    ConvertPriceAndAmountColumnsToBigint,
+)
+from hummingbot.model.executors import Executors
+from hummingbot.strategy_v2.models.executors import CloseType
 
 
 class ConvertPriceAndAmountColumnsToBigintTests(TestCase):
@@ -41,3 +50,47 @@ class AddTradeFeeInQuoteTests(TestCase):
 
     def test_to_version(self):
         self.assertEqual(20230516, AddTradeFeeInQuote(self).to_version)
+
+
+class AddControllerPerformanceRollupsTests(TestCase):
+    def test_name(self):
+        self.assertEqual("AddControllerPerformanceRollups", AddControllerPerformanceRollups(self).name)
+
+    def test_to_version(self):
+        self.assertEqual(20241019, AddControllerPerformanceRollups(self).to_version)
+
+    def test_apply_adds_controller_index_and_fills_the_rollups(self):
+        engine = create_engine("sqlite:///:memory:")
+        table = Executors.__table__
+        table.create(engine)
+        for index in list(table.indexes):
+            if index.name == "ex_controller_id_timestamp":
+                index.drop(engine)
+        executor_values = {"timestamp": 1, "type": "position_executor", "status": 3, "config": {}, "net_pnl_pct": 0,
+                           "cum_fees_quote": 0, "is_active": False, "is_trading": False, "custom_info": {}}
+        engine.execute(table.insert(), [
+            dict(executor_values, id="1", controller_id="controller_1", net_pnl_quote=5, filled_amount_quote=100,
+                 close_type=CloseType.TAKE_PROFIT.value),
+            dict(executor_values, id="2", controller_id="controller_1", net_pnl_quote=-2, filled_amount_quote=50,
+                 close_type=CloseType.STOP_LOSS.value),
+            dict(executor_values, id="3", controller_id="controller_1", net_pnl_quote=1, filled_amount_quote=20,
+                 close_type=CloseType.TAKE_PROFIT.value),
+            dict(executor_values, id="4", controller_id=None, net_pnl_quote=1, filled_amount_quote=10,
+                 close_type=None),
+        ])
+        db_handle = MagicMock()
+        db_handle.engine = engine
+
+        AddControllerPerformanceRollups(migrator=self).apply(db_handle)
+
+        index_names = [index["name"] for index in inspect(engine).get_indexes("Executors")]
+        self.assertIn("ex_controller_id_timestamp", index_names)
+        rows = {row.controller_id: row for row in engine.execute(ControllerPerformance.__table__.select())}
+        self.assertEqual({"controller_1", "main"}, set(rows))
+        self.assertEqual(3, rows["controller_1"].executors_count)
+        self.assertEqual(4, rows["controller_1"].realized_pnl_quote)
+        self.assertEqual(170, rows["controller_1"].volume_traded)
+        self.assertEqual({str(CloseType.TAKE_PROFIT.value): 2, str(CloseType.STOP_LOSS.value): 1},
+                         rows["controller_1"].close_type_counts)
+        self.assertEqual(1, rows["main"].executors_count)
+        self.assertEqual({}, rows["main"].close_type_counts)
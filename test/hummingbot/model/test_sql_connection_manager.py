@@ -0,0 +1,77 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from sqlalchemy.exc import OperationalError
+
+from hummingbot.client.config.client_config_map import ClientConfigMap, DBSqliteMode, DBSqlitePerformanceMode
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.model.metadata import Metadata
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+
+
+class SQLConnectionManagerTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, "test_trades.sqlite")
+        self.managers = []
+
+    def tearDown(self) -> None:
+        for manager in self.managers:
+            manager.dispose()
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def create_manager(self, db_mode) -> SQLConnectionManager:
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.db_mode = db_mode
+        manager = SQLConnectionManager(client_config_map, SQLConnectionType.TRADE_FILLS, db_path=self.db_path)
+        self.managers.append(manager)
+        return manager
+
+    def test_db_mode_from_dict_with_performance_settings(self):
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+
+        client_config_map.db_mode = {"db_engine": "sqlite"}
+        self.assertIsInstance(client_config_map.db_mode.hb_config, DBSqliteMode)
+        self.assertNotIsInstance(client_config_map.db_mode.hb_config, DBSqlitePerformanceMode)
+
+        client_config_map.db_mode = {"db_engine": "sqlite", "cache_size_mb": 32, "mmap_size_mb": 0}
+        self.assertIsInstance(client_config_map.db_mode.hb_config, DBSqlitePerformanceMode)
+        self.assertEqual(-32 * 1024, client_config_map.db_mode.get_sqlite_pragmas()["cache_size"])
+
+    def test_default_sqlite_mode_does_not_change_journal_mode(self):
+        manager = self.create_manager(DBSqliteMode())
+
+        with manager.get_new_session() as session:
+            journal_mode = session.execute("PRAGMA journal_mode").scalar()
+
+        self.assertEqual("delete", journal_mode)
+        self.assertIs(manager._session_cls, manager._read_only_session_cls)
+
+    def test_performance_mode_applies_pragmas(self):
+        manager = self.create_manager(DBSqlitePerformanceMode(cache_size_mb=16, mmap_size_mb=0))
+
+        with manager.get_new_session() as session:
+            journal_mode = session.execute("PRAGMA journal_mode").scalar()
+            synchronous = session.execute("PRAGMA synchronous").scalar()
+            cache_size = session.execute("PRAGMA cache_size").scalar()
+
+        self.assertEqual("wal", journal_mode)
+        self.assertEqual(1, synchronous)  # NORMAL
+        self.assertEqual(-16 * 1024, cache_size)
+
+    def test_performance_mode_read_only_sessions_read_committed_data_and_can_not_write(self):
+        manager = self.create_manager(DBSqlitePerformanceMode())
+        with manager.get_new_session() as session:
+            with session.begin():
+                session.add(Metadata(key="test_key", value="test_value"))
+
+        with manager.get_read_only_session() as session:
+            value = session.query(Metadata).filter(Metadata.key == "test_key").one().value
+            with self.assertRaises(OperationalError):
+                session.execute("DELETE FROM Metadata")
+
+        self.assertEqual("test_value", value)
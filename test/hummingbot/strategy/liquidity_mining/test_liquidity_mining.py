@@ -403,6 +403,55 @@ class LiquidityMiningTest(unittest.TestCase):
         self.assertTrue("ETH-BTC" in strategy.sell_budgets)
         self.assertFalse("ETH-BUSD" in strategy.sell_budgets)
 
+    @unittest.mock.patch('hummingbot.strategy.liquidity_mining.liquidity_mining.build_trade_fee')
+    def test_trading_starts_when_the_order_books_arrive_after_start(self, estimate_fee_mock):
+        estimate_fee_mock.return_value = AddedToCostTradeFee(
+            percent=0, flat_fees=[TokenAmount('ETH', Decimal(0.00005))]
+        )
+
+        trading_pairs = ["ETH-USDT", "ETH-BTC"]
+        market, market_infos = self.create_empty_ob_market(trading_pairs, 100,
+                                                           {"USDT": 5000, "ETH": 500, "BTC": 100})
+
+        strategy = LiquidityMiningStrategy()
+        strategy.init_params(
+            client_config_map=ClientConfigMap(),
+            exchange=market,
+            market_infos=market_infos,
+            token="ETH",
+            order_amount=Decimal(2),
+            spread=Decimal(0.0005),
+            inventory_skew_enabled=False,
+            target_base_pct=Decimal(0.5),
+            order_refresh_time=5,
+            order_refresh_tolerance_pct=Decimal(0.1),
+        )
+
+        self.clock.add_iterator(market)
+        self.clock.add_iterator(strategy)
+        self.clock.backtest_til(self.start_timestamp + 2)
+        # The clock logs the errors raised by the strategy, tick it directly so that they fail the test
+        strategy.tick(self.clock.current_timestamp)
+
+        self.assertFalse(strategy._ready_to_trade)
+        self.assertEqual(0, len(strategy.active_orders))
+
+        for trading_pair in trading_pairs:
+            market.set_balanced_order_book(trading_pair=trading_pair,
+                                           mid_price=100,
+                                           min_price=1,
+                                           max_price=200,
+                                           price_step_size=1,
+                                           volume_step_size=10)
+        self.clock.backtest_til(self.start_timestamp + 4)
+        strategy.tick(self.clock.current_timestamp)
+
+        self.assertTrue(strategy._ready_to_trade)
+        self.assertEqual(set(trading_pairs), set(strategy.buy_budgets))
+        self.assertEqual(Decimal(5000), strategy.buy_budgets["ETH-USDT"])
+        self.assertEqual(Decimal(100), strategy.buy_budgets["ETH-BTC"])
+        self.assertEqual(4, len(strategy.active_orders))
+
     @unittest.mock.patch('hummingbot.strategy.liquidity_mining.liquidity_mining.build_trade_fee')
     def test_inventory_skew(self, estimate_fee_mock):
         """
@@ -0,0 +1,94 @@
+import unittest
+from decimal import Decimal
+from statistics import mean
+
+import numpy as np
+
+from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.strategy.liquidity_mining.market_state import MarketStateTable
+
+
+class MarketStateTableTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.markets = ["ETH-USDT", "ETH-BTC"]
+
+    @staticmethod
+    def reference_volatility(mid_prices, volatility_interval):
+        # Per market calculation the table replaces
+        atr = []
+        for i in range(len(mid_prices) - 1, 0, -volatility_interval):
+            prices = mid_prices[max(i - volatility_interval + 1, 0): i + 1]
+            atr.append((max(prices) - min(prices)) / min(prices))
+        return mean(atr) if atr else float("nan")
+
+    def test_volatility_is_nan_until_two_mid_prices(self):
+        table = MarketStateTable(self.markets, mid_price_samples=10)
+        table.update_volatility(volatility_interval=5)
+        self.assertTrue(np.isnan(table.volatility).all())
+
+        table.add_mid_prices(np.array([100.0, 10.0]))
+        table.update_volatility(volatility_interval=5)
+        self.assertTrue(np.isnan(table.volatility).all())
+
+        table.add_mid_prices(np.array([110.0, 10.0]))
+        table.update_volatility(volatility_interval=5)
+        self.assertEqual([0.1, 0.0], list(table.volatility))
+
+    def test_mid_price_history_keeps_the_last_samples(self):
+        table = MarketStateTable(self.markets, mid_price_samples=4)
+        for price in range(1, 11):
+            table.add_mid_prices(np.array([float(price), float(price * 2)]))
+
+        history = table.mid_price_history()
+
+        self.assertEqual([7.0, 8.0, 9.0, 10.0], list(history[0]))
+        self.assertEqual([14.0, 16.0, 18.0, 20.0], list(history[1]))
+        self.assertEqual([10.0, 20.0], list(table.mid_prices))
+
+    def test_volatility_matches_the_per_market_calculation(self):
+        volatility_interval = 3
+        table = MarketStateTable(self.markets, mid_price_samples=volatility_interval * 4)
+        random = np.random.default_rng(42)
+        samples = []
+        for _ in range(30):
+            mid_prices = random.uniform(90, 110, size=2)
+            samples.append(mid_prices)
+            table.add_mid_prices(mid_prices)
+            table.update_volatility(volatility_interval)
+
+            kept_samples = np.array(samples[-volatility_interval * 4:])
+            expected = [self.reference_volatility(list(kept_samples[:, i]), volatility_interval)
+                        for i in range(len(self.markets))]
+            np.testing.assert_allclose(expected, table.volatility)
+
+    def test_order_prices_of_the_first_orders_of_each_market(self):
+        table = MarketStateTable(self.markets, mid_price_samples=10)
+        orders = [
+            LimitOrder("buy-1", "ETH-USDT", True, "ETH", "USDT", Decimal("99"), Decimal("1")),
+            LimitOrder("buy-2", "ETH-USDT", True, "ETH", "USDT", Decimal("98"), Decimal("1")),
+            LimitOrder("sell-1", "ETH-USDT", False, "ETH", "USDT", Decimal("101"), Decimal("1")),
+            LimitOrder("sell-2", "ETH-DAI", False, "ETH", "DAI", Decimal("101"), Decimal("1")),
+        ]
+
+        table.update_order_prices({"ETH-USDT": orders[:3], "ETH-DAI": orders[3:]})
+
+        self.assertEqual(99.0, table.buy_order_prices[0])
+        self.assertEqual(101.0, table.sell_order_prices[0])
+        self.assertTrue(np.isnan(table.buy_order_prices[1]))
+        self.assertTrue(np.isnan(table.sell_order_prices[1]))
+
+    def test_within_tolerance(self):
+        nan = np.nan
+        within_tolerance = MarketStateTable.within_tolerance(
+            buy_order_prices=np.array([100.0, 100.0, 100.0, nan, 100.0]),
+            sell_order_prices=np.array([110.0, 110.0, nan, nan, 110.0]),
+            buy_prices=np.array([101.0, 100.0, 120.0, 90.0, 100.0]),
+            buy_sizes=np.array([1.0, 1.0, 1.0, 1.0, 0.0]),
+            sell_prices=np.array([111.0, 130.0, 100.0, 100.0, 110.0]),
+            sell_sizes=np.array([1.0, 1.0, 1.0, 1.0, 1.0]),
+            tolerance=0.1,
+        )
+
+        self.assertEqual([True, False, False, True, False], list(within_tolerance))
@@ -0,0 +1,110 @@
+import unittest
+from decimal import Decimal
+from unittest.mock import patch
+
+import pandas as pd
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.pure_market_making.pure_market_making import PureMarketMakingStrategy
+from hummingbot.strategy.pure_market_making.stage_timer import StageTimer
+
+
+class StageTimerTest(unittest.TestCase):
+
+    @patch("hummingbot.strategy.pure_market_making.stage_timer.time.perf_counter")
+    def test_stage_durations_and_percentiles(self, perf_counter_mock):
+        timer = StageTimer(max_samples=100)
+        for tick in range(200):
+            # first stage takes from 1 ms to 200 ms, the second one always 2 ms
+            perf_counter_mock.side_effect = [0.0, (tick + 1) / 1000, (tick + 3) / 1000]
+            timer.start()
+            timer.mark("first")
+            timer.mark("second")
+
+        stats = timer.stats()
+
+        self.assertEqual(["first", "second"], timer.stages)
+        self.assertEqual(100, stats["first"]["count"])
+        self.assertAlmostEqual(150.5, stats["first"]["p50_ms"])
+        self.assertAlmostEqual(200, stats["first"]["max_ms"])
+        self.assertAlmostEqual(2, stats["second"]["p99_ms"])
+
+        status = timer.format_status()
+        self.assertIn("Tick stages (ms, last 100 ticks):", status)
+        self.assertIn("first", status)
+
+        timer.reset()
+        self.assertEqual({}, timer.stats())
+        self.assertEqual("  Tick stages: no samples yet.", timer.format_status())
+
+
+class PMMStageTimingTest(unittest.TestCase):
+    start: pd.Timestamp = pd.Timestamp("2019-01-01", tz="UTC")
+    end: pd.Timestamp = pd.Timestamp("2019-01-01 01:00:00", tz="UTC")
+    start_timestamp: float = start.timestamp()
+    end_timestamp: float = end.timestamp()
+    trading_pair = "HBOT-ETH"
+    base_asset = trading_pair.split("-")[0]
+    quote_asset = trading_pair.split("-")[1]
+
+    def setUp(self):
+        self.clock = Clock(ClockMode.BACKTEST, 1, self.start_timestamp, self.end_timestamp)
+        self.market = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        self.market.set_balanced_order_book(trading_pair=self.trading_pair,
+                                            mid_price=100,
+                                            min_price=1,
+                                            max_price=200,
+                                            price_step_size=1,
+                                            volume_step_size=10)
+        self.market.set_balance("HBOT", 500)
+        self.market.set_balance("ETH", 5000)
+        self.market.set_quantization_param(QuantizationParams(self.trading_pair, 6, 6, 6, 6))
+        self.clock.add_iterator(self.market)
+        self.strategy = PureMarketMakingStrategy()
+        self.strategy.init_params(
+            MarketTradingPairTuple(self.market, self.trading_pair, self.base_asset, self.quote_asset),
+            bid_spread=Decimal("0.01"),
+            ask_spread=Decimal("0.01"),
+            order_amount=Decimal("1"),
+            order_levels=3,
+            order_refresh_time=4,
+            hanging_orders_enabled=True,
+        )
+        self.clock.add_iterator(self.strategy)
+
+    def test_stage_timing_disabled_by_default(self):
+        self.clock.backtest_til(self.start_timestamp + 2)
+
+        self.assertFalse(self.strategy.stage_timing_enabled)
+        self.assertIsNone(self.strategy.stage_timer)
+        self.assertNotIn("Tick stages", self.strategy.format_status())
+
+    def test_stage_timing_toggled_at_runtime(self):
+        self.clock.backtest_til(self.start_timestamp + 1)
+        self.strategy.stage_timing_enabled = True
+        self.clock.backtest_til(self.start_timestamp + 6)
+
+        stats = self.strategy.stage_timer.stats()
+        self.assertCountEqual(["create_base_proposal",
+                               "order_levels_modifiers",
+                               "order_price_modifiers",
+                               "order_size_modifiers",
+                               "budget_constraint",
+                               "filter_out_takers",
+                               "hanging_orders",
+                               "cancel_orders",
+                               "execute_orders_proposal"], stats.keys())
+        self.assertEqual(5, stats["hanging_orders"]["count"])
+        self.assertEqual(1, stats["execute_orders_proposal"]["count"])
+        self.assertIn("Tick stages (ms, last 1000 ticks):", self.strategy.format_status())
+
+        self.strategy.stage_timing_enabled = False
+        self.clock.backtest_til(self.start_timestamp + 8)
+
+        self.assertIsNone(self.strategy.stage_timer)
+        self.assertNotIn("Tick stages", self.strategy.format_status())
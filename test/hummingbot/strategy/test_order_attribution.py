@@ -0,0 +1,45 @@
+import unittest
+
+from hummingbot.strategy.order_attribution import OrderAttribution
+
+
+class OrderAttributionTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.order_attribution = OrderAttribution(max_orders=2)
+        self.order_attribution.add_strategy("conf_pure_mm_1.yml", "pure_market_making")
+
+    def test_owner_of_registered_orders(self):
+        self.order_attribution.register_order("OID1", "conf_pure_mm_1.yml")
+
+        self.assertEqual("conf_pure_mm_1.yml", self.order_attribution.owner("OID1"))
+        self.assertEqual("pure_market_making", self.order_attribution.strategy_name("conf_pure_mm_1.yml"))
+        self.assertIsNone(self.order_attribution.owner("OID2"))
+
+    def test_only_complete_orders_are_forgotten(self):
+        for order_id in ("OID1", "OID2", "OID3"):
+            self.order_attribution.register_order(order_id, "conf_pure_mm_1.yml")
+
+        # None of the orders is complete, all of them are kept over the limit
+        self.assertEqual("conf_pure_mm_1.yml", self.order_attribution.owner("OID1"))
+
+        self.order_attribution.complete_order("OID2")
+
+        self.assertIsNone(self.order_attribution.owner("OID2"))
+        self.assertEqual("conf_pure_mm_1.yml", self.order_attribution.owner("OID1"))
+        self.assertEqual("conf_pure_mm_1.yml", self.order_attribution.owner("OID3"))
+
+        self.order_attribution.complete_order("OID1")
+        self.order_attribution.register_order("OID4", "conf_pure_mm_1.yml")
+
+        self.assertIsNone(self.order_attribution.owner("OID1"))
+        self.assertEqual("conf_pure_mm_1.yml", self.order_attribution.owner("OID4"))
+
+    def test_complete_order_ignores_unknown_orders(self):
+        self.order_attribution.complete_order("OID1")
+        self.order_attribution.register_order("OID1", "conf_pure_mm_1.yml")
+        self.order_attribution.register_order("OID2", "conf_pure_mm_1.yml")
+        self.order_attribution.register_order("OID3", "conf_pure_mm_1.yml")
+
+        self.assertEqual("conf_pure_mm_1.yml", self.order_attribution.owner("OID1"))
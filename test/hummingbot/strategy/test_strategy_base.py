@@ -18,6 +18,7 @@ from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.market_order import MarketOrder
 from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.order_attribution import OrderAttribution
 from hummingbot.strategy.order_tracker import OrderTracker
 from hummingbot.strategy.strategy_base import StrategyBase
 
@@ -350,6 +351,26 @@ class StrategyBaseUnitTests(unittest.TestCase):
 
         self.assertEqual(1, len(self.strategy.order_tracker.tracked_market_orders))
 
+    def test_order_attribution_registers_created_orders(self):
+        order_attribution = OrderAttribution()
+        self.strategy.set_order_attribution(order_attribution, "conf_pure_mm_1.yml")
+
+        limit_order_id: str = self.strategy.buy_with_specific_market(
+            market_trading_pair_tuple=self.market_info,
+            order_type=OrderType.LIMIT,
+            price=Decimal("100"),
+            amount=Decimal("50"),
+        )
+        market_order_id: str = self.strategy.sell_with_specific_market(
+            market_trading_pair_tuple=self.market_info,
+            order_type=OrderType.MARKET,
+            amount=Decimal("10"),
+        )
+
+        self.assertEqual("conf_pure_mm_1.yml", order_attribution.owner(limit_order_id))
+        self.assertEqual("conf_pure_mm_1.yml", order_attribution.owner(market_order_id))
+        self.assertIsNone(order_attribution.owner("unknown_order"))
+
     def test_stop_tracking_market_order(self):
         self.assertEqual(0, len(self.strategy.order_tracker.tracked_limit_orders))
 
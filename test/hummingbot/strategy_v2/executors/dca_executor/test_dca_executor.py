@@ -601,3 +601,22 @@ class TestDCAExecutor(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
         self.assertTrue(executor._is_within_activation_bounds(order_price, Decimal("100.5")))
         # Case 2: close_price is outside the activation bounds
         self.assertFalse(executor._is_within_activation_bounds(order_price, Decimal("106")))
+
+    @patch.object(DCAExecutor, "get_price", MagicMock(return_value=Decimal("120")))
+    async def test_is_idle_once_all_levels_are_placed(self):
+        config = DCAExecutorConfig(id="test", timestamp=123, side=TradeType.BUY, connector_name="binance",
+                                   trading_pair="ETH-USDT",
+                                   amounts_quote=[Decimal(10), Decimal(20)],
+                                   prices=[Decimal(100), Decimal(80)])
+        executor = self.get_dca_executor_from_config(config)
+        executor._status = RunnableStatus.RUNNING
+        await executor.control_task()
+        self.assertFalse(executor.is_idle())
+        await executor.control_task()
+        self.assertTrue(executor.is_idle())
+
+        executor._open_orders[0].order = InFlightOrder(
+            client_order_id="OID-BUY-1", exchange_order_id="EOID1", trading_pair="ETH-USDT",
+            order_type=OrderType.LIMIT, trade_type=TradeType.BUY, amount=Decimal("0.1"), price=Decimal("100"),
+            creation_timestamp=1640001112.223, initial_state=OrderState.FILLED)
+        self.assertFalse(executor.is_idle())
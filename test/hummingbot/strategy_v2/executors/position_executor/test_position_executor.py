@@ -715,3 +715,20 @@ class TestPositionExecutor(IsolatedAsyncioWrapperTestCase):
         executor_info = position_executor.executor_info
         self.assertEqual(executor_info.close_type, CloseType.FAILED)
         self.assertEqual(executor_info.net_pnl_pct, Decimal("0"))
+
+    def test_is_idle_while_open_order_waits_to_be_filled(self):
+        position_executor = self.get_position_executor_running_from_config(self.get_position_config_market_long())
+        self.assertFalse(position_executor.is_idle())
+
+        position_executor._open_order = TrackedOrder(order_id="OID-BUY-1")
+        self.assertTrue(position_executor.is_idle())
+
+        position_executor._open_order.order = InFlightOrder(
+            client_order_id="OID-BUY-1", exchange_order_id="EOID4", trading_pair=position_executor.config.trading_pair,
+            order_type=OrderType.LIMIT, trade_type=TradeType.BUY, amount=Decimal("1"), price=Decimal("100"),
+            creation_timestamp=1640001112.223, initial_state=OrderState.FILLED)
+        self.assertFalse(position_executor.is_idle())
+
+        position_executor._open_order.order.current_state = OrderState.OPEN
+        type(self.strategy).current_timestamp = PropertyMock(return_value=1234567890 + 61)
+        self.assertFalse(position_executor.is_idle())
@@ -19,6 +19,7 @@ from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 from hummingbot.strategy_v2.executors.data_types import ExecutorConfigBase
 from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
 from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.models.executors import CloseType
 
 
 class TestExecutorBase(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
@@ -162,6 +163,25 @@ class TestExecutorBase(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
         executor_info = self.component.executor_info
         self.assertEqual(executor_info.id, "test")
 
+    @patch.object(ExecutorBase, "get_net_pnl_pct", return_value=Decimal("0.01"))
+    @patch.object(ExecutorBase, "get_net_pnl_quote", return_value=Decimal("1.0"))
+    @patch.object(ExecutorBase, "get_cum_fees_quote", return_value=Decimal("0.1"))
+    def test_executor_info_is_cached_until_state_changes(self, *_):
+        type(self.strategy).current_timestamp = PropertyMock(return_value=1000)
+        executor_info = self.component.executor_info
+
+        self.assertIs(executor_info, self.component.executor_info)
+
+        self.component._fill_order_forwarder(MagicMock())
+        executor_info_after_fill = self.component.executor_info
+        self.assertIsNot(executor_info, executor_info_after_fill)
+
+        self.component.close_type = CloseType.EARLY_STOP
+        self.assertIsNot(executor_info_after_fill, self.component.executor_info)
+
+        type(self.strategy).current_timestamp = PropertyMock(return_value=1001)
+        self.assertEqual(self.component.executor_info.close_type, CloseType.EARLY_STOP)
+
     def test_get_price_by_type(self):
         price = self.component.get_price("connector1", "EHT-USDT", PriceType.MidPrice)
         self.assertEqual(price, Decimal("1000.0"))
@@ -0,0 +1,105 @@
+import unittest
+from decimal import Decimal
+from unittest.mock import MagicMock, PropertyMock
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import MarketEvent, OrderCancelledEvent, OrderFilledEvent
+from hummingbot.core.pubsub import PubSub
+from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
+from hummingbot.strategy_v2.executors.data_types import ExecutorConfigBase
+from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
+from hummingbot.strategy_v2.executors.executor_event_router import ExecutorEventRouter
+
+
+class ExecutorEventRouterTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        # PubSub is enough as connector, the router only listens to its events
+        self.connector = PubSub()
+        self.strategy = MagicMock(spec=ScriptStrategyBase)
+        type(self.strategy).current_timestamp = PropertyMock(return_value=1234567890)
+        self.strategy.connectors = {"connector1": self.connector}
+        self.strategy.buy.side_effect = ["OID-1", "OID-2", "OID-3"]
+        self.router = ExecutorEventRouter()
+
+    def _create_executor(self, executor_id: str) -> ExecutorBase:
+        config = ExecutorConfigBase(id=executor_id, type="test", timestamp=1234567890)
+        executor = ExecutorBase(strategy=self.strategy, connectors=["connector1"], config=config)
+        executor.process_order_filled_event = MagicMock()
+        executor.process_order_canceled_event = MagicMock()
+        executor.set_event_router(self.router)
+        executor.register_events()
+        return executor
+
+    def _place_order(self, executor: ExecutorBase) -> str:
+        return executor.place_order(
+            connector_name="connector1",
+            trading_pair="ETH-USDT",
+            order_type=OrderType.LIMIT,
+            side=TradeType.BUY,
+            amount=Decimal("1"),
+            price=Decimal("1000"),
+        )
+
+    def _fill_event(self, order_id: str) -> OrderFilledEvent:
+        return OrderFilledEvent(
+            timestamp=1234567890,
+            order_id=order_id,
+            trading_pair="ETH-USDT",
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal("1000"),
+            amount=Decimal("1"),
+            trade_fee=AddedToCostTradeFee(),
+        )
+
+    def test_router_subscribes_once_per_connector(self):
+        self._create_executor("executor_1")
+        self._create_executor("executor_2")
+
+        for event in ExecutorEventRouter.EVENT_HANDLERS:
+            self.assertEqual(1, len(self.connector.get_listeners(event)))
+
+    def test_events_are_delivered_only_to_order_owner(self):
+        executor_1 = self._create_executor("executor_1")
+        executor_2 = self._create_executor("executor_2")
+        order_id = self._place_order(executor_2)
+
+        fill_event = self._fill_event(order_id)
+        self.connector.trigger_event(MarketEvent.OrderFilled, fill_event)
+        cancel_event = OrderCancelledEvent(timestamp=1234567890, order_id=order_id)
+        self.connector.trigger_event(MarketEvent.OrderCancelled, cancel_event)
+
+        executor_1.process_order_filled_event.assert_not_called()
+        executor_2.process_order_filled_event.assert_called_once_with(
+            MarketEvent.OrderFilled.value, self.connector, fill_event)
+        executor_2.process_order_canceled_event.assert_called_once_with(
+            MarketEvent.OrderCancelled.value, self.connector, cancel_event)
+
+    def test_events_of_untracked_orders_are_ignored(self):
+        executor = self._create_executor("executor_1")
+        self._place_order(executor)
+
+        self.connector.trigger_event(MarketEvent.OrderFilled, self._fill_event("OTHER-OID"))
+
+        executor.process_order_filled_event.assert_not_called()
+
+    def test_unregister_executor_removes_orders_and_connector_listeners(self):
+        executor_1 = self._create_executor("executor_1")
+        executor_2 = self._create_executor("executor_2")
+        order_id = self._place_order(executor_1)
+        self._place_order(executor_2)
+
+        executor_1.unregister_events()
+        self.connector.trigger_event(MarketEvent.OrderFilled, self._fill_event(order_id))
+
+        executor_1.process_order_filled_event.assert_not_called()
+        self.assertEqual(1, self.router.tracked_orders_count)
+        self.assertEqual(1, len(self.connector.get_listeners(MarketEvent.OrderFilled)))
+
+        executor_2.unregister_events()
+
+        self.assertEqual(0, self.router.tracked_orders_count)
+        self.assertEqual(0, len(self.connector.get_listeners(MarketEvent.OrderFilled)))
@@ -1,5 +1,7 @@
+import asyncio
 import unittest
 from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
 from unittest.mock import MagicMock, PropertyMock, patch
 
 from hummingbot.connector.exchange_py_base import ExchangePyBase
@@ -28,7 +30,7 @@ class TestExecutorOrchestrator(unittest.TestCase):
     @patch.object(MarketsRecorder, "get_instance")
     def setUp(self, markets_recorder: MagicMock):
         markets_recorder.return_value = MagicMock(spec=MarketsRecorder)
-        markets_recorder.get_all_executors = MagicMock(return_value=[])
+        markets_recorder.get_controllers_performance = MagicMock(return_value={})
         markets_recorder.store_or_update_executor = MagicMock(return_value=None)
         self.mock_strategy = self.create_mock_strategy()
         self.orchestrator = ExecutorOrchestrator(strategy=self.mock_strategy)
@@ -205,3 +207,127 @@ class TestExecutorOrchestrator(unittest.TestCase):
         self.assertAlmostEqual(global_report.global_pnl_quote, expected_total_realized_pnl)
         self.assertAlmostEqual(global_report.global_pnl_pct,
                                (expected_total_realized_pnl / expected_total_volume_traded) * 100)
+
+    @patch.object(MarketsRecorder, "get_instance")
+    def test_closed_executors_performance_is_added_once(self, _):
+        config = PositionExecutorConfig(
+            timestamp=1234, trading_pair="ETH-USDT", connector_name="binance",
+            side=TradeType.BUY, amount=Decimal(10), entry_price=Decimal(100),
+        )
+        closed_executor = MagicMock(spec=PositionExecutor)
+        closed_executor.config = config
+        closed_executor.is_active = False
+        closed_executor.executor_info = ExecutorInfo(
+            id="closed", timestamp=1234, type="position_executor", status=RunnableStatus.TERMINATED, config=config,
+            close_type=CloseType.TAKE_PROFIT, filled_amount_quote=Decimal(200), net_pnl_quote=Decimal(10),
+            net_pnl_pct=Decimal(5), cum_fees_quote=Decimal(1), is_trading=False, is_active=False,
+            custom_info={"side": TradeType.BUY}
+        )
+        running_executor = MagicMock(spec=PositionExecutor)
+        running_executor.executor_info = ExecutorInfo(
+            id="running", timestamp=1234, type="position_executor", status=RunnableStatus.RUNNING, config=config,
+            filled_amount_quote=Decimal(100), net_pnl_quote=Decimal(3), net_pnl_pct=Decimal(3),
+            cum_fees_quote=Decimal(1), is_trading=True, is_active=True, custom_info={}
+        )
+        self.orchestrator.cached_performance["test"] = PerformanceReport(realized_pnl_quote=Decimal(5))
+        self.orchestrator.active_executors["test"] = [closed_executor, running_executor]
+        self.orchestrator.archived_executors["test"] = []
+
+        for _ in range(2):
+            report = self.orchestrator.generate_performance_report("test")
+            self.assertEqual(Decimal(15), report.realized_pnl_quote)
+            self.assertEqual(Decimal(3), report.unrealized_pnl_quote)
+            self.assertEqual(Decimal(300), report.volume_traded)
+            self.assertEqual(Decimal(200), report.inventory_imbalance)
+            self.assertEqual(Decimal(800 + 900), report.open_order_volume)
+            self.assertEqual({CloseType.TAKE_PROFIT: 1}, report.close_type_counts)
+        self.assertEqual(Decimal(15), self.orchestrator.cached_performance["test"].realized_pnl_quote)
+
+        closed_executor.executor_info = closed_executor.executor_info.copy(update={"net_pnl_quote": Decimal(1000)})
+        self.orchestrator.execute_action(StoreExecutorAction(executor_id=config.id, controller_id="test"))
+        report = self.orchestrator.generate_performance_report("test")
+
+        self.assertEqual([running_executor], self.orchestrator.active_executors["test"])
+        self.assertEqual(Decimal(15), report.realized_pnl_quote)
+        self.assertEqual(Decimal(0), report.inventory_imbalance)
+        self.assertEqual(Decimal(900), report.open_order_volume)
+        self.assertEqual({CloseType.TAKE_PROFIT: 1}, report.close_type_counts)
+
+    @patch.object(MarketsRecorder, "get_instance")
+    def test_store_all_executors_archives_closed_executors(self, markets_recorder: MagicMock):
+        config = PositionExecutorConfig(
+            timestamp=1234, trading_pair="ETH-USDT", connector_name="binance",
+            side=TradeType.BUY, amount=Decimal(10), entry_price=Decimal(100),
+        )
+        closed_executor = MagicMock(spec=PositionExecutor)
+        closed_executor.is_active = False
+        closed_executor.executor_info = ExecutorInfo(
+            id="closed", timestamp=1234, type="position_executor", status=RunnableStatus.TERMINATED, config=config,
+            close_type=CloseType.TAKE_PROFIT, filled_amount_quote=Decimal(200), net_pnl_quote=Decimal(10),
+            net_pnl_pct=Decimal(5), cum_fees_quote=Decimal(1), is_trading=False, is_active=False,
+            custom_info={"side": TradeType.BUY}
+        )
+        running_executor = MagicMock(spec=PositionExecutor)
+        running_executor.is_active = True
+        running_executor.executor_info = ExecutorInfo(
+            id="running", timestamp=1234, type="position_executor", status=RunnableStatus.RUNNING, config=config,
+            filled_amount_quote=Decimal(100), net_pnl_quote=Decimal(3), net_pnl_pct=Decimal(3),
+            cum_fees_quote=Decimal(1), is_trading=True, is_active=True, custom_info={}
+        )
+        self.orchestrator.active_executors["test"] = [closed_executor, running_executor]
+        self.orchestrator.archived_executors["test"] = []
+        self.orchestrator.generate_performance_report("test")
+
+        self.orchestrator.store_all_executors()
+        report = self.orchestrator.generate_performance_report("test")
+
+        self.assertEqual(2, markets_recorder.return_value.store_or_update_executor.call_count)
+        self.assertEqual([running_executor], self.orchestrator.active_executors["test"])
+        self.assertEqual([closed_executor.executor_info], self.orchestrator.archived_executors["test"])
+        self.assertEqual({}, self.orchestrator._closed_executors)
+        self.assertEqual(Decimal(10), report.realized_pnl_quote)
+        self.assertEqual(Decimal(0), report.inventory_imbalance)
+        self.assertEqual(Decimal(900), report.open_order_volume)
+
+    @patch.object(MarketsRecorder, "get_instance")
+    def test_stored_performance_survives_first_action(self, markets_recorder: MagicMock):
+        stored_report = PerformanceReport(realized_pnl_quote=Decimal(50), volume_traded=Decimal(1000),
+                                          close_type_counts={CloseType.STOP_LOSS: 2})
+        markets_recorder.return_value.get_controllers_performance.return_value = {"test": stored_report}
+        orchestrator = ExecutorOrchestrator(strategy=self.mock_strategy)
+
+        orchestrator.execute_action(StoreExecutorAction(executor_id="unknown", controller_id="test"))
+        report = orchestrator.generate_performance_report("test")
+
+        self.assertIs(stored_report, orchestrator.cached_performance["test"])
+        self.assertEqual(Decimal(50), report.realized_pnl_quote)
+        self.assertEqual(Decimal(1000), report.volume_traded)
+        self.assertEqual({CloseType.STOP_LOSS: 2}, report.close_type_counts)
+
+
+class TestExecutorOrchestratorStop(IsolatedAsyncioWrapperTestCase):
+
+    @patch.object(MarketsRecorder, "get_instance")
+    async def test_stop_stops_scheduler_and_event_router_once_executors_closed(self, markets_recorder: MagicMock):
+        markets_recorder.return_value.get_controllers_performance.return_value = {}
+        orchestrator = ExecutorOrchestrator(strategy=TestExecutorOrchestrator.create_mock_strategy(),
+                                            use_shared_scheduler=True)
+        orchestrator.scheduler.stop = MagicMock()
+        orchestrator.event_router.stop = MagicMock()
+        executor = MagicMock()
+        executor.is_closed = False
+        executor.terminated = asyncio.Event()
+        orchestrator.active_executors["test"] = [executor]
+
+        orchestrator.stop()
+        await asyncio.sleep(0.01)
+
+        executor.early_stop.assert_called_once()
+        orchestrator.scheduler.stop.assert_not_called()
+        orchestrator.event_router.stop.assert_not_called()
+
+        executor.terminated.set()
+        await orchestrator._stop_task
+
+        orchestrator.scheduler.stop.assert_called_once()
+        orchestrator.event_router.stop.assert_called_once()
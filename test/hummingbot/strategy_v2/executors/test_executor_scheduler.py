@@ -0,0 +1,110 @@
+import asyncio
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import patch
+
+from hummingbot.strategy_v2.executors.executor_scheduler import ControlTaskHistogram, ExecutorScheduler
+from hummingbot.strategy_v2.runnable_base import RunnableBase
+
+
+class CountingRunnable(RunnableBase):
+    def __init__(self, idle: bool = False):
+        super().__init__(update_interval=0.1)
+        self.idle = idle
+        self.started_count = 0
+        self.stopped_count = 0
+        self.control_task_count = 0
+
+    def on_start(self):
+        self.started_count += 1
+
+    def on_stop(self):
+        self.stopped_count += 1
+
+    def is_idle(self) -> bool:
+        return self.idle
+
+    async def control_task(self):
+        self.control_task_count += 1
+
+
+class ExecutorSchedulerTests(IsolatedAsyncioWrapperTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.scheduler = ExecutorScheduler(interval=0.05)
+
+    def tearDown(self) -> None:
+        self.scheduler.stop()
+        super().tearDown()
+
+    def _runnable(self, idle: bool = False) -> CountingRunnable:
+        runnable = CountingRunnable(idle=idle)
+        runnable.set_scheduler(self.scheduler)
+        return runnable
+
+    async def test_scheduled_runnables_share_one_task(self):
+        runnables = [self._runnable() for _ in range(3)]
+        with patch("hummingbot.strategy_v2.runnable_base.safe_ensure_future") as control_loop_mock:
+            for runnable in runnables:
+                runnable.start()
+        await asyncio.sleep(0.12)
+
+        control_loop_mock.assert_not_called()
+        for runnable in runnables:
+            self.assertEqual(1, runnable.started_count)
+            self.assertGreaterEqual(runnable.control_task_count, 2)
+        self.assertEqual(3, len(self.scheduler.control_task_histograms()))
+
+    async def test_stopped_runnable_is_removed_and_stopped(self):
+        runnable = self._runnable()
+        runnable.start()
+        await self.scheduler.run_pass()
+
+        runnable.stop()
+        await self.scheduler.run_pass()
+
+        self.assertEqual(1, runnable.stopped_count)
+        self.assertEqual(0, self.scheduler.runnables_count)
+        self.assertEqual(runnable.control_task_count, self.scheduler.global_control_task_histogram()["count"])
+
+    async def test_idle_runnables_are_skipped(self):
+        runnable = self._runnable(idle=True)
+        runnable.start()
+
+        await self.scheduler.run_pass()
+
+        self.assertEqual(1, runnable.started_count)
+        self.assertEqual(0, runnable.control_task_count)
+        self.assertEqual(1, self.scheduler.stats["idle_skipped_control_tasks"])
+
+    async def test_runnables_over_time_budget_run_first_in_next_pass(self):
+        self.scheduler = ExecutorScheduler(interval=10, time_budget=0)
+        runnables = [self._runnable() for _ in range(3)]
+        # The passes are run by the test instead of the scheduler loop
+        with patch("hummingbot.strategy_v2.executors.executor_scheduler.safe_ensure_future",
+                   side_effect=lambda coroutine: coroutine.close()):
+            for runnable in runnables:
+                runnable.start()
+
+        await self.scheduler.run_pass()
+        self.assertEqual([1, 0, 0], [runnable.control_task_count for runnable in runnables])
+        await self.scheduler.run_pass()
+        self.assertEqual([1, 1, 0], [runnable.control_task_count for runnable in runnables])
+        await self.scheduler.run_pass()
+        self.assertEqual([1, 1, 1], [runnable.control_task_count for runnable in runnables])
+        self.assertEqual(3, self.scheduler.stats["over_budget_passes"])
+        self.assertEqual(2 + 2 + 2, self.scheduler.stats["deferred_control_tasks"])
+
+    def test_histogram_buckets(self):
+        histogram = ControlTaskHistogram()
+        histogram.add(0.0005)
+        histogram.add(0.003)
+        histogram.add(2)
+
+        histogram_info = histogram.to_dict()
+
+        self.assertEqual(3, histogram_info["count"])
+        self.assertEqual(1, histogram_info["buckets"]["<=1ms"])
+        self.assertEqual(1, histogram_info["buckets"]["<=5ms"])
+        self.assertEqual(1, histogram_info["buckets"][">1000ms"])
+        self.assertEqual(2000, histogram_info["max_ms"])